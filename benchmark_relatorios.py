@@ -0,0 +1,199 @@
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import biblioteca as _b
+import dados_sinteticos
+
+
+@contextlib.contextmanager
+def _entradas(respostas: list[str]):
+    """
+    Responde os input() das funções interativas com as respostas informadas, em ordem.
+    """
+    fila = iter(respostas)
+    original = builtins.input
+    builtins.input = lambda *args: next(fila, "")
+    try:
+        yield
+    finally:
+        builtins.input = original
+
+
+def medir(funcao, repeticoes: int) -> dict:
+    """
+    Executa a função uma vez para aquecimento e depois 'repeticoes' vezes, retornando as estatísticas em ms.
+    """
+    funcao()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return {
+        "repeticoes": repeticoes,
+        "min_ms": round(tempos[0], 3),
+        "mediana_ms": round(statistics.median(tempos), 3),
+        "media_ms": round(statistics.fmean(tempos), 3),
+        "p95_ms": round(tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))], 3),
+        "max_ms": round(tempos[-1], 3)
+    }
+
+
+def mes_mais_recente(conn) -> tuple[int, int] | None:
+    """
+    Retorna (mês, ano) do registro de métricas mais recente do banco, ou None se não houver registros.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT MAX(dt_registro) FROM T_MNDSH_METRICA_DIA")
+        ultimo = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    if ultimo is None:
+        return None
+    if isinstance(ultimo, str):
+        ultimo = datetime.fromisoformat(ultimo)
+    return ultimo.month, ultimo.year
+
+
+def executar(conn, mes: int, ano: int, repeticoes: int, pasta: str) -> dict:
+    """
+    Mede as etapas do pipeline de relatórios sobre os dados do mês já gravados no banco.
+
+    Raises:
+        ValueError: Se o banco não tiver registros de métricas no mês.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT c.nr_cpf, MIN(m.dt_registro)
+            FROM T_MNDSH_METRICA_DIA m
+            JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+            WHERE m.dt_registro >= :inicio AND m.dt_registro < :fim
+            GROUP BY c.nr_cpf
+            ORDER BY c.nr_cpf
+        """, dict(zip(("inicio", "fim"), _b.faixa_registro(mes=mes, ano=ano))))
+        linha = cursor.fetchone()
+    finally:
+        cursor.close()
+    if linha is None:
+        raise ValueError(f"Nenhum registro de métricas em {mes:02d}/{ano} no banco.")
+    cpf, primeiro_registro = linha
+    if isinstance(primeiro_registro, str):
+        primeiro_registro = datetime.fromisoformat(primeiro_registro)
+    data_dia = datetime(primeiro_registro.year, primeiro_registro.month, primeiro_registro.day)
+
+    df_mes = _b.buscar_metricas(conn, mes=mes, ano=ano)
+    df_desempenho, medias = _b.dados_relatorio_geral(conn, mes, ano)
+    df_exibir = _b.formatar_desempenho_exibir(df_desempenho)
+    linhas_desempenho = [linha for _, linha in df_desempenho.iterrows()]
+    arquivo_csv = os.path.join(pasta, "benchmark.csv")
+    arquivo_json = os.path.join(pasta, "benchmark.json")
+    grupos = [("TODAS", ["CPF"] + [c for c in df_exibir.columns if c != "CPF"])]
+
+    def imprimir():
+        with contextlib.redirect_stdout(io.StringIO()):
+            _b.imprimir_tabela(df_exibir, titulo="Benchmark", colunas_exibir=grupos)
+
+    def exportar(opcao: str, arquivo: str):
+        def gerar():
+            with _entradas([opcao, arquivo, ""]), contextlib.redirect_stdout(io.StringIO()):
+                _b.gerar_dataframe(df_exibir)
+        return gerar
+
+    etapas = {
+        "consulta_relatorio_diario": lambda: _b.dados_relatorio_diario(conn, cpf, data_dia),
+        "consulta_relatorio_mensal": lambda: _b.dados_relatorio_mensal(conn, cpf, mes, ano),
+        "consulta_relatorio_geral": lambda: _b.dados_relatorio_geral(conn, mes, ano),
+        "buscar_metricas_mes": lambda: _b.buscar_metricas(conn, mes=mes, ano=ano),
+        "calcular_desempenho_mes": lambda: _b.calcular_desempenho(df_mes),
+        "gerar_feedback_e_insights_por_colaborador": lambda: [_b.gerar_feedback_e_insights(linha.to_dict()) for linha in linhas_desempenho],
+        "gerar_feedback_e_insights_geral": lambda: _b.gerar_feedback_e_insights_geral(medias),
+        "formatar_df_exibir": lambda: _b.formatar_desempenho_exibir(df_desempenho),
+        "imprimir_tabela_geral": imprimir,
+        "gerar_dataframe_csv": exportar("1", arquivo_csv),
+        "gerar_dataframe_json": exportar("3", arquivo_json)
+    }
+    resultados = {}
+    for nome, funcao in etapas.items():
+        print(f"{nome}...", file=sys.stderr)
+        resultados[nome] = medir(funcao, repeticoes)
+    return {
+        "linhas": {"metricas_mes": len(df_mes), "colaboradores_mes": len(df_desempenho)},
+        "resultados": resultados
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline de relatórios sobre o banco local SQLite com dados sintéticos.")
+    parser.add_argument("-c", "--colaboradores", type=int, default=200)
+    parser.add_argument("-t", "--tarefas", type=int, default=5000)
+    parser.add_argument("-d", "--dias", type=int, default=31)
+    parser.add_argument("--inicio", help="primeiro dia dos dados sintéticos (DD/MM/AAAA, padrão: 01/01/2025)")
+    parser.add_argument("--mes", type=int, help="mês medido (padrão: o de --inicio ou, com --sqlite, o do registro mais recente)")
+    parser.add_argument("--ano", type=int, help="ano medido (junto com --mes)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("-r", "--repeticoes", type=int, default=10)
+    parser.add_argument("--sqlite", help="banco já populado (padrão: gera um banco temporário)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.inicio is not None and not _b.validar_data(args.inicio):
+        sys.exit("Data inválida! Use DD/MM/AAAA.")
+    if (args.mes is None) != (args.ano is None) or (args.mes is not None and not 1 <= args.mes <= 12):
+        sys.exit("Informe --mes (1-12) e --ano juntos.")
+    inicio = _b.data_datetime(args.inicio) if args.inicio else datetime(2025, 1, 1)
+    with tempfile.TemporaryDirectory() as pasta:
+        _b.config_banco["sqlite"] = args.sqlite or os.path.join(pasta, "benchmark.db")
+        with contextlib.redirect_stdout(sys.stderr):
+            conn = _b.conectarBD()
+        if conn is None:
+            sys.exit(1)
+        try:
+            geracao = None
+            if not args.sqlite:
+                geracao = dados_sinteticos.popular_banco(conn, args.colaboradores, args.tarefas, args.dias, inicio, args.semente)
+            if args.mes is not None:
+                mes, ano = args.mes, args.ano
+            elif args.inicio or not args.sqlite:
+                mes, ano = inicio.month, inicio.year
+            else:
+                periodo = mes_mais_recente(conn)
+                if periodo is None:
+                    sys.exit(f"O banco {args.sqlite} não tem registros de métricas.")
+                mes, ano = periodo
+            try:
+                medicoes = executar(conn, mes, ano, args.repeticoes, pasta)
+            except ValueError as e:
+                sys.exit(str(e))
+            resultado = {
+                "data": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "parametros": {"colaboradores": args.colaboradores, "tarefas": args.tarefas, "dias": args.dias,
+                               "semente": args.semente, "sqlite": args.sqlite, "mes": mes, "ano": ano},
+                "geracao": geracao,
+                **medicoes
+            }
+        finally:
+            conn.close()
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
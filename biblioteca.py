@@ -1,13 +1,75 @@
+from __future__ import annotations
+
 from datetime import datetime, timedelta
-import pandas as pd
 import os
+import contextlib
+import csv
+import importlib
 import json
-import oracledb
-from tabulate import tabulate
-import requests
+import mmap
+import queue
+import random
+import re
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import uuid
 
 margem = ' ' * 4
 
+# ====== IMPORTAÇÃO TARDIA ======
+
+class _ModuloTardio:
+    """
+    Adia a importação de uma dependência pesada até o primeiro uso de um de seus atributos.
+    Após a importação, o nome global passa a apontar diretamente para o módulo real.
+
+    Args:
+        nome: Nome do módulo a importar.
+        apelido: Nome global usado neste arquivo (ex.: "pd" para pandas).
+    """
+    def __init__(self, nome: str, apelido: str):
+        self._nome = nome
+        self._apelido = apelido
+
+    def carregar(self):
+        modulo = importlib.import_module(self._nome)
+        globals()[self._apelido] = modulo
+        return modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self.carregar(), atributo)
+
+pd = _ModuloTardio("pandas", "pd")
+oracledb = _ModuloTardio("oracledb", "oracledb")
+requests = _ModuloTardio("requests", "requests")
+futuros_concorrentes = _ModuloTardio("concurrent.futures", "futuros_concorrentes")
+
+def precarregar_dependencias(nomes: tuple[str, ...] = ("pd", "oracledb")) -> threading.Thread:
+    """
+    Importa as dependências pesadas em uma thread em segundo plano, enquanto o usuário lê o menu.
+    Se uma função precisar do módulo antes do fim, a importação em andamento é aguardada.
+
+    Args:
+        nomes: Apelidos globais dos módulos a carregar.
+
+    Returns:
+        threading.Thread: A thread (daemon) iniciada.
+    """
+    def carregar():
+        for nome in nomes:
+            modulo = globals()[nome]
+            if isinstance(modulo, _ModuloTardio):
+                try:
+                    modulo.carregar()
+                except Exception:
+                    pass
+    thread = threading.Thread(target=carregar, name="precarregar", daemon=True)
+    thread.start()
+    return thread
+
 # Definição de métricas positivas ou negativas
 metrica_positiva_negativa = {
     "produtividade": "positivo",
@@ -76,8 +138,12 @@ colunas_renomear ={
 
 def limpa_tela():
     """
-    Limpa a tela do terminal no Windows e no Linux/macOS.
-    """    
+    Limpa a tela do terminal no Windows e no Linux/macOS. Nas sessões do servidor de quiosque
+    (sys.stdout com terminal_remoto), envia a sequência ANSI para o terminal do cliente.
+    """
+    if getattr(sys.stdout, "terminal_remoto", False):
+        print("\033[2J\033[H", end="", flush=True)
+        return
     os.system('cls' if os.name == 'nt' else 'clear')
 
 def valida_nota(msg: str) -> int:
@@ -111,11 +177,31 @@ def validar_cpf(cpf: str) -> bool:
     cpf_numeros = "".join(c for c in cpf if c.isdigit())
     return len(cpf_numeros) == 11
 
+def cpf_digitos_validos(cpf: str) -> bool:
+    """
+    Confere os dígitos verificadores do CPF, além dos 11 dígitos de validar_cpf() (CPFs com todos os dígitos iguais são recusados).
+
+    Args:
+        cpf (str): String contendo um CPF, com ou sem máscara.
+
+    Returns:
+        bool: True se os dois dígitos verificadores conferem, False caso contrário.
+    """
+    numeros = [int(c) for c in cpf if c.isdigit()]
+    if len(numeros) != 11 or len(set(numeros)) == 1:
+        return False
+    for posicao in (9, 10):
+        soma = sum(digito * (posicao + 1 - i) for i, digito in enumerate(numeros[:posicao]))
+        if soma * 10 % 11 % 10 != numeros[posicao]:
+            return False
+    return True
+
 def cpf_unico(conn: oracledb.Connection, cpf: str) -> bool:
     """
     Verifica se um CPF já está cadastrado na tabela T_MNDSH_COLABORADOR.
     Caso o CPF não exista, retorna True.
     Caso exista já exista, retorna False.
+    Um colaborador excluído ocupa o CPF até ser expurgado (expurgar_colaboradores).
 
     Args:
         conn (oracledb.Connection): Conexão ativa com o banco de dados Oracle.
@@ -284,7 +370,7 @@ def gerar_dataframe(df: pd.DataFrame) -> None:
         None: A função realiza a operação de salvamento e não retorna nenhum valor.
     
     Dependências:
-        Esta função depende de 'menu_opcoes', 'margem'.
+        Esta função depende de 'menu_opcoes', 'exportar_dataframe', 'margem'.
     """
     opcoes_texto = ["CSV", "Excel", "JSON", "Não salvar"]
     opcoes_valor = ["csv", "excel", "json", "nao"]
@@ -293,19 +379,21 @@ def gerar_dataframe(df: pd.DataFrame) -> None:
         nome_arquivo = input("\nNome do arquivo CSV: ").strip() or "dados.csv"
         if not nome_arquivo.lower().endswith(".csv"):
             nome_arquivo += ".csv"
-        df.to_csv(nome_arquivo, index=False, encoding='utf-8-sig')
+        exportar_dataframe(df, nome_arquivo, "csv")
         print(f"\n {margem} Arquivo CSV salvo como {nome_arquivo}\n")
     elif escolha == "excel":
         nome_arquivo = input("\nNome do arquivo Excel: ").strip() or "dados.xlsx"
         if not nome_arquivo.lower().endswith(".xlsx"):
             nome_arquivo += ".xlsx"
-        df.to_excel(nome_arquivo, index=False)
+        exportar_dataframe(df, nome_arquivo, "excel")
         print(f"\n {margem} Arquivo Excel salvo como {nome_arquivo}\n")
     elif escolha == "json":
         nome_arquivo = input("\nNome do arquivo JSON: ").strip() or "dados.json"
         if not nome_arquivo.lower().endswith(".json"):
             nome_arquivo += ".json"
-        df.to_json(nome_arquivo, orient="records", force_ascii=False, indent=4)
+        with medir_duracao("mindshift_exportacao_segundos", "Duração das exportações de dados.", formato="json"):
+            df.to_json(nome_arquivo, orient="records", force_ascii=False, indent=4)
+        contador_inc("mindshift_exportacao_linhas_total", "Linhas exportadas.", len(df), formato="json")
         print(f"\n {margem} Arquivo JSON salvo como {nome_arquivo}\n")
     else:
         print(f"\n {margem} Não salvando arquivo.\n")
@@ -361,11 +449,54 @@ def perguntar_continuar2(acao: str ="tentar novamente") -> bool:
             limpa_tela()
             return False
 
+_COLUNAS_COLABORADOR = ["id", "nr_cpf", "nm_colaborador", "dt_nascimento", "ds_sexo", "cep", "ds_logradouro", "nr_endereco", "ds_bairro",
+                        "ds_cidade", "ds_estado", "vl_salario", "ds_cargo", "dt_admissao", "dt_demissao", "ds_status", "dt_criacao", "dt_ultima_modificacao"]
+
+def obter_colaborador(conn: oracledb.Connection, identificador: str) -> dict | None:
+    """
+    Busca um colaborador por ID ou CPF sem interação com o usuário.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        identificador: ID numérico ou CPF com 11 dígitos.
+
+    Returns:
+        dict: Os dados do colaborador (valores nulos trocados por "" ou 0, como em buscar_colaborador()).
+        None: Se o identificador for inválido ou o colaborador não existir (ou estiver excluído, aguardando o expurgo).
+    """
+    identificador = str(identificador).strip()
+    if not identificador.isdigit():
+        return None
+    if len(identificador) == 11:
+        filtro, params = "nr_cpf = :cpf", {"cpf": identificador}
+    else:
+        filtro, params = "id = :id", {"id": int(identificador)}
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT {", ".join(_COLUNAS_COLABORADOR)}
+            FROM T_MNDSH_COLABORADOR
+            WHERE {filtro} AND dt_exclusao IS NULL
+        """, params)
+        resultado = cursor.fetchone()
+    finally:
+        cursor.close()
+    if not resultado:
+        return None
+    colaborador_dicionario = dict(zip(_COLUNAS_COLABORADOR, resultado))
+    for k, v in colaborador_dicionario.items():
+        if v is None:
+            if k in ['vl_salario', 'nr_endereco']:
+                colaborador_dicionario[k] = 0
+            else:
+                colaborador_dicionario[k] = ""
+    return colaborador_dicionario
+
 def buscar_colaborador(conn: oracledb.Connection, identificador: str | None = None, titulo_menu: str | None = None)-> dict | None:
     """
     Busca um colaborador no banco de dados Oracle por ID ou CPF.
     Esta função entra em um loop contínuo que solicita ao usuário um identificador, quando válido, 
-    valida o formato (ID numérico ou CPF de 11 dígitos) e executa a consulta apropriada na tabela T_MNDSH_COLABORADOR.
+    valida o formato (ID numérico ou CPF de 11 dígitos) e consulta a tabela T_MNDSH_COLABORADOR via obter_colaborador().
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
@@ -377,45 +508,21 @@ def buscar_colaborador(conn: oracledb.Connection, identificador: str | None = No
         None: Se o colaborador não for encontrado ou se ocorrer um erro.
 
     Dependências:
-        Esta função depende de 'perguntar_continuar2' e 'margem'.
+        Esta função depende de 'obter_colaborador', 'perguntar_continuar2' e 'margem'.
     """
-    cursor = conn.cursor()
     try:
         while True:
             if not identificador:
                 print(f"\n===== {titulo_menu} =====\n")
                 identificador = input("ID ou CPF do colaborador: ").strip()
-            if identificador.isdigit() and len(identificador) != 11:
-                cursor.execute("""
-                    SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
-                           ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao
-                    FROM T_MNDSH_COLABORADOR
-                    WHERE id = :id
-                """, {"id": int(identificador)})
-            elif identificador.isdigit() and len(identificador) == 11:
-                cursor.execute("""
-                    SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
-                           ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status,dt_criacao, dt_ultima_modificacao
-                    FROM T_MNDSH_COLABORADOR
-                    WHERE nr_cpf = :cpf
-                """, {"cpf": identificador})
-            else:
+            if not identificador.isdigit():
                 print(f"\n {margem} Identificador inválido. Use um ID numérico ou CPF com 11 dígitos.\n")
                 if not perguntar_continuar2("tentar novamente"):
                     return None
                 identificador = None
                 continue
-            resultado = cursor.fetchone()
-            if resultado:
-                colunas = ["id", "nr_cpf", "nm_colaborador", "dt_nascimento", "ds_sexo", "cep", "ds_logradouro", "nr_endereco", "ds_bairro", 
-                    "ds_cidade", "ds_estado", "vl_salario", "ds_cargo", "dt_admissao", "dt_demissao", "ds_status", "dt_criacao", "dt_ultima_modificacao"]
-                colaborador_dicionario = dict(zip(colunas, resultado))
-                for k, v in colaborador_dicionario.items():
-                    if v is None:
-                        if k in ['vl_salario', 'nr_endereco']:
-                            colaborador_dicionario[k] = 0
-                        else:
-                            colaborador_dicionario[k] = ""
+            colaborador_dicionario = obter_colaborador(conn, identificador)
+            if colaborador_dicionario:
                 return colaborador_dicionario
             else:
                 print(f"\n {margem} Colaborador não encontrado.\n")
@@ -425,8 +532,6 @@ def buscar_colaborador(conn: oracledb.Connection, identificador: str | None = No
     except Exception as e:
         print(f"\n{margem} Erro ao buscar colaborador: {e}\n")
         return None
-    finally:
-        cursor.close()
 
 def menu_opcoes(pergunta: str, opcoes_texto: list[str], opcoes_valor: list[str]) -> str:
     """
@@ -481,422 +586,1951 @@ def menu_opcoes2(pergunta: str, opcoes_texto: list[str], opcoes_valor: list[str]
 
 # ====== CONEXÃO ======
 
+# Credenciais do banco (podem ser sobrescritas por variáveis de ambiente).
+# Se MINDSHIFT_SQLITE apontar para um arquivo, o banco local SQLite substitui o Oracle.
+config_banco = {
+    "usuario": os.environ.get("MINDSHIFT_DB_USUARIO", "RM565698"),
+    "senha": os.environ.get("MINDSHIFT_DB_SENHA", "200591"),
+    "dsn": os.environ.get("MINDSHIFT_DB_DSN", "oracle.fiap.com.br:1521/ORCL"),
+    "sqlite": os.environ.get("MINDSHIFT_SQLITE")
+}
+
 def conectarBD() -> oracledb.Connection | None:
     """
     Estabelece uma conexão com o banco de dados Oracle.
-    Usa as credenciais e a DSN (Data Source Name) fixas para tentar a conexão.
+    Usa as credenciais e a DSN (Data Source Name) de config_banco para tentar a conexão,
+    ou abre o banco local SQLite quando config_banco["sqlite"] estiver definido.
     Exibe uma mensagem de sucesso ou uma mensagem de erro em caso de falha.
 
     Returns:
         oracledb.Connection: O objeto de conexão ativo, se a conexão for bem-sucedida.
         None: Se ocorrer qualquer erro durante a tentativa de conexão.
     """
+    inicio = time.perf_counter()
     try:
-        conn = oracledb.connect(user="RM565698", password="200591", dsn="oracle.fiap.com.br:1521/ORCL")
+        if config_banco["sqlite"]:
+            conn = ConexaoSQLite(config_banco["sqlite"])
+        else:
+            conn = oracledb.connect(user=config_banco["usuario"], password=config_banco["senha"], dsn=config_banco["dsn"])
     except Exception as e:
+        contador_inc("mindshift_conexoes_total", "Tentativas de conexão com o banco.", resultado="erro")
         print(f"\n {margem} Erro ao conectar no banco de dados: {e} \n")
         return None
     else:
+        contador_inc("mindshift_conexoes_total", "Tentativas de conexão com o banco.", resultado="ok")
+        histograma_observar("mindshift_conexao_segundos", "Tempo para abrir uma conexão com o banco.", time.perf_counter() - inicio)
         print(f"\n {margem} Conexão realizada!\n")
-        return conn
-
-# ====== API EXTERNA ======
+        return ConexaoInstrumentada(conn)
 
-def endereco_cep(cep: str) -> dict | None:
+def criar_pool(minimo: int = 1, maximo: int = 10):
     """
-    Busca dados de endereço (logradouro, bairro, cidade, estado) usando a API ViaCEP.
-    Limpa e valida o CEP fornecido (deve ter 8 dígitos). Faz uma requisição HTTP
-    para a API e trata a resposta JSON, incluindo casos de CEP não encontrado.
+    Cria um pool de conexões com o mesmo banco usado por conectarBD().
+    As conexões são emprestadas com pool.acquire() e devolvidas com pool.release(conn).
 
     Args:
-        cep: A string contendo o CEP a ser consultado.
+        minimo: Quantidade de conexões abertas na criação do pool.
+        maximo: Quantidade máxima de conexões simultâneas.
 
     Returns:
-        dict: Um dicionário com as chaves "logradouro", "bairro", "cidade" e "estado", se o CEP for encontrado.
-        None: Se o CEP for inválido, não for encontrado, ou se ocorrer um erro na consulta.
+        oracledb.ConnectionPool | PoolSQLite: O pool criado.
+        None: Se ocorrer qualquer erro durante a criação.
     """
     try:
-        cep = cep.strip().replace("-", "").replace(".", "")
-        if len(cep) != 8 or not cep.isdigit():
-            print(f"\n {margem} CEP inválido. Deve conter 8 números.\n")
-            return None
-        url = f"https://viacep.com.br/ws/{cep}/json/"
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            dados = response.json()
-            if "erro" not in dados:
-                return {"logradouro": dados["logradouro"], "bairro": dados["bairro"], "cidade": dados["localidade"], "estado": dados["uf"]}
-        print(f"\n {margem} CEP não encontrado.\n")
+        if config_banco["sqlite"]:
+            return PoolInstrumentado(PoolSQLite(config_banco["sqlite"], minimo, maximo))
+        return PoolInstrumentado(oracledb.create_pool(user=config_banco["usuario"], password=config_banco["senha"], dsn=config_banco["dsn"],
+                                                      min=minimo, max=maximo, increment=1))
     except Exception as e:
-        print(f"\n {margem} Erro ao consultar o CEP: {e}\n")
-    return None
+        print(f"\n {margem} Erro ao criar o pool de conexões: {e} \n")
+        return None
 
-# ====== CRUD CADASTRO ======
+# ====== BANCO LOCAL (SQLite) ======
+
+# Substituto local do Oracle para testes e benchmarks: mesmo esquema de scripts.sql,
+# com as funções Oracle usadas pelo sistema (TRUNC, TO_DATE, TO_CHAR, EXTRACT, SYSDATE) traduzidas.
+_ESQUEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS T_MNDSH_COLABORADOR (
+    id                 INTEGER PRIMARY KEY AUTOINCREMENT,
+    nr_cpf             VARCHAR2(11) NOT NULL UNIQUE,
+    nm_colaborador     VARCHAR2(100) NOT NULL,
+    dt_nascimento      DATE NOT NULL,
+    ds_sexo            CHAR(1) NOT NULL CHECK (ds_sexo IN ('M','F')),
+    cep                VARCHAR2(9) NOT NULL,
+    ds_logradouro      VARCHAR2(150) NOT NULL,
+    nr_endereco        VARCHAR2(10) NOT NULL,
+    ds_bairro          VARCHAR2(50) NOT NULL,
+    ds_cidade          VARCHAR2(50) NOT NULL,
+    ds_estado          CHAR(2) NOT NULL,
+    vl_salario         NUMBER(12,2) NOT NULL CHECK (vl_salario >= 0),
+    ds_cargo           VARCHAR2(50) NOT NULL,
+    dt_admissao        DATE NOT NULL,
+    dt_demissao        DATE,
+    ds_status          VARCHAR2(20) DEFAULT 'Ativo' CHECK (ds_status IN ('Ativo','Inativo')),
+    dt_criacao         DATE DEFAULT (datetime('now', 'localtime')) NOT NULL,
+    dt_ultima_modificacao DATE DEFAULT (datetime('now', 'localtime')) NOT NULL,
+    dt_exclusao        DATE
+);
+CREATE TABLE IF NOT EXISTS T_MNDSH_TAREFA (
+    id_tarefa            INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_colaborador       INTEGER NOT NULL REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE,
+    ds_titulo            VARCHAR2(100) NOT NULL,
+    ds_descricao         VARCHAR2(4000),
+    ds_prioridade        VARCHAR2(10) DEFAULT 'baixa' CHECK (ds_prioridade IN ('baixa','média','alta')),
+    ds_status            VARCHAR2(20) DEFAULT 'pendente' CHECK (ds_status IN ('pendente','em andamento','concluída')),
+    dt_prazo             DATE NOT NULL,
+    dt_conclusao         DATE,
+    dt_criacao           DATE DEFAULT (datetime('now', 'localtime')),
+    dt_modificacao       DATE DEFAULT (datetime('now', 'localtime')),
+    grau_dificuldade     NUMBER(3,1) CHECK (grau_dificuldade BETWEEN 0 AND 10)
+);
+CREATE INDEX IF NOT EXISTS idx_tarefa_status ON T_MNDSH_TAREFA(ds_status);
+CREATE INDEX IF NOT EXISTS idx_tarefa_prazo ON T_MNDSH_TAREFA(dt_prazo);
+CREATE TABLE IF NOT EXISTS T_MNDSH_METRICA_DIA (
+    id_metrica_dia           INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_colaborador           INTEGER NOT NULL REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE,
+    dt_registro              DATE DEFAULT (datetime('now', 'localtime')) NOT NULL,
+    dt_dia                   DATE GENERATED ALWAYS AS (substr(dt_registro, 1, 10) || ' 00:00:00') VIRTUAL,
+    horas_produtivas         NUMBER(3,1),
+    nivel_foco               NUMBER(3,1),
+    tarefas_concluidas       NUMBER,
+    tarefas_andamento        NUMBER,
+    tarefas_pendentes        NUMBER,
+    concluidas_no_prazo      NUMBER,
+    concluidas_atraso        NUMBER,
+    estresse                 NUMBER(3,1),
+    humor                    NUMBER(3,1),
+    energia                  NUMBER(3,1),
+    controle_dia             NUMBER(3,1),
+    satisfacao_geral         NUMBER(3,1),
+    relacao_colegas          NUMBER(3,1),
+    reconhecimento           NUMBER(3,1),
+    carga_trabalho           NUMBER(3,1),
+    horas_dormidas           NUMBER(3,1),
+    descanso                 NUMBER(3,1),
+    despertares              NUMBER(3,1),
+    atividade_fisica         NUMBER(3,1),
+    ingestao_agua            NUMBER(3,1),
+    intensidade_atividade    NUMBER(3,1)
+);
+CREATE INDEX IF NOT EXISTS idx_metrica_dia_dt ON T_MNDSH_METRICA_DIA(dt_registro);
+CREATE TABLE IF NOT EXISTS T_MNDSH_METRICA_ARQUIVO (
+    id_metrica_dia           INTEGER PRIMARY KEY,
+    id_colaborador           INTEGER NOT NULL REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE,
+    dt_registro              DATE NOT NULL,
+    dt_dia                   DATE GENERATED ALWAYS AS (substr(dt_registro, 1, 10) || ' 00:00:00') VIRTUAL,
+    horas_produtivas         NUMBER(3,1),
+    nivel_foco               NUMBER(3,1),
+    tarefas_concluidas       NUMBER,
+    tarefas_andamento        NUMBER,
+    tarefas_pendentes        NUMBER,
+    concluidas_no_prazo      NUMBER,
+    concluidas_atraso        NUMBER,
+    estresse                 NUMBER(3,1),
+    humor                    NUMBER(3,1),
+    energia                  NUMBER(3,1),
+    controle_dia             NUMBER(3,1),
+    satisfacao_geral         NUMBER(3,1),
+    relacao_colegas          NUMBER(3,1),
+    reconhecimento           NUMBER(3,1),
+    carga_trabalho           NUMBER(3,1),
+    horas_dormidas           NUMBER(3,1),
+    descanso                 NUMBER(3,1),
+    despertares              NUMBER(3,1),
+    atividade_fisica         NUMBER(3,1),
+    ingestao_agua            NUMBER(3,1),
+    intensidade_atividade    NUMBER(3,1)
+);
+CREATE INDEX IF NOT EXISTS idx_metrica_arquivo_dt ON T_MNDSH_METRICA_ARQUIVO(dt_registro);
+CREATE TABLE IF NOT EXISTS T_MNDSH_ARQUIVAMENTO (
+    dt_mes                   DATE PRIMARY KEY,
+    qt_linhas                NUMBER NOT NULL,
+    dt_arquivamento          DATE DEFAULT (datetime('now', 'localtime')) NOT NULL
+);
+"""
+
+# Índices sobre id_colaborador, criados depois de _atualizar_esquema_sqlite() (arquivos antigos ainda têm nr_cpf
+# nas tabelas filhas até a conversão)
+_INDICES_SQLITE = """
+CREATE INDEX IF NOT EXISTS idx_tarefa_colaborador ON T_MNDSH_TAREFA(id_colaborador, ds_status, dt_prazo);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_metrica_dia_colaborador ON T_MNDSH_METRICA_DIA(id_colaborador, dt_dia);
+CREATE UNIQUE INDEX IF NOT EXISTS uk_metrica_arquivo_colaborador ON T_MNDSH_METRICA_ARQUIVO(id_colaborador, dt_dia);
+CREATE INDEX IF NOT EXISTS idx_colaborador_exclusao ON T_MNDSH_COLABORADOR(dt_exclusao) WHERE dt_exclusao IS NOT NULL;
+"""
+
+_FORMATO_DATA_SQLITE = "%Y-%m-%d %H:%M:%S"
+_FORMATOS_DATA_ORACLE = [("YYYY", "%Y"), ("HH24", "%H"), ("MI", "%M"), ("SS", "%S"), ("DD", "%d"), ("MM", "%m")]
+_TRADUCOES_SQLITE = [
+    (re.compile(r"\bSYSDATE\b", re.I), "datetime('now', 'localtime')"),
+    (re.compile(r"EXTRACT\s*\(\s*(YEAR|MONTH|DAY)\s+FROM\s+([\w.]+)\s*\)", re.I),
+     lambda m: f"CAST(strftime('%{ {'YEAR': 'Y', 'MONTH': 'm', 'DAY': 'd'}[m.group(1).upper()] }', {m.group(2)}) AS INTEGER)"),
+    (re.compile(r"OFFSET\s+(:?\w+)\s+ROWS\s+FETCH\s+NEXT\s+(:?\w+)\s+ROWS\s+ONLY", re.I), r"LIMIT \2 OFFSET \1")
+]
+
+def _formato_data_oracle(formato: str) -> str:
+    """
+    Converte uma máscara de data do Oracle (ex.: 'DD/MM/YYYY HH24:MI') para o formato do strftime.
+    """
+    for oracle, python in _FORMATOS_DATA_ORACLE:
+        formato = formato.replace(oracle, python)
+    return formato
 
-def cadastrar_colaborador(conn: oracledb.Connection) -> None:
+def _sqlite_trunc(valor):
     """
-    Solicita, valida e insere os dados de um novo colaborador na tabela T_MNDSH_COLABORADOR usando INSERT e trata exceções de conexão.
+    TRUNC(data) do Oracle: zera o horário de uma data armazenada como texto.
+    """
+    return None if valor is None else str(valor)[:10] + " 00:00:00"
+
+def _sqlite_to_date(valor, formato="DD/MM/YYYY"):
+    """
+    TO_DATE(texto, máscara) do Oracle.
+    """
+    if valor is None:
+        return None
+    return datetime.strptime(str(valor), _formato_data_oracle(formato)).strftime(_FORMATO_DATA_SQLITE)
+
+def _sqlite_to_char(valor, formato=None):
+    """
+    TO_CHAR(valor, máscara) do Oracle para datas e números.
+    """
+    if valor is None or formato is None:
+        return None if valor is None else str(valor)
+    if isinstance(valor, (int, float)):
+        return f"{valor:,.2f}"
+    try:
+        return datetime.strptime(str(valor)[:19], _FORMATO_DATA_SQLITE).strftime(_formato_data_oracle(formato))
+    except ValueError:
+        return str(valor)
+
+def _converter_data_sqlite(valor: bytes) -> datetime:
+    """
+    Converte as colunas DATE lidas do SQLite em datetime, como faz o oracledb.
+    """
+    texto = valor.decode()
+    return datetime.strptime(texto[:19], _FORMATO_DATA_SQLITE) if len(texto) > 10 else datetime.strptime(texto, "%Y-%m-%d")
+
+sqlite3.register_adapter(datetime, lambda d: d.strftime(_FORMATO_DATA_SQLITE))
+sqlite3.register_converter("DATE", _converter_data_sqlite)
+
+def _atualizar_esquema_sqlite(conn: "ConexaoSQLite") -> None:
+    """
+    Leva arquivos antigos ao esquema atual: as tabelas filhas que ainda referenciam o colaborador por nr_cpf
+    passam a usar id_colaborador (converter_chave_colaborador), a tabela T_MNDSH_METRICA do formato anterior
+    (uma linha por categoria) é convertida em T_MNDSH_METRICA_DIA e dá lugar à visão de compatibilidade de
+    mesmo nome (converter_metricas_largas), a coluna dt_exclusao (exclusão lógica) é criada em
+    T_MNDSH_COLABORADOR e os índices de _INDICES_SQLITE são criados.
+    """
+    converter_chave_colaborador(conn)
+    if "dt_exclusao" not in colunas_tabela(conn, "T_MNDSH_COLABORADOR"):
+        conn._conn.execute("ALTER TABLE T_MNDSH_COLABORADOR ADD COLUMN dt_exclusao DATE")
+    if tipo_objeto_banco(conn, "T_MNDSH_METRICA") != "view":
+        converter_metricas_largas(conn)
+    conn._conn.executescript(_INDICES_SQLITE)
+
+def traduzir_sql_sqlite(sql: str) -> str:
+    """
+    Traduz as construções Oracle usadas pelo sistema para o dialeto do SQLite.
 
     Args:
-        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        sql: O comando SQL escrito para Oracle.
 
     Returns:
-        None: A função realiza a ação de inserção.
+        str: O comando equivalente no SQLite.
+    """
+    for padrao, substituto in _TRADUCOES_SQLITE:
+        sql = padrao.sub(substituto, sql)
+    return sql
+
+class _CursorSQLite:
+    """
+    Cursor do banco local que traduz o SQL Oracle antes de executar.
+    """
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, sql: str, params=None):
+        self._cursor.execute(traduzir_sql_sqlite(sql), params or {})
+        return self
+
+    def executemany(self, sql: str, params) -> None:
+        self._cursor.executemany(traduzir_sql_sqlite(sql), params)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, nome):
+        return getattr(self._cursor, nome)
+
+class ConexaoSQLite:
+    """
+    Conexão com o banco local SQLite com a mesma interface usada do oracledb.Connection
+    (cursor, commit, rollback e close). O esquema é criado se o arquivo estiver vazio.
+
+    Args:
+        caminho: Caminho do arquivo do banco local.
+    """
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._conn = sqlite3.connect(caminho, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if caminho != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        for nome, aridade, funcao in [("TRUNC", 1, _sqlite_trunc), ("TO_DATE", 1, _sqlite_to_date), ("TO_DATE", 2, _sqlite_to_date),
+                                      ("TO_CHAR", 1, _sqlite_to_char), ("TO_CHAR", 2, _sqlite_to_char)]:
+            self._conn.create_function(nome, aridade, funcao, deterministic=True)
+        self._conn.executescript(_ESQUEMA_SQLITE)
+        _atualizar_esquema_sqlite(self)
+
+    def cursor(self) -> _CursorSQLite:
+        return _CursorSQLite(self._conn.cursor())
+
+    def __getattr__(self, nome):
+        return getattr(self._conn, nome)
+
+class PoolSQLite:
+    """
+    Pool de conexões do banco local com a mesma interface do oracledb.ConnectionPool (acquire/release/close).
+
+    Args:
+        caminho: Caminho do arquivo do banco local.
+        minimo: Conexões abertas na criação.
+        maximo: Máximo de conexões simultâneas; acquire() bloqueia quando todas estão em uso.
+    """
+    def __init__(self, caminho: str, minimo: int = 1, maximo: int = 10):
+        self.caminho = caminho
+        self.max = maximo
+        self._livres = queue.LifoQueue()
+        self._vagas = threading.Semaphore(maximo)
+        for _ in range(min(minimo, maximo)):
+            self._livres.put(ConexaoSQLite(caminho))
+
+    def acquire(self) -> ConexaoSQLite:
+        self._vagas.acquire()
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            try:
+                return ConexaoSQLite(self.caminho)
+            except Exception:
+                self._vagas.release()
+                raise
+
+    def release(self, conn: ConexaoSQLite) -> None:
+        conn.rollback()
+        self._livres.put(conn)
+        self._vagas.release()
+
+    def close(self) -> None:
+        while not self._livres.empty():
+            self._livres.get_nowait().close()
+
+def eh_sqlite(conn) -> bool:
+    """
+    Indica se a conexão é do banco local SQLite (para os poucos comandos que mudam de dialeto).
+    """
+    if isinstance(conn, ConexaoEmprestada):
+        pool = conn.pool.pool if isinstance(conn.pool, PoolInstrumentado) else conn.pool
+        return isinstance(pool, PoolSQLite)
+    if isinstance(conn, ConexaoInstrumentada):
+        conn = conn.conexao
+    return isinstance(conn, ConexaoSQLite)
+
+# ====== INSTRUMENTAÇÃO DE SQL ======
+
+# Comandos acima do limite vão para o log de SQL lento (JSONL); os valores dos binds nunca são gravados
+config_sql_lento = {
+    "limite_ms": float(os.environ.get("MINDSHIFT_SQL_LENTO_MS", "200")),
+    "arquivo": os.environ.get("MINDSHIFT_SQL_LENTO_LOG", "sql_lento.jsonl")
+}
+# Limites superiores (ms) das faixas do histograma de tempo total (execução + busca)
+faixas_histograma_sql = [1, 5, 10, 50, 100, 500, 1000, 5000, float("inf")]
+# Estatísticas por comando desde o início do programa: {nome: {...}}
+estatisticas_sql = {}
+_trava_sql = threading.Lock()
+
+def _nome_comando_sql(sql: str) -> str:
+    """
+    Identifica um comando pela função que o executou, a operação e a tabela principal
+    (ex.: "buscar_metricas:SELECT T_MNDSH_METRICA_DIA").
+    """
+    funcao = "?"
+    quadro = sys._getframe(1)
+    while quadro is not None:
+        if quadro.f_code.co_name not in ("_executar", "execute", "executemany"):
+            funcao = quadro.f_code.co_name
+            break
+        quadro = quadro.f_back
+    operacao = sql.split(None, 1)[0].upper() if sql.strip() else "?"
+    tabela = re.search(r"\b(?:FROM|INTO|UPDATE|MERGE\s+INTO)\s+(\w+)", sql, re.IGNORECASE)
+    return f"{funcao}:{operacao} {tabela.group(1).upper() if tabela else ''}".strip()
+
+def _formato_binds(params) -> str:
+    """
+    Descreve a forma dos binds (nomes e tipos, sem os valores), por exemplo "cpf:str,data:str".
+    """
+    if not params:
+        return ""
+    if isinstance(params, dict):
+        return ",".join(f"{k}:{type(v).__name__}" for k, v in sorted(params.items()))
+    return ",".join(type(v).__name__ for v in params)
+
+def _registrar_sql(registro: dict) -> None:
+    """
+    Soma um comando finalizado às estatísticas e, se passar do limite, grava-o no log de SQL lento.
+    """
+    total_ms = registro["execucao_ms"] + registro["busca_ms"]
+    histograma_observar("mindshift_sql_segundos", "Duração dos comandos SQL (execução + busca).", total_ms / 1000, comando=registro["nome"])
+    faixa = next(i for i, limite in enumerate(faixas_histograma_sql) if total_ms <= limite)
+    with _trava_sql:
+        item = estatisticas_sql.setdefault(registro["nome"], {
+            "execucoes": 0, "linhas": 0, "execucao_ms": 0.0, "busca_ms": 0.0, "max_ms": 0.0,
+            "histograma": [0] * len(faixas_histograma_sql)})
+        item["execucoes"] += 1
+        item["linhas"] += registro["linhas"]
+        item["execucao_ms"] += registro["execucao_ms"]
+        item["busca_ms"] += registro["busca_ms"]
+        item["max_ms"] = max(item["max_ms"], total_ms)
+        item["histograma"][faixa] += 1
+    # Fora da trava: um disco lento não segura os outros comandos; cada linha vai em uma única escrita em modo append
+    if config_sql_lento["arquivo"] and total_ms >= config_sql_lento["limite_ms"]:
+        linha = json.dumps({"data": datetime.now().isoformat(timespec="milliseconds"), **registro}, ensure_ascii=False) + "\n"
+        try:
+            with open(config_sql_lento["arquivo"], "a", encoding="utf-8") as arquivo:
+                arquivo.write(linha)
+        except OSError:
+            pass
+
+class CursorInstrumentado:
+    """
+    Cursor que mede cada comando: tempo de execução, tempo de busca (fetch) e linhas retornadas.
+    O registro é fechado no próximo execute, no close() ou ao esgotar o resultado.
+
+    Args:
+        cursor: O cursor real (oracledb ou banco local).
+    """
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._registro = None
+
+    def _finalizar(self) -> None:
+        if self._registro is not None:
+            registro, self._registro = self._registro, None
+            registro["busca_ms"] = round(registro["busca_ms"], 3)
+            _registrar_sql(registro)
+
+    def _executar(self, metodo, sql: str, params, binds: str):
+        self._finalizar()
+        inicio = time.perf_counter()
+        try:
+            return metodo(sql, params) if params is not None else metodo(sql)
+        finally:
+            self._registro = {
+                "nome": _nome_comando_sql(sql),
+                "binds": binds,
+                "execucao_ms": round((time.perf_counter() - inicio) * 1000, 3),
+                "busca_ms": 0.0,
+                "linhas": 0,
+                "sql": " ".join(sql.split())[:500]
+            }
+
+    def execute(self, sql: str, params=None):
+        self._executar(self._cursor.execute, sql, params, _formato_binds(params))
+        if self._cursor.description is None:
+            self._registro["linhas"] = max(self._cursor.rowcount or 0, 0)
+            self._finalizar()
+        return self
+
+    def executemany(self, sql: str, params) -> None:
+        params = list(params)
+        self._executar(self._cursor.executemany, sql, params, f"{len(params)}x({_formato_binds(params[0]) if params else ''})")
+        self._registro["linhas"] = max(self._cursor.rowcount or 0, 0)
+        self._finalizar()
+
+    def _buscar(self, metodo, *args, esgotou=None):
+        inicio = time.perf_counter()
+        resultado = metodo(*args)
+        if self._registro is not None:
+            self._registro["busca_ms"] += (time.perf_counter() - inicio) * 1000
+            linhas = len(resultado) if isinstance(resultado, list) else int(resultado is not None)
+            self._registro["linhas"] += linhas
+            if esgotou is not None and esgotou(resultado):
+                self._finalizar()
+        return resultado
+
+    def fetchone(self):
+        return self._buscar(self._cursor.fetchone, esgotou=lambda r: r is None)
+
+    def fetchmany(self, quantidade: int | None = None):
+        args = (quantidade,) if quantidade is not None else ()
+        return self._buscar(self._cursor.fetchmany, *args, esgotou=lambda r: not r)
+
+    def fetchall(self):
+        return self._buscar(self._cursor.fetchall, esgotou=lambda r: True)
+
+    def __iter__(self):
+        while True:
+            linha = self.fetchone()
+            if linha is None:
+                return
+            yield linha
+
+    def close(self) -> None:
+        self._finalizar()
+        self._cursor.close()
+
+    def __del__(self):
+        try:
+            self._finalizar()
+        except Exception:
+            pass
+
+    def __getattr__(self, nome):
+        return getattr(self._cursor, nome)
+
+class ConexaoInstrumentada:
+    """
+    Conexão cujos cursores são instrumentados (CursorInstrumentado); o restante é repassado à conexão real.
+
+    Args:
+        conexao: A conexão real (oracledb.Connection ou ConexaoSQLite).
+    """
+    def __init__(self, conexao):
+        self.conexao = conexao
+
+    def cursor(self) -> CursorInstrumentado:
+        return CursorInstrumentado(self.conexao.cursor())
+
+    def __getattr__(self, nome):
+        return getattr(self.conexao, nome)
+
+class PoolInstrumentado:
+    """
+    Pool que entrega conexões instrumentadas (ConexaoInstrumentada) e devolve as reais ao pool original.
+
+    Args:
+        pool: O pool real (oracledb.ConnectionPool ou PoolSQLite).
+    """
+    def __init__(self, pool):
+        self.pool = pool
+
+    def acquire(self) -> ConexaoInstrumentada:
+        return ConexaoInstrumentada(self.pool.acquire())
+
+    def release(self, conn: ConexaoInstrumentada) -> None:
+        self.pool.release(conn.conexao)
+
+    def __getattr__(self, nome):
+        return getattr(self.pool, nome)
+
+def _percentil_histograma(histograma: list[int], fracao: float) -> str:
+    """
+    Retorna o limite superior da faixa do histograma que contém o percentil pedido.
+    """
+    alvo = sum(histograma) * fracao
+    acumulado = 0
+    for limite, quantidade in zip(faixas_histograma_sql, histograma):
+        acumulado += quantidade
+        if acumulado >= alvo and quantidade:
+            return f"≤{limite:g}" if limite != float("inf") else f">{faixas_histograma_sql[-2]:g}"
+    return "-"
+
+def exibir_estatisticas_sql() -> None:
+    """
+    Exibe, por comando SQL, as execuções, linhas, tempos médios e percentis aproximados desde o início do programa.
 
     Dependências:
-        - Funções: limpa_tela, perguntar_continuar, perguntar_continuar2, validar_cpf,
-                   cpf_unico, validar_data, data_datetime, menu_opcoes2, endereco_cep,
-                   parse_salario.
-        - Variáveis: margem.
+        - Funções: imprimir_tabela, limpa_tela, _percentil_histograma.
+        - Variáveis: estatisticas_sql, config_sql_lento, margem.
     """
-    while True:
-        limpa_tela()
-        print("===== CADASTRAR COLABORADOR =====\n")
+    with _trava_sql:
+        itens = sorted(estatisticas_sql.items(), key=lambda item: -(item[1]["execucao_ms"] + item[1]["busca_ms"]))
+        linhas = [[nome, e["execucoes"], e["linhas"],
+                   round((e["execucao_ms"] + e["busca_ms"]), 1),
+                   round(e["execucao_ms"] / e["execucoes"], 2),
+                   round(e["busca_ms"] / e["execucoes"], 2),
+                   _percentil_histograma(e["histograma"], 0.5),
+                   _percentil_histograma(e["histograma"], 0.95),
+                   round(e["max_ms"], 1)] for nome, e in itens]
+    if not linhas:
+        print(f"\n{margem}Nenhum comando SQL executado ainda.\n")
+    else:
+        df = pd.DataFrame(linhas, columns=["Comando", "Execuções", "Linhas", "Total (ms)", "Execução média (ms)",
+                                           "Busca média (ms)", "p50 (ms)", "p95 (ms)", "Máx (ms)"])
+        imprimir_tabela(df, titulo="ESTATÍSTICAS DE SQL", tamanhos_wrap={"Comando": 45})
+        print(f"\n{margem}Comandos acima de {config_sql_lento['limite_ms']:g} ms são gravados em {config_sql_lento['arquivo']}.\n")
+    input("Pressione ENTER para continuar...")
+    limpa_tela()
+
+# ====== CONEXÕES EMPRESTADAS DO POOL ======
+
+# Comandos que abrem uma transação: a conexão fica presa à sessão até o commit/rollback
+_comandos_escrita = ("INSERT", "UPDATE", "DELETE", "MERGE")
+
+class CursorEmprestado:
+    """
+    Cursor de ConexaoEmprestada. O resultado das consultas é lido inteiro para a memória, para que a
+    conexão volte ao pool logo após o execute; fetchone/fetchmany/fetchall leem desse buffer.
+
+    Args:
+        conexao: A ConexaoEmprestada que criou o cursor.
+    """
+    arraysize = 100
+
+    def __init__(self, conexao: "ConexaoEmprestada"):
+        self._conexao = conexao
+        self._linhas = []
+        self._posicao = 0
+        self.description = None
+        self.rowcount = -1
+
+    def _executar(self, metodo: str, sql: str, params, escrita: bool):
+        conn = self._conexao._emprestar(escrita)
         try:
             cursor = conn.cursor()
-            # CPF
-            while True:
-                cpf = input("\nCPF (11 dígitos, somente números): ").strip()
-                if not validar_cpf(cpf):
-                    print(f"\n {margem} CPF inválido! Digite 11 números.\n")
-                    if not perguntar_continuar("informar outro CPF"):
-                        return
-                    continue
-                if not cpf_unico(conn, cpf):
-                    print(f"\n {margem} CPF já cadastrado! Não é possível cadastrar novamente.\n")
-                    if not perguntar_continuar("informar outro CPF"):
-                        return
-                    continue
-                break
-            # NOME
-            while True:
-                nome = input("\nNome: ").strip()
-                if not nome:
-                    print(f"\n {margem} Nome é obrigatório.\n")
-                    if not perguntar_continuar("informar outro nome"):
-                        return
-                    continue
-                if len(nome) < 3:
-                    print(f"\n {margem} O nome deve ter pelo menos 3 caracteres.\n")
-                    if not perguntar_continuar("informar outro nome"):
-                        return
-                    continue
-                break
-            # DATA DE NASCIMENTO
-            while True:
-                data_nasc = input("\nData de nascimento (DD/MM/AAAA): ").strip()
-                if not validar_data(data_nasc):
-                    print(f"\n {margem} Data inválida!\n")
-                    if not perguntar_continuar("informar outra data de nascimento"):
-                        return
-                    continue
-                data_nasc_dt = data_datetime(data_nasc)
-                idade = (datetime.now() - data_nasc_dt).days // 365
-                if idade < 16:
-                    print(f"\n {margem} O colaborador deve ter pelo menos 16 anos!\n")
-                    if not perguntar_continuar("informar outra data de nascimento"):
-                        return
-                    continue              
-                break
-            # SEXO
-            sexo = menu_opcoes2("\nSexo:", ["Masculino", "Feminino"], ["M", "F"])
-            # ENDEREÇO
-            while True:
-                cep = input("\nCEP: ").strip()
-                endereco = endereco_cep(cep)
-                if endereco:
-                    print(f"\n {margem} Endereço encontrado:\n")
-                    print(f"Logradouro: {endereco['logradouro']}")
-                    print(f"Bairro: {endereco['bairro']}")
-                    print(f"Cidade: {endereco['cidade']}")
-                    print(f"Estado: {endereco['estado']}")
-                    break
+            try:
+                if params is not None:
+                    getattr(cursor, metodo)(sql, params)
                 else:
-                    print(f"\n {margem} CEP inválido ou não encontrado.\n")
-                    if not perguntar_continuar("informar outro CEP"):
-                        return
-                    continue
-                break
-            # NÚMERO DA RESIDENCIA
-            while True:
-                numero = input("\nNúmero do endereço: ").strip()
-                if not numero:
-                    print(f"\n {margem} Número é obrigatório.\n")
-                    if not perguntar_continuar("informar outro número"):
-                        return
-                    continue
-                if not numero.isdigit():
-                    print(f"\n {margem} Número inválido! Digite apenas números.\n")
-                    if not perguntar_continuar("informar outro número"):
-                        return
-                    continue
-                break
-            # SALARIO
-            while True:
-                entrada = input("\nSalário: ").strip()
-                salario = parse_salario(entrada)
-                if salario is None:
-                    print(f"\n {margem} Valor inválido para salário!\n")
-                    if not perguntar_continuar("informar outro salário"):
-                        return
-                    continue
-                break
-            # CARGO
-            while True:
-                cargo = input("\nCargo: ").strip()
-                if not cargo:
-                    print(f"\n {margem} Cargo é obrigatório.\n")
-                    if not perguntar_continuar("informar outro cargo"):
-                        return
-                    continue
-                if len(cargo) < 3:
-                    print(f"\n {margem} O cargo deve ter pelo menos 3 caracteres.\n")
-                    if not perguntar_continuar("informar outro cargo"):
-                        return
-                    continue
-                break
-            # DATA DE ADMISSÃO 
-            while True:
-                data_admissao = input("\nData de admissão (DD/MM/AAAA): ").strip()
-                if not validar_data(data_admissao):
-                    print(f"\n {margem} Data de admissão inválida!\n")
-                    if not perguntar_continuar("informar outra data"):
-                        return
-                    continue
-                data_admissao_dt = data_datetime(data_admissao)
-                if data_admissao_dt < data_nasc_dt + timedelta(days=16*365):
-                    print(f"\n {margem} A data de admissão não pode ser antes de o colaborador completar 16 anos!\n")
-                    if not perguntar_continuar("informar outra data"):
-                        return
-                    continue
-                if data_admissao_dt > datetime.now():
-                    print(f"\n {margem} A data de admissão não pode ser futura!\n")
-                    if not perguntar_continuar("informar outra data"):
-                        return
-                    continue
-                break
-            # DATA DE DEMISSÃO - OPCIONAL 
-            while True:
-                data_demissao = input("\nData de demissão (opcional, DD/MM/AAAA, ou pressione ENTER para continuar): ").strip()
-                if not data_demissao:
-                    status = "Ativo"
-                    data_demissao_dt = None
-                    break
-                if not validar_data(data_demissao):
-                    print(f"\n {margem} Data de demissão inválida!\n")
-                    if not perguntar_continuar("informar outra data"):
-                        return
-                    continue
-                data_demissao_dt = data_datetime(data_demissao)
-                if data_demissao_dt < data_admissao_dt:
-                    print(f"\n {margem} A data de demissão não pode ser antes da admissão!\n")
-                    if not perguntar_continuar("informar outra data"):
-                        return
-                    continue
-                if data_demissao_dt > datetime.now():
-                    print(f"\n {margem} A data de demissão não pode ser futura!\n")
-                    if not perguntar_continuar("informar outra data"):
-                        return
-                    continue
-                #STATUS
-                status = "Inativo"
-                break
-            #DATA DE CRIAÇÃO E ÚLTIMA MODIFICAÇÃO
-            dt_criacao = datetime.now()
-            dt_ultima_modificacao = datetime.now()
-            cursor.execute("""
-                INSERT INTO T_MNDSH_COLABORADOR (nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro, ds_cidade, 
-                           ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao)
-                            VALUES (:cpf, :nome, TO_DATE(:nasc, 'DD/MM/YYYY'), :sexo, :cep, :logradouro,:numero, :bairro, :cidade, :estado, :salario, :cargo,
-                     TO_DATE(:admissao, 'DD/MM/YYYY'), TO_DATE(:demissao, 'DD/MM/YYYY'),:status, :criacao,:modificacao)
-            """, 
-            {"cpf": cpf, "nome": nome, "nasc": data_nasc, "sexo": sexo, "cep": cep, "logradouro": endereco['logradouro'],"numero": numero, "bairro": endereco['bairro'], 
-             "cidade": endereco['cidade'], "estado": endereco['estado'], "salario": salario, "cargo": cargo, "admissao": data_admissao, 
-             "demissao": data_demissao if data_demissao else None, "status": status, "criacao": dt_criacao, "modificacao": dt_ultima_modificacao})
-            conn.commit()
-            print(f"\n {margem} Colaborador cadastrado com sucesso!\n")
-        except Exception as e:
-            print(f"\n {margem} Erro ao cadastrar colaborador: {e}\n")
-            conn.rollback()
+                    getattr(cursor, metodo)(sql)
+                self.description = cursor.description
+                self._linhas = list(cursor.fetchall()) if cursor.description else []
+                self._posicao = 0
+                self.rowcount = cursor.rowcount if cursor.description is None else len(self._linhas)
+            finally:
+                cursor.close()
         finally:
-            cursor.close()
-        if not perguntar_continuar2("cadastrar outro colaborador"):
-            break
+            self._conexao._devolver_se_livre()
 
-def listar_colaboradores(conn: oracledb.Connection) -> None:
-    """
-    Apresenta opções para buscar e listar dados de colaboradores do banco.
+    def execute(self, sql: str, params=None):
+        operacao = sql.split(None, 1)[0].upper() if sql.strip() else ""
+        self._executar("execute", sql, params, operacao in _comandos_escrita)
+        return self
 
-    Oferece modos de listagem por ID/CPF, Todos e Pesquisa Genérica.
-    Os resultados são convertidos em um DataFrame e exibidos de forma formatada imprimir_tabela(),
-    com opção de exportação gerar_dataframe().
+    def executemany(self, sql: str, params) -> None:
+        self._executar("executemany", sql, list(params), True)
 
-    Args:
-        conn: O objeto de conexão ativo com o banco de dados Oracle.
+    def fetchone(self):
+        if self._posicao >= len(self._linhas):
+            return None
+        self._posicao += 1
+        return self._linhas[self._posicao - 1]
 
-    Returns:
-        None: A função gerencia a exibição e exportação.
+    def fetchmany(self, quantidade: int | None = None):
+        fim = self._posicao + (quantidade or self.arraysize)
+        linhas, self._posicao = self._linhas[self._posicao:fim], min(fim, len(self._linhas))
+        return linhas
 
-    Dependências:
-        - Funções: limpa_tela, menu_opcoes, buscar_colaborador, perguntar_continuar,
-                   perguntar_continuar2, imprimir_tabela, gerar_dataframe.
-        - Variáveis: margem (para formatação de saída).
-    """
-    while True:
-        cursor = conn.cursor()
-        try:
-            limpa_tela()
-            opcao = menu_opcoes("===== LISTAR COLABORADORES =====\n \nEscolha a forma de pesquisa:", ["ID ou CPF", "Todos", "Pesquisa genérica", "Voltar"], ["ID ou CPF", "TODOS", "GENERICA", "VOLTAR"])
-            dados = []
-            colunas = ['Id','CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado', 
-                       'Salário', 'Cargo', 'Data de admissão', 'Data de demissão','Status', 'Data Criação', 'Data última modificação']
+    def fetchall(self):
+        linhas, self._posicao = self._linhas[self._posicao:], len(self._linhas)
+        return linhas
 
-            if opcao == "ID ou CPF":
-                limpa_tela()
-                colaborador = buscar_colaborador(conn,  titulo_menu="LISTAR COLABORADORES")
-                if colaborador:
-                    dados = [list(colaborador.values())]
-                else:
-                    continue
-            elif opcao == "TODOS":
-                query = """
-                    SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
-                           ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao
-                    FROM T_MNDSH_COLABORADOR
-                    ORDER BY id
-                """
-                cursor.execute(query)
-                dados = cursor.fetchall()
-            elif opcao == "GENERICA":
-                desistencia = False
-                while True:
-                    limpa_tela()
-                    print("===== LISTAR COLABORADORES =====\n")
-                    base = input("\nDigite parte do texto para pesquisa: ").strip()
-                    if not base:
-                        print(f"\n{margem} Digite pelo menos um trecho de texto!\n")
-                        if not perguntar_continuar("tentar novamente"):
-                            desistencia = True
-                            break 
-                        continue
-                    query = """
-                        SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
-                            ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao
-                        FROM T_MNDSH_COLABORADOR
-                        WHERE UPPER(nm_colaborador) LIKE UPPER(:base)
-                        OR UPPER(nr_cpf) LIKE UPPER(:base)
-                        OR TO_CHAR(dt_nascimento, 'DD/MM/YYYY') LIKE :base
-                        OR UPPER(ds_sexo) LIKE UPPER(:base)
-                        OR cep LIKE :base
-                        OR UPPER(ds_logradouro) LIKE UPPER(:base)
-                        OR TO_CHAR(nr_endereco) LIKE :base
-                        OR UPPER(ds_bairro) LIKE UPPER(:base)
-                        OR UPPER(ds_cidade) LIKE UPPER(:base)
-                        OR UPPER(ds_estado) LIKE UPPER(:base)
-                        OR TO_CHAR(vl_salario, '999G999D99') LIKE :base
-                        OR UPPER(ds_cargo) LIKE UPPER(:base)
-                        OR UPPER(ds_status) LIKE UPPER(:base)
-                        OR TO_CHAR(dt_admissao, 'DD/MM/YYYY') LIKE :base
-                        OR TO_CHAR(dt_demissao, 'DD/MM/YYYY') LIKE :base
-                        OR TO_CHAR(dt_criacao, 'DD/MM/YYYY HH24:MI') LIKE :base
-                        OR TO_CHAR(dt_ultima_modificacao, 'DD/MM/YYYY HH24:MI') LIKE :base
-                        ORDER BY nm_colaborador
-                    """
-                    cursor.execute(query, {"base": f"%{base}%"})
-                    dados = cursor.fetchall()
-                    break 
-                if desistencia:
-                    continue
-            elif opcao == "VOLTAR":
-                print(f"\n{margem} Voltando...\n")
-                input("Pressione ENTER para continuar...")
-                limpa_tela()
-                break
-            if dados:
-                limpa_tela()
-                df = pd.DataFrame(dados, columns=colunas)
-                grupos_personalizados = [
-                    ("DADOS PESSOAIS", ['Id', 'CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado']),
-                    ("VÍNCULO EMPREGATÍCIO", ['Id', 'CPF', 'Nome', 'Salário', 'Cargo', 'Data de admissão', 'Data de demissão', 'Status', 'Data Criação', 'Data última modificação']),
-                ]
-                imprimir_tabela(df, 
-                    titulo="LISTA DE COLABORADORES", 
-                    colunas_datas=['Data de nascimento', 'Data de admissão', 'Data de demissão'], 
-                    colunas_datetime=['Data Criação', 'Data última modificação'], 
-                    colunas_moeda=['Salário'],
-                    colunas_exibir=grupos_personalizados)
-                gerar_dataframe(df)
-        except Exception as e:
-            print(f"\n{margem} Erro ao listar colaboradores: {e}\n")
-        finally:
-            cursor.close()
-        if not perguntar_continuar2("realizar outra pesquisa/listagem"):
-            break
+    def __iter__(self):
+        while True:
+            linha = self.fetchone()
+            if linha is None:
+                return
+            yield linha
 
-def atualizar_colaborador(conn: oracledb.Connection) -> None:
-    """
-    Permite ao usuário atualizar um campo específico de um colaborador no banco.
+    def close(self) -> None:
+        self._linhas = []
 
-    Primeiro, busca o colaborador buscar_colaborador(). Em seguida, exibe os dados
-    atuais e apresenta um menu para escolher o campo a ser alterado. Cada campo possui
-    sua própria lógica de validação. Alterações no CEP, Data de Demissão e Status
-    são tratadas separadamente com lógica SQL e atualização do dicionário do colaborador.
+class ConexaoEmprestada:
+    """
+    Conexão lógica de uma sessão que só ocupa uma conexão real do pool enquanto trabalha: consultas pegam e
+    devolvem a conexão a cada execute; um INSERT/UPDATE/DELETE/MERGE a mantém até o commit() ou rollback().
+    Assim, sessões paradas em um input() não contam no limite de sessões do banco.
 
     Args:
-        conn: O objeto de conexão ativo com o banco de dados Oracle.
-
-    Returns:
-        None: A função realiza a ação de atualização.
-
-    Dependências:
-        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes,
-                   menu_opcoes2, perguntar_continuar, perguntar_continuar2, validar_cpf,
-                   cpf_unico, validar_data, data_datetime, endereco_cep, parse_salario.
-        - Variáveis: margem, mapeamento_colunas.
+        pool: Pool retornado por criar_pool().
     """
-    while True:
-        limpa_tela()
+    def __init__(self, pool):
+        self.pool = pool
+        self._conn = None
+        self._em_transacao = False
+
+    def _emprestar(self, escrita: bool):
+        if self._conn is None:
+            with medir_duracao("mindshift_pool_espera_segundos", "Espera por uma conexão livre do pool."):
+                self._conn = self.pool.acquire()
+            medidor_somar("mindshift_pool_conexoes_emprestadas", "Conexões do pool em uso pelas sessões.", 1)
+        self._em_transacao = self._em_transacao or escrita
+        return self._conn
+
+    def _devolver_se_livre(self) -> None:
+        if self._conn is not None and not self._em_transacao:
+            conn, self._conn = self._conn, None
+            self.pool.release(conn)
+            medidor_somar("mindshift_pool_conexoes_emprestadas", "Conexões do pool em uso pelas sessões.", -1)
+
+    def _encerrar_transacao(self, metodo: str) -> None:
         try:
-            colaborador_dicionario = buscar_colaborador(conn, titulo_menu="ATUALIZAR COLABORADOR")
-            if not colaborador_dicionario:
-                return
-            campos = {"Nome": "nm_colaborador", "CPF": "nr_cpf", "Data de nascimento": "dt_nascimento", "Sexo": "ds_sexo", "CEP": "cep", "Número": "nr_endereco", 
-                      "Salário": "vl_salario", "Cargo": "ds_cargo", "Data de admissão": "dt_admissao", "Data de demissão": "dt_demissao"}         
-            while True:
-                limpa_tela()
-                grupos_personalizados = [
-                    ("DADOS PESSOAIS", ['Id', 'CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado']),
-                    ("VÍNCULO EMPREGATÍCIO", ['Id', 'CPF', 'Nome', 'Salário', 'Cargo', 'Data de admissão', 'Data de demissão', 'Status', 'Data Criação', 'Data última modificação']),
-                ]
-                df = pd.DataFrame([colaborador_dicionario.copy()]) 
-                df.rename(columns=mapeamento_colunas, inplace=True)
-                imprimir_tabela(df, 
-                                titulo="DADOS ATUAIS DO COLABORADOR", 
-                                colunas_datas=['Data de nascimento', 'Data de admissão', 'Data de demissão'],
-                                colunas_datetime=['Data Criação', 'Data última modificação'], 
-                                colunas_moeda=['Salário'], 
-                                colunas_exibir=grupos_personalizados)
+            if self._conn is not None:
+                getattr(self._conn, metodo)()
+        finally:
+            self._em_transacao = False
+            self._devolver_se_livre()
 
-                escolha = menu_opcoes("\nQual campo deseja alterar?", list(campos.keys()) + ["Finalizar"], list(campos.keys()) + ["Finalizar"])
+    def cursor(self) -> CursorEmprestado:
+        return CursorEmprestado(self)
 
-                if escolha == "Finalizar":
-                    print(f"\n {margem} Finalizando...\n")
-                    input("\nPressione ENTER para continuar...")
-                    limpa_tela()
-                    break
+    def commit(self) -> None:
+        self._encerrar_transacao("commit")
 
-                campo_sql = campos[escolha]
-                novo_valor = None 
+    def rollback(self) -> None:
+        self._encerrar_transacao("rollback")
 
-                while True: 
-                    # SEXO 
-                    if escolha == "Sexo":
-                        novo_valor = menu_opcoes2("\nInforme o sexo:", ["Masculino", "Feminino"], ["M", "F"])
-                        break
+    def close(self) -> None:
+        self.rollback()
 
-                    entrada = input(f"\nNovo valor para {escolha}: ").strip()
-                    
-                    if not entrada and escolha != "Data de demissão":
+# ====== MÉTRICAS OPERACIONAIS (Prometheus) ======
+
+# Exposição das métricas: servidor HTTP local (GET /metrics) e/ou arquivo reescrito periodicamente
+config_prometheus = {
+    "porta": int(os.environ.get("MINDSHIFT_METRICAS_PORTA", "0")) or None,
+    "host": os.environ.get("MINDSHIFT_METRICAS_HOST", "127.0.0.1"),
+    "arquivo": os.environ.get("MINDSHIFT_METRICAS_ARQUIVO"),
+    "intervalo_segundos": 15
+}
+# Limites (segundos) padrão dos histogramas de duração
+faixas_histograma_segundos = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Registro das métricas: {nome: {"tipo", "ajuda", "series": {rótulos: valor ou [contagens, soma, total]}}}
+_metricas = {}
+_trava_metricas = threading.Lock()
+_exportador_metricas = {"servidor": None, "thread": None}
+_inicio_processo = time.time()
+
+def _serie_metrica(nome: str, tipo: str, ajuda: str, rotulos: dict):
+    item = _metricas.get(nome)
+    if item is None:
+        item = _metricas[nome] = {"tipo": tipo, "ajuda": ajuda, "series": {}}
+    return item["series"], tuple(sorted((k, str(v)) for k, v in rotulos.items()))
+
+def contador_inc(nome: str, ajuda: str, valor: float = 1, **rotulos) -> None:
+    """
+    Incrementa um contador (valor que só cresce, ex.: total de check-ins).
+    """
+    with _trava_metricas:
+        series, chave = _serie_metrica(nome, "counter", ajuda, rotulos)
+        series[chave] = series.get(chave, 0) + valor
+
+def medidor_definir(nome: str, ajuda: str, valor: float, **rotulos) -> None:
+    """
+    Define o valor atual de um medidor (gauge).
+    """
+    with _trava_metricas:
+        series, chave = _serie_metrica(nome, "gauge", ajuda, rotulos)
+        series[chave] = valor
+
+def medidor_somar(nome: str, ajuda: str, valor: float, **rotulos) -> None:
+    """
+    Soma (ou subtrai, com valor negativo) ao valor atual de um medidor.
+    """
+    with _trava_metricas:
+        series, chave = _serie_metrica(nome, "gauge", ajuda, rotulos)
+        series[chave] = series.get(chave, 0) + valor
+
+def histograma_observar(nome: str, ajuda: str, valor: float, **rotulos) -> None:
+    """
+    Registra uma observação (normalmente uma duração em segundos) em um histograma.
+    """
+    with _trava_metricas:
+        series, chave = _serie_metrica(nome, "histogram", ajuda, rotulos)
+        serie = series.get(chave)
+        if serie is None:
+            serie = series[chave] = [[0] * len(faixas_histograma_segundos), 0.0, 0]
+        for i, limite in enumerate(faixas_histograma_segundos):
+            if valor <= limite:
+                serie[0][i] += 1
+                break
+        serie[1] += valor
+        serie[2] += 1
+
+@contextlib.contextmanager
+def medir_duracao(nome: str, ajuda: str, **rotulos):
+    """
+    Mede a duração do bloco 'with' e a registra no histograma informado, mesmo se ocorrer erro.
+    """
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        histograma_observar(nome, ajuda, time.perf_counter() - inicio, **rotulos)
+
+def _formatar_rotulos(chave: tuple, extra: tuple = ()) -> str:
+    pares = [(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in chave + extra]
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pares) + "}" if pares else ""
+
+def _formatar_valor_metrica(valor: float) -> str:
+    """
+    Valor de uma amostra com precisão total: inteiros sem casa decimal e os demais pelo repr do float
+    (o formato :g guarda só 6 dígitos e congela contadores grandes e o instante de início do processo).
+    """
+    valor = float(valor)
+    if valor != valor:
+        return "NaN"
+    if valor in (float("inf"), float("-inf")):
+        return "+Inf" if valor > 0 else "-Inf"
+    return str(int(valor)) if valor.is_integer() else repr(valor)
+
+def texto_prometheus() -> str:
+    """
+    Gera o texto de todas as métricas no formato de exposição do Prometheus (text/plain 0.0.4).
+
+    Returns:
+        str: As métricas, com as linhas # HELP e # TYPE de cada uma.
+    """
+    linhas = []
+    with _trava_metricas:
+        for nome, item in sorted(_metricas.items()):
+            linhas.append(f"# HELP {nome} {item['ajuda']}")
+            linhas.append(f"# TYPE {nome} {item['tipo']}")
+            for chave, valor in sorted(item["series"].items()):
+                if item["tipo"] != "histogram":
+                    linhas.append(f"{nome}{_formatar_rotulos(chave)} {_formatar_valor_metrica(valor)}")
+                    continue
+                contagens, soma, total = valor
+                acumulado = 0
+                for limite, quantidade in zip(faixas_histograma_segundos, contagens):
+                    acumulado += quantidade
+                    linhas.append(f"{nome}_bucket{_formatar_rotulos(chave, (('le', f'{limite:g}'),))} {acumulado}")
+                linhas.append(f"{nome}_bucket{_formatar_rotulos(chave, (('le', '+Inf'),))} {total}")
+                linhas.append(f"{nome}_sum{_formatar_rotulos(chave)} {_formatar_valor_metrica(soma)}")
+                linhas.append(f"{nome}_count{_formatar_rotulos(chave)} {total}")
+    return "\n".join(linhas) + "\n"
+
+def gravar_metricas_arquivo(caminho: str) -> None:
+    """
+    Reescreve o arquivo de métricas de forma atômica (para o textfile collector do node_exporter).
+    """
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write(texto_prometheus())
+    os.replace(temporario, caminho)
+
+def iniciar_exportador_metricas(porta: int | None = None, arquivo: str | None = None) -> None:
+    """
+    Inicia a exposição das métricas em segundo plano: um servidor HTTP local que responde GET /metrics
+    e/ou uma thread que reescreve o arquivo a cada config_prometheus["intervalo_segundos"].
+    Sem porta nem arquivo (nos argumentos ou em config_prometheus), não faz nada.
+
+    Args:
+        porta: Porta do servidor HTTP. Se None, usa config_prometheus["porta"].
+        arquivo: Caminho do arquivo de métricas. Se None, usa config_prometheus["arquivo"].
+    """
+    porta = porta or config_prometheus["porta"]
+    arquivo = arquivo or config_prometheus["arquivo"]
+    medidor_definir("mindshift_inicio_processo_segundos", "Instante (epoch) em que o processo iniciou.", _inicio_processo)
+
+    if porta and _exportador_metricas["servidor"] is None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class _Tratador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                corpo = texto_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, *args):
+                pass
+
+        servidor = ThreadingHTTPServer((config_prometheus["host"], porta), _Tratador)
+        servidor.daemon_threads = True
+        _exportador_metricas["servidor"] = servidor
+        threading.Thread(target=servidor.serve_forever, name="metricas-http", daemon=True).start()
+
+    if arquivo and _exportador_metricas["thread"] is None:
+        def reescrever():
+            while True:
+                try:
+                    gravar_metricas_arquivo(arquivo)
+                except OSError:
+                    pass
+                time.sleep(config_prometheus["intervalo_segundos"])
+        _exportador_metricas["thread"] = threading.Thread(target=reescrever, name="metricas-arquivo", daemon=True)
+        _exportador_metricas["thread"].start()
+
+# ====== API EXTERNA ======
+
+# Configuração do cliente de CEP (a URL pode apontar para um servidor local de testes)
+config_cep = {
+    "url_base": os.environ.get("MINDSHIFT_VIACEP_URL", "https://viacep.com.br/ws"),
+    "timeout_conexao": 3,
+    "timeout_leitura": 5,
+    "tentativas": 3,
+    "backoff_base": 0.2,
+    "backoff_max": 2.0,
+    "tamanho_pool": 10
+}
+# Contadores de latência e falhas do cliente de CEP
+estatisticas_cep = {
+    "requisicoes": 0,
+    "retentativas": 0,
+    "falhas": 0,
+    "tempo_total": 0.0,
+    "tempo_max": 0.0
+}
+_cliente_cep = {"sessao": None, "lock": threading.Lock()}
+
+def _sessao_cep() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada do cliente de CEP, criando-a na primeira chamada.
+    A sessão mantém um pool de conexões keep-alive, evitando um novo handshake TCP/TLS por consulta.
+
+    Returns:
+        requests.Session: A sessão compartilhada.
+    """
+    with _cliente_cep["lock"]:
+        if _cliente_cep["sessao"] is None:
+            sessao = requests.Session()
+            adaptador = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=config_cep["tamanho_pool"], max_retries=0)
+            sessao.mount("http://", adaptador)
+            sessao.mount("https://", adaptador)
+            sessao.headers.update({"Accept": "application/json"})
+            _cliente_cep["sessao"] = sessao
+        return _cliente_cep["sessao"]
+
+def fechar_cliente_cep() -> None:
+    """
+    Fecha a sessão HTTP compartilhada do cliente de CEP (uma nova é criada na próxima consulta).
+    """
+    with _cliente_cep["lock"]:
+        if _cliente_cep["sessao"] is not None:
+            _cliente_cep["sessao"].close()
+            _cliente_cep["sessao"] = None
+
+def _registrar_latencia_cep(inicio: float, falhou: bool) -> None:
+    """
+    Atualiza os contadores do cliente de CEP com o tempo de uma requisição.
+
+    Args:
+        inicio: Instante (time.perf_counter) em que a requisição começou.
+        falhou: True se a requisição terminou em erro.
+    """
+    duracao = time.perf_counter() - inicio
+    histograma_observar("mindshift_viacep_segundos", "Duração das requisições HTTP à API ViaCEP.", duracao,
+                        resultado="erro" if falhou else "ok")
+    with _cliente_cep["lock"]:
+        estatisticas_cep["requisicoes"] += 1
+        estatisticas_cep["tempo_total"] += duracao
+        estatisticas_cep["tempo_max"] = max(estatisticas_cep["tempo_max"], duracao)
+        if falhou:
+            estatisticas_cep["falhas"] += 1
+
+def _consultar_viacep(cep: str) -> dict | None:
+    """
+    Consulta a API ViaCEP para um CEP já normalizado (8 dígitos) usando a sessão compartilhada.
+    Falhas de rede, timeouts e respostas 429/5xx são repetidas até config_cep["tentativas"] vezes,
+    com espera exponencial e jitter entre as tentativas.
+
+    Args:
+        cep: O CEP contendo somente os 8 dígitos.
+
+    Returns:
+        dict: Um dicionário com as chaves "logradouro", "bairro", "cidade" e "estado", se o CEP for encontrado.
+        None: Se a API responder que o CEP não existe.
+
+    Raises:
+        requests.RequestException: Se todas as tentativas falharem (o erro não é gravado no cache).
+    """
+    url = f"{config_cep['url_base']}/{cep}/json/"
+    timeout = (config_cep["timeout_conexao"], config_cep["timeout_leitura"])
+    tentativa = 0
+    while True:
+        tentativa += 1
+        inicio = time.perf_counter()
+        try:
+            response = _sessao_cep().get(url, timeout=timeout)
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError):
+            _registrar_latencia_cep(inicio, True)
+            if tentativa >= config_cep["tentativas"]:
+                raise
+            espera = min(config_cep["backoff_max"], config_cep["backoff_base"] * 2 ** (tentativa - 1))
+            with _cliente_cep["lock"]:
+                estatisticas_cep["retentativas"] += 1
+            contador_inc("mindshift_viacep_retentativas_total", "Retentativas de requisições à API ViaCEP.")
+            time.sleep(random.uniform(0, espera))
+            continue
+        _registrar_latencia_cep(inicio, False)
+        break
+    if response.status_code in (400, 404):
+        return None
+    response.raise_for_status()
+    dados = response.json()
+    if "erro" in dados:
+        return None
+    return {"logradouro": dados["logradouro"], "bairro": dados["bairro"], "cidade": dados["localidade"], "estado": dados["uf"]}
+
+def _resolver_cep(cep: str, aguardar=None, usar_cache: bool = True) -> dict | None:
+    """
+    Resolve um CEP normalizado consultando, nesta ordem, o cache local, o índice offline
+    e a API ViaCEP. Respostas da API (inclusive "não encontrado") são gravadas no cache.
+
+    Args:
+        cep: O CEP contendo somente os 8 dígitos.
+        aguardar: Função opcional chamada antes de cada requisição HTTP (limitador de taxa).
+        usar_cache: Se False, ignora o que está no cache (a resposta obtida ainda é gravada nele).
+
+    Returns:
+        dict: O endereço encontrado.
+        None: Se o CEP não existir.
+
+    Raises:
+        requests.RequestException: Se a API estiver indisponível.
+    """
+    ajuda = "Consultas de CEP por origem da resposta (cache, índice offline ou API)."
+    encontrado_cache, endereco = cache_cep_obter(cep) if usar_cache else (False, None)
+    if encontrado_cache:
+        contador_inc("mindshift_cep_consultas_total", ajuda, origem="cache")
+        return endereco
+    endereco = indice_cep_obter(cep)
+    if endereco:
+        contador_inc("mindshift_cep_consultas_total", ajuda, origem="indice")
+        return endereco
+    contador_inc("mindshift_cep_consultas_total", ajuda, origem="viacep")
+    if aguardar:
+        aguardar()
+    endereco = _consultar_viacep(cep)
+    cache_cep_gravar(cep, endereco)
+    return endereco
+
+def endereco_cep(cep: str) -> dict | None:
+    """
+    Busca dados de endereço (logradouro, bairro, cidade, estado) usando a API ViaCEP.
+    Limpa e valida o CEP fornecido (deve ter 8 dígitos). Consulta primeiro o cache local
+    de CEPs e o índice offline, e só faz a requisição HTTP quando o CEP não está em nenhum deles.
+    Respostas de "CEP não encontrado" também são armazenadas (cache negativo).
+
+    Args:
+        cep: A string contendo o CEP a ser consultado.
+
+    Returns:
+        dict: Um dicionário com as chaves "logradouro", "bairro", "cidade" e "estado", se o CEP for encontrado.
+        None: Se o CEP for inválido, não for encontrado, ou se ocorrer um erro na consulta.
+
+    Dependências:
+        - Funções: normalizar_cep, _resolver_cep.
+    """
+    try:
+        cep = normalizar_cep(cep)
+        if len(cep) != 8 or not cep.isdigit():
+            print(f"\n {margem} CEP inválido. Deve conter 8 números.\n")
+            return None
+        with medir_duracao("mindshift_endereco_cep_segundos", "Duração de endereco_cep() (cache, índice ou API)."):
+            endereco = _resolver_cep(cep)
+        if endereco:
+            return endereco
+        print(f"\n {margem} CEP não encontrado.\n")
+    except requests.RequestException as e:
+        print(f"\n {margem} Serviço de CEP indisponível ({type(e).__name__}): {e}\n")
+    except Exception as e:
+        print(f"\n {margem} Erro ao consultar o CEP: {e}\n")
+    return None
+
+# ====== CACHE DE CEP ======
+
+# Configuração do cache persistente de CEPs (arquivo SQLite local)
+config_cache_cep = {
+    "arquivo": os.environ.get("MINDSHIFT_CACHE_CEP", "cache_cep.db"),
+    "ttl_segundos": 30 * 24 * 3600,
+    "ttl_negativo_segundos": 24 * 3600
+}
+_cache_cep = {"conn": None, "arquivo": None, "lock": threading.Lock()}
+
+def normalizar_cep(cep: str) -> str:
+    """
+    Remove espaços, hífen e ponto de um CEP.
+
+    Args:
+        cep: O CEP com ou sem máscara.
+
+    Returns:
+        str: O CEP somente com os dígitos informados.
+    """
+    return str(cep).strip().replace("-", "").replace(".", "")
+
+def _abrir_cache_cep() -> sqlite3.Connection:
+    """
+    Abre (e cria, se necessário) o arquivo SQLite do cache de CEPs.
+    A conexão é reaproveitada enquanto o caminho configurado não mudar.
+
+    Returns:
+        sqlite3.Connection: Conexão com o arquivo de cache.
+    """
+    if _cache_cep["conn"] is None or _cache_cep["arquivo"] != config_cache_cep["arquivo"]:
+        if _cache_cep["conn"] is not None:
+            _cache_cep["conn"].close()
+        conn_cache = sqlite3.connect(config_cache_cep["arquivo"], check_same_thread=False)
+        conn_cache.execute("""
+            CREATE TABLE IF NOT EXISTS cep_cache (
+                cep          TEXT PRIMARY KEY,
+                encontrado   INTEGER NOT NULL,
+                dados        TEXT,
+                dt_consulta  REAL NOT NULL
+            )
+        """)
+        conn_cache.commit()
+        _cache_cep["conn"] = conn_cache
+        _cache_cep["arquivo"] = config_cache_cep["arquivo"]
+    return _cache_cep["conn"]
+
+def cache_cep_obter(cep: str) -> tuple[bool, dict | None]:
+    """
+    Procura um CEP normalizado no cache local respeitando o TTL de cada tipo de entrada.
+
+    Args:
+        cep: O CEP contendo somente os 8 dígitos.
+
+    Returns:
+        tuple[bool, dict | None]: Uma tupla contendo:
+        1. True se o CEP está no cache e ainda é válido, False caso contrário.
+        2. O endereço armazenado, ou None para CEP não encontrado (cache negativo).
+    """
+    with _cache_cep["lock"]:
+        linha = _abrir_cache_cep().execute(
+            "SELECT encontrado, dados, dt_consulta FROM cep_cache WHERE cep = ?", (cep,)).fetchone()
+    if not linha:
+        return False, None
+    encontrado, dados, dt_consulta = linha
+    ttl = config_cache_cep["ttl_segundos"] if encontrado else config_cache_cep["ttl_negativo_segundos"]
+    if time.time() - dt_consulta > ttl:
+        return False, None
+    return True, json.loads(dados) if encontrado else None
+
+def cache_cep_gravar(cep: str, endereco: dict | None) -> None:
+    """
+    Grava (ou substitui) um CEP no cache local.
+
+    Args:
+        cep: O CEP contendo somente os 8 dígitos.
+        endereco: O endereço retornado pela API, ou None para registrar "CEP não encontrado".
+    """
+    with _cache_cep["lock"]:
+        conn_cache = _abrir_cache_cep()
+        conn_cache.execute(
+            "INSERT OR REPLACE INTO cep_cache (cep, encontrado, dados, dt_consulta) VALUES (?, ?, ?, ?)",
+            (cep, 1 if endereco else 0, json.dumps(endereco, ensure_ascii=False) if endereco else None, time.time()))
+        conn_cache.commit()
+
+def preaquecer_cache_cep(conn: oracledb.Connection) -> int:
+    """
+    Pré-carrega o cache de CEPs com os endereços já gravados em T_MNDSH_COLABORADOR,
+    sem nenhuma chamada à API ViaCEP. Cada CEP recebe o endereço completo do colaborador
+    modificado por último.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        int: Quantidade de CEPs distintos gravados no cache.
+    """
+    cursor = conn.cursor()
+    try:
+        # Um endereço inteiro por CEP (o do colaborador alterado por último), nunca colunas de linhas diferentes
+        cursor.execute("""
+            SELECT cep, ds_logradouro, ds_bairro, ds_cidade, ds_estado
+            FROM (SELECT cep, ds_logradouro, ds_bairro, ds_cidade, ds_estado,
+                         ROW_NUMBER() OVER (PARTITION BY cep
+                                            ORDER BY dt_ultima_modificacao DESC NULLS LAST, id DESC) AS ordem
+                  FROM T_MNDSH_COLABORADOR)
+            WHERE ordem = 1
+        """)
+        linhas = cursor.fetchall()
+    finally:
+        cursor.close()
+    agora = time.time()
+    registros = {}
+    for cep, logradouro, bairro, cidade, estado in linhas:
+        cep = normalizar_cep(cep or "")
+        if len(cep) != 8 or not cep.isdigit():
+            continue
+        endereco = {"logradouro": logradouro, "bairro": bairro, "cidade": cidade, "estado": estado}
+        registros[cep] = (cep, 1, json.dumps(endereco, ensure_ascii=False), agora)
+    with _cache_cep["lock"]:
+        conn_cache = _abrir_cache_cep()
+        conn_cache.executemany(
+            "INSERT OR REPLACE INTO cep_cache (cep, encontrado, dados, dt_consulta) VALUES (?, ?, ?, ?)",
+            list(registros.values()))
+        conn_cache.commit()
+    return len(registros)
+
+# ====== ÍNDICE OFFLINE DE CEP ======
+
+# Formato do arquivo: cabeçalho (assinatura + quantidade), tabela ordenada de entradas
+# (cep, deslocamento, tamanho) de tamanho fixo e, em seguida, os endereços em UTF-8.
+_ASSINATURA_INDICE_CEP = b"MSCEPIX1"
+_CABECALHO_INDICE_CEP = struct.Struct("<8sI4x")
+_ENTRADA_INDICE_CEP = struct.Struct("<III")
+_SEPARADOR_INDICE_CEP = "\x1f"
+
+# O arquivo é conferido (os.stat) a cada verificar_segundos: um índice criado ou regerado depois
+# (gerar_indice_cep.py, mesmo em outro processo) passa a ser usado sem reiniciar o programa
+config_indice_cep = {
+    "arquivo": os.environ.get("MINDSHIFT_INDICE_CEP", "indice_cep.bin"),
+    "verificar_segundos": float(os.environ.get("MINDSHIFT_INDICE_CEP_VERIFICAR", "5"))
+}
+# "estado" é substituído por inteiro (nunca alterado) e lido sem o lock; o lock só serializa a abertura
+_indice_cep = {"estado": None, "lock": threading.Lock()}
+
+def construir_indice_cep(caminho_csv: str, destino: str | None = None) -> int:
+    """
+    Converte um CSV de CEPs no arquivo binário ordenado usado pelo índice offline.
+
+    O CSV deve ter cabeçalho com as colunas "cep", "logradouro", "bairro", "cidade" (ou "localidade")
+    e "estado" (ou "uf"); o separador (vírgula ou ponto e vírgula) é detectado automaticamente, com vírgula
+    quando a primeira linha não permite detectar (ex.: arquivo vazio ou de uma coluna só).
+    CEPs repetidos mantêm a última ocorrência. O arquivo é gravado em um temporário e substituído
+    ao final, para não corromper um índice em uso; o mapeamento aberto do índice anterior não é fechado,
+    porque consultas em andamento ainda podem usá-lo.
+
+    Args:
+        caminho_csv: Caminho do arquivo CSV de origem.
+        destino: Caminho do índice gerado. Padrão é config_indice_cep["arquivo"].
+
+    Returns:
+        int: Quantidade de CEPs gravados no índice.
+    """
+    destino = destino or config_indice_cep["arquivo"]
+    registros = {}
+    with open(caminho_csv, encoding="utf-8-sig", newline="") as arquivo:
+        amostra = arquivo.readline()
+        arquivo.seek(0)
+        try:
+            dialeto = csv.Sniffer().sniff(amostra, delimiters=",;")
+        except csv.Error:
+            dialeto = csv.excel
+        for linha in csv.DictReader(arquivo, dialect=dialeto):
+            linha = {(k or "").strip().lower(): (v or "").strip() for k, v in linha.items()}
+            cep = normalizar_cep(linha.get("cep", ""))
+            if len(cep) != 8 or not cep.isdigit():
+                continue
+            campos = [linha.get("logradouro", ""), linha.get("bairro", ""),
+                      linha.get("cidade") or linha.get("localidade", ""), linha.get("estado") or linha.get("uf", "")]
+            registros[int(cep)] = _SEPARADOR_INDICE_CEP.join(c.replace(_SEPARADOR_INDICE_CEP, " ") for c in campos).encode("utf-8")
+
+    ceps = sorted(registros)
+    temporario = destino + ".tmp"
+    with open(temporario, "wb") as saida:
+        saida.write(_CABECALHO_INDICE_CEP.pack(_ASSINATURA_INDICE_CEP, len(ceps)))
+        deslocamento = 0
+        for cep in ceps:
+            saida.write(_ENTRADA_INDICE_CEP.pack(cep, deslocamento, len(registros[cep])))
+            deslocamento += len(registros[cep])
+        for cep in ceps:
+            saida.write(registros[cep])
+    with _indice_cep["lock"]:
+        os.replace(temporario, destino)
+        # O mapeamento anterior não é fechado: consultas em andamento ainda podem usá-lo (ele é liberado
+        # com a última referência); a próxima consulta mapeia o arquivo novo
+        _indice_cep["estado"] = None
+    return len(ceps)
+
+def _identificar_arquivo_indice(caminho: str) -> tuple | None:
+    """
+    Retorna (inode, tamanho, modificação) do arquivo do índice, ou None se ele não existir.
+    """
+    try:
+        info = os.stat(caminho)
+    except OSError:
+        return None
+    return info.st_ino, info.st_size, info.st_mtime_ns
+
+def _mapear_indice_cep(caminho: str, identificacao: tuple | None) -> tuple[mmap.mmap | None, int]:
+    """
+    Mapeia em memória (somente leitura) o arquivo do índice offline e lê a quantidade de CEPs do cabeçalho.
+
+    Returns:
+        tuple[mmap.mmap | None, int]: O mapeamento e a quantidade; (None, 0) se o arquivo não existir
+        ou não for um índice válido.
+    """
+    if identificacao is None or identificacao[1] < _CABECALHO_INDICE_CEP.size:
+        return None, 0
+    try:
+        with open(caminho, "rb") as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None, 0
+    assinatura, quantidade = _CABECALHO_INDICE_CEP.unpack_from(mapa, 0)
+    if assinatura != _ASSINATURA_INDICE_CEP:
+        mapa.close()
+        return None, 0
+    return mapa, quantidade
+
+def _abrir_indice_cep() -> tuple[mmap.mmap | None, int]:
+    """
+    Retorna o mapeamento do índice offline e a quantidade de CEPs, reaproveitando o mapeamento aberto.
+    Passados config_indice_cep["verificar_segundos"], o arquivo é conferido de novo: se apareceu, mudou
+    ou sumiu, o mapeamento é trocado. Só a conferência e a troca acontecem sob o lock; o mapeamento
+    anterior não é fechado na troca, porque uma leitura em andamento ainda pode usá-lo (ele é liberado
+    quando a última referência deixa de existir).
+
+    Returns:
+        tuple[mmap.mmap | None, int]: O arquivo mapeado e a quantidade de CEPs; (None, 0) se o arquivo
+        não existir ou não for um índice válido.
+    """
+    caminho = config_indice_cep["arquivo"]
+    estado = _indice_cep["estado"]
+    if (estado is not None and estado["arquivo"] == caminho
+            and time.monotonic() - estado["verificado"] < config_indice_cep["verificar_segundos"]):
+        return estado["mmap"], estado["quantidade"]
+    with _indice_cep["lock"]:
+        agora = time.monotonic()
+        estado = _indice_cep["estado"]
+        if (estado is not None and estado["arquivo"] == caminho
+                and agora - estado["verificado"] < config_indice_cep["verificar_segundos"]):
+            return estado["mmap"], estado["quantidade"]
+        identificacao = _identificar_arquivo_indice(caminho) if caminho else None
+        if estado is not None and estado["arquivo"] == caminho and estado["identificacao"] == identificacao:
+            novo = {**estado, "verificado": agora}
+        else:
+            mapa, quantidade = _mapear_indice_cep(caminho, identificacao)
+            novo = {"arquivo": caminho, "identificacao": identificacao, "mmap": mapa, "quantidade": quantidade, "verificado": agora}
+        _indice_cep["estado"] = novo
+    return novo["mmap"], novo["quantidade"]
+
+def fechar_indice_cep() -> None:
+    """
+    Libera o mapeamento do índice offline (ele é reaberto na próxima consulta).
+    """
+    estado, _indice_cep["estado"] = _indice_cep["estado"], None
+    if estado is not None and estado["mmap"] is not None:
+        estado["mmap"].close()
+
+def indice_cep_obter(cep: str) -> dict | None:
+    """
+    Procura um CEP normalizado no índice offline com busca binária (O(log n)).
+    A leitura não usa lock: o mapeamento é somente leitura e cada consulta usa o que estava aberto
+    quando começou.
+
+    Args:
+        cep: O CEP contendo somente os 8 dígitos.
+
+    Returns:
+        dict: O endereço com as chaves "logradouro", "bairro", "cidade" e "estado".
+        None: Se o índice não existir ou não contiver o CEP.
+    """
+    mapa, quantidade = _abrir_indice_cep()
+    if mapa is None:
+        return None
+    inicio_dados = _CABECALHO_INDICE_CEP.size + quantidade * _ENTRADA_INDICE_CEP.size
+    alvo = int(cep)
+    baixo, alto = 0, quantidade - 1
+    try:
+        while baixo <= alto:
+            meio = (baixo + alto) // 2
+            valor, deslocamento, tamanho = _ENTRADA_INDICE_CEP.unpack_from(mapa, _CABECALHO_INDICE_CEP.size + meio * _ENTRADA_INDICE_CEP.size)
+            if valor < alvo:
+                baixo = meio + 1
+            elif valor > alvo:
+                alto = meio - 1
+            else:
+                dados = mapa[inicio_dados + deslocamento:inicio_dados + deslocamento + tamanho].decode("utf-8")
+                logradouro, bairro, cidade, estado = dados.split(_SEPARADOR_INDICE_CEP)
+                return {"logradouro": logradouro, "bairro": bairro, "cidade": cidade, "estado": estado}
+    except ValueError:
+        # Mapeamento fechado por fechar_indice_cep() durante a leitura: a consulta segue para a API
+        return None
+    return None
+
+# ====== ENRIQUECIMENTO DE CEP EM LOTE ======
+
+def _criar_limitador_taxa(por_segundo: float):
+    """
+    Cria um limitador de taxa compartilhado entre threads (intervalo mínimo entre chamadas).
+
+    Args:
+        por_segundo: Número máximo de chamadas por segundo. Zero ou negativo desativa o limite.
+
+    Returns:
+        function: Função sem argumentos que bloqueia até a próxima chamada ser permitida.
+    """
+    intervalo = 1 / por_segundo if por_segundo > 0 else 0
+    estado = {"proxima": time.monotonic()}
+    lock = threading.Lock()
+
+    def aguardar():
+        if not intervalo:
+            return
+        with lock:
+            agora = time.monotonic()
+            horario = max(agora, estado["proxima"])
+            estado["proxima"] = horario + intervalo
+        if horario > agora:
+            time.sleep(horario - agora)
+    return aguardar
+
+def _ler_ceps_arquivo(caminho: str) -> set[str]:
+    """
+    Lê os CEPs de um arquivo de importação: CSV com coluna "cep" ou um CEP por linha.
+    O separador (vírgula ou ponto e vírgula) é detectado automaticamente e campos entre aspas
+    podem conter o separador.
+
+    Args:
+        caminho: Caminho do arquivo.
+
+    Returns:
+        set[str]: Os CEPs normalizados (8 dígitos) encontrados no arquivo.
+    """
+    with open(caminho, encoding="utf-8-sig", newline="") as arquivo:
+        amostra = arquivo.readline()
+        arquivo.seek(0)
+        try:
+            dialeto = csv.Sniffer().sniff(amostra, delimiters=",;")
+        except csv.Error:
+            dialeto = csv.excel
+        linhas = [linha for linha in csv.reader(arquivo, dialect=dialeto) if any(campo.strip() for campo in linha)]
+    cabecalho = [campo.strip().lower() for campo in linhas[0]] if linhas else []
+    if "cep" in cabecalho:
+        indice = cabecalho.index("cep")
+        valores = [linha[indice] for linha in linhas[1:] if len(linha) > indice]
+    else:
+        valores = [linha[0] for linha in linhas]
+    ceps = {normalizar_cep(cep) for cep in valores}
+    return {cep for cep in ceps if len(cep) == 8 and cep.isdigit()}
+
+def enriquecer_ceps_em_lote(conn: oracledb.Connection, arquivo: str | None = None, max_threads: int = 8, limite_por_segundo: float = 10.0, tamanho_lote: int = 500, usar_cache: bool = False) -> dict:
+    """
+    Resolve os CEPs distintos de T_MNDSH_COLABORADOR de forma concorrente e grava logradouro,
+    bairro, cidade e estado de volta na tabela com UPDATEs em lote (executemany).
+
+    Cada CEP é consultado uma única vez, no índice offline e depois na API ViaCEP, respeitando o
+    limite de requisições por segundo. O cache local só é lido com usar_cache: ele pode ter sido
+    pré-carregado (preaquecer_cache_cep) com os próprios endereços do banco que a correção quer
+    substituir; as respostas da API sempre atualizam o cache. Se um arquivo de importação for
+    informado, apenas os colaboradores cujos CEPs estão no arquivo são atualizados, e os CEPs do
+    arquivo sem colaborador no banco são informados no resumo.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        arquivo: Arquivo opcional de CEPs (CSV com coluna "cep" ou um CEP por linha).
+        max_threads: Quantidade de consultas simultâneas.
+        limite_por_segundo: Máximo de requisições HTTP por segundo.
+        tamanho_lote: Quantidade de UPDATEs por executemany/commit.
+        usar_cache: Se True, aproveita as respostas válidas do cache local.
+
+    Returns:
+        dict: Resumo com total de CEPs, resolvidos, não encontrados, erros, linhas atualizadas, CEPs do
+        arquivo fora do banco e duração.
+
+    Dependências:
+        - Funções: normalizar_cep, _resolver_cep, _criar_limitador_taxa, _ler_ceps_arquivo.
+    """
+    inicio = time.perf_counter()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT DISTINCT cep FROM T_MNDSH_COLABORADOR")
+        ceps_banco = [linha[0] for linha in cursor.fetchall() if linha[0]]
+    finally:
+        cursor.close()
+
+    filtro = _ler_ceps_arquivo(arquivo) if arquivo else None
+    originais_por_cep = {}
+    for cep_original in ceps_banco:
+        cep = normalizar_cep(cep_original)
+        if len(cep) != 8 or not cep.isdigit() or (filtro is not None and cep not in filtro):
+            continue
+        originais_por_cep.setdefault(cep, []).append(cep_original)
+
+    aguardar = _criar_limitador_taxa(limite_por_segundo)
+
+    resumo = {"ceps": len(originais_por_cep), "resolvidos": 0, "nao_encontrados": 0, "erros": 0, "linhas_atualizadas": 0}
+    if filtro is not None:
+        resumo["ceps_fora_do_banco"] = sorted(filtro - set(originais_por_cep))
+    atualizacoes = []
+    with futuros_concorrentes.ThreadPoolExecutor(max_workers=max(1, max_threads)) as executor:
+        futuros = {executor.submit(_resolver_cep, cep, aguardar, usar_cache): cep for cep in originais_por_cep}
+        for futuro in futuros_concorrentes.as_completed(futuros):
+            cep = futuros[futuro]
+            try:
+                endereco = futuro.result()
+            except Exception:
+                resumo["erros"] += 1
+                continue
+            if not endereco:
+                resumo["nao_encontrados"] += 1
+                continue
+            resumo["resolvidos"] += 1
+            for cep_original in originais_por_cep[cep]:
+                atualizacoes.append({"cep": cep_original, "logradouro": endereco["logradouro"], "bairro": endereco["bairro"],
+                                     "cidade": endereco["cidade"], "estado": endereco["estado"]})
+
+    cursor = conn.cursor()
+    try:
+        for i in range(0, len(atualizacoes), tamanho_lote):
+            lote = atualizacoes[i:i + tamanho_lote]
+            cursor.executemany("""
+                UPDATE T_MNDSH_COLABORADOR
+                SET ds_logradouro = :logradouro, ds_bairro = :bairro, ds_cidade = :cidade,
+                    ds_estado = :estado, dt_ultima_modificacao = SYSDATE
+                WHERE cep = :cep
+            """, lote)
+            conn.commit()
+            resumo["linhas_atualizadas"] += cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    resumo["segundos"] = round(time.perf_counter() - inicio, 3)
+    return resumo
+
+def menu_enriquecer_ceps(conn: oracledb.Connection) -> None:
+    """
+    Ação do menu de manutenção que executa o enriquecimento de CEPs em lote.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+    """
+    print("===== ENRIQUECER ENDEREÇOS EM LOTE =====\n")
+    arquivo = input("Arquivo de CEPs (opcional, ENTER para usar todos os colaboradores): ").strip() or None
+    if arquivo and not os.path.exists(arquivo):
+        print(f"\n {margem} Arquivo não encontrado.\n")
+    else:
+        try:
+            resumo = enriquecer_ceps_em_lote(conn, arquivo)
+            print(f"\n {margem} CEPs distintos: {resumo['ceps']} | Resolvidos: {resumo['resolvidos']} | "
+                  f"Não encontrados: {resumo['nao_encontrados']} | Erros: {resumo['erros']}")
+            print(f" {margem} Linhas atualizadas: {resumo['linhas_atualizadas']} em {resumo['segundos']:.1f}s\n")
+            if resumo.get("ceps_fora_do_banco"):
+                print(f" {margem} CEPs do arquivo sem colaborador no banco ({len(resumo['ceps_fora_do_banco'])}): "
+                      f"{', '.join(resumo['ceps_fora_do_banco'][:20])}{' ...' if len(resumo['ceps_fora_do_banco']) > 20 else ''}\n")
+        except Exception as e:
+            print(f"\n {margem} Erro ao enriquecer endereços: {e}\n")
+    input("Pressione ENTER para continuar...")
+    limpa_tela()
+
+def exibir_estatisticas_cep() -> None:
+    """
+    Exibe os contadores de latência e falhas do cliente de CEP desde o início do programa.
+    """
+    requisicoes = estatisticas_cep["requisicoes"]
+    media = estatisticas_cep["tempo_total"] / requisicoes if requisicoes else 0
+    print("\n===== ESTATÍSTICAS DO CLIENTE DE CEP =====\n")
+    print(f"{margem}Requisições HTTP: {requisicoes}")
+    print(f"{margem}Retentativas: {estatisticas_cep['retentativas']}")
+    print(f"{margem}Falhas: {estatisticas_cep['falhas']}")
+    print(f"{margem}Latência média: {media * 1000:.1f} ms")
+    print(f"{margem}Latência máxima: {estatisticas_cep['tempo_max'] * 1000:.1f} ms\n")
+    input("Pressione ENTER para continuar...")
+    limpa_tela()
+
+def menu_preaquecer_cache_cep(conn: oracledb.Connection) -> None:
+    """
+    Ação do menu de manutenção que pré-carrega o cache de CEPs e informa o resultado.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+    """
+    try:
+        qtd = preaquecer_cache_cep(conn)
+        print(f"\n {margem} Cache de CEP pré-carregado com {qtd} CEP(s).\n")
+    except Exception as e:
+        print(f"\n {margem} Erro ao pré-carregar cache de CEP: {e}\n")
+    input("Pressione ENTER para continuar...")
+    limpa_tela()
+
+# ====== CRUD CADASTRO ======
+
+def cadastrar_colaborador(conn: oracledb.Connection) -> None:
+    """
+    Solicita, valida e insere os dados de um novo colaborador na tabela T_MNDSH_COLABORADOR usando INSERT e trata exceções de conexão.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função realiza a ação de inserção.
+
+    Dependências:
+        - Funções: limpa_tela, perguntar_continuar, perguntar_continuar2, validar_cpf,
+                   cpf_unico, validar_data, data_datetime, menu_opcoes2, endereco_cep,
+                   parse_salario.
+        - Variáveis: margem.
+    """
+    while True:
+        limpa_tela()
+        print("===== CADASTRAR COLABORADOR =====\n")
+        try:
+            cursor = conn.cursor()
+            # CPF
+            while True:
+                cpf = input("\nCPF (11 dígitos, somente números): ").strip()
+                if not validar_cpf(cpf):
+                    print(f"\n {margem} CPF inválido! Digite 11 números.\n")
+                    if not perguntar_continuar("informar outro CPF"):
+                        return
+                    continue
+                if not cpf_unico(conn, cpf):
+                    print(f"\n {margem} CPF já cadastrado! Não é possível cadastrar novamente.\n")
+                    if not perguntar_continuar("informar outro CPF"):
+                        return
+                    continue
+                break
+            # NOME
+            while True:
+                nome = input("\nNome: ").strip()
+                if not nome:
+                    print(f"\n {margem} Nome é obrigatório.\n")
+                    if not perguntar_continuar("informar outro nome"):
+                        return
+                    continue
+                if len(nome) < 3:
+                    print(f"\n {margem} O nome deve ter pelo menos 3 caracteres.\n")
+                    if not perguntar_continuar("informar outro nome"):
+                        return
+                    continue
+                break
+            # DATA DE NASCIMENTO
+            while True:
+                data_nasc = input("\nData de nascimento (DD/MM/AAAA): ").strip()
+                if not validar_data(data_nasc):
+                    print(f"\n {margem} Data inválida!\n")
+                    if not perguntar_continuar("informar outra data de nascimento"):
+                        return
+                    continue
+                data_nasc_dt = data_datetime(data_nasc)
+                idade = (datetime.now() - data_nasc_dt).days // 365
+                if idade < 16:
+                    print(f"\n {margem} O colaborador deve ter pelo menos 16 anos!\n")
+                    if not perguntar_continuar("informar outra data de nascimento"):
+                        return
+                    continue              
+                break
+            # SEXO
+            sexo = menu_opcoes2("\nSexo:", ["Masculino", "Feminino"], ["M", "F"])
+            # ENDEREÇO
+            while True:
+                cep = input("\nCEP: ").strip()
+                endereco = endereco_cep(cep)
+                if endereco:
+                    print(f"\n {margem} Endereço encontrado:\n")
+                    print(f"Logradouro: {endereco['logradouro']}")
+                    print(f"Bairro: {endereco['bairro']}")
+                    print(f"Cidade: {endereco['cidade']}")
+                    print(f"Estado: {endereco['estado']}")
+                    break
+                else:
+                    print(f"\n {margem} CEP inválido ou não encontrado.\n")
+                    if not perguntar_continuar("informar outro CEP"):
+                        return
+                    continue
+                break
+            # NÚMERO DA RESIDENCIA
+            while True:
+                numero = input("\nNúmero do endereço: ").strip()
+                if not numero:
+                    print(f"\n {margem} Número é obrigatório.\n")
+                    if not perguntar_continuar("informar outro número"):
+                        return
+                    continue
+                if not numero.isdigit():
+                    print(f"\n {margem} Número inválido! Digite apenas números.\n")
+                    if not perguntar_continuar("informar outro número"):
+                        return
+                    continue
+                break
+            # SALARIO
+            while True:
+                entrada = input("\nSalário: ").strip()
+                salario = parse_salario(entrada)
+                if salario is None:
+                    print(f"\n {margem} Valor inválido para salário!\n")
+                    if not perguntar_continuar("informar outro salário"):
+                        return
+                    continue
+                break
+            # CARGO
+            while True:
+                cargo = input("\nCargo: ").strip()
+                if not cargo:
+                    print(f"\n {margem} Cargo é obrigatório.\n")
+                    if not perguntar_continuar("informar outro cargo"):
+                        return
+                    continue
+                if len(cargo) < 3:
+                    print(f"\n {margem} O cargo deve ter pelo menos 3 caracteres.\n")
+                    if not perguntar_continuar("informar outro cargo"):
+                        return
+                    continue
+                break
+            # DATA DE ADMISSÃO 
+            while True:
+                data_admissao = input("\nData de admissão (DD/MM/AAAA): ").strip()
+                if not validar_data(data_admissao):
+                    print(f"\n {margem} Data de admissão inválida!\n")
+                    if not perguntar_continuar("informar outra data"):
+                        return
+                    continue
+                data_admissao_dt = data_datetime(data_admissao)
+                if data_admissao_dt < data_nasc_dt + timedelta(days=16*365):
+                    print(f"\n {margem} A data de admissão não pode ser antes de o colaborador completar 16 anos!\n")
+                    if not perguntar_continuar("informar outra data"):
+                        return
+                    continue
+                if data_admissao_dt > datetime.now():
+                    print(f"\n {margem} A data de admissão não pode ser futura!\n")
+                    if not perguntar_continuar("informar outra data"):
+                        return
+                    continue
+                break
+            # DATA DE DEMISSÃO - OPCIONAL 
+            while True:
+                data_demissao = input("\nData de demissão (opcional, DD/MM/AAAA, ou pressione ENTER para continuar): ").strip()
+                if not data_demissao:
+                    status = "Ativo"
+                    data_demissao_dt = None
+                    break
+                if not validar_data(data_demissao):
+                    print(f"\n {margem} Data de demissão inválida!\n")
+                    if not perguntar_continuar("informar outra data"):
+                        return
+                    continue
+                data_demissao_dt = data_datetime(data_demissao)
+                if data_demissao_dt < data_admissao_dt:
+                    print(f"\n {margem} A data de demissão não pode ser antes da admissão!\n")
+                    if not perguntar_continuar("informar outra data"):
+                        return
+                    continue
+                if data_demissao_dt > datetime.now():
+                    print(f"\n {margem} A data de demissão não pode ser futura!\n")
+                    if not perguntar_continuar("informar outra data"):
+                        return
+                    continue
+                #STATUS
+                status = "Inativo"
+                break
+            #DATA DE CRIAÇÃO E ÚLTIMA MODIFICAÇÃO
+            dt_criacao = datetime.now()
+            dt_ultima_modificacao = datetime.now()
+            cursor.execute("""
+                INSERT INTO T_MNDSH_COLABORADOR (nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro, ds_cidade, 
+                           ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao)
+                            VALUES (:cpf, :nome, TO_DATE(:nasc, 'DD/MM/YYYY'), :sexo, :cep, :logradouro,:numero, :bairro, :cidade, :estado, :salario, :cargo,
+                     TO_DATE(:admissao, 'DD/MM/YYYY'), TO_DATE(:demissao, 'DD/MM/YYYY'),:status, :criacao,:modificacao)
+            """, 
+            {"cpf": cpf, "nome": nome, "nasc": data_nasc, "sexo": sexo, "cep": cep, "logradouro": endereco['logradouro'],"numero": numero, "bairro": endereco['bairro'], 
+             "cidade": endereco['cidade'], "estado": endereco['estado'], "salario": salario, "cargo": cargo, "admissao": data_admissao, 
+             "demissao": data_demissao if data_demissao else None, "status": status, "criacao": dt_criacao, "modificacao": dt_ultima_modificacao})
+            conn.commit()
+            print(f"\n {margem} Colaborador cadastrado com sucesso!\n")
+        except Exception as e:
+            print(f"\n {margem} Erro ao cadastrar colaborador: {e}\n")
+            conn.rollback()
+        finally:
+            cursor.close()
+        if not perguntar_continuar2("cadastrar outro colaborador"):
+            break
+
+def listar_colaboradores(conn: oracledb.Connection) -> None:
+    """
+    Apresenta opções para buscar e listar dados de colaboradores do banco.
+
+    Oferece modos de listagem por ID/CPF, Todos e Pesquisa Genérica.
+    Os resultados são convertidos em um DataFrame e exibidos de forma formatada imprimir_tabela(),
+    com opção de exportação gerar_dataframe().
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função gerencia a exibição e exportação.
+
+    Dependências:
+        - Funções: limpa_tela, menu_opcoes, buscar_colaborador, perguntar_continuar,
+                   perguntar_continuar2, imprimir_tabela, gerar_dataframe.
+        - Variáveis: margem (para formatação de saída).
+    """
+    while True:
+        cursor = conn.cursor()
+        try:
+            limpa_tela()
+            opcao = menu_opcoes("===== LISTAR COLABORADORES =====\n \nEscolha a forma de pesquisa:", ["ID ou CPF", "Todos", "Pesquisa genérica", "Voltar"], ["ID ou CPF", "TODOS", "GENERICA", "VOLTAR"])
+            dados = []
+            colunas = ['Id','CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado', 
+                       'Salário', 'Cargo', 'Data de admissão', 'Data de demissão','Status', 'Data Criação', 'Data última modificação']
+
+            if opcao == "ID ou CPF":
+                limpa_tela()
+                colaborador = buscar_colaborador(conn,  titulo_menu="LISTAR COLABORADORES")
+                if colaborador:
+                    dados = [list(colaborador.values())]
+                else:
+                    continue
+            elif opcao == "TODOS":
+                cursor.execute("""
+                    SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
+                           ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao
+                    FROM T_MNDSH_COLABORADOR
+                    WHERE dt_exclusao IS NULL
+                    ORDER BY id
+                """)
+                dados = cursor.fetchall()
+            elif opcao == "GENERICA":
+                desistencia = False
+                while True:
+                    limpa_tela()
+                    print("===== LISTAR COLABORADORES =====\n")
+                    base = input("\nDigite parte do texto para pesquisa: ").strip()
+                    if not base:
+                        print(f"\n{margem} Digite pelo menos um trecho de texto!\n")
+                        if not perguntar_continuar("tentar novamente"):
+                            desistencia = True
+                            break 
+                        continue
+                    cursor.execute("""
+                        SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
+                            ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao
+                        FROM T_MNDSH_COLABORADOR
+                        WHERE dt_exclusao IS NULL
+                        AND (UPPER(nm_colaborador) LIKE UPPER(:base)
+                        OR UPPER(nr_cpf) LIKE UPPER(:base)
+                        OR TO_CHAR(dt_nascimento, 'DD/MM/YYYY') LIKE :base
+                        OR UPPER(ds_sexo) LIKE UPPER(:base)
+                        OR cep LIKE :base
+                        OR UPPER(ds_logradouro) LIKE UPPER(:base)
+                        OR TO_CHAR(nr_endereco) LIKE :base
+                        OR UPPER(ds_bairro) LIKE UPPER(:base)
+                        OR UPPER(ds_cidade) LIKE UPPER(:base)
+                        OR UPPER(ds_estado) LIKE UPPER(:base)
+                        OR TO_CHAR(vl_salario, '999G999D99') LIKE :base
+                        OR UPPER(ds_cargo) LIKE UPPER(:base)
+                        OR UPPER(ds_status) LIKE UPPER(:base)
+                        OR TO_CHAR(dt_admissao, 'DD/MM/YYYY') LIKE :base
+                        OR TO_CHAR(dt_demissao, 'DD/MM/YYYY') LIKE :base
+                        OR TO_CHAR(dt_criacao, 'DD/MM/YYYY HH24:MI') LIKE :base
+                        OR TO_CHAR(dt_ultima_modificacao, 'DD/MM/YYYY HH24:MI') LIKE :base)
+                        ORDER BY nm_colaborador
+                    """, {"base": f"%{base}%"})
+                    dados = cursor.fetchall()
+                    break 
+                if desistencia:
+                    continue
+            elif opcao == "VOLTAR":
+                print(f"\n{margem} Voltando...\n")
+                input("Pressione ENTER para continuar...")
+                limpa_tela()
+                break
+            if dados:
+                limpa_tela()
+                df = pd.DataFrame(dados, columns=colunas)
+                grupos_personalizados = [
+                    ("DADOS PESSOAIS", ['Id', 'CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado']),
+                    ("VÍNCULO EMPREGATÍCIO", ['Id', 'CPF', 'Nome', 'Salário', 'Cargo', 'Data de admissão', 'Data de demissão', 'Status', 'Data Criação', 'Data última modificação']),
+                ]
+                imprimir_tabela(df, 
+                    titulo="LISTA DE COLABORADORES", 
+                    colunas_datas=['Data de nascimento', 'Data de admissão', 'Data de demissão'], 
+                    colunas_datetime=['Data Criação', 'Data última modificação'], 
+                    colunas_moeda=['Salário'],
+                    colunas_exibir=grupos_personalizados)
+                gerar_dataframe(df)
+        except Exception as e:
+            print(f"\n{margem} Erro ao listar colaboradores: {e}\n")
+        finally:
+            cursor.close()
+        if not perguntar_continuar2("realizar outra pesquisa/listagem"):
+            break
+
+def atualizar_campo_colaborador(conn: oracledb.Connection, id_colaborador: int, campo_sql: str, valor) -> None:
+    """
+    Atualiza uma coluna do colaborador e a data da última modificação (sem commit).
+    Colunas de data (dt_*) recebem o valor no formato DD/MM/AAAA.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        id_colaborador: Id do colaborador.
+        campo_sql: Nome da coluna, vindo da lista fixa de campos editáveis (nunca da entrada do usuário).
+        valor: Novo valor da coluna.
+    """
+    cursor = conn.cursor()
+    try:
+        if campo_sql.startswith("dt_"):
+            cursor.execute(f"""
+                UPDATE T_MNDSH_COLABORADOR
+                SET {campo_sql} = TO_DATE(:valor, 'DD/MM/YYYY'),
+                    dt_ultima_modificacao = SYSDATE
+                WHERE id = :id
+            """, {"valor": valor, "id": id_colaborador})
+        else:
+            cursor.execute(f"""
+                UPDATE T_MNDSH_COLABORADOR
+                SET {campo_sql} = :valor,
+                    dt_ultima_modificacao = SYSDATE
+                WHERE id = :id
+            """, {"valor": valor, "id": id_colaborador})
+    finally:
+        cursor.close()
+
+def atualizar_colaborador(conn: oracledb.Connection) -> None:
+    """
+    Permite ao usuário atualizar um campo específico de um colaborador no banco.
+
+    Primeiro, busca o colaborador buscar_colaborador(). Em seguida, exibe os dados
+    atuais e apresenta um menu para escolher o campo a ser alterado. Cada campo possui
+    sua própria lógica de validação. Alterações no CEP, Data de Demissão e Status
+    são tratadas separadamente com lógica SQL e atualização do dicionário do colaborador.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função realiza a ação de atualização.
+
+    Dependências:
+        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes,
+                   menu_opcoes2, perguntar_continuar, perguntar_continuar2, validar_cpf,
+                   cpf_unico, validar_data, data_datetime, endereco_cep, parse_salario.
+        - Variáveis: margem, mapeamento_colunas.
+    """
+    while True:
+        limpa_tela()
+        try:
+            colaborador_dicionario = buscar_colaborador(conn, titulo_menu="ATUALIZAR COLABORADOR")
+            if not colaborador_dicionario:
+                return
+            campos = {"Nome": "nm_colaborador", "CPF": "nr_cpf", "Data de nascimento": "dt_nascimento", "Sexo": "ds_sexo", "CEP": "cep", "Número": "nr_endereco", 
+                      "Salário": "vl_salario", "Cargo": "ds_cargo", "Data de admissão": "dt_admissao", "Data de demissão": "dt_demissao"}         
+            while True:
+                limpa_tela()
+                grupos_personalizados = [
+                    ("DADOS PESSOAIS", ['Id', 'CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado']),
+                    ("VÍNCULO EMPREGATÍCIO", ['Id', 'CPF', 'Nome', 'Salário', 'Cargo', 'Data de admissão', 'Data de demissão', 'Status', 'Data Criação', 'Data última modificação']),
+                ]
+                df = pd.DataFrame([colaborador_dicionario.copy()]) 
+                df.rename(columns=mapeamento_colunas, inplace=True)
+                imprimir_tabela(df, 
+                                titulo="DADOS ATUAIS DO COLABORADOR", 
+                                colunas_datas=['Data de nascimento', 'Data de admissão', 'Data de demissão'],
+                                colunas_datetime=['Data Criação', 'Data última modificação'], 
+                                colunas_moeda=['Salário'], 
+                                colunas_exibir=grupos_personalizados)
+
+                escolha = menu_opcoes("\nQual campo deseja alterar?", list(campos.keys()) + ["Finalizar"], list(campos.keys()) + ["Finalizar"])
+
+                if escolha == "Finalizar":
+                    print(f"\n {margem} Finalizando...\n")
+                    input("\nPressione ENTER para continuar...")
+                    limpa_tela()
+                    break
+
+                campo_sql = campos[escolha]
+                novo_valor = None 
+
+                while True: 
+                    # SEXO 
+                    if escolha == "Sexo":
+                        novo_valor = menu_opcoes2("\nInforme o sexo:", ["Masculino", "Feminino"], ["M", "F"])
+                        break
+
+                    entrada = input(f"\nNovo valor para {escolha}: ").strip()
+                    
+                    if not entrada and escolha != "Data de demissão":
                          print(f"\n {margem} Valor inválido. Não pode ficar vazio.\n")
                          if not perguntar_continuar("tentar novamente"):
                             break 
@@ -936,1040 +2570,2818 @@ def atualizar_colaborador(conn: oracledb.Connection) -> None:
                             if not perguntar_continuar("informar outra data de nascimento"):
                                 break 
                             continue
-                        # DATA DE ADMISSÃO 
-                        data_admissao_valor_atual = colaborador_dicionario["dt_admissao"] 
-                        
-                        if data_admissao_valor_atual and pd.notna(data_admissao_valor_atual): 
-                            if isinstance(data_admissao_valor_atual, datetime):
-                                data_admissao_str_atual = data_admissao_valor_atual.strftime('%d/%m/%Y')
+                        # DATA DE ADMISSÃO 
+                        data_admissao_valor_atual = colaborador_dicionario["dt_admissao"] 
+                        
+                        if data_admissao_valor_atual and pd.notna(data_admissao_valor_atual): 
+                            if isinstance(data_admissao_valor_atual, datetime):
+                                data_admissao_str_atual = data_admissao_valor_atual.strftime('%d/%m/%Y')
+                            else:
+                                data_admissao_str_atual = str(data_admissao_valor_atual)
+                            
+                            data_admissao_dt_atual = data_datetime(data_admissao_str_atual)
+
+                            idade_min_admissao = data_nasc_dt + timedelta(days=16*365)
+                            
+                            if data_admissao_dt_atual < idade_min_admissao:
+                                print(f"\n {margem} Esta nova data de nascimento torna a data de admissão ({colaborador_dicionario['dt_admissao']}) inválida.\n")
+                                print(f"\n {margem} Altere a data de admissão ou desista desta alteração.")
+                                if not perguntar_continuar("alterar outro campo"):
+                                    break 
+                                continue
+
+                        novo_valor = entrada 
+                    # CEP 
+                    elif escolha == "CEP":                        
+                        endereco = endereco_cep(entrada)
+                        if not endereco:
+                            print(f"\n {margem} CEP inválido ou não encontrado.\n")
+                            if not perguntar_continuar("informar outro CEP"):
+                                break 
+                            continue
+
+                        print(f"\n {margem} Endereço encontrado:")
+                        print(f" {margem} Logradouro: {endereco['logradouro']}")
+                        print(f" {margem} Bairro: {endereco['bairro']}")
+                        print(f" {margem} Cidade: {endereco['cidade']}")
+                        print(f" {margem} Estado: {endereco['estado']}")
+                        
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            UPDATE T_MNDSH_COLABORADOR
+                            SET cep = :cep, ds_logradouro = :logradouro, ds_bairro = :bairro, ds_cidade = :cidade,
+                                ds_estado = :estado, dt_ultima_modificacao = SYSDATE
+                            WHERE id = :id
+                        """, {"cep": entrada, "logradouro": endereco["logradouro"], "bairro": endereco["bairro"],
+                            "cidade": endereco["cidade"], "estado": endereco["estado"], "id": colaborador_dicionario["id"]})
+                        conn.commit()
+                        cursor.close()
+
+                        colaborador_dicionario.update({"cep": entrada, "ds_logradouro": endereco["logradouro"],
+                            "ds_bairro": endereco["bairro"],"ds_cidade": endereco["cidade"], "ds_estado": endereco["estado"]})
+                            
+                        print(f"\n {margem} Endereço atualizado com sucesso!\n")
+                        input("Pressione ENTER...")
+                        
+                        novo_valor = "CEP_ATUALIZADO" 
+                        break 
+                    # NÚMERO DA RESIDÊNCIA
+                    elif escolha == "Número":
+                        if not entrada.isdigit():
+                            print(f"\n {margem} Número inválido! Digite apenas números.\n")
+                            if not perguntar_continuar("informar outro número"):
+                                break 
+                            continue
+                        novo_valor = int(entrada)
+                    # SALÁRIO
+                    elif escolha == "Salário":
+                        salario = parse_salario(entrada)
+                        if salario is None:
+                            print(f"\n {margem} Valor inválido para salário!\n")
+                            if not perguntar_continuar("informar outro salário"):
+                                break 
+                            continue
+                        novo_valor = salario                        
+                    # CARGO
+                    elif escolha == "Cargo":
+                        if len(entrada) < 3:
+                            print(f"\n {margem} O cargo deve ter pelo menos 3 caracteres.\n")
+                            if not perguntar_continuar("informar outro cargo"):
+                                break 
+                            continue
+                        novo_valor = entrada
+                    # DATA DE ADMISSÃO
+                    elif escolha == "Data de admissão":
+                        data_nasc_valor_atual = colaborador_dicionario["dt_nascimento"]
+                        if isinstance(data_nasc_valor_atual, datetime):
+                            data_nasc_str_atual = data_nasc_valor_atual.strftime('%d/%m/%Y')
+                        else:
+                            data_nasc_str_atual = str(data_nasc_valor_atual)
+                        data_nasc_dt_atual = data_datetime(data_nasc_str_atual)
+                        if not validar_data(entrada):
+                            print(f"\n {margem} Data de admissão inválida!\n")
+                            if not perguntar_continuar("informar outra data"):
+                                break 
+                            continue
+                            
+                        data_admissao_dt = data_datetime(entrada)
+                        if data_admissao_dt < data_nasc_dt_atual + timedelta(days=16*365):
+                            print(f"\n {margem} A data de admissão não pode ser antes de o colaborador completar 16 anos!\n")
+                            if not perguntar_continuar("informar outra data"):
+                                break 
+                            continue
+                        if data_admissao_dt > datetime.now():
+                            print(f"\n {margem} A data de admissão não pode ser futura!\n")
+                            if not perguntar_continuar("informar outra data"):
+                                break 
+                            continue
+                        novo_valor = entrada 
+                        break 
+                    # DATA DE DEMISSÃO
+                    elif escolha == "Data de demissão":
+                        data_admissao_valor_atual = colaborador_dicionario["dt_admissao"]
+                        data_admissao_dt_atual = None
+                        if pd.notna(data_admissao_valor_atual):
+                            if isinstance(data_admissao_valor_atual, datetime):
+                                data_admissao_str_atual = data_admissao_valor_atual.strftime('%d/%m/%Y')
+                            else:
+                                data_admissao_str_atual = str(data_admissao_valor_atual)
+                            try:
+                                data_admissao_dt_atual = data_datetime(data_admissao_str_atual)
+                            except:
+                                pass 
+                        if not entrada:
+                            cursor = conn.cursor()
+                            cursor.execute("""
+                                UPDATE T_MNDSH_COLABORADOR
+                                SET dt_demissao = NULL, ds_status = 'Ativo', dt_ultima_modificacao = SYSDATE
+                                WHERE id = :id
+                            """, {"id": colaborador_dicionario["id"]})
+                            conn.commit()
+                            cursor.close()
+
+                            colaborador_dicionario["dt_demissao"] = None
+                            colaborador_dicionario["ds_status"] = "Ativo"
+                            print(f"\n {margem} Data de demissão removida e status atualizado para Ativo com sucesso!\n")
+                            input("Pressione ENTER...")
+                            novo_valor = "DEMISSAO_ATUALIZADA" 
+                            break 
+                        else:
+                            if not validar_data(entrada):
+                                print(f"\n {margem} Data de demissão inválida!\n")
+                                if not perguntar_continuar("informar outra data"):
+                                    break 
+                                continue
+                            data_demissao_dt = data_datetime(entrada)
+                            if data_admissao_dt_atual and data_demissao_dt < data_admissao_dt_atual:
+                                print(f"\n {margem} A data de demissão não pode ser antes da admissão!\n")
+                                if not perguntar_continuar("informar outra data"):
+                                    break 
+                                continue
+                            if data_demissao_dt > datetime.now():
+                                print(f"\n {margem} A data de demissão não pode ser futura!\n")
+                                if not perguntar_continuar("informar outra data"):
+                                    break 
+                                continue
+                                
+                            novo_valor = entrada 
+                            status = "Inativo"
+                            
+                            cursor = conn.cursor()
+                            cursor.execute("""
+                                UPDATE T_MNDSH_COLABORADOR
+                                SET ds_status = :status, dt_ultima_modificacao = SYSDATE
+                                WHERE id = :id
+                            """, {"status": status, "id": colaborador_dicionario["id"]})
+                            conn.commit()
+                            cursor.close()
+                            colaborador_dicionario["ds_status"] = status
+                            break 
+                    break 
+
+                if novo_valor is None or novo_valor == "CEP_ATUALIZADO" or novo_valor == "DEMISSAO_ATUALIZADA":
+                    continue
+
+                atualizar_campo_colaborador(conn, colaborador_dicionario["id"], campo_sql, novo_valor)
+                conn.commit()
+                colaborador_dicionario[campo_sql] = novo_valor
+                print(f"\n {margem} {escolha} atualizado com sucesso!\n")
+                input("Pressione ENTER...")   
+        except Exception as e:
+            print(f"\n{margem} Erro ao atualizar colaborador: {e}\n")
+            conn.rollback()
+        if not perguntar_continuar2("atualizar outro colaborador"):
+            break
+
+def excluir_colaborador(conn: oracledb.Connection) -> None:
+    """
+    Busca um colaborador por ID/CPF e, após confirmação, o exclui do banco de dados.
+    Exibe os dados completos do colaborador antes de solicitar a confirmação final.
+    A exclusão é lógica (marcar_colaborador_excluido, com commit): o colaborador some das buscas e relatórios
+    na hora, e as tarefas e métricas dele são apagadas em lotes pelo expurgo em segundo plano (iniciar_expurgo).
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função realiza a ação de exclusão.
+
+    Dependências:
+        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes2,
+                   perguntar_continuar2, marcar_colaborador_excluido, iniciar_expurgo.
+        - Variáveis: margem, mapeamento_colunas.
+    """
+    while True:
+        limpa_tela()
+        try:
+            colaborador = buscar_colaborador(conn, titulo_menu="EXCLUIR COLABORADOR")
+            if not colaborador:  
+                break
+            limpa_tela()
+            grupos_personalizados = [
+                    ("DADOS PESSOAIS", ['Id', 'CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado']),
+                    ("VÍNCULO EMPREGATÍCIO", ['Id', 'CPF', 'Nome', 'Salário', 'Cargo', 'Data de admissão', 'Data de demissão', 'Status', 'Data Criação', 'Data última modificação']),
+                ]
+            df = pd.DataFrame([colaborador.copy()]) 
+            df.rename(columns=mapeamento_colunas, inplace=True) 
+            imprimir_tabela(df, 
+                            titulo=f"DADOS DO COLABORADOR: {colaborador.get('nm_colaborador','')}", 
+                            colunas_datas=['Data de nascimento', 'Data de admissão', 'Data de demissão'], 
+                            colunas_datetime=['Data Criação', 'Data última modificação'], 
+                            colunas_moeda=['Salário'], 
+                            colunas_exibir=grupos_personalizados)
+            confirmacao = menu_opcoes2(f"\nTem certeza que deseja excluir o colaborador {colaborador.get('nm_colaborador','')} - CPF: {colaborador.get('nr_cpf','')} (ID: {colaborador['id']})?", ["Sim", "Não"], ["S", "N"])
+            if confirmacao != "S":
+                print(f"\n {margem} Exclusão cancelada.\n")
+                input("\nPressione ENTER para continuar...")
+                limpa_tela()
+            elif marcar_colaborador_excluido(conn, colaborador["id"]):
+                print(f"\n {margem} Colaborador excluído com sucesso!\n")
+                if iniciar_expurgo() is not None:
+                    print(f"{margem} As tarefas e métricas do colaborador estão sendo removidas em segundo plano.\n")
+                input("\nPressione ENTER para continuar...")
+                limpa_tela()
+            else:
+                print(f"\n {margem} O colaborador já havia sido excluído.\n")
+                input("\nPressione ENTER para continuar...")
+                limpa_tela()
+        except Exception as e:
+            print(f"\n {margem} Erro ao excluir colaborador:", e, "\n")
+        if not perguntar_continuar2("excluir outro colaborador"):
+            break
+
+# ====== CRUD tarefas ======
+
+# ADMINISTRADOR 
+
+def adicionar_tarefa_admin(conn: oracledb.Connection) -> None:
+    """
+    Permite ao administrador selecionar um colaborador e atribuir uma nova tarefa.
+
+    A função solicita o ID/CPF do colaborador buscar_colaborador(), o título, a descrição, a prioridade (via menu) e o prazo.
+    O prazo é validado para garantir que seja uma data futura. A tarefa é
+    inserida na tabela T_MNDSH_TAREFA com o status inicial 'pendente'.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função realiza a ação de inserção.
+
+    Dependências:
+        - Funções: limpa_tela, buscar_colaborador, perguntar_continuar, menu_opcoes2.
+        - Variáveis: margem.
+    """
+    while True: 
+        limpa_tela()
+        cursor = conn.cursor()
+        try:
+            colaborador = buscar_colaborador(conn, titulo_menu="ADICIONAR NOVA TAREFA")
+            if not colaborador:
+                return
+            id_colaborador = colaborador["id"]
+            cpf = colaborador["nr_cpf"]
+            nome = colaborador["nm_colaborador"]
+            status = colaborador["ds_status"]
+            print(f"\n {margem} Colaborador selecionado: {nome} (CPF: {cpf}) Status: {status}\n")
+            while True:
+                voltar_para_colaborador = False 
+                while True:
+                    titulo = input("\nTítulo: ").strip()
+                    if len(titulo) < 5:
+                        print(f"\n {margem} O título deve conter ao menos 5 caracteres.\n")
+                        if perguntar_continuar("tentar novamente"):
+                            continue
+                        else:
+                            voltar_para_colaborador = True
+                            break 
+                    break
+                if voltar_para_colaborador:
+                    break 
+
+                descricao = input("\nDescrição (opcional): ").strip() or None
+
+                prioridade = menu_opcoes2("\nPrioridade da tarefa:", ["Baixa", "Média", "Alta"], ["baixa", "média", "alta"])
+
+                while True:
+                    data_prazo = input("\nPrazo (DD/MM/AAAA): ").strip()
+                    voltar_para_colaborador = False 
+                    try:
+                        dt_prazo = datetime.strptime(data_prazo, "%d/%m/%Y")
+                        if dt_prazo < datetime.today():
+                            print(f"\n {margem} A data deve ser hoje ou futura.\n")
+                            if perguntar_continuar("tentar novamente"):
+                                continue
                             else:
-                                data_admissao_str_atual = str(data_admissao_valor_atual)
-                            
-                            data_admissao_dt_atual = data_datetime(data_admissao_str_atual)
+                                voltar_para_colaborador = True
+                                break
+                        break
+                    except ValueError:
+                        print(f"\n {margem} Formato inválido! Use DD/MM/AAAA.\n")
+                        if perguntar_continuar("tentar novamente"):
+                            continue
+                        else:
+                            voltar_para_colaborador = True
+                            break
+
+                if voltar_para_colaborador:
+                    break
+
+                cursor.execute("""
+                    INSERT INTO T_MNDSH_TAREFA(id_colaborador, ds_titulo, ds_descricao,ds_prioridade, dt_prazo, ds_status, dt_criacao, dt_modificacao)
+                    VALUES (:id, :titulo, :descricao, :prioridade, TO_DATE(:prazo, 'DD/MM/YYYY'), 'pendente', SYSDATE, SYSDATE)
+                """, {"id": id_colaborador, "titulo": titulo, "descricao": descricao, "prioridade": prioridade, "prazo": dt_prazo.strftime("%d/%m/%Y")})
+                conn.commit()
+                print(f"\n {margem} Tarefa adicionada com sucesso!\n")
+                input("Pressione ENTER...")
+                limpa_tela()
+
+                if perguntar_continuar("adicionar outra tarefa para este colaborador"):
+                    limpa_tela()
+                    print("===== ADICIONAR NOVA TAREFA =====\n")
+                    print(f"{margem} Colaborador selecionado: {nome} (CPF: {cpf}) Status: {status}\n")
+                    continue
+                else:
+                    break         
+        except Exception as e:
+            conn.rollback()
+            print(f"\nErro ao adicionar tarefa: {e}\n")
+            input("ENTER...")
+        finally:
+            cursor.close()
+        if not perguntar_continuar2("adicionar tarefa para outro colaborador"):
+                break
+
+def consultar_tarefas_admin(conn: oracledb.Connection, id_colaborador: int | None = None,
+                            status: str | None = None) -> list[tuple]:
+    """
+    Consulta as tarefas para a listagem do administrador, ordenadas pelo prazo.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        id_colaborador: Se informado, só as tarefas desse colaborador (sem as colunas de CPF e nome).
+        status: Se informado, só as tarefas com esse status ('pendente', 'em andamento' ou 'concluída').
+
+    Returns:
+        list[tuple]: Com id_colaborador: (id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo,
+        dt_criacao, dt_modificacao); sem ele, o mesmo com nr_cpf e nm_colaborador após o id_tarefa.
+    """
+    filtro_status = " AND t.ds_status = :status" if status else ""
+    params = {"status": status} if status else {}
+    cursor = conn.cursor()
+    try:
+        if id_colaborador is None:
+            cursor.execute(f"""
+                SELECT t.id_tarefa, c.nr_cpf, c.nm_colaborador, t.ds_titulo, t.ds_descricao, t.ds_status, t.ds_prioridade, t.dt_prazo, t.dt_criacao, t.dt_modificacao
+                FROM T_MNDSH_TAREFA t
+                JOIN T_MNDSH_COLABORADOR c ON t.id_colaborador = c.id
+                WHERE c.dt_exclusao IS NULL{filtro_status}
+                ORDER BY t.dt_prazo
+            """, params)
+        else:
+            cursor.execute(f"""
+                SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
+                FROM T_MNDSH_TAREFA t
+                WHERE id_colaborador = :id_colaborador{filtro_status}
+                ORDER BY dt_prazo
+            """, {**params, "id_colaborador": id_colaborador})
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+def listar_tarefas_admin(conn: oracledb.Connection) -> None:
+    """
+    Permite ao administrador listar tarefas com opções de filtro.
+    Oferece filtros por:
+    1. Colaborador (todos ou um específico, via buscar_colaborador().
+    2. Status (todas, pendentes, em andamento, concluídas).
+    Os resultados são consultados, formatados em um DataFrame (com colunas adaptadas)
+    e exibidos via imprimir_tabela(), com opção de exportação gerar_dataframe().
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função gerencia a exibição e exportação.
+
+    Dependências:
+        - Funções: limpa_tela, menu_opcoes, buscar_colaborador, perguntar_continuar2,
+                   imprimir_tabela, gerar_dataframe.
+        - Variáveis: margem.
+        - Módulo: pandas (pd)
+    """
+    while True:
+        limpa_tela()
+        try:
+            filtro = menu_opcoes("===== LISTAR TAREFAS =====\n \nDeseja listar:\n", ["Todos os colaboradores", "Por colaborador", "Voltar"], ["todos", "colaborador", "voltar"])
+            if filtro == "voltar":
+                print(f"\n {margem} Voltando...!\n")
+                input("\nPressione ENTER para continuar...")
+                limpa_tela()
+                break
+            cpf = None
+            nome = None
+            colunas = []
+
+            filtro_status_pendente = menu_opcoes("\nDeseja filtrar por status:\n", 
+                                        ["Todas", "Pendentes","Em Andamento", "Concluídas"], 
+                                        ["todas", "pendentes","em andamento", "concluidas"])
+            status = {"pendentes": "pendente", "em andamento": "em andamento", "concluidas": "concluída"}.get(filtro_status_pendente)
+
+            if filtro == "todos":
+                tarefas = consultar_tarefas_admin(conn, status=status)
+                colunas = ["ID", "CPF", "Colaborador", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
+
+                titulo = f"LISTA DE TAREFAS — {filtro_status_pendente.upper()}"
+            else:
+                limpa_tela()
+                colaborador = buscar_colaborador(conn, titulo_menu="LISTAR TAREFAS")
+                if not colaborador:
+                    continue
+                cpf = colaborador["nr_cpf"]
+                nome = colaborador["nm_colaborador"]
+
+                tarefas = consultar_tarefas_admin(conn, colaborador["id"], status)
+                colunas = ["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
+                titulo = f"TAREFAS ({filtro_status_pendente.upper()}) — {nome} (CPF: {cpf})"
+            if tarefas:
+                df = pd.DataFrame(tarefas, columns=colunas)
+                limpa_tela()
+                imprimir_tabela(df, 
+                                titulo=titulo, 
+                                tamanhos_wrap={"Título":25,"Descrição":40}, 
+                                colunas_datas=["Prazo"], 
+                                colunas_datetime=["Data Criação", "Data Última Modificação"])
+                gerar_dataframe(df)
+            else:
+                limpa_tela()
+                print(f"===== {titulo} =====")
+                print(f"\n {margem} Nenhuma tarefa encontrada.\n")
+        except Exception as e:
+            print(f"\n {margem} Erro ao listar tarefas: {e}\n")
+            input("\nPressione ENTER para continuar...")
+        if not perguntar_continuar2("realizar outra pesquisa/listagem"):
+            break
+
+def atualizar_campo_tarefa(conn: oracledb.Connection, id_tarefa: int, campo_sql: str, valor) -> None:
+    """
+    Atualiza uma coluna da tarefa e a data de modificação (sem commit).
+    O prazo (dt_prazo) recebe o valor no formato DD/MM/AAAA.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        id_tarefa: Id da tarefa.
+        campo_sql: Nome da coluna, vindo da lista fixa de campos editáveis (nunca da entrada do usuário).
+        valor: Novo valor da coluna.
+    """
+    cursor = conn.cursor()
+    try:
+        if campo_sql.startswith("dt_"):
+            cursor.execute(f"""
+                UPDATE T_MNDSH_TAREFA
+                SET {campo_sql} = TO_DATE(:valor,'DD/MM/YYYY'), dt_modificacao=SYSDATE
+                WHERE id_tarefa=:id
+            """, {"valor": valor, "id": id_tarefa})
+        else:
+            cursor.execute(f"""
+                UPDATE T_MNDSH_TAREFA
+                SET {campo_sql} = :valor, dt_modificacao=SYSDATE
+                WHERE id_tarefa=:id
+            """, {"valor": valor, "id": id_tarefa})
+    finally:
+        cursor.close()
+
+def atualizar_tarefa_admin(conn: oracledb.Connection) -> None:
+    """
+    Permite ao administrador atualizar qualquer campo de uma tarefa atribuída a um colaborador.
+
+    O processo envolve:
+    1. Selecionar o colaborador buscar_colaborador().
+    2. Listar todas as tarefas do colaborador.
+    3. O administrador escolhe o ID da tarefa a ser alterada.
+    4. Apresenta um menu para escolha do campo (Título, Descrição, Status, Prioridade, Prazo).
+    5. Cada campo tem validação específica.
+    6. Executa o UPDATE no banco e atualiza a visualização.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função realiza a ação de atualização.
+
+    Dependências:
+        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes,
+                   menu_opcoes2, perguntar_continuar, perguntar_continuar2.
+        - Variáveis: margem.
+        - Módulo: pandas (pd).
+    """
+    while True:
+        cursor = conn.cursor()
+        limpa_tela()
+        try:
+            colaborador = buscar_colaborador(conn, titulo_menu="ATUALIZAR TAREFA")
+            if not colaborador:
+                return
+            cpf = colaborador["nr_cpf"]
+            id_colaborador = colaborador["id"]
+            nome = colaborador["nm_colaborador"]
+            
+            cursor.execute("""
+                SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
+                FROM T_MNDSH_TAREFA
+                WHERE id_colaborador = :id_colaborador
+                ORDER BY dt_prazo
+            """, {"id_colaborador": id_colaborador})
+            tarefas = cursor.fetchall()
+            if not tarefas:
+                print(f"\n===== TAREFAS DE {nome} (CPF: {cpf}) =====\n")
+                print(f"{margem} Nenhuma tarefa registrada.\n")
+                input("Pressione ENTER para continuar...")
+                continue
+
+            colunas = ["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
+            df_tarefas = pd.DataFrame(tarefas, columns=colunas)
+
+            while True:
+                limpa_tela()
+                imprimir_tabela(df_tarefas, 
+                                titulo=f"TAREFAS DE {nome} (CPF: {cpf})", 
+                                tamanhos_wrap={"Título":25,"Descrição":40}, 
+                                colunas_datas=["Prazo"],
+                                colunas_datetime=["Data Criação", "Data Última Modificação"])
+                try:
+                    id_tarefa = int(input("\nID da tarefa que deseja atualizar: "))
+                except ValueError:
+                    print(f"\n{margem} ID inválido. Digite apenas números.\n")
+                    if not perguntar_continuar2("tentar novamente"):
+                        break
+                    continue
+                cursor.execute("""
+                    SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo
+                    FROM T_MNDSH_TAREFA
+                    WHERE id_tarefa=:id AND id_colaborador=:id_colaborador
+                """, {"id": id_tarefa, "id_colaborador": id_colaborador})
+                tarefa = cursor.fetchone()
+                if not tarefa:
+                    print(f"\n{margem} Tarefa não encontrada.\n")
+                    if not perguntar_continuar2("tentar novamente"):
+                        break
+                    continue
+
+                campos = {"Título": "ds_titulo", "Descrição": "ds_descricao", "Status": "ds_status", "Prioridade": "ds_prioridade", "Prazo": "dt_prazo"}
+
+                editar_tarefa = True
+                while editar_tarefa:
+                    novo_valor = None 
+                    limpa_tela()
+                    df_tarefa_atual = pd.DataFrame([tarefa], columns=["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo"])
+                    imprimir_tabela(df_tarefa_atual, 
+                                    titulo="DADOS ATUAIS DA TAREFA", 
+                                    tamanhos_wrap={"Título":25,"Descrição":40}, 
+                                    colunas_datas=["Prazo"])
+
+                    escolha = menu_opcoes("\nQual campo deseja alterar?", list(campos.keys()) + ["Finalizar"], list(campos.keys()) + ["Finalizar"])
+
+                    if escolha == "Finalizar":
+                        editar_tarefa = False
+                        break
+
+                    campo_sql = campos[escolha]
+
+                    if escolha == "Título":
+                        while True:
+                            entrada = input("\nNovo título: ").strip()
+                            if len(entrada) < 5:
+                                print(f"\n{margem} O título deve ter pelo menos 5 caracteres.\n")
+                                if not perguntar_continuar("tentar novamente"):
+                                    break
+                                continue
+                            novo_valor = entrada
+                            break
+                    elif escolha == "Descrição":
+                        novo_valor = input("\nNova descrição (pode ficar vazia): ").strip()
+                    elif escolha == "Prioridade":
+                        novo_valor = menu_opcoes2("\nEscolha a prioridade:", ["Baixa", "Média", "Alta"], ["baixa", "média", "alta"])
+                    elif escolha == "Status":
+                        novo_valor = menu_opcoes2("\nEscolha o status:", ["Pendente", "Em andamento", "Concluída"], ["pendente", "em andamento", "concluída"])
+                    elif escolha == "Prazo":
+                        while True:
+                            entrada = input("\nNovo prazo (DD/MM/AAAA): ").strip()
+                            if not entrada:
+                                print(f"\n{margem} Valor inválido. Não pode ficar vazio.")
+                                if not perguntar_continuar("tentar novamente"):
+                                    break
+                                continue
+                            try:
+                                dt_novo = datetime.strptime(entrada, "%d/%m/%Y")
+                                if dt_novo < datetime.today():
+                                    print(f"\n{margem} A data deve ser hoje ou futura.")
+                                    if not perguntar_continuar("tentar novamente"):
+                                        break
+                                    continue
+                                novo_valor = entrada
+                                break
+                            except ValueError:
+                                print(f"\n{margem} Formato inválido! Use DD/MM/AAAA.")
+                                if not perguntar_continuar("tentar novamente"):
+                                    break
+                    if novo_valor is None:
+                        continue
+                    atualizar_campo_tarefa(conn, id_tarefa, campo_sql, novo_valor)
+                    conn.commit()
+                    print(f"\n{margem} {escolha} atualizado com sucesso!\n")
+                    input("Pressione ENTER...")
+                    cursor.execute("""
+                        SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo
+                        FROM T_MNDSH_TAREFA
+                        WHERE id_tarefa=:id
+                    """, {"id": id_tarefa})
+                    tarefa = cursor.fetchone()
+                if not perguntar_continuar2("atualizar outra tarefa deste colaborador"):
+                    break 
+        except Exception as e:
+            print(f"\n{margem} Erro ao atualizar tarefa: {e}\n")
+            conn.rollback()
+        finally:
+            if 'cursor' in locals() and cursor:
+                cursor.close()
+        if not perguntar_continuar2("atualizar tarefa de outro colaborador"):
+            break
+
+def excluir_tarefa_admin(conn: oracledb.Connection) -> None:
+    """
+    Permite ao administrador excluir uma tarefa específica atribuída a um colaborador.
+    O administrador seleciona o colaborador buscar_colaborador(), lista suas tarefas
+    e escolhe o ID da tarefa a ser excluída. Uma confirmação final é solicitada antes
+    da execução do DELETE.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        None: A função realiza a ação de exclusão.
+
+    Dependências:
+        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes2,
+                   perguntar_continuar2.
+        - Variáveis: margem.
+        - Módulo: pandas (pd).
+    """
+    while True:
+        limpa_tela()
+        cursor = conn.cursor()
+        try:
+            colaborador = buscar_colaborador(conn, titulo_menu="EXCLUIR TAREFA")
+            if not colaborador:
+                return 
+            id_colaborador = colaborador["id"]
+            nome = colaborador["nm_colaborador"]
+            while True:  
+                cursor.execute("""
+                    SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
+                    FROM T_MNDSH_TAREFA 
+                    WHERE id_colaborador=:id_colaborador 
+                    ORDER BY dt_prazo
+                """, {"id_colaborador": id_colaborador})
+                tarefas = cursor.fetchall()
+                if not tarefas:
+                    print(f"\n {margem} Nenhuma tarefa encontrada para {nome}.\n")
+                    input("\nPressione ENTER para continuar...")
+                    break 
+
+                df = pd.DataFrame(tarefas, columns=["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"])
+                limpa_tela()
+                imprimir_tabela(df, 
+                                titulo=f"TAREFAS DE {nome}", 
+                                tamanhos_wrap={"Título":25,"Descrição":40}, 
+                                colunas_datas=["Prazo"], 
+                                colunas_datetime=["Data Criação","Data Última Modificação"])
+
+                tarefa = None
+                sair_para_outro_colaborador = False 
+                while True:
+                    try:
+                        id_tarefa = int(input("\nID da tarefa: "))
+                    except ValueError:
+                        print(f"\n {margem} ID inválido.\n")
+                        if not perguntar_continuar2("tentar novamente"):
+                            sair_para_outro_colaborador = True
+                            break  
+                        limpa_tela()
+                        imprimir_tabela(df, 
+                                        titulo=f"TAREFAS DE {nome}", 
+                                        tamanhos_wrap={"Título":25,"Descrição":40}, 
+                                        colunas_datas=["Prazo"], 
+                                        colunas_datetime=["Data Criação","Data Última Modificação"])
+                        continue
+                    cursor.execute("""
+                        SELECT ds_titulo 
+                        FROM T_MNDSH_TAREFA 
+                        WHERE id_tarefa=:id AND id_colaborador=:id_colaborador
+                    """, {"id": id_tarefa, "id_colaborador": id_colaborador})
+                    tarefa = cursor.fetchone()
+
+                    if tarefa:
+                        break 
+                    print(f"\n {margem} Tarefa não encontrada.\n")
+                    if not perguntar_continuar2("tentar novamente"):
+                        sair_para_outro_colaborador = True
+                        tarefa = None
+                        break
+                    limpa_tela()
+                    imprimir_tabela(df, 
+                                    titulo=f"TAREFAS DE {nome}", 
+                                    tamanhos_wrap={"Título":25,"Descrição":40}, 
+                                    colunas_datas=["Prazo"], 
+                                    colunas_datetime=["Data Criação","Data Última Modificação"])
+
+                if sair_para_outro_colaborador:
+                    break
+
+                print(f"\nTarefa selecionada: {tarefa[0]}")
+                confirmacao = menu_opcoes2("\nConfirma exclusão?", ["Sim", "Não"], ["S", "N"])
+                if confirmacao == "S":
+                    cursor.execute("""
+                        DELETE FROM T_MNDSH_TAREFA 
+                        WHERE id_tarefa=:id AND id_colaborador=:id_colaborador
+                    """, {"id": id_tarefa, "id_colaborador": id_colaborador})
+                    conn.commit()
+                    print(f"\n {margem} Tarefa excluída com sucesso!\n")
+                else:
+                    print(f"\n {margem} Exclusão cancelada.\n")
+                input("\nPressione ENTER para continuar...")
+                if not perguntar_continuar2(f"excluir outra tarefa do colaborador {nome}"):
+                    break 
+        except Exception as e:
+            conn.rollback()
+            print(f"\n {margem} Erro ao excluir tarefa: {e}\n")
+            input("\nPressione ENTER para continuar...")
+        finally:
+            cursor.close()
+        if not perguntar_continuar2("excluir tarefa de outro colaborador"):
+            break  
+
+# COLABORADOR 
+
+def listar_tarefas_colaborador(conn: oracledb.Connection, cpf_colaborador: str, painel: "PainelColaborador | None" = None) -> None:
+    """
+    Busca e exibe todas as tarefas PENDENTES/EM ANDAMENTO de um colaborador específico.
+    A função utiliza o CPF do colaborador logado para filtrar as tarefas na tabela
+    T_MNDSH_TAREFA, excluindo aquelas com status 'concluída'. Os resultados são exibidos
+    em formato de tabela e podem ser exportados.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador logado.
+        painel: Cache da sessão; se tiver as tarefas pré-carregadas, a tela não consulta o banco.
+
+    Returns:
+        None: A função gerencia a exibição e exportação.
+
+    Dependências:
+        - Funções: limpa_tela, imprimir_tabela, gerar_dataframe, carregar_tarefas_abertas.
+        - Variáveis: margem, colunas_tarefas_abertas.
+        - Módulo: pandas (pd).
+    """
+    limpa_tela()
+    cursor = conn.cursor()
+    try:
+        tarefas = painel.obter("tarefas_abertas") if painel is not None else None
+        if tarefas is not None:
+            nome = painel.nome
+        else:
+            cursor.execute("SELECT nm_colaborador FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf", {"cpf": cpf_colaborador})
+            resultado = cursor.fetchone()
+            if not resultado:
+                print("\nErro ao identificar colaborador.\n")
+                input("Pressione ENTER para voltar...")
+                return
+            nome = resultado[0]
+            tarefas = carregar_tarefas_abertas(conn, cpf_colaborador)
+
+        if not tarefas:
+            print(f"\n{margem} Nenhuma tarefa encontrada para {nome} (CPF: {cpf_colaborador}).\n")
+            input("Pressione ENTER para voltar...")
+            return
+        df = pd.DataFrame(tarefas, columns=colunas_tarefas_abertas)
+        imprimir_tabela(df, 
+                        titulo=f"TAREFAS DE {nome}", 
+                        tamanhos_wrap={"Título":25,"Descrição":40}, 
+                        colunas_datas=["Prazo"], 
+                        colunas_datetime=["Data Criação", "Data Última Modificação"])
+        gerar_dataframe(df)
+    except Exception as e:
+        print(f"\n{margem} Erro ao listar tarefas: {e}\n")
+        input("Pressione ENTER para continuar...")
+    finally:
+        cursor.close()
+
+def atualizar_tarefa_colaborador(conn: oracledb.Connection, cpf_colaborador: str, nome_colaborador: str,
+                                 painel: "PainelColaborador | None" = None) -> None:
+    """
+    Permite ao colaborador alterar o status de suas tarefas (para 'em andamento' ou 'concluída').
+    A função lista apenas as tarefas NÃO CONCLUÍDAS do colaborador. Após a seleção do ID,
+    permite alterar o status, validando que a tarefa pertence ao colaborador e não está
+    concluída. A alteração é confirmada e registrada no banco.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador logado.
+        nome_colaborador: O nome do colaborador logado.
+        painel: Cache da sessão; a primeira lista vem das tarefas pré-carregadas, que são
+            descartadas a cada status alterado.
+
+    Returns:
+        None: A função realiza a ação de atualização.
+
+    Dependências:
+        - Funções: limpa_tela, imprimir_tabela, menu_opcoes2, perguntar_continuar,
+                   perguntar_continuar2, atualizar_status_tarefa, carregar_tarefas_abertas.
+        - Variáveis: margem, colunas_tarefas_abertas.
+        - Módulo: pandas (pd).
+    """
+    while True:
+        limpa_tela()
+        cursor = conn.cursor()
+        try:
+            tarefas = painel.obter("tarefas_abertas") if painel is not None else None
+            if tarefas is None:
+                tarefas = carregar_tarefas_abertas(conn, cpf_colaborador)
+            if not tarefas:
+                limpa_tela()
+                print(f"===== TAREFAS A CONCLUIR DE {nome_colaborador} (CPF: {cpf_colaborador}) =====")
+                print(f"\n{margem} Nenhuma tarefa NÃO CONCLUÍDA encontrada.\n")
+                input("Pressione ENTER para voltar...")
+                break
+
+            df = pd.DataFrame(tarefas, columns=colunas_tarefas_abertas)
+            imprimir_tabela(df, 
+                            titulo=f"TAREFAS A CONCLUIR DE {nome_colaborador}",
+                            tamanhos_wrap={"Título":25,"Descrição":40},  
+                            colunas_datas=["Prazo"], 
+                            colunas_datetime=["Data Criação","Data Última Modificação"])
+            
+            id_tarefa = None
+            while True:
+                try:
+                    id_tarefa_input = input("\nDigite o ID da tarefa que deseja ATUALIZAR: ")
+                    id_tarefa = int(id_tarefa_input)
+                    break 
+                except ValueError:
+                    print(f"\n{margem} Entrada inválida. Por favor, digite o número do ID.\n")
+                    if not perguntar_continuar("tentar novamente"):
+                        id_tarefa = -1
+                        break
+            if id_tarefa == -1:
+                break
+
+            cursor.execute("""
+                SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
+                FROM T_MNDSH_TAREFA
+                WHERE id_tarefa=:id AND ds_status != 'concluída'
+                  AND id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf_colaborador)
+            """, {"id": id_tarefa, "cpf_colaborador": cpf_colaborador})
+            tarefa_completa = cursor.fetchone()
+
+            if not tarefa_completa:
+                print(f"\n{margem} ID da tarefa ({id_tarefa}) é inválido, já está concluído ou não pertence à sua lista.\n")
+                input("Pressione ENTER para continuar...")
+                continue
+
+            limpa_tela()
+            df_tarefa = pd.DataFrame([tarefa_completa], columns=["ID","Título","Descrição","Status","Prioridade","Prazo","Data Criação","Última Modificação"])
+            imprimir_tabela(df_tarefa, 
+                            titulo=f"ATUALIZAR TAREFA - {nome_colaborador}", 
+                            tamanhos_wrap={"Título":25,"Descrição":40}, 
+                            colunas_datas=["Prazo"], 
+                            colunas_datetime=["Data Criação","Última Modificação"])
+
+            novo_status = menu_opcoes2("\nSelecione o novo status:", ["Em Andamento", "Concluída", "Voltar"], ["EM ANDAMENTO", "CONCLUIDA", "VOLTAR"])
+
+            if novo_status == "VOLTAR":
+                print(f"\n{margem} Atualização cancelada.\n")
+                input("Pressione ENTER para continuar...")
+                continue
+            
+            status_bd = 'em andamento' if novo_status == 'EM ANDAMENTO' else 'concluída'
+            status_display = novo_status.upper()
+
+            confirmacao = perguntar_continuar(f"confirmar a mudança para o status '{status_display}'")
+            if confirmacao:
+                atualizar_status_tarefa(conn, id_tarefa, status_bd, cpf_colaborador)
+                if painel is not None:
+                    painel.invalidar("tarefas_abertas")
+                print(f"\n{margem} Tarefa '{tarefa_completa[1]}' atualizada para status: {status_display} com sucesso!\n")
+            else:
+                continue
+            if not perguntar_continuar2("atualizar outra tarefa"):
+                        break
+        except Exception as e:
+            conn.rollback()
+            print(f"\n{margem} Erro ao atualizar tarefa: {e}\n")
+            input("Pressione ENTER para voltar...")
+        finally:
+            if 'cursor' in locals() and cursor:
+                cursor.close()
+
+def atualizar_status_tarefa(conn: oracledb.Connection, id_tarefa: int, novo_status: str, cpf_colaborador: str | None = None) -> bool:
+    """
+    Altera o status de uma tarefa sem interação com o usuário e atualiza dt_modificacao.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        id_tarefa: O ID da tarefa.
+        novo_status: 'pendente', 'em andamento' ou 'concluída'.
+        cpf_colaborador: Se informado, só altera a tarefa se ela pertencer a este colaborador.
+
+    Returns:
+        bool: True se a tarefa foi encontrada e atualizada, False caso contrário.
+
+    Raises:
+        ValueError: Se o status for inválido.
+    """
+    if novo_status not in ("pendente", "em andamento", "concluída"):
+        raise ValueError("Status inválido. Use 'pendente', 'em andamento' ou 'concluída'.")
+    filtro_cpf = ""
+    params = {"novo_status": novo_status, "id": id_tarefa}
+    if cpf_colaborador is not None:
+        filtro_cpf = " AND id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf_colaborador)"
+        params["cpf_colaborador"] = cpf_colaborador
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            UPDATE T_MNDSH_TAREFA
+            SET ds_status=:novo_status, dt_modificacao=SYSDATE
+            WHERE id_tarefa=:id{filtro_cpf}
+        """, params)
+        atualizada = cursor.rowcount > 0
+        conn.commit()
+        return atualizada
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+# ====== PRAZOS DAS TAREFAS ======
+
+# Situações da varredura de prazos, na ordem de urgência, e os títulos usados nas tabelas
+situacoes_prazo = {"atrasadas": "Atrasada", "vencem_hoje": "Vence hoje", "vencem_semana": "Vence na semana"}
+
+def varrer_prazos(conn: oracledb.Connection, referencia: datetime | None = None, dias_semana: int = 7,
+                  tamanho_lote: int = 1000) -> dict:
+    """
+    Separa, em uma única consulta, as tarefas não concluídas de todos os colaboradores em atrasadas
+    (prazo antes do dia de referência), que vencem hoje e que vencem nos 'dias_semana' dias seguintes.
+    O filtro é uma faixa em dt_prazo (idx_tarefa_prazo) com os status abertos (idx_tarefa_status);
+    o resultado é lido em lotes de 'tamanho_lote' linhas.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        referencia: O dia da varredura (padrão: hoje; o horário é ignorado).
+        dias_semana: Quantos dias depois de hoje contam como "vencem na semana".
+        tamanho_lote: Linhas buscadas por fetchmany.
+
+    Returns:
+        dict: referencia e ate (datas ISO), resumo (contagens por situação, por prioridade das atrasadas,
+        colaboradores afetados e maior atraso em dias) e colaboradores (cpf, nome e as listas de tarefas
+        de cada situação), com os mais atrasados primeiro.
+
+    Dependências:
+        - Variáveis: situacoes_prazo.
+    """
+    referencia = referencia or datetime.now()
+    hoje = datetime(referencia.year, referencia.month, referencia.day)
+    amanha = hoje + timedelta(days=1)
+    limite = amanha + timedelta(days=dias_semana)
+    colaboradores = {}
+    resumo = {situacao: 0 for situacao in situacoes_prazo}
+    atrasadas_por_prioridade = {}
+    maior_atraso = 0
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT t.id_tarefa, c.nr_cpf, c.nm_colaborador, t.ds_titulo, t.ds_status, t.ds_prioridade, t.dt_prazo
+            FROM T_MNDSH_TAREFA t
+            JOIN T_MNDSH_COLABORADOR c ON c.id = t.id_colaborador
+            WHERE t.ds_status IN ('pendente', 'em andamento')
+              AND t.dt_prazo < :limite
+              AND c.dt_exclusao IS NULL
+            ORDER BY t.dt_prazo, t.id_tarefa
+        """, {"limite": limite})
+        while True:
+            linhas = cursor.fetchmany(tamanho_lote)
+            if not linhas:
+                break
+            for id_tarefa, cpf, nome, titulo, status, prioridade, prazo in linhas:
+                tarefa = {"id_tarefa": id_tarefa, "titulo": titulo, "status": status, "prioridade": prioridade,
+                          "prazo": prazo.date().isoformat()}
+                if prazo < hoje:
+                    situacao = "atrasadas"
+                    tarefa["dias_atraso"] = (hoje - datetime(prazo.year, prazo.month, prazo.day)).days
+                    maior_atraso = max(maior_atraso, tarefa["dias_atraso"])
+                    atrasadas_por_prioridade[prioridade] = atrasadas_por_prioridade.get(prioridade, 0) + 1
+                elif prazo < amanha:
+                    situacao = "vencem_hoje"
+                else:
+                    situacao = "vencem_semana"
+                resumo[situacao] += 1
+                if cpf not in colaboradores:
+                    colaboradores[cpf] = {"cpf": cpf, "nome": nome, **{s: [] for s in situacoes_prazo}}
+                colaboradores[cpf][situacao].append(tarefa)
+    finally:
+        cursor.close()
+    ordenados = sorted(colaboradores.values(),
+                       key=lambda c: (-len(c["atrasadas"]), -len(c["vencem_hoje"]), -len(c["vencem_semana"]), c["nome"]))
+    resumo.update({
+        "colaboradores": len(ordenados),
+        "colaboradores_com_atraso": sum(1 for c in ordenados if c["atrasadas"]),
+        "atrasadas_por_prioridade": dict(sorted(atrasadas_por_prioridade.items())),
+        "maior_atraso_dias": maior_atraso
+    })
+    contador_inc("mindshift_varreduras_prazo_total", "Varreduras de prazos das tarefas executadas.")
+    return {"referencia": hoje.date().isoformat(), "ate": (limite - timedelta(days=1)).date().isoformat(),
+            "resumo": resumo, "colaboradores": ordenados}
+
+def tabela_prazos(varredura: dict) -> pd.DataFrame:
+    """
+    Uma linha por tarefa da varredura de prazos (para exibição e exportação em CSV/Excel).
+
+    Args:
+        varredura: O retorno de varrer_prazos().
+
+    Returns:
+        pd.DataFrame: Colunas Situação, CPF, Colaborador, ID, Título, Status, Prioridade, Prazo e Dias de atraso.
+    """
+    linhas = []
+    for colaborador in varredura["colaboradores"]:
+        for situacao, titulo_situacao in situacoes_prazo.items():
+            for tarefa in colaborador[situacao]:
+                linhas.append([titulo_situacao, colaborador["cpf"], colaborador["nome"], tarefa["id_tarefa"], tarefa["titulo"],
+                               tarefa["status"], tarefa["prioridade"], tarefa["prazo"], tarefa.get("dias_atraso", 0)])
+    return pd.DataFrame(linhas, columns=["Situação", "CPF", "Colaborador", "ID", "Título", "Status", "Prioridade", "Prazo",
+                                         "Dias de atraso"])
+
+def relatorio_prazos(conn: oracledb.Connection) -> None:
+    """
+    Exibe ao administrador o resumo da varredura de prazos e a contagem por colaborador (os mais atrasados
+    primeiro), com opção de exportar a lista completa de tarefas.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Dependências:
+        - Funções: limpa_tela, varrer_prazos, tabela_prazos, imprimir_tabela, gerar_dataframe.
+        - Variáveis: margem.
+    """
+    limpa_tela()
+    try:
+        varredura = varrer_prazos(conn)
+    except Exception as e:
+        print(f"\n{margem} Erro ao verificar os prazos: {e}\n")
+        input("Pressione ENTER para continuar...")
+        return
+    resumo = varredura["resumo"]
+    referencia = datetime.fromisoformat(varredura["referencia"]).strftime("%d/%m/%Y")
+    ate = datetime.fromisoformat(varredura["ate"]).strftime("%d/%m/%Y")
+    print(f"===== PRAZOS DAS TAREFAS - {referencia} =====\n")
+    print(f"{margem}Atrasadas: {resumo['atrasadas']} (maior atraso: {resumo['maior_atraso_dias']} dia(s))")
+    print(f"{margem}Vencem hoje: {resumo['vencem_hoje']}")
+    print(f"{margem}Vencem até {ate}: {resumo['vencem_semana']}")
+    print(f"{margem}Colaboradores com tarefas atrasadas: {resumo['colaboradores_com_atraso']} de {resumo['colaboradores']}")
+    if not varredura["colaboradores"]:
+        print(f"\n{margem} Nenhuma tarefa atrasada ou vencendo nos próximos dias.\n")
+        input("Pressione ENTER para continuar...")
+        return
+    df_colaboradores = pd.DataFrame(
+        [[c["cpf"], c["nome"], len(c["atrasadas"]), len(c["vencem_hoje"]), len(c["vencem_semana"])] for c in varredura["colaboradores"]],
+        columns=["CPF", "Colaborador", "Atrasadas", "Vencem hoje", "Vencem na semana"])
+    imprimir_tabela(df_colaboradores, titulo="TAREFAS POR COLABORADOR")
+    print(f"\n{margem}A exportação contém a lista completa das tarefas.")
+    gerar_dataframe(tabela_prazos(varredura))
+
+# ====== IMPORTAÇÃO E EXPORTAÇÃO ======
+
+# Colunas exibidas/exportadas de tarefas e os nomes correspondentes no banco
+colunas_tarefas = {
+    "ID": "id_tarefa",
+    "CPF": "nr_cpf",
+    "Colaborador": "nm_colaborador",
+    "Título": "ds_titulo",
+    "Descrição": "ds_descricao",
+    "Status": "ds_status",
+    "Prioridade": "ds_prioridade",
+    "Prazo": "dt_prazo",
+    "Data Criação": "dt_criacao",
+    "Data Última Modificação": "dt_modificacao"
+}
+
+def consultar_colaboradores(conn: oracledb.Connection) -> pd.DataFrame:
+    """
+    Retorna todos os colaboradores ordenados por ID, com as colunas renomeadas para exibição.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        pd.DataFrame: Os colaboradores com os nomes de colunas de mapeamento_colunas.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT id, nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro,
+                   ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao
+            FROM T_MNDSH_COLABORADOR
+            WHERE dt_exclusao IS NULL
+            ORDER BY id
+        """)
+        dados = cursor.fetchall()
+    finally:
+        cursor.close()
+    return pd.DataFrame(dados, columns=list(mapeamento_colunas.values()))
+
+def consultar_tarefas(conn: oracledb.Connection, cpf: str | None = None, status: str | None = None, limite: int | None = None, deslocamento: int = 0) -> pd.DataFrame:
+    """
+    Retorna as tarefas (com o nome do colaborador) ordenadas pelo prazo, sem interação com o usuário.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf: Filtra as tarefas de um colaborador. Se None, retorna de todos.
+        status: Filtra por status ('pendente', 'em andamento' ou 'concluída'). Se None, retorna todos.
+        limite: Quantidade máxima de linhas (paginação no banco). Se None, retorna todas.
+        deslocamento: Quantidade de linhas a pular antes da primeira retornada.
+
+    Returns:
+        pd.DataFrame: As tarefas com os nomes de colunas de colunas_tarefas.
+    """
+    filtros = ""
+    params = {}
+    if cpf is not None:
+        filtros += " AND c.nr_cpf = :cpf"
+        params["cpf"] = cpf
+    if status is not None:
+        filtros += " AND t.ds_status = :status"
+        params["status"] = status
+    paginacao = ""
+    if limite is not None:
+        paginacao = "OFFSET :deslocamento ROWS FETCH NEXT :limite ROWS ONLY"
+        params.update({"deslocamento": deslocamento, "limite": limite})
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT t.id_tarefa, c.nr_cpf, c.nm_colaborador, t.ds_titulo, t.ds_descricao, t.ds_status, t.ds_prioridade, t.dt_prazo, t.dt_criacao, t.dt_modificacao
+            FROM T_MNDSH_TAREFA t
+            JOIN T_MNDSH_COLABORADOR c ON t.id_colaborador = c.id
+            WHERE c.dt_exclusao IS NULL {filtros}
+            ORDER BY t.dt_prazo, t.id_tarefa
+            {paginacao}
+        """, params)
+        dados = cursor.fetchall()
+    finally:
+        cursor.close()
+    return pd.DataFrame(dados, columns=list(colunas_tarefas.keys()))
+
+def exportar_dataframe(df: pd.DataFrame, destino, formato: str = "json") -> None:
+    """
+    Grava um DataFrame em CSV, Excel ou JSON sem interação com o usuário (versão não interativa de gerar_dataframe).
+
+    Args:
+        df: O DataFrame a ser gravado.
+        destino: Caminho do arquivo ou objeto de arquivo aberto (ex.: sys.stdout). Excel exige caminho.
+        formato: "csv", "excel" ou "json".
+    """
+    if formato not in ("csv", "excel", "json"):
+        raise ValueError(f"Formato desconhecido: {formato}")
+    with medir_duracao("mindshift_exportacao_segundos", "Duração das exportações de dados.", formato=formato):
+        if formato == "csv":
+            df.to_csv(destino, index=False, encoding="utf-8-sig" if isinstance(destino, str) else None)
+        elif formato == "excel":
+            df.to_excel(destino, index=False)
+        else:
+            df.to_json(destino, orient="records", force_ascii=False, indent=4, date_format="iso")
+    contador_inc("mindshift_exportacao_linhas_total", "Linhas exportadas.", len(df), formato=formato)
+
+def ler_arquivo_importacao(caminho: str) -> pd.DataFrame:
+    """
+    Lê um arquivo CSV, Excel ou JSON (pela extensão) para importação.
+
+    Args:
+        caminho: Caminho do arquivo.
+
+    Returns:
+        pd.DataFrame: O conteúdo do arquivo, com todas as colunas como texto.
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".json":
+        return pd.read_json(caminho, orient="records", dtype=False).astype(object)
+    if extensao in (".xlsx", ".xls"):
+        return pd.read_excel(caminho, dtype=str)
+    return pd.read_csv(caminho, dtype=str, encoding="utf-8-sig", sep=None, engine="python")
+
+def _valor_importacao(valor):
+    """
+    Normaliza um valor lido de arquivo de importação (NaN e texto vazio viram None).
+    """
+    if valor is None or (not isinstance(valor, str) and pd.isna(valor)):
+        return None
+    if isinstance(valor, str):
+        valor = valor.strip()
+        return valor or None
+    return valor
+
+def _data_importacao(valor) -> datetime | None:
+    """
+    Converte uma data de arquivo de importação (DD/MM/AAAA ou ISO) em datetime.
+    """
+    valor = _valor_importacao(valor)
+    if valor is None:
+        return None
+    if isinstance(valor, str) and validar_data(valor):
+        return data_datetime(valor)
+    data = pd.to_datetime(valor, errors="coerce")
+    return None if pd.isna(data) else data.to_pydatetime().replace(tzinfo=None)
+
+def importar_colaboradores(conn: oracledb.Connection, df: pd.DataFrame, tamanho_lote: int = 500) -> dict:
+    """
+    Valida e insere colaboradores a partir de um DataFrame (colunas do banco ou nomes de exibição).
+
+    Aplica as mesmas regras do cadastro interativo (CPF com 11 dígitos e único, nome e cargo com
+    pelo menos 3 caracteres, idade mínima de 16 anos, datas coerentes). Se o logradouro não vier no
+    arquivo, o endereço é resolvido pelo CEP. As linhas válidas são inseridas com executemany em lotes.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        df: Os dados a importar (ex.: retorno de ler_arquivo_importacao()).
+        tamanho_lote: Quantidade de linhas por executemany/commit.
+
+    Returns:
+        dict: {"inseridos": int, "rejeitados": list[tuple[int, str]]} com o número da linha e o motivo.
+    """
+    df = df.rename(columns={v: k for k, v in mapeamento_colunas.items()})
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT nr_cpf FROM T_MNDSH_COLABORADOR")
+        cpfs_existentes = {linha[0] for linha in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+    linhas = []
+    rejeitados = []
+    for i, registro in enumerate(df.to_dict(orient="records"), 1):
+        r = {k: _valor_importacao(v) for k, v in registro.items()}
+        cpf = "".join(c for c in str(r.get("nr_cpf") or "") if c.isdigit())
+        nascimento = _data_importacao(r.get("dt_nascimento"))
+        admissao = _data_importacao(r.get("dt_admissao"))
+        demissao = _data_importacao(r.get("dt_demissao"))
+        salario = r.get("vl_salario")
+        salario = salario if isinstance(salario, (int, float)) else parse_salario(str(salario or ""))
+        sexo = str(r.get("ds_sexo") or "").upper()[:1]
+        motivo = None
+        if not validar_cpf(cpf):
+            motivo = "CPF inválido"
+        elif cpf in cpfs_existentes:
+            motivo = "CPF já cadastrado"
+        elif len(str(r.get("nm_colaborador") or "")) < 3:
+            motivo = "Nome inválido"
+        elif nascimento is None or (datetime.now() - nascimento).days // 365 < 16:
+            motivo = "Data de nascimento inválida"
+        elif sexo not in ("M", "F"):
+            motivo = "Sexo inválido"
+        elif not salario or salario <= 0:
+            motivo = "Salário inválido"
+        elif len(str(r.get("ds_cargo") or "")) < 3:
+            motivo = "Cargo inválido"
+        elif admissao is None or admissao < nascimento + timedelta(days=16*365) or admissao > datetime.now():
+            motivo = "Data de admissão inválida"
+        elif demissao is not None and (demissao < admissao or demissao > datetime.now()):
+            motivo = "Data de demissão inválida"
+        elif not r.get("nr_endereco"):
+            motivo = "Número do endereço obrigatório"
+        if motivo is None:
+            endereco = {"logradouro": r.get("ds_logradouro"), "bairro": r.get("ds_bairro"),
+                        "cidade": r.get("ds_cidade"), "estado": r.get("ds_estado")}
+            if not all(endereco.values()):
+                try:
+                    cep = normalizar_cep(r.get("cep") or "")
+                    endereco = _resolver_cep(cep) if len(cep) == 8 and cep.isdigit() else None
+                except Exception:
+                    endereco = None
+                if not endereco:
+                    motivo = "CEP inválido ou não encontrado"
+        if motivo:
+            rejeitados.append((i, motivo))
+            continue
+        cpfs_existentes.add(cpf)
+        linhas.append({"cpf": cpf, "nome": r["nm_colaborador"], "nasc": nascimento, "sexo": sexo, "cep": r.get("cep"),
+                       "logradouro": endereco["logradouro"], "numero": str(r["nr_endereco"]), "bairro": endereco["bairro"],
+                       "cidade": endereco["cidade"], "estado": endereco["estado"], "salario": float(salario), "cargo": r["ds_cargo"],
+                       "admissao": admissao, "demissao": demissao, "status": "Inativo" if demissao else "Ativo"})
+
+    cursor = conn.cursor()
+    try:
+        for inicio in range(0, len(linhas), tamanho_lote):
+            cursor.executemany("""
+                INSERT INTO T_MNDSH_COLABORADOR (nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco, ds_bairro, ds_cidade,
+                           ds_estado, vl_salario, ds_cargo, dt_admissao, dt_demissao, ds_status, dt_criacao, dt_ultima_modificacao)
+                VALUES (:cpf, :nome, :nasc, :sexo, :cep, :logradouro, :numero, :bairro, :cidade, :estado, :salario, :cargo,
+                        :admissao, :demissao, :status, SYSDATE, SYSDATE)
+            """, linhas[inicio:inicio + tamanho_lote])
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return {"inseridos": len(linhas), "rejeitados": rejeitados}
+
+def importar_tarefas(conn: oracledb.Connection, df: pd.DataFrame, tamanho_lote: int = 500) -> dict:
+    """
+    Valida e insere tarefas a partir de um DataFrame (colunas do banco ou nomes de colunas_tarefas).
+
+    O colaborador é identificado pelo CPF; status e prioridade seguem os valores aceitos pela tabela
+    (padrão 'pendente' e 'baixa'). As linhas válidas são inseridas com executemany em lotes.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        df: Os dados a importar (ex.: retorno de ler_arquivo_importacao()).
+        tamanho_lote: Quantidade de linhas por executemany/commit.
+
+    Returns:
+        dict: {"inseridos": int, "rejeitados": list[tuple[int, str]]} com o número da linha e o motivo.
+    """
+    df = df.rename(columns=colunas_tarefas)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT nr_cpf, id FROM T_MNDSH_COLABORADOR")
+        id_por_cpf = dict(cursor.fetchall())
+    finally:
+        cursor.close()
 
-                            idade_min_admissao = data_nasc_dt + timedelta(days=16*365)
-                            
-                            if data_admissao_dt_atual < idade_min_admissao:
-                                print(f"\n {margem} Esta nova data de nascimento torna a data de admissão ({colaborador_dicionario['dt_admissao']}) inválida.\n")
-                                print(f"\n {margem} Altere a data de admissão ou desista desta alteração.")
-                                if not perguntar_continuar("alterar outro campo"):
-                                    break 
-                                continue
+    linhas = []
+    rejeitados = []
+    for i, registro in enumerate(df.to_dict(orient="records"), 1):
+        r = {k: _valor_importacao(v) for k, v in registro.items()}
+        cpf = "".join(c for c in str(r.get("nr_cpf") or "") if c.isdigit())
+        prazo = _data_importacao(r.get("dt_prazo"))
+        prioridade = str(r.get("ds_prioridade") or "baixa").lower()
+        status = str(r.get("ds_status") or "pendente").lower()
+        motivo = None
+        if cpf not in id_por_cpf:
+            motivo = "Colaborador não encontrado"
+        elif len(str(r.get("ds_titulo") or "")) < 5:
+            motivo = "Título deve conter ao menos 5 caracteres"
+        elif prazo is None:
+            motivo = "Prazo inválido"
+        elif prioridade not in ("baixa", "média", "alta"):
+            motivo = "Prioridade inválida"
+        elif status not in ("pendente", "em andamento", "concluída"):
+            motivo = "Status inválido"
+        if motivo:
+            rejeitados.append((i, motivo))
+            continue
+        linhas.append({"id": id_por_cpf[cpf], "titulo": r["ds_titulo"], "descricao": r.get("ds_descricao"),
+                       "prioridade": prioridade, "status": status, "prazo": prazo})
 
-                        novo_valor = entrada 
-                    # CEP 
-                    elif escolha == "CEP":                        
-                        endereco = endereco_cep(entrada)
-                        if not endereco:
-                            print(f"\n {margem} CEP inválido ou não encontrado.\n")
-                            if not perguntar_continuar("informar outro CEP"):
-                                break 
-                            continue
+    cursor = conn.cursor()
+    try:
+        for inicio in range(0, len(linhas), tamanho_lote):
+            cursor.executemany("""
+                INSERT INTO T_MNDSH_TAREFA(id_colaborador, ds_titulo, ds_descricao, ds_prioridade, dt_prazo, ds_status, dt_criacao, dt_modificacao)
+                VALUES (:id, :titulo, :descricao, :prioridade, :prazo, :status, SYSDATE, SYSDATE)
+            """, linhas[inicio:inicio + tamanho_lote])
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return {"inseridos": len(linhas), "rejeitados": rejeitados}
 
-                        print(f"\n {margem} Endereço encontrado:")
-                        print(f" {margem} Logradouro: {endereco['logradouro']}")
-                        print(f" {margem} Bairro: {endereco['bairro']}")
-                        print(f" {margem} Cidade: {endereco['cidade']}")
-                        print(f" {margem} Estado: {endereco['estado']}")
-                        
-                        cursor = conn.cursor()
-                        cursor.execute("""
-                            UPDATE T_MNDSH_COLABORADOR
-                            SET cep = :cep, ds_logradouro = :logradouro, ds_bairro = :bairro, ds_cidade = :cidade,
-                                ds_estado = :estado, dt_ultima_modificacao = SYSDATE
-                            WHERE id = :id
-                        """, {"cep": entrada, "logradouro": endereco["logradouro"], "bairro": endereco["bairro"],
-                            "cidade": endereco["cidade"], "estado": endereco["estado"], "id": colaborador_dicionario["id"]})
-                        conn.commit()
-                        cursor.close()
+# ====== Registro de métricas e relatórios ======
 
-                        colaborador_dicionario.update({"cep": entrada, "ds_logradouro": endereco["logradouro"],
-                            "ds_bairro": endereco["bairro"],"ds_cidade": endereco["cidade"], "ds_estado": endereco["estado"]})
-                            
-                        print(f"\n {margem} Endereço atualizado com sucesso!\n")
-                        input("Pressione ENTER...")
-                        
-                        novo_valor = "CEP_ATUALIZADO" 
-                        break 
-                    # NÚMERO DA RESIDÊNCIA
-                    elif escolha == "Número":
-                        if not entrada.isdigit():
-                            print(f"\n {margem} Número inválido! Digite apenas números.\n")
-                            if not perguntar_continuar("informar outro número"):
-                                break 
-                            continue
-                        novo_valor = int(entrada)
-                    # SALÁRIO
-                    elif escolha == "Salário":
-                        salario = parse_salario(entrada)
-                        if salario is None:
-                            print(f"\n {margem} Valor inválido para salário!\n")
-                            if not perguntar_continuar("informar outro salário"):
-                                break 
-                            continue
-                        novo_valor = salario                        
-                    # CARGO
-                    elif escolha == "Cargo":
-                        if len(entrada) < 3:
-                            print(f"\n {margem} O cargo deve ter pelo menos 3 caracteres.\n")
-                            if not perguntar_continuar("informar outro cargo"):
-                                break 
-                            continue
-                        novo_valor = entrada
-                    # DATA DE ADMISSÃO
-                    elif escolha == "Data de admissão":
-                        data_nasc_valor_atual = colaborador_dicionario["dt_nascimento"]
-                        if isinstance(data_nasc_valor_atual, datetime):
-                            data_nasc_str_atual = data_nasc_valor_atual.strftime('%d/%m/%Y')
-                        else:
-                            data_nasc_str_atual = str(data_nasc_valor_atual)
-                        data_nasc_dt_atual = data_datetime(data_nasc_str_atual)
-                        if not validar_data(entrada):
-                            print(f"\n {margem} Data de admissão inválida!\n")
-                            if not perguntar_continuar("informar outra data"):
-                                break 
-                            continue
-                            
-                        data_admissao_dt = data_datetime(entrada)
-                        if data_admissao_dt < data_nasc_dt_atual + timedelta(days=16*365):
-                            print(f"\n {margem} A data de admissão não pode ser antes de o colaborador completar 16 anos!\n")
-                            if not perguntar_continuar("informar outra data"):
-                                break 
-                            continue
-                        if data_admissao_dt > datetime.now():
-                            print(f"\n {margem} A data de admissão não pode ser futura!\n")
-                            if not perguntar_continuar("informar outra data"):
-                                break 
-                            continue
-                        novo_valor = entrada 
-                        break 
-                    # DATA DE DEMISSÃO
-                    elif escolha == "Data de demissão":
-                        data_admissao_valor_atual = colaborador_dicionario["dt_admissao"]
-                        data_admissao_dt_atual = None
-                        if pd.notna(data_admissao_valor_atual):
-                            if isinstance(data_admissao_valor_atual, datetime):
-                                data_admissao_str_atual = data_admissao_valor_atual.strftime('%d/%m/%Y')
-                            else:
-                                data_admissao_str_atual = str(data_admissao_valor_atual)
-                            try:
-                                data_admissao_dt_atual = data_datetime(data_admissao_str_atual)
-                            except:
-                                pass 
-                        if not entrada:
-                            cursor = conn.cursor()
-                            cursor.execute("""
-                                UPDATE T_MNDSH_COLABORADOR
-                                SET dt_demissao = NULL, ds_status = 'Ativo', dt_ultima_modificacao = SYSDATE
-                                WHERE id = :id
-                            """, {"id": colaborador_dicionario["id"]})
-                            conn.commit()
-                            cursor.close()
+# Campos de cada categoria de métrica diária (todas na mesma linha de T_MNDSH_METRICA_DIA; a visão
+# T_MNDSH_METRICA mantém o formato anterior, de uma linha por categoria)
+campos_metricas_diarias = {
+    "Produtividade": ["horas_produtivas", "nivel_foco", "tarefas_concluidas", "tarefas_andamento", "tarefas_pendentes",
+                      "concluidas_no_prazo", "concluidas_atraso"],
+    "Bem-estar emocional": ["estresse", "humor", "energia", "controle_dia"],
+    "Satisfação no trabalho": ["satisfacao_geral", "relacao_colegas", "reconhecimento", "carga_trabalho"],
+    "Qualidade do sono": ["horas_dormidas", "descanso", "despertares"],
+    "Bem-estar físico": ["atividade_fisica", "ingestao_agua", "intensidade_atividade"]
+}
+# Notas de 0 a 10 informadas pelo colaborador (os contadores de tarefas são calculados pelo sistema)
+notas_metricas_diarias = ["horas_produtivas", "nivel_foco", "estresse", "humor", "energia", "controle_dia", "satisfacao_geral",
+                          "relacao_colegas", "reconhecimento", "carga_trabalho", "horas_dormidas", "descanso", "despertares",
+                          "atividade_fisica", "ingestao_agua", "intensidade_atividade"]
+# Colunas de métricas de T_MNDSH_METRICA_DIA, na ordem das categorias
+colunas_metricas_diarias = [campo for campos in campos_metricas_diarias.values() for campo in campos]
+
+def tipo_objeto_banco(conn: oracledb.Connection, nome: str) -> str | None:
+    """
+    Informa se o nome é de uma tabela ou visão do esquema atual, no Oracle (user_objects) ou no banco local.
 
-                            colaborador_dicionario["dt_demissao"] = None
-                            colaborador_dicionario["ds_status"] = "Ativo"
-                            print(f"\n {margem} Data de demissão removida e status atualizado para Ativo com sucesso!\n")
-                            input("Pressione ENTER...")
-                            novo_valor = "DEMISSAO_ATUALIZADA" 
-                            break 
-                        else:
-                            if not validar_data(entrada):
-                                print(f"\n {margem} Data de demissão inválida!\n")
-                                if not perguntar_continuar("informar outra data"):
-                                    break 
-                                continue
-                            data_demissao_dt = data_datetime(entrada)
-                            if data_admissao_dt_atual and data_demissao_dt < data_admissao_dt_atual:
-                                print(f"\n {margem} A data de demissão não pode ser antes da admissão!\n")
-                                if not perguntar_continuar("informar outra data"):
-                                    break 
-                                continue
-                            if data_demissao_dt > datetime.now():
-                                print(f"\n {margem} A data de demissão não pode ser futura!\n")
-                                if not perguntar_continuar("informar outra data"):
-                                    break 
-                                continue
-                                
-                            novo_valor = entrada 
-                            status = "Inativo"
-                            
-                            cursor = conn.cursor()
-                            cursor.execute("""
-                                UPDATE T_MNDSH_COLABORADOR
-                                SET ds_status = :status, dt_ultima_modificacao = SYSDATE
-                                WHERE id = :id
-                            """, {"status": status, "id": colaborador_dicionario["id"]})
-                            conn.commit()
-                            cursor.close()
-                            colaborador_dicionario["ds_status"] = status
-                            break 
-                    break 
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        nome: Nome do objeto em maiúsculas (ex.: "T_MNDSH_METRICA").
 
-                if novo_valor is None or novo_valor == "CEP_ATUALIZADO" or novo_valor == "DEMISSAO_ATUALIZADA":
-                    continue
+    Returns:
+        str: "table" ou "view".
+        None: Se o objeto não existir.
+    """
+    cursor = conn.cursor()
+    try:
+        if eh_sqlite(conn):
+            cursor.execute("SELECT type FROM sqlite_master WHERE name = :nome AND type IN ('table', 'view')", {"nome": nome})
+        else:
+            cursor.execute("SELECT LOWER(object_type) FROM user_objects WHERE object_name = :nome AND object_type IN ('TABLE', 'VIEW')",
+                           {"nome": nome})
+        linha = cursor.fetchone()
+    finally:
+        cursor.close()
+    return linha[0] if linha else None
 
-                cursor = conn.cursor()
-                if escolha in ["Data de nascimento", "Data de admissão", "Data de demissão"]:
-                    sql = f"""
-                        UPDATE T_MNDSH_COLABORADOR
-                        SET {campo_sql} = TO_DATE(:valor, 'DD/MM/YYYY'),
-                            dt_ultima_modificacao = SYSDATE
-                        WHERE id = :id
-                    """
-                else:
-                    sql = f"""
-                        UPDATE T_MNDSH_COLABORADOR
-                        SET {campo_sql} = :valor,
-                            dt_ultima_modificacao = SYSDATE
-                        WHERE id = :id
-                    """
-                cursor.execute(sql, {"valor": novo_valor, "id": colaborador_dicionario["id"]})
+def colunas_tabela(conn: oracledb.Connection, tabela: str) -> list[str]:
+    """
+    Lista as colunas (em minúsculas) de uma tabela do banco, inclusive as virtuais.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        tabela: O nome da tabela (em maiúsculas).
+
+    Returns:
+        list[str]: Os nomes das colunas (vazia se a tabela não existir).
+    """
+    cursor = conn.cursor()
+    try:
+        if eh_sqlite(conn):
+            cursor.execute(f"PRAGMA table_xinfo({tabela})")
+            return [linha[1].lower() for linha in cursor.fetchall()]
+        cursor.execute("SELECT LOWER(column_name) FROM user_tab_columns WHERE table_name = :tabela ORDER BY column_id",
+                       {"tabela": tabela})
+        return [linha[0] for linha in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+def comando_visao_metrica() -> str:
+    """
+    Monta o CREATE VIEW da visão de compatibilidade T_MNDSH_METRICA: cada linha de T_MNDSH_METRICA_DIA
+    aparece como cinco linhas, uma por categoria (tipo_metrica), com as colunas das outras categorias nulas,
+    como era a tabela antes da conversão. O id_metrica é derivado do id_metrica_dia e o nr_cpf vem de
+    T_MNDSH_COLABORADOR pela chave id_colaborador.
+
+    Dependências:
+        - Variáveis: campos_metricas_diarias, colunas_metricas_diarias.
+    """
+    selects = []
+    for ordem, (tipo, campos) in enumerate(campos_metricas_diarias.items(), start=1):
+        colunas = ", ".join(f"m.{campo}" if campo in campos else f"NULL AS {campo}" for campo in colunas_metricas_diarias)
+        selects.append(f"SELECT m.id_metrica_dia * {len(campos_metricas_diarias)} + {ordem} AS id_metrica, m.id_colaborador, c.nr_cpf, "
+                       f"'{tipo}' AS tipo_metrica, m.dt_registro, m.dt_dia, {colunas} "
+                       f"FROM T_MNDSH_METRICA_DIA m JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador")
+    return "CREATE VIEW T_MNDSH_METRICA AS " + " UNION ALL ".join(selects)
+
+def converter_metricas_largas(conn: oracledb.Connection) -> int:
+    """
+    Converte as métricas do formato anterior (tabela T_MNDSH_METRICA, uma linha por categoria) para
+    T_MNDSH_METRICA_DIA (uma linha por colaborador e dia): a tabela antiga é renomeada para
+    T_MNDSH_METRICA_LEGADO, as cinco categorias de cada dia são agrupadas em uma linha e a visão de
+    compatibilidade T_MNDSH_METRICA é criada no lugar da tabela.
+
+    Se uma categoria foi registrada mais de uma vez no dia, vale o primeiro registro (a mesma política do
+    upsert de gravar_metricas_lote). O CPF da tabela antiga é trocado pelo id do colaborador. Dias que já estão em T_MNDSH_METRICA_DIA não são regravados, então a
+    conversão interrompida pode ser repetida. A tabela T_MNDSH_METRICA_LEGADO é mantida para conferência.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+
+    Returns:
+        int: Quantidade de dias gravados em T_MNDSH_METRICA_DIA.
+
+    Dependências:
+        - Funções: tipo_objeto_banco, comando_visao_metrica.
+        - Variáveis: campos_metricas_diarias, colunas_metricas_diarias.
+    """
+    tipo_categoria = {campo: tipo for tipo, campos in campos_metricas_diarias.items() for campo in campos}
+    agregados = ", ".join(f"MAX(CASE WHEN tipo_metrica = '{tipo_categoria[campo]}' THEN {campo} END)"
+                          for campo in colunas_metricas_diarias)
+    gravados = 0
+    cursor = conn.cursor()
+    try:
+        atual = tipo_objeto_banco(conn, "T_MNDSH_METRICA")
+        if atual == "table":
+            cursor.execute("ALTER TABLE T_MNDSH_METRICA RENAME TO T_MNDSH_METRICA_LEGADO")
+        if tipo_objeto_banco(conn, "T_MNDSH_METRICA_LEGADO") == "table":
+            cursor.execute(f"""
+                INSERT INTO T_MNDSH_METRICA_DIA (id_colaborador, dt_registro, {", ".join(colunas_metricas_diarias)})
+                SELECT c.id, MIN(p.dt_registro), {agregados}
+                FROM (SELECT l.*, ROW_NUMBER() OVER (PARTITION BY nr_cpf, TRUNC(dt_registro), tipo_metrica
+                                                     ORDER BY dt_registro, id_metrica) AS ordem
+                      FROM T_MNDSH_METRICA_LEGADO l) p
+                JOIN T_MNDSH_COLABORADOR c ON c.nr_cpf = p.nr_cpf
+                WHERE p.ordem = 1
+                  AND NOT EXISTS (SELECT 1 FROM T_MNDSH_METRICA_DIA d
+                                  WHERE d.id_colaborador = c.id AND d.dt_dia = TRUNC(p.dt_registro))
+                GROUP BY c.id, TRUNC(p.dt_registro)
+            """)
+            gravados = max(cursor.rowcount or 0, 0)
+        if atual != "view":
+            cursor.execute(comando_visao_metrica())
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return gravados
+
+# Tabelas filhas do colaborador: chave primária e as restrições e índices sobre id_colaborador
+# (as restrições antigas sobre nr_cpf são removidas por converter_chave_colaborador)
+chaves_colaborador = {
+    "T_MNDSH_TAREFA": {
+        "chave": "id_tarefa",
+        "restricoes": {"fk_tarefa_colaborador_id": "FOREIGN KEY (id_colaborador) REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE"},
+        "indices": {"idx_tarefa_colaborador": "(id_colaborador, ds_status, dt_prazo)"}
+    },
+    "T_MNDSH_METRICA_DIA": {
+        "chave": "id_metrica_dia",
+        "restricoes": {"fk_metrica_dia_colaborador_id": "FOREIGN KEY (id_colaborador) REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE",
+                       "uk_metrica_dia_colaborador": "UNIQUE (id_colaborador, dt_dia)"},
+        "indices": {}
+    },
+    "T_MNDSH_METRICA_ARQUIVO": {
+        "chave": "id_metrica_dia",
+        "restricoes": {"fk_metrica_arquivo_colaborador_id": "FOREIGN KEY (id_colaborador) REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE",
+                       "uk_metrica_arquivo_colaborador": "UNIQUE (id_colaborador, dt_dia)"},
+        "indices": {}
+    }
+}
+
+def _preencher_id_colaborador(conn: oracledb.Connection, tabela: str, chave: str, tamanho_lote: int) -> int:
+    """
+    Preenche (ou corrige) id_colaborador a partir do nr_cpf de cada linha, em faixas de 'tamanho_lote' valores
+    da chave primária, com um commit por faixa. Linhas já corretas não são alteradas, então a carga
+    interrompida pode ser repetida.
+    """
+    atualizadas = 0
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT MIN({chave}), MAX({chave}) FROM {tabela}")
+        menor, maior = cursor.fetchone()
+        if menor is None:
+            return 0
+        for inicio in range(int(menor), int(maior) + 1, tamanho_lote):
+            cursor.execute(f"""
+                UPDATE {tabela} t
+                SET id_colaborador = (SELECT c.id FROM T_MNDSH_COLABORADOR c WHERE c.nr_cpf = t.nr_cpf)
+                WHERE t.{chave} >= :inicio AND t.{chave} < :fim
+                  AND (t.id_colaborador IS NULL
+                       OR t.id_colaborador <> (SELECT c.id FROM T_MNDSH_COLABORADOR c WHERE c.nr_cpf = t.nr_cpf))
+            """, {"inicio": inicio, "fim": inicio + tamanho_lote})
+            atualizadas += max(cursor.rowcount or 0, 0)
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return atualizadas
+
+def converter_chave_colaborador(conn: oracledb.Connection, tamanho_lote: int = 50000) -> dict:
+    """
+    Troca a referência ao colaborador das tabelas filhas (chaves_colaborador) de nr_cpf para id_colaborador.
+
+    No Oracle, cada tabela é alterada no lugar: a coluna id_colaborador é criada (se faltar) e preenchida
+    em lotes pela chave primária, passa a NOT NULL, recebe a chave estrangeira, a chave única diária e os
+    índices de chaves_colaborador, e só então nr_cpf é marcada sem uso (SET UNUSED, sem reescrever a tabela)
+    com as restrições antigas. O arquivo de métricas, que tem compressão básica, é recomprimido depois
+    do preenchimento. No banco local, a tabela antiga é renomeada para <tabela>_CPF, recriada pelo esquema
+    atual e copiada com o id de cada CPF. Nos dois casos a visão T_MNDSH_METRICA é recriada e cada passo
+    confere o estado antes de agir, então a conversão interrompida pode ser repetida.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        tamanho_lote: Valores da chave primária por lote do preenchimento (Oracle).
+
+    Returns:
+        dict: Linhas preenchidas (Oracle) ou copiadas (banco local) por tabela convertida.
+
+    Dependências:
+        - Funções: eh_sqlite, colunas_tabela, tipo_objeto_banco, comando_visao_metrica, _preencher_id_colaborador.
+        - Variáveis: chaves_colaborador, _ESQUEMA_SQLITE.
+    """
+    convertidas = {}
+    cursor = conn.cursor()
+    try:
+        if eh_sqlite(conn):
+            pendentes = [tabela for tabela in chaves_colaborador if "nr_cpf" in colunas_tabela(conn, tabela)]
+            if pendentes:
+                cursor.execute("PRAGMA legacy_alter_table = ON")
+                for tabela in pendentes:
+                    cursor.execute(f"ALTER TABLE {tabela} RENAME TO {tabela}_CPF")
+                cursor.execute("PRAGMA legacy_alter_table = OFF")
+                conn._conn.executescript(_ESQUEMA_SQLITE)
+            for tabela in chaves_colaborador:
+                if tipo_objeto_banco(conn, f"{tabela}_CPF") != "table":
+                    continue
+                antigas = set(colunas_tabela(conn, f"{tabela}_CPF"))
+                colunas = [coluna for coluna in colunas_tabela(conn, tabela)
+                           if coluna not in ("id_colaborador", "dt_dia") and coluna in antigas]
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO {tabela} (id_colaborador, {", ".join(colunas)})
+                    SELECT c.id, {", ".join("o." + coluna for coluna in colunas)}
+                    FROM {tabela}_CPF o
+                    JOIN T_MNDSH_COLABORADOR c ON c.nr_cpf = o.nr_cpf
+                """)
+                convertidas[tabela] = max(cursor.rowcount or 0, 0)
+                cursor.execute(f"DROP TABLE {tabela}_CPF")
                 conn.commit()
-                cursor.close()
-                colaborador_dicionario[campo_sql] = novo_valor
-                print(f"\n {margem} {escolha} atualizado com sucesso!\n")
-                input("Pressione ENTER...")   
-        except Exception as e:
-            print(f"\n{margem} Erro ao atualizar colaborador: {e}\n")
-            conn.rollback()
-        if not perguntar_continuar2("atualizar outro colaborador"):
-            break
+            if convertidas:
+                # Os índices de mesmo nome ficaram com as tabelas _CPF até elas serem apagadas
+                conn._conn.executescript(_ESQUEMA_SQLITE)
+            if convertidas and tipo_objeto_banco(conn, "T_MNDSH_METRICA") == "view":
+                cursor.execute("DROP VIEW T_MNDSH_METRICA")
+                cursor.execute(comando_visao_metrica())
+                conn.commit()
+            return convertidas
+
+        for tabela, definicao in chaves_colaborador.items():
+            colunas = colunas_tabela(conn, tabela)
+            if not colunas:
+                continue
+            if "nr_cpf" in colunas:
+                if "id_colaborador" not in colunas:
+                    cursor.execute(f"ALTER TABLE {tabela} ADD (id_colaborador NUMBER)")
+                convertidas[tabela] = _preencher_id_colaborador(conn, tabela, definicao["chave"], tamanho_lote)
+                cursor.execute("SELECT nullable FROM user_tab_columns WHERE table_name = :tabela AND column_name = 'ID_COLABORADOR'",
+                               {"tabela": tabela})
+                if cursor.fetchone()[0] == "Y":
+                    cursor.execute(f"ALTER TABLE {tabela} MODIFY (id_colaborador NOT NULL)")
+            for nome, restricao in definicao["restricoes"].items():
+                cursor.execute("SELECT 1 FROM user_constraints WHERE constraint_name = :nome", {"nome": nome.upper()})
+                if cursor.fetchone() is None:
+                    cursor.execute(f"ALTER TABLE {tabela} ADD CONSTRAINT {nome} {restricao}")
+            for nome, indice in definicao["indices"].items():
+                cursor.execute("SELECT 1 FROM user_indexes WHERE index_name = :nome", {"nome": nome.upper()})
+                if cursor.fetchone() is None:
+                    cursor.execute(f"CREATE INDEX {nome} ON {tabela}{indice} ONLINE")
+            if "nr_cpf" in colunas:
+                cursor.execute(f"ALTER TABLE {tabela} SET UNUSED (nr_cpf) CASCADE CONSTRAINTS")
+                if tabela == "T_MNDSH_METRICA_ARQUIVO" and convertidas[tabela]:
+                    # O UPDATE descomprime as linhas alteradas; MOVE regrava cada partição comprimida
+                    cursor.execute("SELECT partition_name FROM user_tab_partitions WHERE table_name = :tabela", {"tabela": tabela})
+                    for (particao,) in cursor.fetchall():
+                        cursor.execute(f"ALTER TABLE {tabela} MOVE PARTITION {particao} ROW STORE COMPRESS BASIC UPDATE INDEXES")
+        if convertidas:
+            cursor.execute(comando_visao_metrica().replace("CREATE VIEW", "CREATE OR REPLACE VIEW", 1))
+        return convertidas
+    finally:
+        cursor.close()
+
+def metricas_registradas_hoje(conn: oracledb.Connection, cpf_colaborador: str) -> bool:
+    """
+    Verifica se o colaborador já registrou as métricas na data atual, pela chave diária (id_colaborador, dt_dia):
+    a consulta é respondida só pelo índice único uk_metrica_dia_colaborador, sem ler a tabela.
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador.
+
+    Returns:
+        bool: True se já existe registro hoje, False caso contrário.
+    """
+    agora = datetime.now()
+    hoje = datetime(agora.year, agora.month, agora.day)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT 1
+            FROM T_MNDSH_METRICA_DIA
+            WHERE id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf)
+              AND dt_dia = :hoje
+        """, {"cpf": cpf_colaborador, "hoje": hoje})
+        return cursor.fetchone() is not None
+    finally:
+        cursor.close()
 
-def excluir_colaborador(conn: oracledb.Connection) -> None:
+def contar_tarefas_colaborador(conn: oracledb.Connection, cpf_colaborador: str) -> dict:
     """
-    Busca um colaborador por ID/CPF e, após confirmação, o exclui (DELETE) do banco de dados.
-    Exibe os dados completos do colaborador antes de solicitar a confirmação final.
-    Em caso de sucesso, realiza o commit.
+    Calcula os contadores objetivos de tarefas usados na métrica de Produtividade.
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador.
 
     Returns:
-        None: A função realiza a ação de exclusão.
-
-    Dependências:
-        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes2,
-                   perguntar_continuar2.
-        - Variáveis: margem, mapeamento_colunas.
+        dict: Chaves tarefas_concluidas, tarefas_andamento, tarefas_pendentes, concluidas_no_prazo e concluidas_atraso.
     """
-    while True:
-        limpa_tela()
-        cursor = conn.cursor()
-        try:
-            colaborador = buscar_colaborador(conn, titulo_menu="EXCLUIR COLABORADOR")
-            if not colaborador:  
-                break
-            limpa_tela()
-            grupos_personalizados = [
-                    ("DADOS PESSOAIS", ['Id', 'CPF', 'Nome', 'Data de nascimento', 'Sexo', 'CEP', 'Logradouro', 'Número', 'Bairro', 'Cidade', 'Estado']),
-                    ("VÍNCULO EMPREGATÍCIO", ['Id', 'CPF', 'Nome', 'Salário', 'Cargo', 'Data de admissão', 'Data de demissão', 'Status', 'Data Criação', 'Data última modificação']),
-                ]
-            df = pd.DataFrame([colaborador.copy()]) 
-            df.rename(columns=mapeamento_colunas, inplace=True) 
-            imprimir_tabela(df, 
-                            titulo=f"DADOS DO COLABORADOR: {colaborador.get('nm_colaborador','')}", 
-                            colunas_datas=['Data de nascimento', 'Data de admissão', 'Data de demissão'], 
-                            colunas_datetime=['Data Criação', 'Data última modificação'], 
-                            colunas_moeda=['Salário'], 
-                            colunas_exibir=grupos_personalizados)
-            confirmacao = menu_opcoes2(f"\nTem certeza que deseja excluir o colaborador {colaborador.get('nm_colaborador','')} - CPF: {colaborador.get('nr_cpf','')} (ID: {colaborador['id']})?", ["Sim", "Não"], ["S", "N"])
-            if confirmacao != "S":
-                print(f"\n {margem} Exclusão cancelada.\n")
-                input("\nPressione ENTER para continuar...")
-                limpa_tela()
-            else:
-                cursor.execute("DELETE FROM T_MNDSH_COLABORADOR WHERE id = :id", {"id": colaborador["id"]})
-                conn.commit()
-                print(f"\n {margem} Colaborador excluído com sucesso!\n")
-                input("\nPressione ENTER para continuar...")
-                limpa_tela()
-        except Exception as e:
-            print(f"\n {margem} Erro ao excluir colaborador:", e, "\n")
-            conn.rollback()
-        finally:
-            cursor.close()
-        if not perguntar_continuar2("excluir outro colaborador"):
-            break
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT
+                SUM(CASE WHEN ds_status = 'concluída' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN ds_status = 'em andamento' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN ds_status = 'pendente' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN ds_status = 'concluída' AND TRUNC(dt_prazo) >= TRUNC(SYSDATE) THEN 1 ELSE 0 END),
+                SUM(CASE WHEN ds_status = 'concluída' AND TRUNC(dt_prazo) < TRUNC(SYSDATE) THEN 1 ELSE 0 END)
+            FROM T_MNDSH_TAREFA
+            WHERE id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf)
+        """, {"cpf": cpf_colaborador})
+        r = cursor.fetchone()
+    finally:
+        cursor.close()
+    chaves = ["tarefas_concluidas", "tarefas_andamento", "tarefas_pendentes", "concluidas_no_prazo", "concluidas_atraso"]
+    return {chave: int(valor or 0) for chave, valor in zip(chaves, r)}
 
-# ====== CRUD tarefas ======
+def contar_tarefas_colaboradores(conn: oracledb.Connection, cpfs: list[str]) -> dict:
+    """
+    Versão em lote de contar_tarefas_colaborador(): uma consulta agrupada por CPF (até 500 CPFs por consulta).
 
-# ADMINISTRADOR 
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpfs: Os CPFs dos colaboradores.
 
-def adicionar_tarefa_admin(conn: oracledb.Connection) -> None:
+    Returns:
+        dict: {cpf: contadores}, com os contadores zerados para quem não tem tarefas.
     """
-    Permite ao administrador selecionar um colaborador e atribuir uma nova tarefa.
+    chaves = ["tarefas_concluidas", "tarefas_andamento", "tarefas_pendentes", "concluidas_no_prazo", "concluidas_atraso"]
+    cpfs = list(dict.fromkeys(cpfs))
+    contadores = {cpf: dict.fromkeys(chaves, 0) for cpf in cpfs}
+    cursor = conn.cursor()
+    try:
+        for i in range(0, len(cpfs), 500):
+            binds = {f"c{j}": cpf for j, cpf in enumerate(cpfs[i:i + 500])}
+            cursor.execute(f"""
+                SELECT c.nr_cpf,
+                    SUM(CASE WHEN t.ds_status = 'concluída' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN t.ds_status = 'em andamento' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN t.ds_status = 'pendente' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN t.ds_status = 'concluída' AND TRUNC(t.dt_prazo) >= TRUNC(SYSDATE) THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN t.ds_status = 'concluída' AND TRUNC(t.dt_prazo) < TRUNC(SYSDATE) THEN 1 ELSE 0 END)
+                FROM T_MNDSH_COLABORADOR c
+                JOIN T_MNDSH_TAREFA t ON t.id_colaborador = c.id
+                WHERE c.nr_cpf IN ({", ".join(":" + nome for nome in binds)})
+                GROUP BY c.nr_cpf
+            """, binds)
+            for linha in cursor.fetchall():
+                contadores[linha[0]] = {chave: int(valor or 0) for chave, valor in zip(chaves, linha[1:])}
+    finally:
+        cursor.close()
+    return contadores
 
-    A função solicita o ID/CPF do colaborador buscar_colaborador(), o título, a descrição, a prioridade (via menu) e o prazo.
-    O prazo é validado para garantir que seja uma data futura. A tarefa é
-    inserida na tabela T_MNDSH_TAREFA com o status inicial 'pendente'.
+def ids_colaboradores(conn: oracledb.Connection, cpfs: list[str]) -> dict:
+    """
+    Obtém o id dos colaboradores ativos (não excluídos) pelo CPF, até 500 CPFs por consulta.
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpfs: Os CPFs dos colaboradores.
 
     Returns:
-        None: A função realiza a ação de inserção.
+        dict: {cpf: id}; CPFs sem colaborador ativo ficam de fora.
+    """
+    cpfs = list(dict.fromkeys(cpfs))
+    ids = {}
+    cursor = conn.cursor()
+    try:
+        for i in range(0, len(cpfs), 500):
+            binds = {f"c{j}": cpf for j, cpf in enumerate(cpfs[i:i + 500])}
+            cursor.execute(f"""
+                SELECT nr_cpf, id FROM T_MNDSH_COLABORADOR
+                WHERE dt_exclusao IS NULL AND nr_cpf IN ({", ".join(":" + nome for nome in binds)})
+            """, binds)
+            ids.update((cpf, id_colaborador) for cpf, id_colaborador in cursor.fetchall())
+    finally:
+        cursor.close()
+    return ids
 
-    Dependências:
-        - Funções: limpa_tela, buscar_colaborador, perguntar_continuar, menu_opcoes2.
-        - Variáveis: margem.
+def validar_notas_metricas(notas: dict) -> str | None:
     """
-    while True: 
-        limpa_tela()
-        cursor = conn.cursor()
-        try:
-            colaborador = buscar_colaborador(conn, titulo_menu="ADICIONAR NOVA TAREFA")
-            if not colaborador:
-                return
-            id_colaborador = colaborador["id"]
-            cpf = colaborador["nr_cpf"]
-            nome = colaborador["nm_colaborador"]
-            status = colaborador["ds_status"]
-            print(f"\n {margem} Colaborador selecionado: {nome} (CPF: {cpf}) Status: {status}\n")
-            while True:
-                voltar_para_colaborador = False 
-                while True:
-                    titulo = input("\nTítulo: ").strip()
-                    if len(titulo) < 5:
-                        print(f"\n {margem} O título deve conter ao menos 5 caracteres.\n")
-                        if perguntar_continuar("tentar novamente"):
-                            continue
-                        else:
-                            voltar_para_colaborador = True
-                            break 
-                    break
-                if voltar_para_colaborador:
-                    break 
+    Valida as notas subjetivas de um registro diário (todas obrigatórias, inteiros de 0 a 10).
 
-                descricao = input("\nDescrição (opcional): ").strip() or None
+    Args:
+        notas: Dicionário com as chaves de notas_metricas_diarias.
 
-                prioridade = menu_opcoes2("\nPrioridade da tarefa:", ["Baixa", "Média", "Alta"], ["baixa", "média", "alta"])
+    Returns:
+        str: Mensagem de erro, se houver.
+        None: Se todas as notas forem válidas.
+    """
+    for campo in notas_metricas_diarias:
+        valor = notas.get(campo)
+        if isinstance(valor, bool) or not isinstance(valor, int) or not 0 <= valor <= 10:
+            return f"Nota inválida para {campo}: informe um inteiro de 0 a 10."
+    return None
 
-                while True:
-                    data_prazo = input("\nPrazo (DD/MM/AAAA): ").strip()
-                    voltar_para_colaborador = False 
-                    try:
-                        dt_prazo = datetime.strptime(data_prazo, "%d/%m/%Y")
-                        if dt_prazo < datetime.today():
-                            print(f"\n {margem} A data deve ser hoje ou futura.\n")
-                            if perguntar_continuar("tentar novamente"):
-                                continue
-                            else:
-                                voltar_para_colaborador = True
-                                break
-                        break
-                    except ValueError:
-                        print(f"\n {margem} Formato inválido! Use DD/MM/AAAA.\n")
-                        if perguntar_continuar("tentar novamente"):
-                            continue
-                        else:
-                            voltar_para_colaborador = True
-                            break
+def gravar_metricas_lote(conn: oracledb.Connection, registros: list[dict], sem_colaborador: list | None = None) -> int:
+    """
+    Grava vários registros diários (uma linha cada em T_MNDSH_METRICA_DIA) em um único executemany e faz um só commit.
 
-                if voltar_para_colaborador:
-                    break
+    Os ids dos colaboradores são obtidos pelo CPF antes da gravação (ids_colaboradores), e a gravação é um upsert
+    pela chave única (id_colaborador, dt_dia): MERGE no Oracle e INSERT ... ON CONFLICT DO NOTHING no banco local.
+    Registros de CPF sem colaborador ativo (digitado errado, excluído ou expurgado) não chegam ao banco: vão para
+    sem_colaborador, se informada, ou a função levanta ValueError antes de gravar qualquer registro. Política de reenvio: vale o primeiro registro do dia; reenvios (mesmo colaborador, mesmo dia)
+    são ignorados sem erro e contados como duplicados, inclusive quando chegam no mesmo lote. Assim não é
+    preciso consultar o banco antes e repetir a gravação é seguro.
 
-                cursor.execute("""
-                    INSERT INTO T_MNDSH_TAREFA(id_colaborador, nr_cpf, ds_titulo, ds_descricao,ds_prioridade, dt_prazo, ds_status, dt_criacao, dt_modificacao)
-                    VALUES (:id, :cpf, :titulo, :descricao, :prioridade, TO_DATE(:prazo, 'DD/MM/YYYY'), 'pendente', SYSDATE, SYSDATE)
-                """, {"id": id_colaborador, "cpf": cpf, "titulo": titulo, "descricao": descricao, "prioridade": prioridade, "prazo": dt_prazo.strftime("%d/%m/%Y")})
-                conn.commit()
-                print(f"\n {margem} Tarefa adicionada com sucesso!\n")
-                input("Pressione ENTER...")
-                limpa_tela()
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        registros: Dicionários com cpf, valores (notas e contadores de tarefas) e dt_registro
+            (datetime do check-in; se None em todos, grava SYSDATE).
+        sem_colaborador: Lista que recebe os registros de CPF sem colaborador ativo (que são pulados).
 
-                if perguntar_continuar("adicionar outra tarefa para este colaborador"):
-                    limpa_tela()
-                    print("===== ADICIONAR NOVA TAREFA =====\n")
-                    print(f"{margem} Colaborador selecionado: {nome} (CPF: {cpf}) Status: {status}\n")
-                    continue
-                else:
-                    break         
-        except Exception as e:
-            conn.rollback()
-            print(f"\nErro ao adicionar tarefa: {e}\n")
-            input("ENTER...")
-        finally:
-            cursor.close()
-        if not perguntar_continuar2("adicionar tarefa para outro colaborador"):
+    Returns:
+        int: Quantidade de registros gravados (os demais já existiam no dia ou não têm colaborador).
+
+    Raises:
+        ValueError: Se algum CPF não tiver colaborador ativo e sem_colaborador não for informada.
+
+    Dependências:
+        - Funções: ids_colaboradores, eh_sqlite, dias_nao_arquivados.
+        - Variáveis: colunas_metricas_diarias.
+    """
+    ids = ids_colaboradores(conn, [r["cpf"] for r in registros])
+    desconhecidos = [r for r in registros if r["cpf"] not in ids]
+    if desconhecidos:
+        if sem_colaborador is None:
+            raise ValueError(f"Colaborador não encontrado: {', '.join(sorted({r['cpf'] for r in desconhecidos}))}.")
+        sem_colaborador.extend(desconhecidos)
+        registros = [r for r in registros if r["cpf"] in ids]
+    usa_sysdate = all(r.get("dt_registro") is None for r in registros)
+    linhas = []
+    # Reproduções (diário offline) podem trazer dias já movidos para o arquivo, onde a chave única da tabela
+    # quente não alcança: esses dias já têm registro e contam como duplicados
+    for registro in (registros if usa_sysdate else dias_nao_arquivados(conn, registros)):
+        linha = {campo: registro["valores"].get(campo) for campo in colunas_metricas_diarias}
+        linha["id_colaborador"] = ids[registro["cpf"]]
+        if not usa_sysdate:
+            linha["dt_registro"] = registro["dt_registro"]
+        linhas.append(linha)
+    data = "SYSDATE" if usa_sysdate else ":dt_registro"
+    if eh_sqlite(conn):
+        sql = f"""
+            INSERT INTO T_MNDSH_METRICA_DIA (id_colaborador, dt_registro, {", ".join(colunas_metricas_diarias)})
+            VALUES (:id_colaborador, {data}, {", ".join(":" + campo for campo in colunas_metricas_diarias)})
+            ON CONFLICT (id_colaborador, dt_dia) DO NOTHING
+        """
+    else:
+        sql = f"""
+            MERGE INTO T_MNDSH_METRICA_DIA m
+            USING (SELECT :id_colaborador AS id_colaborador, {data} AS dt_registro,
+                          {", ".join(f":{campo} AS {campo}" for campo in colunas_metricas_diarias)}
+                   FROM dual) n
+            ON (m.id_colaborador = n.id_colaborador AND m.dt_dia = TRUNC(n.dt_registro))
+            WHEN NOT MATCHED THEN
+                INSERT (id_colaborador, dt_registro, {", ".join(colunas_metricas_diarias)})
+                VALUES (n.id_colaborador, n.dt_registro, {", ".join("n." + campo for campo in colunas_metricas_diarias)})
+        """
+    gravados = 0
+    cursor = conn.cursor()
+    try:
+        for tentativa in range(2 if linhas else 0):
+            try:
+                cursor.executemany(sql, linhas)
+                gravados = max(cursor.rowcount or 0, 0)
+                conn.commit()
                 break
+            except Exception as e:
+                conn.rollback()
+                # Dois MERGE simultâneos do mesmo dia: o segundo esbarra no índice único (ORA-00001) depois que
+                # o primeiro confirma; repetido, ele já enxerga a linha gravada e a ignora
+                if tentativa or "ORA-00001" not in str(e):
+                    raise
+    finally:
+        cursor.close()
+    contador_inc("mindshift_checkins_total", "Registros diários de métricas gravados.", gravados)
+    if gravados < len(registros):
+        contador_inc("mindshift_checkins_duplicados_total", "Registros diários recusados por já existir registro no dia.",
+                     len(registros) - gravados)
+    return gravados
 
-def listar_tarefas_admin(conn: oracledb.Connection) -> None:
+def gravar_metricas_dia(conn: oracledb.Connection, cpf_colaborador: str, valores: dict) -> bool:
     """
-    Permite ao administrador listar tarefas com opções de filtro.
-    Oferece filtros por:
-    1. Colaborador (todos ou um específico, via buscar_colaborador().
-    2. Status (todas, pendentes, em andamento, concluídas).
-    Os resultados são consultados, formatados em um DataFrame (com colunas adaptadas)
-    e exibidos via imprimir_tabela(), com opção de exportação gerar_dataframe().
+    Grava a linha do registro diário (as cinco categorias) com data SYSDATE e faz o commit.
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador.
+        valores: Notas e contadores de tarefas (chaves de campos_metricas_diarias).
 
     Returns:
-        None: A função gerencia a exibição e exportação.
+        bool: True se o registro foi gravado, False se o colaborador já tinha registro hoje.
+
+    Raises:
+        ValueError: Se o CPF não tiver colaborador ativo.
 
     Dependências:
-        - Funções: limpa_tela, menu_opcoes, buscar_colaborador, perguntar_continuar2,
-                   imprimir_tabela, gerar_dataframe.
-        - Variáveis: margem.
-        - Módulo: pandas (pd)
+        - Funções: gravar_metricas_lote.
     """
-    while True:
-        limpa_tela()
-        cursor = conn.cursor()
-        try:
-            filtro = menu_opcoes("===== LISTAR TAREFAS =====\n \nDeseja listar:\n", ["Todos os colaboradores", "Por colaborador", "Voltar"], ["todos", "colaborador", "voltar"])
-            if filtro == "voltar":
-                print(f"\n {margem} Voltando...!\n")
-                input("\nPressione ENTER para continuar...")
-                limpa_tela()
-                break
-            cpf = None
-            nome = None
-            params = {} 
-            colunas = []
+    return gravar_metricas_lote(conn, [{"cpf": cpf_colaborador, "valores": valores, "dt_registro": None}]) > 0
 
-            filtro_status_pendente = menu_opcoes("\nDeseja filtrar por status:\n", 
-                                        ["Todas", "Pendentes","Em Andamento", "Concluídas"], 
-                                        ["todas", "pendentes","em andamento", "concluidas"])
-            filtro_status = ""
-            if filtro_status_pendente == "pendentes":
-                filtro_status = " AND t.ds_status = 'pendente'"
-            elif filtro_status_pendente == "em andamento":
-                filtro_status = " AND t.ds_status = 'em andamento'"
-            elif filtro_status_pendente == "concluidas":
-                filtro_status = " AND t.ds_status = 'concluída'"
+def registrar_metricas_dia(conn: oracledb.Connection, cpf_colaborador: str, notas: dict) -> bool:
+    """
+    Registra as métricas diárias sem interação com o usuário: calcula os contadores de tarefas e grava
+    as cinco categorias. O registro duplicado no dia é recusado pela própria gravação (upsert), sem
+    consulta prévia; só com a fila de gravação ativa, que confirma antes de gravar, o banco é consultado antes.
 
-            if filtro == "todos":
-                query = f"""
-                    SELECT t.id_tarefa, t.nr_cpf, c.nm_colaborador, t.ds_titulo, t.ds_descricao, t.ds_status, t.ds_prioridade, t.dt_prazo, t.dt_criacao, t.dt_modificacao
-                    FROM T_MNDSH_TAREFA t
-                    JOIN T_MNDSH_COLABORADOR c ON t.nr_cpf = c.nr_cpf
-                    WHERE 1=1 {filtro_status}
-                    ORDER BY t.dt_prazo
-                """
-                cursor.execute(query, params)
-                tarefas = cursor.fetchall()
-                colunas = ["ID", "CPF", "Colaborador", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador.
+        notas: Notas de 0 a 10 (chaves de notas_metricas_diarias).
 
-                titulo = f"LISTA DE TAREFAS — {filtro_status_pendente.upper()}"
-            else:
-                limpa_tela()
-                colaborador = buscar_colaborador(conn, titulo_menu="LISTAR TAREFAS")
-                if not colaborador:
-                    continue
-                cpf = colaborador["nr_cpf"]
-                nome = colaborador["nm_colaborador"]
-                params["cpf"] = cpf
+    Returns:
+        bool: True se o registro foi gravado, False se já existia registro na data de hoje.
 
-                query = f"""
-                    SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
-                    FROM T_MNDSH_TAREFA t
-                    WHERE nr_cpf = :cpf {filtro_status}
-                    ORDER BY dt_prazo
-                """
-                cursor.execute(query, params)
-                tarefas = cursor.fetchall()
-                colunas = ["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
-                titulo = f"TAREFAS ({filtro_status_pendente.upper()}) — {nome} (CPF: {cpf})"
-            if tarefas:
-                df = pd.DataFrame(tarefas, columns=colunas)
-                limpa_tela()
-                imprimir_tabela(df, 
-                                titulo=titulo, 
-                                tamanhos_wrap={"Título":25,"Descrição":40}, 
-                                colunas_datas=["Prazo"], 
-                                colunas_datetime=["Data Criação", "Data Última Modificação"])
-                gerar_dataframe(df)
-            else:
-                limpa_tela()
-                print(f"===== {titulo} =====")
-                print(f"\n {margem} Nenhuma tarefa encontrada.\n")
-        except Exception as e:
-            print(f"\n {margem} Erro ao listar tarefas: {e}\n")
-            input("\nPressione ENTER para continuar...")
-        finally:
-            cursor.close()
-        if not perguntar_continuar2("realizar outra pesquisa/listagem"):
-            break
+    Raises:
+        ValueError: Se alguma nota for inválida.
+    """
+    erro = validar_notas_metricas(notas)
+    if erro:
+        raise ValueError(erro)
+    fila = _fila_metricas["fila"]
+    if fila is not None and (fila.pendente(cpf_colaborador) or metricas_registradas_hoje(conn, cpf_colaborador)):
+        contador_inc("mindshift_checkins_duplicados_total", "Registros diários recusados por já existir registro no dia.")
+        return False
+    valores = contar_tarefas_colaborador(conn, cpf_colaborador)
+    valores.update({campo: notas[campo] for campo in notas_metricas_diarias})
+    if fila is not None:
+        return fila.enfileirar(cpf_colaborador, valores)
+    return gravar_metricas_dia(conn, cpf_colaborador, valores)
 
-def atualizar_tarefa_admin(conn: oracledb.Connection) -> None:
+def registrar_metrica(conn: oracledb.Connection, cpf_colaborador: str, painel: "PainelColaborador | None" = None) -> None:
     """
-    Permite ao administrador atualizar qualquer campo de uma tarefa atribuída a um colaborador.
+    Permite ao colaborador registrar suas métricas diárias em cinco categorias:
+    Produtividade, Bem-estar emocional, Satisfação no trabalho, Qualidade do sono e Bem-estar físico.
 
-    O processo envolve:
-    1. Selecionar o colaborador buscar_colaborador().
-    2. Listar todas as tarefas do colaborador.
-    3. O administrador escolhe o ID da tarefa a ser alterada.
-    4. Apresenta um menu para escolha do campo (Título, Descrição, Status, Prioridade, Prazo).
-    5. Cada campo tem validação específica.
-    6. Executa o UPDATE no banco e atualiza a visualização.
+    A função primeiro verifica se já existe um registro para o colaborador na data atual (SYSDATE), para não pedir
+    as notas à toa; a gravação em si não depende dessa consulta (o upsert de gravar_metricas_lote recusa o reenvio).
+    Em caso negativo, ela calcula métricas objetivas de tarefas e, em seguida, solicita notas subjetivas 
+    (0 a 10) para cada categoria,de maneira que se colaborador não responder ou não responder corretamente 
+    ele fica preso no loop ate que a resposta certa seja dada obrigando assim o colaborador a responder 
+    obrigatoriamente todas as questões. Ao final, grava as cinco categorias em uma linha de T_MNDSH_METRICA_DIA
+    com gravar_metricas_dia() ou, com a fila de gravação ativa (config_fila_metricas), entrega o registro à FilaMetricas.
+    Sem conexão (conn None), as notas vão para o diário offline e os contadores de tarefas são calculados na reprodução.
 
     Args:
-        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        conn: O objeto de conexão ativo com o banco de dados Oracle (None no modo offline).
+        cpf_colaborador: O CPF do colaborador logado.
+        painel: Cache da sessão; se souber se já há registro hoje, a verificação inicial não consulta o banco.
 
     Returns:
-        None: A função realiza a ação de atualização.
+        None: A função realiza as inserções no banco.
 
     Dependências:
-        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes,
-                   menu_opcoes2, perguntar_continuar, perguntar_continuar2.
-        - Variáveis: margem.
-        - Módulo: pandas (pd).
+        - Funções: limpa_tela, valida_nota, metricas_registradas_hoje, contar_tarefas_colaborador, gravar_metricas_dia,
+                   checkin_offline_hoje, registrar_offline.
+        - Variáveis: margem, _fila_metricas.
     """
-    while True:
-        cursor = conn.cursor()
-        limpa_tela()
-        try:
-            colaborador = buscar_colaborador(conn, titulo_menu="ATUALIZAR TAREFA")
-            if not colaborador:
-                return
-            cpf = colaborador["nr_cpf"]
-            nome = colaborador["nm_colaborador"]
-            
-            cursor.execute("""
-                SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
-                FROM T_MNDSH_TAREFA
-                WHERE nr_cpf = :cpf
-                ORDER BY dt_prazo
-            """, {"cpf": cpf})
-            tarefas = cursor.fetchall()
-            if not tarefas:
-                print(f"\n===== TAREFAS DE {nome} (CPF: {cpf}) =====\n")
-                print(f"{margem} Nenhuma tarefa registrada.\n")
-                input("Pressione ENTER para continuar...")
-                continue
-
-            colunas = ["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
-            df_tarefas = pd.DataFrame(tarefas, columns=colunas)
+    limpa_tela()
+    print("===== REGISTRAR MÉTRICAS =====\n")
+    print(f"{margem}Registro obrigatório diario (de preferência ao fim do expediente).")
+    print(f"\n{margem}Respostas apenas números inteiros de 0 a 10.")
+    fila = _fila_metricas["fila"]
+    try:
+        if conn is None:
+            registrado = checkin_offline_hoje(cpf_colaborador)
+        else:
+            registrado = painel.obter("registrado_hoje") if painel is not None else None
+            if registrado is None:
+                registrado = metricas_registradas_hoje(conn, cpf_colaborador)
+            registrado = registrado or (fila is not None and fila.pendente(cpf_colaborador))
+        if registrado:
+            contador_inc("mindshift_checkins_duplicados_total", "Registros diários recusados por já existir registro no dia.")
+            print(f"\n{margem}AVISO: Já existe um registro de métricas para o colaborador {cpf_colaborador} na data de hoje.")
+            print(f"{margem}Por favor, retorne amanhã para um novo registro.")
+            return 
 
-            while True:
-                limpa_tela()
-                imprimir_tabela(df_tarefas, 
-                                titulo=f"TAREFAS DE {nome} (CPF: {cpf})", 
-                                tamanhos_wrap={"Título":25,"Descrição":40}, 
-                                colunas_datas=["Prazo"],
-                                colunas_datetime=["Data Criação", "Data Última Modificação"])
-                try:
-                    id_tarefa = int(input("\nID da tarefa que deseja atualizar: "))
-                except ValueError:
-                    print(f"\n{margem} ID inválido. Digite apenas números.\n")
-                    if not perguntar_continuar2("tentar novamente"):
-                        break
-                    continue
-                cursor.execute("""
-                    SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo
-                    FROM T_MNDSH_TAREFA
-                    WHERE id_tarefa=:id AND nr_cpf=:cpf
-                """, {"id": id_tarefa, "cpf": cpf})
-                tarefa = cursor.fetchone()
-                if not tarefa:
-                    print(f"\n{margem} Tarefa não encontrada.\n")
-                    if not perguntar_continuar2("tentar novamente"):
-                        break
-                    continue
+        print("\n--- PRODUTIVIDADE ---")
+        if conn is None:
+            valores = {}
+            print(f"\n{margem}(Modo offline: os contadores de tarefas serão calculados quando a conexão voltar.)")
+        else:
+            valores = contar_tarefas_colaborador(conn, cpf_colaborador)
+            print(f"\nTarefas concluídas: {valores['tarefas_concluidas']}, Em andamento: {valores['tarefas_andamento']}, Pendentes: {valores['tarefas_pendentes']}")
+            print(f"\nConcluídas no prazo: {valores['concluidas_no_prazo']}, Atrasadas: {valores['concluidas_atraso']}")
 
-                campos = {"Título": "ds_titulo", "Descrição": "ds_descricao", "Status": "ds_status", "Prioridade": "ds_prioridade", "Prazo": "dt_prazo"}
+        valores["horas_produtivas"] = valida_nota("\nHoras produtivas hoje (0-10): ")
+        valores["nivel_foco"] = valida_nota("\nNível de foco (0-10): ")
 
-                editar_tarefa = True
-                while editar_tarefa:
-                    novo_valor = None 
-                    limpa_tela()
-                    df_tarefa_atual = pd.DataFrame([tarefa], columns=["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo"])
-                    imprimir_tabela(df_tarefa_atual, 
-                                    titulo="DADOS ATUAIS DA TAREFA", 
-                                    tamanhos_wrap={"Título":25,"Descrição":40}, 
-                                    colunas_datas=["Prazo"])
+        # --- BEM-ESTAR EMOCIONAL ---
+        print("\n--- BEM-ESTAR EMOCIONAL ---")
+        valores["estresse"] = valida_nota("\nNível de estresse (0-10): ")
+        valores["humor"] = valida_nota("\nHumor geral (0-10): ")
+        valores["energia"] = valida_nota("\nEnergia/disposição (0-10): ")
+        valores["controle_dia"] = valida_nota("\nSensação de controle sobre o dia (0-10): ")
 
-                    escolha = menu_opcoes("\nQual campo deseja alterar?", list(campos.keys()) + ["Finalizar"], list(campos.keys()) + ["Finalizar"])
+        # --- SATISFAÇÃO NO TRABALHO ---
+        print("\n--- SATISFAÇÃO NO TRABALHO ---")
+        valores["satisfacao_geral"] = valida_nota("\nSatisfação geral (0-10): ")
+        valores["relacao_colegas"] = valida_nota("\nRelação com colegas (0-10): ")
+        valores["reconhecimento"] = valida_nota("\nReconhecimento recebido (0-10): ")
+        valores["carga_trabalho"] = valida_nota("\nCarga de trabalho percebida (0-10): ")
 
-                    if escolha == "Finalizar":
-                        editar_tarefa = False
-                        break
+        # --- QUALIDADE DO SONO ---
+        print("\n--- QUALIDADE DO SONO ---")
+        valores["horas_dormidas"] = valida_nota("\nHoras dormidas (0-10): ")
+        valores["descanso"] = valida_nota("\nSensação de descanso (0-10): ")
+        valores["despertares"] = valida_nota("\nNúmero de vezes que acordou à noite (0-10): ")
 
-                    campo_sql = campos[escolha]
+        # --- BEM-ESTAR FÍSICO ---
+        print("\n--- BEM-ESTAR FÍSICO ---")
+        valores["atividade_fisica"] = valida_nota("\nHoras de atividade física (0-10): ")
+        valores["ingestao_agua"] = valida_nota("\nIngestão de água (0-10): ")
+        valores["intensidade_atividade"] = valida_nota("\nIntensidade da atividade física (0-10): ")
+
+        if conn is None:
+            registrar_offline("checkin", cpf=cpf_colaborador, notas=valores)
+            print(f"\n{margem}Métricas guardadas no diário offline! Serão enviadas quando a conexão com o banco voltar.\n")
+        elif fila is None and gravar_metricas_dia(conn, cpf_colaborador, valores):
+            print(f"\n{margem}Métricas registradas com sucesso!\n")
+        elif fila is not None and fila.enfileirar(cpf_colaborador, valores):
+            print(f"\n{margem}Métricas registradas com sucesso! A gravação no banco é concluída em segundo plano.\n")
+        else:
+            print(f"\n{margem}AVISO: Já existe um registro de métricas para o colaborador {cpf_colaborador} na data de hoje.")
+        if painel is not None and conn is not None:
+            painel.definir("registrado_hoje", True)
+            painel.invalidar("desempenho_mes")
+    except Exception as e:
+        print(f"\n{margem}Erro ao registrar métricas: {e}\n")
+    finally:
+        input("\nPressione ENTER para voltar ao menu do colaborador...")
+        limpa_tela()
 
-                    if escolha == "Título":
-                        while True:
-                            entrada = input("\nNovo título: ").strip()
-                            if len(entrada) < 5:
-                                print(f"\n{margem} O título deve ter pelo menos 5 caracteres.\n")
-                                if not perguntar_continuar("tentar novamente"):
-                                    break
-                                continue
-                            novo_valor = entrada
-                            break
-                    elif escolha == "Descrição":
-                        novo_valor = input("\nNova descrição (pode ficar vazia): ").strip()
-                    elif escolha == "Prioridade":
-                        novo_valor = menu_opcoes2("\nEscolha a prioridade:", ["Baixa", "Média", "Alta"], ["baixa", "média", "alta"])
-                    elif escolha == "Status":
-                        novo_valor = menu_opcoes2("\nEscolha o status:", ["Pendente", "Em andamento", "Concluída"], ["pendente", "em andamento", "concluída"])
-                    elif escolha == "Prazo":
-                        while True:
-                            entrada = input("\nNovo prazo (DD/MM/AAAA): ").strip()
-                            if not entrada:
-                                print(f"\n{margem} Valor inválido. Não pode ficar vazio.")
-                                if not perguntar_continuar("tentar novamente"):
-                                    break
-                                continue
-                            try:
-                                dt_novo = datetime.strptime(entrada, "%d/%m/%Y")
-                                if dt_novo < datetime.today():
-                                    print(f"\n{margem} A data deve ser hoje ou futura.")
-                                    if not perguntar_continuar("tentar novamente"):
-                                        break
-                                    continue
-                                novo_valor = entrada
-                                break
-                            except ValueError:
-                                print(f"\n{margem} Formato inválido! Use DD/MM/AAAA.")
-                                if not perguntar_continuar("tentar novamente"):
-                                    break
-                    if novo_valor is None:
-                        continue
-                    if escolha == "Prazo":
-                        cursor.execute(f"""
-                            UPDATE T_MNDSH_TAREFA
-                            SET {campo_sql} = TO_DATE(:valor,'DD/MM/YYYY'), dt_modificacao=SYSDATE
-                            WHERE id_tarefa=:id
-                        """, {"valor": novo_valor, "id": id_tarefa})
-                    else:
-                        cursor.execute(f"""
-                            UPDATE T_MNDSH_TAREFA
-                            SET {campo_sql} = :valor, dt_modificacao=SYSDATE
-                            WHERE id_tarefa=:id
-                        """, {"valor": novo_valor, "id": id_tarefa})
-                    conn.commit()
-                    print(f"\n{margem} {escolha} atualizado com sucesso!\n")
-                    input("Pressione ENTER...")
-                    cursor.execute("""
-                        SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo
-                        FROM T_MNDSH_TAREFA
-                        WHERE id_tarefa=:id
-                    """, {"id": id_tarefa})
-                    tarefa = cursor.fetchone()
-                if not perguntar_continuar2("atualizar outra tarefa deste colaborador"):
-                    break 
-        except Exception as e:
-            print(f"\n{margem} Erro ao atualizar tarefa: {e}\n")
-            conn.rollback()
-        finally:
-            if 'cursor' in locals() and cursor:
-                cursor.close()
-        if not perguntar_continuar2("atualizar tarefa de outro colaborador"):
-            break
+# ====== FILA DE GRAVAÇÃO DAS MÉTRICAS (write-behind) ======
+
+# Com a fila ativa, o check-in é confirmado assim que chega ao spool (arquivo JSONL com fsync) e uma
+# thread grava os registros no banco em lotes, quando o lote enche ou o intervalo termina
+config_fila_metricas = {
+    "ativa": os.environ.get("MINDSHIFT_FILA_METRICAS", "0") == "1",
+    "tamanho_lote": int(os.environ.get("MINDSHIFT_FILA_LOTE", "50")),
+    "intervalo_segundos": float(os.environ.get("MINDSHIFT_FILA_INTERVALO", "2")),
+    "capacidade": int(os.environ.get("MINDSHIFT_FILA_CAPACIDADE", "1000")),
+    "espera_max_segundos": float(os.environ.get("MINDSHIFT_FILA_ESPERA", "5")),
+    "tentativas_max": int(os.environ.get("MINDSHIFT_FILA_TENTATIVAS", "5")),
+    "spool": os.environ.get("MINDSHIFT_FILA_SPOOL", "fila_metricas.jsonl"),
+    "rejeitados": os.environ.get("MINDSHIFT_FILA_REJEITADOS", "fila_metricas_rejeitados.jsonl")
+}
+_fila_metricas = {"fila": None}
 
-def excluir_tarefa_admin(conn: oracledb.Connection) -> None:
+def _erro_do_registro(e: Exception) -> bool:
     """
-    Permite ao administrador excluir uma tarefa específica atribuída a um colaborador.
-    O administrador seleciona o colaborador buscar_colaborador(), lista suas tarefas
-    e escolhe o ID da tarefa a ser excluída. Uma confirmação final é solicitada antes
-    da execução do DELETE.
+    Indica se o erro vem do próprio registro (violação de restrição, valor inválido) e se repetiria a cada tentativa,
+    ao contrário de queda de conexão ou bloqueio. A classe é conferida pelo nome para servir ao oracledb e ao sqlite3.
+    """
+    return isinstance(e, (ValueError, TypeError, KeyError)) or \
+        any(classe.__name__ in ("IntegrityError", "DataError") for classe in type(e).__mro__)
 
-    Args:
-        conn: O objeto de conexão ativo com o banco de dados Oracle.
+class FilaMetricas:
+    """
+    Fila de gravação em segundo plano (write-behind) dos registros diários de métricas.
 
-    Returns:
-        None: A função realiza a ação de exclusão.
+    - enfileirar() grava o registro no spool e o coloca na fila; o retorno é a confirmação para o colaborador.
+    - Uma thread junta os registros e os grava com gravar_metricas_lote() (um executemany e um commit por lote).
+    - Com a fila cheia, enfileirar() espera até espera_max_segundos e então recusa o registro (backpressure).
+    - Um registro por colaborador por dia: a fila recusa CPFs com registro pendente e a gravação (upsert pela
+      chave diária) ignora os que já estão no banco, o que torna seguro regravar o spool.
+    - Registros que sobraram no spool (queda do processo ou do banco) são regravados ao iniciar.
+    - Registros que não podem ser gravados (CPF sem colaborador ativo, ou erro do próprio registro repetido
+      tentativas_max vezes) saem do spool para o arquivo de rejeitados, sem segurar os demais.
 
-    Dependências:
-        - Funções: limpa_tela, buscar_colaborador, imprimir_tabela, menu_opcoes2,
-                   perguntar_continuar2.
-        - Variáveis: margem.
-        - Módulo: pandas (pd).
+    Args:
+        conectar: Função sem argumentos que retorna a conexão da thread (padrão: conectarBD).
+        spool: Caminho do arquivo de spool (padrão: config_fila_metricas["spool"]).
+        rejeitados: Caminho do arquivo de rejeitados (padrão: config_fila_metricas["rejeitados"]).
     """
-    while True:
-        limpa_tela()
-        cursor = conn.cursor()
+    def __init__(self, conectar=None, spool: str | None = None, rejeitados: str | None = None):
+        self._conectar = conectar or conectarBD
+        self.spool = spool or config_fila_metricas["spool"]
+        self.rejeitados = rejeitados or config_fila_metricas["rejeitados"]
+        self.tentativas_max = config_fila_metricas["tentativas_max"]
+        self.tamanho_lote = config_fila_metricas["tamanho_lote"]
+        self.intervalo = config_fila_metricas["intervalo_segundos"]
+        self.espera_max = config_fila_metricas["espera_max_segundos"]
+        self._vagas = threading.BoundedSemaphore(config_fila_metricas["capacidade"])
+        self._fila = queue.Queue()
+        self._pendentes = {}
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+        self._conn = None
+
+    # --- spool ---
+
+    def _escrever_spool(self, dados: dict, caminho: str | None = None) -> None:
+        with open(caminho or self.spool, "a", encoding="utf-8") as arquivo:
+            arquivo.write(json.dumps(dados, ensure_ascii=False, default=str) + "\n")
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+
+    def _ler_spool(self) -> list[dict]:
+        """
+        Retorna os registros do spool ainda não confirmados e reescreve o arquivo só com eles.
+        """
+        if not os.path.exists(self.spool):
+            return []
+        registros, confirmados = {}, set()
+        with open(self.spool, encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                try:
+                    dados = json.loads(linha)
+                except ValueError:
+                    continue  # última linha incompleta (queda durante a escrita)
+                if "confirmados" in dados:
+                    confirmados.update(dados["confirmados"])
+                else:
+                    registros[dados["id"]] = dados
+        restantes = [r for id_registro, r in registros.items() if id_registro not in confirmados]
+        temporario = f"{self.spool}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            for registro in restantes:
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        os.replace(temporario, self.spool)
+        for registro in restantes:
+            registro["dt_registro"] = datetime.fromisoformat(registro["dt_registro"])
+        return restantes
+
+    # --- produtor ---
+
+    def iniciar(self) -> int:
+        """
+        Abre a conexão da thread, inicia a gravação em segundo plano e recoloca na fila o que sobrou no spool.
+
+        Returns:
+            int: Quantidade de registros recuperados do spool.
+        """
+        recuperados = self._ler_spool()
+        self._conn = self._conectar()
+        self._thread = threading.Thread(target=self._executar, name="fila-metricas", daemon=True)
+        self._thread.start()
+        for registro in recuperados:
+            self._vagas.acquire()
+            with self._trava:
+                self._pendentes[(registro["cpf"], registro["dt_registro"].date())] = registro["id"]
+            self._fila.put(registro)
+        medidor_somar("mindshift_fila_metricas_pendentes", "Registros de métricas aguardando gravação.", len(recuperados))
+        return len(recuperados)
+
+    def pendente(self, cpf_colaborador: str, dia: datetime | None = None) -> bool:
+        """
+        Indica se o colaborador tem registro na fila (ainda não gravado) no dia (padrão: hoje).
+        """
+        dia = (dia or datetime.now()).date()
+        with self._trava:
+            return (cpf_colaborador, dia) in self._pendentes
+
+    def enfileirar(self, cpf_colaborador: str, valores: dict, dt_registro: datetime | None = None) -> bool:
+        """
+        Aceita um registro diário: grava no spool e entrega à thread de gravação.
+
+        Args:
+            cpf_colaborador: O CPF do colaborador.
+            valores: Notas e contadores de tarefas (chaves de campos_metricas_diarias).
+            dt_registro: Momento do check-in (padrão: agora).
+
+        Returns:
+            bool: True se o registro foi aceito, False se já havia registro pendente do colaborador no dia.
+
+        Raises:
+            RuntimeError: Se a fila continuar cheia após espera_max_segundos.
+        """
+        registro = {"id": uuid.uuid4().hex, "cpf": cpf_colaborador, "dt_registro": dt_registro or datetime.now(),
+                    "valores": valores}
+        chave = (cpf_colaborador, registro["dt_registro"].date())
+        with self._trava:
+            if chave in self._pendentes:
+                contador_inc("mindshift_checkins_duplicados_total", "Registros diários recusados por já existir registro no dia.")
+                return False
+            self._pendentes[chave] = registro["id"]
+        if not self._vagas.acquire(timeout=self.espera_max):
+            with self._trava:
+                self._pendentes.pop(chave, None)
+            contador_inc("mindshift_fila_metricas_recusados_total", "Registros recusados com a fila de gravação cheia.")
+            raise RuntimeError("Fila de gravação de métricas cheia. Tente novamente em instantes.")
         try:
-            colaborador = buscar_colaborador(conn, titulo_menu="EXCLUIR TAREFA")
-            if not colaborador:
-                return 
-            cpf = colaborador["nr_cpf"]
-            nome = colaborador["nm_colaborador"]
-            while True:  
-                cursor.execute("""
-                    SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
-                    FROM T_MNDSH_TAREFA 
-                    WHERE nr_cpf=:cpf 
-                    ORDER BY dt_prazo
-                """, {"cpf": cpf})
-                tarefas = cursor.fetchall()
-                if not tarefas:
-                    print(f"\n {margem} Nenhuma tarefa encontrada para {nome}.\n")
-                    input("\nPressione ENTER para continuar...")
-                    break 
-
-                df = pd.DataFrame(tarefas, columns=["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"])
-                limpa_tela()
-                imprimir_tabela(df, 
-                                titulo=f"TAREFAS DE {nome}", 
-                                tamanhos_wrap={"Título":25,"Descrição":40}, 
-                                colunas_datas=["Prazo"], 
-                                colunas_datetime=["Data Criação","Data Última Modificação"])
-
-                tarefa = None
-                sair_para_outro_colaborador = False 
-                while True:
-                    try:
-                        id_tarefa = int(input("\nID da tarefa: "))
-                    except ValueError:
-                        print(f"\n {margem} ID inválido.\n")
-                        if not perguntar_continuar2("tentar novamente"):
-                            sair_para_outro_colaborador = True
-                            break  
-                        limpa_tela()
-                        imprimir_tabela(df, 
-                                        titulo=f"TAREFAS DE {nome}", 
-                                        tamanhos_wrap={"Título":25,"Descrição":40}, 
-                                        colunas_datas=["Prazo"], 
-                                        colunas_datetime=["Data Criação","Data Última Modificação"])
-                        continue
-                    cursor.execute("""
-                        SELECT ds_titulo 
-                        FROM T_MNDSH_TAREFA 
-                        WHERE id_tarefa=:id AND nr_cpf=:cpf
-                    """, {"id": id_tarefa, "cpf": cpf})
-                    tarefa = cursor.fetchone()
+            with self._trava:
+                self._escrever_spool(registro)
+        except Exception:
+            self._vagas.release()
+            with self._trava:
+                self._pendentes.pop(chave, None)
+            raise
+        self._fila.put(registro)
+        medidor_somar("mindshift_fila_metricas_pendentes", "Registros de métricas aguardando gravação.", 1)
+        return True
 
-                    if tarefa:
-                        break 
-                    print(f"\n {margem} Tarefa não encontrada.\n")
-                    if not perguntar_continuar2("tentar novamente"):
-                        sair_para_outro_colaborador = True
-                        tarefa = None
-                        break
-                    limpa_tela()
-                    imprimir_tabela(df, 
-                                    titulo=f"TAREFAS DE {nome}", 
-                                    tamanhos_wrap={"Título":25,"Descrição":40}, 
-                                    colunas_datas=["Prazo"], 
-                                    colunas_datetime=["Data Criação","Data Última Modificação"])
+    # --- consumidor ---
 
-                if sair_para_outro_colaborador:
+    def _executar(self) -> None:
+        while True:
+            try:
+                primeiro = self._fila.get(timeout=0.5)
+            except queue.Empty:
+                if self._parar.is_set():
+                    return
+                continue
+            lote = [primeiro]
+            limite = time.monotonic() + self.intervalo
+            while len(lote) < self.tamanho_lote:
+                restante = 0 if self._parar.is_set() else limite - time.monotonic()
+                try:
+                    lote.append(self._fila.get(timeout=restante) if restante > 0 else self._fila.get_nowait())
+                except queue.Empty:
                     break
+            self._gravar(lote)
+
+    def _gravar(self, lote: list[dict]) -> None:
+        """
+        Grava o lote (o upsert descarta os colaboradores que já têm registro no dia) e confirma no spool o que foi resolvido.
+
+        - CPF sem colaborador ativo: o registro vai para o arquivo de rejeitados.
+        - Erro do próprio registro (_erro_do_registro): o lote é regravado um registro por vez, para que os outros
+          passem; quem continuar falhando é repetido com espera crescente e, após tentativas_max, vai para os rejeitados.
+        - Qualquer outro erro (conexão, bloqueio): reconecta e tenta de novo com espera crescente, sem limite;
+          o lote continua no spool.
+        """
+        restantes, tentativas, espera = lote, {}, 1
+        while restantes:
+            sem_colaborador, falhas = [], []
+            try:
+                if self._conn is None:
+                    self._conn = self._conectar()
+                    if self._conn is None:
+                        raise ConnectionError("Sem conexão com o banco de dados.")
+                try:
+                    with medir_duracao("mindshift_fila_metricas_lote_segundos", "Duração da gravação de cada lote da fila de métricas."):
+                        gravar_metricas_lote(self._conn, restantes, sem_colaborador=sem_colaborador)
+                except Exception as e:
+                    if not _erro_do_registro(e):
+                        raise
+                    if len(restantes) == 1:
+                        falhas.append((restantes[0], e))
+                    else:
+                        # Um registro com problema derruba o executemany inteiro: um por vez, os outros passam
+                        sem_colaborador = []
+                        for registro in restantes:
+                            try:
+                                gravar_metricas_lote(self._conn, [registro], sem_colaborador=sem_colaborador)
+                            except Exception as erro:
+                                if not _erro_do_registro(erro):
+                                    raise
+                                falhas.append((registro, erro))
+            except Exception:
+                contador_inc("mindshift_fila_metricas_falhas_total", "Falhas ao gravar lotes da fila de métricas.")
+                self._fechar_conexao()
+                if self._parar.wait(espera) and espera >= 30:
+                    return  # encerrando com o banco fora do ar: o lote fica no spool para a próxima execução
+                espera = min(espera * 2, 30)
+                continue
 
-                print(f"\nTarefa selecionada: {tarefa[0]}")
-                confirmacao = menu_opcoes2("\nConfirma exclusão?", ["Sim", "Não"], ["S", "N"])
-                if confirmacao == "S":
-                    cursor.execute("""
-                        DELETE FROM T_MNDSH_TAREFA 
-                        WHERE id_tarefa=:id AND nr_cpf=:cpf
-                    """, {"id": id_tarefa, "cpf": cpf})
-                    conn.commit()
-                    print(f"\n {margem} Tarefa excluída com sucesso!\n")
+            rejeitados = [(registro, "sem_colaborador", "CPF sem colaborador ativo.") for registro in sem_colaborador]
+            repetir = {}
+            for registro, erro in falhas:
+                tentativas[registro["id"]] = tentativas.get(registro["id"], 0) + 1
+                if tentativas[registro["id"]] >= self.tentativas_max:
+                    rejeitados.append((registro, "erro", str(erro)))
                 else:
-                    print(f"\n {margem} Exclusão cancelada.\n")
-                input("\nPressione ENTER para continuar...")
-                if not perguntar_continuar2(f"excluir outra tarefa do colaborador {nome}"):
-                    break 
-        except Exception as e:
-            conn.rollback()
-            print(f"\n {margem} Erro ao excluir tarefa: {e}\n")
-            input("\nPressione ENTER para continuar...")
-        finally:
-            cursor.close()
-        if not perguntar_continuar2("excluir tarefa de outro colaborador"):
-            break  
+                    repetir[registro["id"]] = registro
+            self._rejeitar(rejeitados)
+            self._confirmar([r for r in restantes if r["id"] not in repetir])
+            restantes = list(repetir.values())
+            if restantes:
+                contador_inc("mindshift_fila_metricas_falhas_total", "Falhas ao gravar lotes da fila de métricas.")
+                if self._parar.wait(espera) and espera >= 30:
+                    return
+                espera = min(espera * 2, 30)
+
+    def _rejeitar(self, rejeitados: list[tuple[dict, str, str]]) -> None:
+        """
+        Acrescenta ao arquivo de rejeitados (JSONL com fsync) os registros que não podem ser gravados,
+        com o motivo ("sem_colaborador" ou "erro") e a mensagem.
+        """
+        for registro, motivo, mensagem in rejeitados:
+            self._escrever_spool({**registro, "motivo": motivo, "erro": mensagem, "rejeitado_em": datetime.now()}, self.rejeitados)
+            contador_inc("mindshift_fila_metricas_rejeitados_total", "Registros da fila de métricas movidos para o arquivo de rejeitados.",
+                         motivo=motivo)
+
+    def _confirmar(self, registros: list[dict]) -> None:
+        """
+        Tira do spool e dos pendentes os registros gravados (ou rejeitados) e libera as vagas na fila.
+        """
+        if not registros:
+            return
+        with self._trava:
+            for registro in registros:
+                self._pendentes.pop((registro["cpf"], registro["dt_registro"].date()), None)
+            if self._pendentes:
+                self._escrever_spool({"confirmados": [r["id"] for r in registros]})
+            else:
+                open(self.spool, "w").close()
+        for _ in registros:
+            self._vagas.release()
+        medidor_somar("mindshift_fila_metricas_pendentes", "Registros de métricas aguardando gravação.", -len(registros))
+
+    def _fechar_conexao(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def encerrar(self, timeout: float = 30) -> bool:
+        """
+        Grava o que estiver na fila e para a thread.
+
+        Returns:
+            bool: True se a fila foi esvaziada dentro do tempo; False se sobrou algo (que continua no spool).
+        """
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        esvaziada = self._thread is None or not self._thread.is_alive()
+        if esvaziada:
+            self._fechar_conexao()
+        return esvaziada
+
+def iniciar_fila_metricas(conectar=None) -> FilaMetricas | None:
+    """
+    Cria e inicia a fila de gravação das métricas, se config_fila_metricas["ativa"] (MINDSHIFT_FILA_METRICAS=1).
 
-# COLABORADOR 
+    Args:
+        conectar: Função que retorna a conexão da thread de gravação (padrão: conectarBD).
 
-def listar_tarefas_colaborador(conn: oracledb.Connection, cpf_colaborador: str) -> None:
+    Returns:
+        FilaMetricas: A fila em uso pelo processo.
+        None: Se a fila estiver desativada.
     """
-    Busca e exibe todas as tarefas PENDENTES/EM ANDAMENTO de um colaborador específico.
-    A função utiliza o CPF do colaborador logado para filtrar as tarefas na tabela
-    T_MNDSH_TAREFA, excluindo aquelas com status 'concluída'. Os resultados são exibidos
-    em formato de tabela e podem ser exportados.
+    if not config_fila_metricas["ativa"]:
+        return None
+    if _fila_metricas["fila"] is None:
+        fila = FilaMetricas(conectar)
+        recuperados = fila.iniciar()
+        if recuperados:
+            print(f"\n{margem}{recuperados} registro(s) de métricas pendentes no spool serão gravados.\n")
+        _fila_metricas["fila"] = fila
+    return _fila_metricas["fila"]
+
+def encerrar_fila_metricas(timeout: float = 30) -> None:
+    """
+    Grava os registros pendentes e encerra a fila de gravação, se estiver em uso.
+    """
+    fila, _fila_metricas["fila"] = _fila_metricas["fila"], None
+    if fila is not None and not fila.encerrar(timeout):
+        print(f"\n{margem}AVISO: registros de métricas não gravados continuam em {fila.spool} e serão gravados na próxima execução.\n")
+
+# ====== EXPURGO DE COLABORADORES EXCLUÍDOS ======
+
+# Excluir um colaborador só preenche dt_exclusao (exclusão lógica), o que o tira das buscas, tarefas e
+# relatórios na hora; as tarefas e métricas dele são apagadas depois por expurgar_colaboradores(), em lotes
+# de tamanho_lote linhas com um commit por lote (sem segurar bloqueios nem a tela do administrador), e só
+# então a linha do colaborador é removida. O expurgo roda numa thread (iniciar_expurgo) ou pelo
+# "cli.py colaboradores expurgar"; interrompido, continua de onde parou na execução seguinte.
+config_expurgo = {
+    "tamanho_lote": int(os.environ.get("MINDSHIFT_EXPURGO_LOTE", "5000")),
+    "pausa_segundos": float(os.environ.get("MINDSHIFT_EXPURGO_PAUSA", "0.05"))
+}
+_expurgo = {"thread": None, "parar": None, "progresso": None, "erro": None}
+
+def marcar_colaborador_excluido(conn: oracledb.Connection, id_colaborador: int) -> bool:
+    """
+    Exclusão lógica do colaborador: preenche dt_exclusao e faz o commit. O CPF continua ocupado até o expurgo.
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
-        cpf_colaborador: O CPF do colaborador logado.
+        id_colaborador: ID do colaborador.
 
     Returns:
-        None: A função gerencia a exibição e exportação.
-
-    Dependências:
-        - Funções: limpa_tela, imprimir_tabela, gerar_dataframe.
-        - Variáveis: margem.
-        - Módulo: pandas (pd).
+        bool: True se o colaborador foi marcado; False se não existe ou já estava excluído.
     """
-    limpa_tela()
     cursor = conn.cursor()
     try:
-        cursor.execute("SELECT nm_colaborador FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf", {"cpf": cpf_colaborador})
-        resultado = cursor.fetchone()
-        if not resultado:
-            print("\nErro ao identificar colaborador.\n")
-            input("Pressione ENTER para voltar...")
-            return
-        nome = resultado[0]
-
         cursor.execute("""
-            SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
-            FROM T_MNDSH_TAREFA
-            WHERE nr_cpf = :cpf AND ds_status != 'concluída'
-            ORDER BY dt_prazo
-        """, {"cpf": cpf_colaborador})
-        tarefas = cursor.fetchall()
+            UPDATE T_MNDSH_COLABORADOR
+            SET dt_exclusao = SYSDATE, dt_ultima_modificacao = SYSDATE
+            WHERE id = :id AND dt_exclusao IS NULL
+        """, {"id": id_colaborador})
+        marcado = cursor.rowcount == 1
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return marcado
 
-        if not tarefas:
-            print(f"\n{margem} Nenhuma tarefa encontrada para {nome} (CPF: {cpf_colaborador}).\n")
-            input("Pressione ENTER para voltar...")
-            return
-        df = pd.DataFrame(tarefas, columns=["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"])
-        imprimir_tabela(df, 
-                        titulo=f"TAREFAS DE {nome}", 
-                        tamanhos_wrap={"Título":25,"Descrição":40}, 
-                        colunas_datas=["Prazo"], 
-                        colunas_datetime=["Data Criação", "Data Última Modificação"])
-        gerar_dataframe(df)
-    except Exception as e:
-        print(f"\n{margem} Erro ao listar tarefas: {e}\n")
-        input("Pressione ENTER para continuar...")
+def pendencias_expurgo(conn: oracledb.Connection) -> list[dict]:
+    """
+    Lista os colaboradores excluídos que aguardam o expurgo (do mais antigo para o mais recente), com as
+    linhas que ainda restam em cada tabela de chaves_colaborador.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT id, nr_cpf, dt_exclusao
+            FROM T_MNDSH_COLABORADOR
+            WHERE dt_exclusao IS NOT NULL
+            ORDER BY dt_exclusao, id
+        """)
+        pendentes = [{"id": id_colaborador, "nr_cpf": cpf, "dt_exclusao": data, "linhas": {}}
+                     for id_colaborador, cpf, data in cursor.fetchall()]
+        for colaborador in pendentes:
+            for tabela in chaves_colaborador:
+                cursor.execute(f"SELECT COUNT(*) FROM {tabela} WHERE id_colaborador = :id", {"id": colaborador["id"]})
+                colaborador["linhas"][tabela] = cursor.fetchone()[0]
     finally:
         cursor.close()
+    return pendentes
 
-def atualizar_tarefa_colaborador(conn: oracledb.Connection, cpf_colaborador: str, nome_colaborador: str) -> None:
+def _apagar_lote_colaborador(conn: oracledb.Connection, cursor, tabela: str, id_colaborador: int, tamanho_lote: int) -> int:
     """
-    Permite ao colaborador alterar o status de suas tarefas (para 'em andamento' ou 'concluída').
-    A função lista apenas as tarefas NÃO CONCLUÍDAS do colaborador. Após a seleção do ID,
-    permite alterar o status, validando que a tarefa pertence ao colaborador e não está
-    concluída. A alteração é confirmada e registrada no banco.
+    Apaga até 'tamanho_lote' linhas do colaborador em 'tabela' (pelo índice que começa em id_colaborador)
+    e faz o commit.
+    """
+    if eh_sqlite(conn):
+        comando = f"""
+            DELETE FROM {tabela}
+            WHERE rowid IN (SELECT rowid FROM {tabela} WHERE id_colaborador = :id LIMIT :lote)
+        """
+    else:
+        comando = f"DELETE FROM {tabela} WHERE id_colaborador = :id AND ROWNUM <= :lote"
+    cursor.execute(comando, {"id": id_colaborador, "lote": tamanho_lote})
+    apagadas = max(cursor.rowcount or 0, 0)
+    conn.commit()
+    return apagadas
+
+def expurgar_colaboradores(conn: oracledb.Connection, tamanho_lote: int | None = None, progresso=None, parar: threading.Event | None = None) -> dict:
+    """
+    Apaga as tarefas e métricas (chaves_colaborador) dos colaboradores excluídos, em lotes com um commit cada
+    e uma pausa de config_expurgo["pausa_segundos"] entre eles, e por fim a linha de cada colaborador.
+    Só linhas de colaboradores já excluídos são apagadas, então o expurgo interrompido pode ser repetido.
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
-        cpf_colaborador: O CPF do colaborador logado.
-        nome_colaborador: O nome do colaborador logado.
+        tamanho_lote: Linhas apagadas por commit (padrão: config_expurgo["tamanho_lote"]).
+        progresso: Função chamada após cada lote com um dicionário (colaborador, posição, tabela, linhas apagadas).
+        parar: Evento que interrompe o expurgo ao fim do lote atual.
 
     Returns:
-        None: A função realiza a ação de atualização.
+        dict: Colaboradores expurgados, linhas apagadas por tabela, lotes, segundos e se foi interrompido.
 
     Dependências:
-        - Funções: limpa_tela, imprimir_tabela, menu_opcoes2, perguntar_continuar,
-                   perguntar_continuar2.
-        - Variáveis: margem.
-        - Módulo: pandas (pd).
+        - Funções: eh_sqlite, contador_inc, medir_duracao.
+        - Variáveis: config_expurgo, chaves_colaborador.
     """
-    while True:
-        limpa_tela()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
-                FROM T_MNDSH_TAREFA
-                WHERE nr_cpf = :cpf AND ds_status != 'concluída'
-                ORDER BY dt_prazo
-            """, {"cpf": cpf_colaborador})
-            tarefas = cursor.fetchall()
-            if not tarefas:
-                limpa_tela()
-                print(f"===== TAREFAS A CONCLUIR DE {nome_colaborador} (CPF: {cpf_colaborador}) =====")
-                print(f"\n{margem} Nenhuma tarefa NÃO CONCLUÍDA encontrada.\n")
-                input("Pressione ENTER para voltar...")
-                break
-
-            df = pd.DataFrame(tarefas, columns=["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"])
-            imprimir_tabela(df, 
-                            titulo=f"TAREFAS A CONCLUIR DE {nome_colaborador}",
-                            tamanhos_wrap={"Título":25,"Descrição":40},  
-                            colunas_datas=["Prazo"], 
-                            colunas_datetime=["Data Criação","Data Última Modificação"])
-            
-            id_tarefa = None
-            while True:
-                try:
-                    id_tarefa_input = input("\nDigite o ID da tarefa que deseja ATUALIZAR: ")
-                    id_tarefa = int(id_tarefa_input)
-                    break 
-                except ValueError:
-                    print(f"\n{margem} Entrada inválida. Por favor, digite o número do ID.\n")
-                    if not perguntar_continuar("tentar novamente"):
-                        id_tarefa = -1
-                        break
-            if id_tarefa == -1:
-                break
-
-            cursor.execute("""
-                SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
-                FROM T_MNDSH_TAREFA
-                WHERE id_tarefa=:id AND nr_cpf=:cpf_colaborador AND ds_status != 'concluída'
-            """, {"id": id_tarefa, "cpf_colaborador": cpf_colaborador})
-            tarefa_completa = cursor.fetchone()
-
-            if not tarefa_completa:
-                print(f"\n{margem} ID da tarefa ({id_tarefa}) é inválido, já está concluído ou não pertence à sua lista.\n")
-                input("Pressione ENTER para continuar...")
-                continue
+    tamanho_lote = tamanho_lote or config_expurgo["tamanho_lote"]
+    resumo = {"colaboradores": 0, "linhas": {tabela: 0 for tabela in chaves_colaborador}, "lotes": 0, "interrompido": False}
+    inicio = time.perf_counter()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT id FROM T_MNDSH_COLABORADOR WHERE dt_exclusao IS NOT NULL ORDER BY dt_exclusao, id")
+        ids = [linha[0] for linha in cursor.fetchall()]
+        for posicao, id_colaborador in enumerate(ids, 1):
+            for tabela in chaves_colaborador:
+                apagadas = tamanho_lote
+                while apagadas >= tamanho_lote:
+                    if parar is not None and parar.is_set():
+                        resumo["interrompido"] = True
+                        return resumo
+                    with medir_duracao("mindshift_expurgo_lote_segundos", "Tempo de cada lote do expurgo de colaboradores.", tabela=tabela):
+                        apagadas = _apagar_lote_colaborador(conn, cursor, tabela, id_colaborador, tamanho_lote)
+                    resumo["linhas"][tabela] += apagadas
+                    resumo["lotes"] += 1
+                    contador_inc("mindshift_expurgo_linhas_total", "Linhas apagadas pelo expurgo de colaboradores.", apagadas, tabela=tabela)
+                    if progresso is not None:
+                        progresso({"id_colaborador": id_colaborador, "posicao": posicao, "colaboradores": len(ids),
+                                   "tabela": tabela, "apagadas": apagadas, "total_tabela": resumo["linhas"][tabela]})
+                    if apagadas >= tamanho_lote and config_expurgo["pausa_segundos"]:
+                        time.sleep(config_expurgo["pausa_segundos"])
+            # Sem linhas filhas, o ON DELETE CASCADE não tem o que apagar
+            cursor.execute("DELETE FROM T_MNDSH_COLABORADOR WHERE id = :id AND dt_exclusao IS NOT NULL", {"id": id_colaborador})
+            conn.commit()
+            resumo["colaboradores"] += 1
+            contador_inc("mindshift_expurgo_colaboradores_total", "Colaboradores excluídos removidos pelo expurgo.")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        resumo["segundos"] = round(time.perf_counter() - inicio, 3)
+    return resumo
 
-            limpa_tela()
-            df_tarefa = pd.DataFrame([tarefa_completa], columns=["ID","Título","Descrição","Status","Prioridade","Prazo","Data Criação","Última Modificação"])
-            imprimir_tabela(df_tarefa, 
-                            titulo=f"ATUALIZAR TAREFA - {nome_colaborador}", 
-                            tamanhos_wrap={"Título":25,"Descrição":40}, 
-                            colunas_datas=["Prazo"], 
-                            colunas_datetime=["Data Criação","Última Modificação"])
+def iniciar_expurgo(conectar=None) -> threading.Thread | None:
+    """
+    Inicia expurgar_colaboradores() numa thread com conexão própria, se ainda não houver um expurgo em
+    andamento. O último lote concluído fica em _expurgo["progresso"] e um erro, em _expurgo["erro"].
 
-            novo_status = menu_opcoes2("\nSelecione o novo status:", ["Em Andamento", "Concluída", "Voltar"], ["EM ANDAMENTO", "CONCLUIDA", "VOLTAR"])
+    Args:
+        conectar: Função sem argumentos que retorna a conexão da thread (padrão: conectarBD).
 
-            if novo_status == "VOLTAR":
-                print(f"\n{margem} Atualização cancelada.\n")
-                input("Pressione ENTER para continuar...")
-                continue
-            
-            status_bd = 'em andamento' if novo_status == 'EM ANDAMENTO' else 'concluída'
-            status_display = novo_status.upper()
+    Returns:
+        threading.Thread: A thread do expurgo.
+        None: Se não foi possível conectar.
+    """
+    thread = _expurgo["thread"]
+    if thread is not None and thread.is_alive():
+        return thread
+    conn = (conectar or conectarBD)()
+    if conn is None:
+        return None
+    parar = threading.Event()
 
-            confirmacao = perguntar_continuar(f"confirmar a mudança para o status '{status_display}'")
-            if confirmacao:
-                cursor.execute("""
-                    UPDATE T_MNDSH_TAREFA 
-                    SET ds_status=:novo_status, dt_modificacao=SYSDATE 
-                    WHERE id_tarefa=:id AND nr_cpf=:cpf_colaborador
-                """, {"novo_status": status_bd, "id": id_tarefa, "cpf_colaborador": cpf_colaborador})
-                
-                conn.commit()
-                print(f"\n{margem} Tarefa '{tarefa_completa[1]}' atualizada para status: {status_display} com sucesso!\n")
-            else:
-                continue
-            if not perguntar_continuar2("atualizar outra tarefa"):
-                        break
+    def executar():
+        try:
+            expurgar_colaboradores(conn, progresso=lambda situacao: _expurgo.update(progresso=situacao), parar=parar)
         except Exception as e:
-            conn.rollback()
-            print(f"\n{margem} Erro ao atualizar tarefa: {e}\n")
-            input("Pressione ENTER para voltar...")
+            _expurgo["erro"] = f"{type(e).__name__}: {e}"
+            contador_inc("mindshift_expurgo_erros_total", "Expurgos de colaboradores interrompidos por erro.")
         finally:
-            if 'cursor' in locals() and cursor:
-                cursor.close()
+            try:
+                conn.close()
+            except Exception:
+                pass
 
-# ====== Registro de métricas e relatórios ======
+    thread = threading.Thread(target=executar, name="mindshift-expurgo", daemon=True)
+    _expurgo.update(thread=thread, parar=parar, progresso=None, erro=None)
+    thread.start()
+    return thread
 
-def registrar_metrica(conn: oracledb.Connection, cpf_colaborador: str) -> None:
+def encerrar_expurgo(timeout: float = 30) -> None:
     """
-    Permite ao colaborador registrar suas métricas diárias em cinco categorias:
-    Produtividade, Bem-estar emocional, Satisfação no trabalho, Qualidade do sono e Bem-estar físico.
+    Interrompe o expurgo em andamento ao fim do lote atual; os colaboradores que faltaram continuam
+    excluídos e são expurgados na próxima execução.
+    """
+    thread, parar = _expurgo["thread"], _expurgo["parar"]
+    _expurgo.update(thread=None, parar=None)
+    if thread is not None and thread.is_alive():
+        parar.set()
+        thread.join(timeout)
+
+# ====== DIÁRIO OFFLINE (banco indisponível) ======
+
+# Sem conexão com o banco, check-ins e mudanças de status de tarefas vão para um diário local (JSONL,
+# somente acréscimo) e são reproduzidos em lote quando a conexão volta
+config_diario_offline = {
+    "arquivo": os.environ.get("MINDSHIFT_DIARIO_OFFLINE", "diario_offline.jsonl"),
+    "quarentena": os.environ.get("MINDSHIFT_DIARIO_QUARENTENA", "diario_offline_quarentena.jsonl"),
+    "tamanho_lote": int(os.environ.get("MINDSHIFT_DIARIO_LOTE", "500"))
+}
+_trava_diario = threading.Lock()
 
-    A função primeiro verifica se já existe um registro para o colaborador na data atual (SYSDATE).
-    Em caso negativo, ela calcula métricas objetivas de tarefas e, em seguida, solicita notas subjetivas 
-    (0 a 10) para cada categoria,de maneira que se colaborador não responder ou não responder corretamente 
-    ele fica preso no loop ate que a resposta certa seja dada obrigando assim o colaborador a responder 
-    obrigatoriamente todas as questões, realizando múltiplas inserções na tabela T_MNDSH_METRICA.
+def _acrescentar_diario(dados: dict, arquivo: str | None = None) -> None:
+    with _trava_diario:
+        with open(arquivo or config_diario_offline["arquivo"], "a", encoding="utf-8") as f:
+            f.write(json.dumps(dados, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+def registrar_offline(tipo: str, arquivo: str | None = None, **dados) -> str:
+    """
+    Acrescenta uma operação ao diário offline.
 
     Args:
-        conn: O objeto de conexão ativo com o banco de dados Oracle.
-        cpf_colaborador: O CPF do colaborador logado.
+        tipo: "checkin" (cpf, notas) ou "status_tarefa" (id_tarefa, status, cpf).
+        arquivo: Caminho do diário (padrão: config_diario_offline["arquivo"]).
+        **dados: Os dados da operação.
 
     Returns:
-        None: A função realiza as inserções no banco.
-
-    Dependências:
-        - Funções: limpa_tela, valida_nota.
-        - Variáveis: margem.
+        str: O identificador (UUID) da entrada, usado para não reaplicá-la.
     """
-    limpa_tela()
-    print("===== REGISTRAR MÉTRICAS =====\n")
-    print(f"{margem}Registro obrigatório diario (de preferência ao fim do expediente).")
-    print(f"\n{margem}Respostas apenas números inteiros de 0 a 10.")
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 1
-            FROM T_MNDSH_METRICA
-            WHERE nr_cpf = :cpf
-              AND TRUNC(dt_registro) = TRUNC(SYSDATE)
-        """, {"cpf": cpf_colaborador})
-        if cursor.fetchone():
-            print(f"\n{margem}AVISO: Já existe um registro de métricas para o colaborador {cpf_colaborador} na data de hoje.")
-            print(f"{margem}Por favor, retorne amanhã para um novo registro.")
-            return 
+    entrada = {"id": uuid.uuid4().hex, "tipo": tipo, "data": datetime.now().isoformat(timespec="seconds"), **dados}
+    _acrescentar_diario(entrada, arquivo)
+    contador_inc("mindshift_diario_offline_total", "Operações gravadas no diário offline.", tipo=tipo)
+    return entrada["id"]
 
-        cursor.execute("""
-            SELECT
-                SUM(CASE WHEN ds_status = 'concluída' THEN 1 ELSE 0 END),
-                SUM(CASE WHEN ds_status = 'em andamento' THEN 1 ELSE 0 END),
-                SUM(CASE WHEN ds_status = 'pendente' THEN 1 ELSE 0 END),
-                SUM(CASE WHEN ds_status = 'concluída' AND TRUNC(dt_prazo) >= TRUNC(SYSDATE) THEN 1 ELSE 0 END),
-                SUM(CASE WHEN ds_status = 'concluída' AND TRUNC(dt_prazo) < TRUNC(SYSDATE) THEN 1 ELSE 0 END)
-            FROM T_MNDSH_TAREFA
-            WHERE nr_cpf = :cpf
-        """, {"cpf": cpf_colaborador})
-        r = cursor.fetchone()
-        tarefas_concluidas = int(r[0] or 0)
-        tarefas_andamento = int(r[1] or 0)
-        tarefas_pendentes = int(r[2] or 0)
-        concluidas_no_prazo = int(r[3] or 0)
-        concluidas_atraso = int(r[4] or 0)
+def ler_diario(arquivo: str | None = None) -> tuple[list[dict], set[str]]:
+    """
+    Lê o diário offline.
 
-        print("\n--- PRODUTIVIDADE ---")
-        print(f"\nTarefas concluídas: {tarefas_concluidas}, Em andamento: {tarefas_andamento}, Pendentes: {tarefas_pendentes}")
-        print(f"\nConcluídas no prazo: {concluidas_no_prazo}, Atrasadas: {concluidas_atraso}")
+    Returns:
+        tuple: (entradas na ordem em que foram gravadas, ids já aplicados no banco).
+    """
+    arquivo = arquivo or config_diario_offline["arquivo"]
+    entradas, aplicados = [], set()
+    if not os.path.exists(arquivo):
+        return entradas, aplicados
+    with open(arquivo, encoding="utf-8") as f:
+        for linha in f:
+            try:
+                dados = json.loads(linha)
+            except ValueError:
+                continue  # última linha incompleta (queda durante a escrita)
+            if "aplicados" in dados:
+                aplicados.update(dados["aplicados"])
+            else:
+                entradas.append(dados)
+    return entradas, aplicados
 
-        horas_produtivas = valida_nota("\nHoras produtivas hoje (0-10): ")
-        nivel_foco = valida_nota("\nNível de foco (0-10): ")
+def diario_pendentes(arquivo: str | None = None) -> list[dict]:
+    """
+    Retorna as entradas do diário offline ainda não aplicadas no banco.
+    """
+    entradas, aplicados = ler_diario(arquivo)
+    return [e for e in entradas if e["id"] not in aplicados]
 
-        cursor.execute("""
-            INSERT INTO T_MNDSH_METRICA (nr_cpf, tipo_metrica, dt_registro,horas_produtivas, nivel_foco, 
-                       tarefas_concluidas, tarefas_andamento, tarefas_pendentes,concluidas_no_prazo, concluidas_atraso)
-            VALUES (:cpf, 'Produtividade', SYSDATE,:horas_produtivas, :nivel_foco, :tarefas_concluidas, :tarefas_andamento, 
-                       :tarefas_pendentes,:concluidas_no_prazo, :concluidas_atraso)
-        """, {"cpf": cpf_colaborador, "horas_produtivas": horas_produtivas, "nivel_foco": nivel_foco, "tarefas_concluidas": tarefas_concluidas,
-            "tarefas_andamento": tarefas_andamento, "tarefas_pendentes": tarefas_pendentes, "concluidas_no_prazo": concluidas_no_prazo, "concluidas_atraso": concluidas_atraso})
+def checkin_offline_hoje(cpf_colaborador: str, arquivo: str | None = None) -> bool:
+    """
+    Indica se o colaborador já tem check-in de hoje no diário offline (ainda não aplicado).
+    """
+    hoje = datetime.now().date().isoformat()
+    return any(e["tipo"] == "checkin" and e["cpf"] == cpf_colaborador and e["data"][:10] == hoje
+               for e in diario_pendentes(arquivo))
 
-        # --- BEM-ESTAR EMOCIONAL ---
-        print("\n--- BEM-ESTAR EMOCIONAL ---")
-        estresse = valida_nota("\nNível de estresse (0-10): ")
-        humor = valida_nota("\nHumor geral (0-10): ")
-        energia = valida_nota("\nEnergia/disposição (0-10): ")
-        controle_dia = valida_nota("\nSensação de controle sobre o dia (0-10): ")
+def _conferir_diario(conn: oracledb.Connection, lote: list[dict]) -> tuple[dict, dict]:
+    """
+    Confere as entradas do diário contra o banco antes da reprodução.
 
-        cursor.execute("""
-            INSERT INTO T_MNDSH_METRICA (nr_cpf, tipo_metrica, dt_registro, estresse, humor, energia, controle_dia)
-            VALUES (:cpf, 'Bem-estar emocional', SYSDATE, :estresse, :humor, :energia, :controle_dia)
-        """, {"cpf": cpf_colaborador, "estresse": estresse, "humor": humor, "energia": energia, "controle_dia": controle_dia})
+    Returns:
+        tuple: ({cpf: id} dos colaboradores ativos, {id da entrada: motivo} das entradas que não podem ser aplicadas:
+            colaborador inexistente, tarefa inexistente ou de outro colaborador, notas inválidas ou entrada malformada).
+    """
+    ids = ids_colaboradores(conn, [e.get("cpf") for e in lote])
+    id_tarefas = list({e.get("id_tarefa") for e in lote if e.get("tipo") == "status_tarefa"})
+    tarefas = {}
+    cursor = conn.cursor()
+    try:
+        for i in range(0, len(id_tarefas), 500):
+            binds = {f"t{j}": id_tarefa for j, id_tarefa in enumerate(id_tarefas[i:i + 500])}
+            cursor.execute(f"""
+                SELECT id_tarefa, id_colaborador FROM T_MNDSH_TAREFA
+                WHERE id_tarefa IN ({", ".join(":" + nome for nome in binds)})
+            """, binds)
+            tarefas.update(cursor.fetchall())
+    finally:
+        cursor.close()
 
-        # --- SATISFAÇÃO NO TRABALHO ---
-        print("\n--- SATISFAÇÃO NO TRABALHO ---")
-        satisfacao_geral = valida_nota("\nSatisfação geral (0-10): ")
-        relacao_colegas = valida_nota("\nRelação com colegas (0-10): ")
-        reconhecimento = valida_nota("\nReconhecimento recebido (0-10): ")
-        carga_trabalho = valida_nota("\nCarga de trabalho percebida (0-10): ")
+    quarentena = {}
+    for entrada in lote:
+        try:
+            datetime.fromisoformat(entrada["data"])
+            if entrada["tipo"] not in ("checkin", "status_tarefa"):
+                motivo = "entrada malformada"
+            elif entrada["cpf"] not in ids:
+                motivo = "colaborador inexistente"
+            elif entrada["tipo"] == "checkin":
+                motivo = "notas inválidas" if validar_notas_metricas(entrada["notas"]) else None
+            elif entrada["id_tarefa"] not in tarefas:
+                motivo = "tarefa inexistente"
+            elif tarefas[entrada["id_tarefa"]] != ids[entrada["cpf"]]:
+                motivo = "tarefa de outro colaborador"
+            else:
+                motivo = None
+        except (KeyError, TypeError, ValueError, AttributeError):
+            motivo = "entrada malformada"
+        if motivo:
+            quarentena[entrada["id"]] = motivo
+    return ids, quarentena
+
+def reproduzir_diario(conn: oracledb.Connection, arquivo: str | None = None, tamanho_lote: int | None = None) -> dict:
+    """
+    Aplica no banco, em lotes, as entradas pendentes do diário offline. Pode ser repetida sem efeito duplicado:
+    cada lote é gravado em uma transação e marcado como aplicado no diário; check-ins de colaboradores que já
+    têm registro no dia são descartados e mudanças de status só valem se a tarefa não foi alterada depois
+    do momento da entrada (a mais recente prevalece).
 
-        cursor.execute("""
-            INSERT INTO T_MNDSH_METRICA (nr_cpf, tipo_metrica, dt_registro, satisfacao_geral, relacao_colegas, reconhecimento, carga_trabalho)
-            VALUES (:cpf, 'Satisfação no trabalho', SYSDATE, :satisfacao_geral, :relacao_colegas, :reconhecimento, :carga_trabalho)
-        """, {"cpf": cpf_colaborador, "satisfacao_geral": satisfacao_geral, "relacao_colegas": relacao_colegas, "reconhecimento": reconhecimento, "carga_trabalho": carga_trabalho})
+    Entradas que não podem ser aplicadas (CPF sem colaborador ativo, tarefa inexistente ou de outro colaborador,
+    notas inválidas) não derrubam o lote: vão para o arquivo de quarentena (config_diario_offline["quarentena"]),
+    são marcadas como tratadas e aparecem no resumo.
 
-        # --- QUALIDADE DO SONO ---
-        print("\n--- QUALIDADE DO SONO ---")
-        horas_dormidas = valida_nota("\nHoras dormidas (0-10): ")
-        descanso = valida_nota("\nSensação de descanso (0-10): ")
-        despertares = valida_nota("\nNúmero de vezes que acordou à noite (0-10): ")
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        arquivo: Caminho do diário (padrão: config_diario_offline["arquivo"]).
+        tamanho_lote: Entradas por transação (padrão: config_diario_offline["tamanho_lote"]).
 
-        cursor.execute("""
-            INSERT INTO T_MNDSH_METRICA (nr_cpf, tipo_metrica, dt_registro, horas_dormidas, descanso, despertares)
-            VALUES (:cpf, 'Qualidade do sono', SYSDATE, :horas_dormidas, :descanso, :despertares)
-        """, {"cpf": cpf_colaborador, "horas_dormidas": horas_dormidas, "descanso": descanso,"despertares": despertares})
+    Returns:
+        dict: Quantidades aplicadas/descartadas por tipo, entradas em quarentena (total e por motivo),
+            segundos e entradas por segundo.
 
-        # --- BEM-ESTAR FÍSICO ---
-        print("\n--- BEM-ESTAR FÍSICO ---")
-        atividade_fisica = valida_nota("\nHoras de atividade física (0-10): ")
-        ingestao_agua = valida_nota("\nIngestão de água (0-10): ")
-        intensidade_atividade = valida_nota("\nIntensidade da atividade física (0-10): ")
+    Dependências:
+        - Funções: diario_pendentes, _conferir_diario, contar_tarefas_colaboradores, gravar_metricas_lote.
+    """
+    arquivo = arquivo or config_diario_offline["arquivo"]
+    tamanho_lote = tamanho_lote or config_diario_offline["tamanho_lote"]
+    pendentes = diario_pendentes(arquivo)
+    resumo = {"entradas": len(pendentes), "checkins": 0, "checkins_duplicados": 0, "status_tarefa": 0, "status_ignorados": 0,
+              "quarentena": 0, "quarentena_por_motivo": {}}
+    inicio = time.perf_counter()
+    for i in range(0, len(pendentes), tamanho_lote):
+        lote = pendentes[i:i + tamanho_lote]
+        ids, quarentena = _conferir_diario(conn, lote)
+        checkins, status = [], []
+        for entrada in lote:
+            if entrada["id"] not in quarentena:
+                (checkins if entrada["tipo"] == "checkin" else status).append(entrada)
+
+        contadores = contar_tarefas_colaboradores(conn, [e["cpf"] for e in checkins]) if checkins else {}
 
-        cursor.execute("""
-            INSERT INTO T_MNDSH_METRICA (nr_cpf, tipo_metrica, dt_registro, atividade_fisica, ingestao_agua, intensidade_atividade)
-            VALUES (:cpf, 'Bem-estar físico', SYSDATE, :atividade_fisica, :ingestao_agua, :intensidade_atividade)
-        """, {"cpf": cpf_colaborador, "atividade_fisica": atividade_fisica, "ingestao_agua": ingestao_agua, "intensidade_atividade": intensidade_atividade})
+        cursor = conn.cursor()
+        try:
+            alteradas = gravados = 0
+            sem_colaborador = []
+            if status:
+                cursor.executemany("""
+                    UPDATE T_MNDSH_TAREFA
+                    SET ds_status = :status, dt_modificacao = :data
+                    WHERE id_tarefa = :id_tarefa AND id_colaborador = :id_colaborador
+                      AND (dt_modificacao IS NULL OR dt_modificacao <= :data)
+                """, [{"status": e["status"], "data": datetime.fromisoformat(e["data"]), "id_tarefa": e["id_tarefa"],
+                       "id_colaborador": ids[e["cpf"]]} for e in status])
+                alteradas = max(cursor.rowcount or 0, 0)
+            if checkins:
+                # Colaborador excluído entre a conferência e a gravação: também vai para a quarentena
+                gravados = gravar_metricas_lote(conn, [{"id": e["id"], "cpf": e["cpf"], "valores": {**contadores[e["cpf"]], **e["notas"]},
+                                                        "dt_registro": datetime.fromisoformat(e["data"])} for e in checkins],
+                                                sem_colaborador=sem_colaborador)
+            else:
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        quarentena.update((r["id"], "colaborador inexistente") for r in sem_colaborador)
+        for entrada in lote:
+            if entrada["id"] in quarentena:
+                motivo = quarentena[entrada["id"]]
+                _acrescentar_diario({**entrada, "motivo": motivo, "quarentena_em": datetime.now().isoformat(timespec="seconds")},
+                                    config_diario_offline["quarentena"])
+                contador_inc("mindshift_diario_offline_quarentena_total", "Entradas do diário offline separadas em quarentena.", motivo=motivo)
+                resumo["quarentena_por_motivo"][motivo] = resumo["quarentena_por_motivo"].get(motivo, 0) + 1
+        _acrescentar_diario({"aplicados": [e["id"] for e in lote]}, arquivo)
+        resumo["checkins"] += gravados
+        resumo["checkins_duplicados"] += len(checkins) - len(sem_colaborador) - gravados
+        resumo["status_tarefa"] += alteradas
+        resumo["status_ignorados"] += len(status) - alteradas
+        resumo["quarentena"] += len(quarentena)
+
+    if pendentes:
+        with _trava_diario:
+            entradas, aplicados = ler_diario(arquivo)
+            if all(e["id"] in aplicados for e in entradas):
+                open(arquivo, "w").close()
+    segundos = time.perf_counter() - inicio
+    contador_inc("mindshift_diario_offline_reproduzidas_total", "Entradas do diário offline aplicadas no banco.",
+                 len(pendentes) - resumo["quarentena"])
+    resumo.update({"segundos": round(segundos, 3),
+                   "entradas_por_segundo": round(len(pendentes) / segundos, 1) if pendentes and segundos else None})
+    return resumo
+
+def atualizar_tarefa_offline(cpf_colaborador: str) -> None:
+    """
+    Versão offline de atualizar_tarefa_colaborador(): sem acesso às tarefas, pede o ID e o novo status
+    e grava a mudança no diário offline, validada contra o banco na reprodução.
 
-        conn.commit()
-        print(f"\n{margem}Métricas registradas com sucesso!\n")
+    Dependências:
+        - Funções: limpa_tela, menu_opcoes2, perguntar_continuar, registrar_offline.
+        - Variáveis: margem.
+    """
+    limpa_tela()
+    print("===== ATUALIZAR TAREFA (OFFLINE) =====\n")
+    try:
+        id_tarefa = input("Digite o ID da tarefa que deseja ATUALIZAR: ").strip()
+        if not id_tarefa.isdigit():
+            print(f"\n{margem} Entrada inválida. O ID deve ser numérico.\n")
+            return
+        novo_status = menu_opcoes2("\nSelecione o novo status:", ["Em Andamento", "Concluída", "Voltar"], ["em andamento", "concluída", "voltar"])
+        if novo_status == "voltar" or not perguntar_continuar(f"confirmar a mudança para o status '{novo_status.upper()}'"):
+            print(f"\n{margem} Atualização cancelada.\n")
+            return
+        registrar_offline("status_tarefa", id_tarefa=int(id_tarefa), status=novo_status, cpf=cpf_colaborador)
+        print(f"\n{margem} Mudança guardada no diário offline; será aplicada quando o banco voltar.\n")
     except Exception as e:
-        print(f"\n{margem}Erro ao registrar métricas: {e}\n")
-        conn.rollback()
+        print(f"\n{margem} Erro ao guardar a mudança: {e}\n")
     finally:
-        cursor.close()
-        input("\nPressione ENTER para voltar ao menu do colaborador...")
+        input("Pressione ENTER para continuar...")
+        limpa_tela()
+
+def menu_offline() -> None:
+    """
+    Menu do colaborador sem conexão com o banco: o CPF não pode ser conferido, então só as operações
+    que vão para o diário offline ficam disponíveis (registro de métricas e status de tarefas).
+
+    Dependências:
+        - Funções: limpa_tela, cpf_digitos_validos, menu_opcoes, executar_acao, registrar_metrica, atualizar_tarefa_offline.
+    """
+    limpa_tela()
+    print("===== MENU DO COLABORADOR (OFFLINE) =====\n")
+    print(f"{margem}Banco de dados indisponível. Os registros ficam guardados neste computador")
+    print(f"{margem}e são enviados automaticamente quando a conexão voltar.\n")
+    cpf = "".join(c for c in input("CPF do colaborador: ") if c.isdigit())
+    # Sem o banco para conferir o colaborador, ao menos os dígitos verificadores barram CPFs digitados errado
+    if not cpf_digitos_validos(cpf):
+        print(f"\n {margem} CPF inválido!\n")
+        input("Pressione ENTER para continuar...")
+        limpa_tela()
+        return
+    while True:
         limpa_tela()
+        op = menu_opcoes(f"===== MENU OFFLINE - CPF {cpf} =====\n",
+            ["Registrar Métricas Diárias", "Atualizar Tarefa", "Voltar Menu Principal"],
+            ["registrar", "atualizar", "voltar"])
+        if op == "registrar":
+            executar_acao("registrar_metrica", registrar_metrica, None, cpf)
+        elif op == "atualizar":
+            executar_acao("atualizar_tarefa_offline", atualizar_tarefa_offline, cpf)
+        else:
+            limpa_tela()
+            return
 
 # ====== FUNÇÕES DE CÁLCULO E FEEDBACK ======
 
@@ -2267,168 +5679,675 @@ def gerar_feedback_e_insights_geral(metricas_media: dict) -> tuple[str, list[str
     adiciona_insight(ruim(produtividade, "produtividade") and prop_conclusao >= 0.8,
                 "Produtividade média baixa, mas equipe consegue concluir tarefas; atenção ao ritmo de trabalho.", insights)
 
-    # Produtividade x sono
-    adiciona_insight(bom(produtividade, "produtividade") and (ruim(sono_horas, "sono_horas") or ruim(sono_descanso, "sono_descanso")),
-                "Produtividade média boa, mas qualidade do sono da equipe pode impactar resultados futuros.", insights)
-    adiciona_insight(ruim(produtividade, "produtividade") and (ruim(sono_horas, "sono_horas") or ruim(sono_descanso, "sono_descanso")),
-                "Produtividade média baixa possivelmente ligada à qualidade do sono da equipe.", insights)
+    # Produtividade x sono
+    adiciona_insight(bom(produtividade, "produtividade") and (ruim(sono_horas, "sono_horas") or ruim(sono_descanso, "sono_descanso")),
+                "Produtividade média boa, mas qualidade do sono da equipe pode impactar resultados futuros.", insights)
+    adiciona_insight(ruim(produtividade, "produtividade") and (ruim(sono_horas, "sono_horas") or ruim(sono_descanso, "sono_descanso")),
+                "Produtividade média baixa possivelmente ligada à qualidade do sono da equipe.", insights)
+
+    # Produtividade x estresse
+    adiciona_insight(ruim(produtividade, "produtividade") and ruim(estresse, "estresse"),
+                "Produtividade média baixa associada a alto estresse na equipe.", insights)
+
+    # Energia x atividade física
+    adiciona_insight(ruim(energia, "energia") and ruim(atividade_fisica, "atividade_fisica"),
+                "Baixa energia e pouca atividade física média da equipe; pode afetar desempenho e saúde.", insights)
+    adiciona_insight(bom(energia, "energia") and ruim(atividade_fisica, "atividade_fisica"),
+                "Energia média boa apesar de pouca atividade física; monitorar bem-estar físico da equipe.", insights)
+
+    # Satisfação x reconhecimento
+    adiciona_insight(ruim(satisfacao, "satisfacao") and ruim(reconhecimento, "reconhecimento"),
+                "Satisfação e reconhecimento médios da equipe baixos; atenção à motivação coletiva.", insights)
+    adiciona_insight(bom(satisfacao, "satisfacao") and ruim(reconhecimento, "reconhecimento"),
+                "Satisfação média boa apesar de pouco reconhecimento; monitorar engajamento da equipe.", insights)
+
+    # Água x energia
+    adiciona_insight(ruim(agua, "agua") and ruim(energia, "energia"),
+                "Baixa ingestão de água correlacionada com baixa energia média da equipe.", insights)
+
+    # Humor x controle do dia
+    adiciona_insight(ruim(humor, "humor") and ruim(controle_dia, "controle_dia"),
+                "Humor médio baixo possivelmente associado à sensação de pouco controle sobre o dia.", insights)
+    adiciona_insight(bom(humor, "humor") and ruim(controle_dia, "controle_dia"),
+                "Humor médio bom, mas sensação de pouco controle sobre o dia pode gerar estresse futuro.", insights)
+
+    # Sono x energia
+    adiciona_insight(ruim(sono_horas, "sono_horas") and bom(energia, "energia"),
+                "Boa energia média da equipe apesar de pouco sono; atenção à fadiga futura.", insights)
+    adiciona_insight(ruim(sono_horas, "sono_horas") and ruim(energia, "energia"),
+                "Pouco sono e baixa energia média; risco de queda de desempenho coletivo.", insights)
+
+    # Estresse x humor x energia
+    adiciona_insight(ruim(estresse, "estresse") and ruim(humor, "humor") and ruim(energia, "energia"),
+                "Alto estresse, humor baixo e energia baixa médios; atenção ao bem-estar emocional da equipe.", insights)
+
+    # Atividade física x energia
+    adiciona_insight(ruim(atividade_fisica, "atividade_fisica") and ruim(energia, "energia"),
+                "Baixa atividade física e energia reduzida na média; cuidado com saúde geral da equipe.", insights)
+
+    # Hidratação x energia
+    adiciona_insight(ruim(agua, "agua") and ruim(energia, "energia"),
+                "Baixa ingestão de água e energia baixa média; atenção à hidratação da equipe.", insights)
+
+    # Sono x estresse
+    adiciona_insight(ruim(sono_horas, "sono_horas") and ruim(estresse, "estresse"),
+                "Sono insuficiente e alto estresse médio; risco elevado de burnout coletivo.", insights)
+
+    # Carga de trabalho x estresse
+    adiciona_insight(ruim(carga_trabalho, "carga_trabalho") and ruim(estresse, "estresse"),
+                "Alta carga de trabalho correlacionada com estresse elevado médio da equipe.", insights)
+
+    # Produtividade x satisfação
+    adiciona_insight(bom(produtividade, "produtividade") and ruim(satisfacao, "satisfacao"),
+                "Produtividade média boa, mas satisfação baixa; monitorar motivação da equipe.", insights)
+
+    # Combinadas adicionais
+    adiciona_insight(prop_conclusao < 0.5 and ruim(energia, "energia"),
+                "Baixa conclusão de tarefas e pouca energia média; atenção à gestão de tempo e bem-estar coletivo.", insights)
+    adiciona_insight(ruim(estresse, "estresse") and ruim(sono_horas, "sono_horas"),
+                "Estresse elevado e pouco sono médio; risco de fadiga e burnout.", insights)
+    adiciona_insight(ruim(carga_trabalho, "carga_trabalho") and ruim(energia, "energia"),
+                "Carga de trabalho alta com baixa energia média; atenção à sobrecarga da equipe.", insights)
+    adiciona_insight(ruim(atividade_fisica, "atividade_fisica") and ruim(sono_horas, "sono_horas"),
+                "Pouca atividade física e sono insuficiente médio; risco de redução de desempenho físico e mental coletivo.", insights)
+    adiciona_insight(ruim(agua, "agua") and ruim(carga_trabalho, "carga_trabalho"),
+                "Baixa ingestão de água com alta carga de trabalho média; cuidado com hidratação e estresse.", insights)
+    adiciona_insight(ruim(sono_horas, "sono_horas") and ruim(carga_trabalho, "carga_trabalho"),
+                "Pouco sono e alta carga de trabalho médio; risco de burnout coletivo.", insights)
+    adiciona_insight(bom(humor, "humor") and ruim(reconhecimento, "reconhecimento"),
+                "Humor médio bom mesmo com baixo reconhecimento; monitorar motivação futura da equipe.", insights)
+    adiciona_insight(ruim(humor, "humor") and bom(reconhecimento, "reconhecimento"),
+                "Humor médio baixo mesmo com reconhecimento alto; atenção a fatores externos.", insights)
+    adiciona_insight(bom(energia, "energia") and ruim(sono_horas, "sono_horas") and ruim(atividade_fisica, "atividade_fisica"),
+                "Alta energia média com pouco sono e pouca atividade física; risco de fadiga futura.", insights)
+    adiciona_insight(ruim(satisfacao, "satisfacao") and ruim(estresse, "estresse") and ruim(carga_trabalho, "carga_trabalho"),
+                "Baixa satisfação, alto estresse e alta carga de trabalho média; alerta vermelho de desmotivação.", insights)
+    adiciona_insight(bom(produtividade, "produtividade") and ruim(energia, "energia"),
+                "Produtividade alta, mas energia média baixa; risco de queda de desempenho coletivo.", insights)
+
+    return "\n".join(feedback), insights
+
+# Colunas de T_MNDSH_METRICA_DIA usadas no desempenho e o nome de cada uma no resultado (na ordem das colunas)
+colunas_desempenho = {
+    "estresse": "estresse", "humor": "humor", "energia": "energia", "controle_dia": "controle_dia",
+    "atividade_fisica": "atividade_fisica", "ingestao_agua": "agua",
+    "horas_produtivas": "produtividade", "nivel_foco": "foco", "tarefas_concluidas": "tarefas_concluidas",
+    "tarefas_andamento": "tarefas_andamento", "tarefas_pendentes": "tarefas_pendentes",
+    "concluidas_no_prazo": "concluidas_no_prazo", "concluidas_atraso": "concluidas_atraso",
+    "horas_dormidas": "sono_horas", "descanso": "sono_descanso", "despertares": "despertares",
+    "satisfacao_geral": "satisfacao", "relacao_colegas": "relacao_colegas", "reconhecimento": "reconhecimento",
+    "carga_trabalho": "carga_trabalho"
+}
+
+def calcular_desempenho(df_metrica: pd.DataFrame, data_filtro: pd.Timestamp = None) -> pd.DataFrame:
+    """
+    Processa um DataFrame de métricas diárias (T_MNDSH_METRICA_DIA, uma linha por colaborador e dia)
+    e consolida os dados, calculando a média de cada variável numérica por colaborador (CPF).
+
+    Args:
+        df_metrica: DataFrame contendo as linhas de métricas diárias.
+        data_filtro: Objeto Timestamp para filtrar os dados por data.
+
+    Returns:
+        pd.DataFrame: Um DataFrame consolidado onde cada linha representa o resumo
+        de desempenho de um colaborador, com colunas nomeadas para as métricas.
+
+    Dependências:
+        - Variáveis: colunas_desempenho.
+    """
+    if df_metrica.empty:
+        return pd.DataFrame()
+
+    df = df_metrica
+
+    if data_filtro is not None:
+        datas = pd.to_datetime(df["dt_registro"], errors="coerce")
+        df = df[datas.dt.date == data_filtro.date()]
+
+    if df.empty:
+        return pd.DataFrame()
+
+    colunas = [coluna for coluna in colunas_desempenho if coluna in df.columns]
+    valores = df[colunas].apply(pd.to_numeric, errors="coerce")
+    return valores.groupby(df["nr_cpf"]).mean().rename(columns=colunas_desempenho).reset_index()
+
+# ====== MEMÓRIA POR ETAPA DOS RELATÓRIOS ======
+
+# Medição opcional (tracemalloc) da memória de cada etapa dos relatórios
+config_memoria_relatorios = {
+    "ativo": os.environ.get("MINDSHIFT_MEMORIA_RELATORIOS", "") not in ("", "0")
+}
+# Última medição: nome do relatório e, por etapa (busca, montagem_df, agregacao, formatacao, exibicao, exportacao),
+# a memória retida ao final, o pico acima do início da etapa e a duração
+_medicao_memoria = {"relatorio": None, "ultimo": None, "etapas": [], "parar_tracemalloc": False}
+
+def iniciar_memoria_relatorio(relatorio: str) -> None:
+    """
+    Inicia a medição de memória de um relatório (se config_memoria_relatorios["ativo"]), descartando a anterior.
+
+    Args:
+        relatorio: Nome do relatório exibido no resumo.
+    """
+    if not config_memoria_relatorios["ativo"]:
+        return
+    import tracemalloc
+    pd.DataFrame  # importa o pandas antes, para a importação não contar como memória da primeira etapa
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _medicao_memoria["parar_tracemalloc"] = True
+    _medicao_memoria.update({"relatorio": relatorio, "etapas": []})
+
+@contextlib.contextmanager
+def etapa_memoria(etapa: str):
+    """
+    Mede a memória alocada pelo bloco 'with' como uma etapa do relatório em medição (não faz nada fora de uma medição).
+    """
+    if _medicao_memoria["relatorio"] is None:
+        yield
+        return
+    import tracemalloc
+    tracemalloc.reset_peak()
+    antes, _ = tracemalloc.get_traced_memory()
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        depois, pico = tracemalloc.get_traced_memory()
+        _medicao_memoria["etapas"].append({"etapa": etapa, "retido_kib": round((depois - antes) / 1024, 1),
+                                           "pico_kib": round((pico - antes) / 1024, 1),
+                                           "ms": round((time.perf_counter() - inicio) * 1000, 1)})
+
+def finalizar_memoria_relatorio() -> list[dict]:
+    """
+    Encerra a medição em andamento (parando o tracemalloc se foi iniciado por ela) e retorna as etapas medidas.
+    """
+    if _medicao_memoria["relatorio"] is not None and _medicao_memoria["parar_tracemalloc"]:
+        import tracemalloc
+        tracemalloc.stop()
+        _medicao_memoria["parar_tracemalloc"] = False
+    _medicao_memoria["ultimo"] = _medicao_memoria["relatorio"] or _medicao_memoria["ultimo"]
+    _medicao_memoria["relatorio"] = None
+    return _medicao_memoria["etapas"]
+
+def exibir_memoria_relatorio(arquivo=None) -> None:
+    """
+    Imprime a memória por etapa da última medição de relatório.
+
+    Args:
+        arquivo: Destino da impressão (padrão: sys.stdout).
+    """
+    arquivo = arquivo or sys.stdout
+    if not _medicao_memoria["etapas"]:
+        print(f"\n{margem}Nenhuma medição de memória de relatório. Ative com MINDSHIFT_MEMORIA_RELATORIOS=1.\n", file=arquivo)
+        return
+    print(f"\n===== MEMÓRIA POR ETAPA - {_medicao_memoria['ultimo'] or _medicao_memoria['relatorio']} =====\n", file=arquivo)
+    print(f"{margem}{'Etapa':<14}{'Pico (KiB)':>14}{'Retido (KiB)':>16}{'Tempo (ms)':>14}", file=arquivo)
+    for item in _medicao_memoria["etapas"]:
+        print(f"{margem}{item['etapa']:<14}{item['pico_kib']:>14.1f}{item['retido_kib']:>16.1f}{item['ms']:>14.1f}", file=arquivo)
+    print(file=arquivo)
+
+def _encerrar_memoria_relatorio() -> None:
+    """
+    Ao final de um relatório interativo com medição ativa, encerra a medição e exibe o resumo por etapa.
+    """
+    if _medicao_memoria["relatorio"] is None:
+        return
+    finalizar_memoria_relatorio()
+    exibir_memoria_relatorio()
+    input("Pressione ENTER para continuar...")
+
+# ====== ARQUIVAMENTO DE MÉTRICAS ======
+
+# Meses mantidos na tabela quente T_MNDSH_METRICA_DIA (o mês corrente e os anteriores); os mais antigos são
+# movidos para a tabela comprimida T_MNDSH_METRICA_ARQUIVO por arquivar_metricas()
+config_arquivamento = {
+    "meses_quentes": int(os.environ.get("MINDSHIFT_ARQUIVO_MESES", "13"))
+}
+# Colunas gravadas nas duas camadas (dt_dia é calculada pelo banco)
+colunas_arquivo_metricas = ["id_metrica_dia", "id_colaborador", "dt_registro"] + colunas_metricas_diarias
+
+def limite_arquivamento(meses_quentes: int | None = None, referencia: datetime | None = None) -> datetime:
+    """
+    Calcula o primeiro dia do mês mais antigo mantido na tabela quente.
+
+    Args:
+        meses_quentes: Meses mantidos na tabela quente, contando o corrente (padrão: config_arquivamento).
+        referencia: Data de referência (padrão: agora).
+
+    Returns:
+        datetime: Registros com dt_registro anterior a esta data podem ser arquivados.
+    """
+    meses_quentes = meses_quentes or config_arquivamento["meses_quentes"]
+    referencia = referencia or datetime.now()
+    indice = referencia.year * 12 + referencia.month - 1 - (meses_quentes - 1)
+    return datetime(indice // 12, indice % 12 + 1, 1)
+
+def arquivado_ate(conn: oracledb.Connection) -> datetime | None:
+    """
+    Retorna o fim (exclusivo) do período arquivado: o primeiro dia do mês seguinte ao último mês
+    registrado em T_MNDSH_ARQUIVAMENTO, ou None se nada foi arquivado.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT dt_mes FROM T_MNDSH_ARQUIVAMENTO ORDER BY dt_mes DESC")
+        linha = cursor.fetchone()
+    finally:
+        cursor.close()
+    if linha is None:
+        return None
+    return faixa_registro(mes=linha[0].month, ano=linha[0].year)[1]
+
+def tabelas_metricas(conn: oracledb.Connection, faixa: tuple[datetime, datetime] | None) -> list[str]:
+    """
+    Escolhe as camadas que guardam o período pedido: só a tabela quente quando o período começa depois do
+    arquivado; senão o arquivo e também a tabela quente, que para meses já arquivados só tem check-ins
+    atrasados ainda não movidos (uma busca por faixa de dt_registro quase sempre vazia).
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        faixa: Intervalo [inicio, fim) de dt_registro, ou None para todo o histórico.
+
+    Returns:
+        list[str]: Nomes das tabelas a consultar.
+
+    Dependências:
+        - Funções: arquivado_ate.
+    """
+    ate = arquivado_ate(conn)
+    if ate is None or (faixa is not None and faixa[0] >= ate):
+        return ["T_MNDSH_METRICA_DIA"]
+    return ["T_MNDSH_METRICA_ARQUIVO", "T_MNDSH_METRICA_DIA"]
+
+def dias_nao_arquivados(conn: oracledb.Connection, registros: list[dict]) -> list[dict]:
+    """
+    Remove da lista os registros de dias que já estão em T_MNDSH_METRICA_ARQUIVO (só os anteriores ao fim
+    do período arquivado são consultados, um a um pela chave única do arquivo).
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        registros: Dicionários com cpf e dt_registro, como em gravar_metricas_lote().
+
+    Returns:
+        list[dict]: Os registros cujo dia não está arquivado.
+    """
+    ate = arquivado_ate(conn)
+    if ate is None or all(r["dt_registro"] is None or r["dt_registro"] >= ate for r in registros):
+        return registros
+    restantes = []
+    cursor = conn.cursor()
+    try:
+        for registro in registros:
+            data = registro["dt_registro"]
+            if data is not None and data < ate:
+                cursor.execute("""
+                    SELECT 1 FROM T_MNDSH_METRICA_ARQUIVO
+                    WHERE id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf) AND dt_dia = :dia
+                """, {"cpf": registro["cpf"], "dia": datetime(data.year, data.month, data.day)})
+                if cursor.fetchone() is not None:
+                    continue
+            restantes.append(registro)
+    finally:
+        cursor.close()
+    return restantes
+
+def _arquivar_mes(conn: oracledb.Connection, inicio: datetime, fim: datetime) -> dict:
+    """
+    Move um mês da tabela quente para o arquivo em uma única transação: cópia em lote (direct-path no
+    Oracle, que é o que a compressão básica comprime), exclusão na tabela quente e registro no controle.
+    Dias que já estão no arquivo não são copiados de novo (vale o primeiro registro do dia).
+    """
+    colunas = ", ".join(colunas_arquivo_metricas)
+    dica = "" if eh_sqlite(conn) else "/*+ APPEND */"
+    faixa = {"inicio": inicio, "fim": fim}
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            INSERT {dica} INTO T_MNDSH_METRICA_ARQUIVO ({colunas})
+            SELECT {colunas}
+            FROM T_MNDSH_METRICA_DIA d
+            WHERE d.dt_registro >= :inicio AND d.dt_registro < :fim
+              AND NOT EXISTS (SELECT 1 FROM T_MNDSH_METRICA_ARQUIVO a
+                              WHERE a.id_colaborador = d.id_colaborador AND a.dt_dia = d.dt_dia)
+        """, faixa)
+        copiadas = max(cursor.rowcount or 0, 0)
+        cursor.execute("DELETE FROM T_MNDSH_METRICA_DIA WHERE dt_registro >= :inicio AND dt_registro < :fim", faixa)
+        removidas = max(cursor.rowcount or 0, 0)
+        cursor.execute("""
+            UPDATE T_MNDSH_ARQUIVAMENTO
+            SET qt_linhas = qt_linhas + :linhas, dt_arquivamento = SYSDATE
+            WHERE dt_mes = :inicio
+        """, {"linhas": copiadas, "inicio": inicio})
+        if not cursor.rowcount:
+            cursor.execute("INSERT INTO T_MNDSH_ARQUIVAMENTO (dt_mes, qt_linhas) VALUES (:inicio, :linhas)",
+                           {"inicio": inicio, "linhas": copiadas})
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return {"mes": inicio.strftime("%m/%Y"), "copiadas": copiadas, "removidas": removidas}
+
+def _liberar_particao(conn: oracledb.Connection, inicio: datetime) -> bool:
+    """
+    No Oracle, remove a partição mensal já vazia da tabela quente, devolvendo o espaço (o DELETE não devolve).
+    A partição inicial da tabela não pode ser removida e partições com outros meses são mantidas.
+    """
+    data = f"DATE '{inicio:%Y-%m-%d}'"
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT 1 FROM T_MNDSH_METRICA_DIA PARTITION FOR ({data}) WHERE ROWNUM = 1")
+        if cursor.fetchone() is not None:
+            return False
+        cursor.execute(f"ALTER TABLE T_MNDSH_METRICA_DIA DROP PARTITION FOR ({data}) UPDATE GLOBAL INDEXES")
+        return True
+    except Exception:
+        return False
+    finally:
+        cursor.close()
+
+def arquivar_metricas(conn: oracledb.Connection, meses_quentes: int | None = None, simular: bool = False) -> dict:
+    """
+    Move as métricas anteriores ao horizonte (limite_arquivamento) da tabela quente para T_MNDSH_METRICA_ARQUIVO,
+    um mês por transação. Cada mês concluído fica em T_MNDSH_ARQUIVAMENTO; interrompido, o arquivamento pode
+    ser executado de novo e continua do mês em que parou (meses já movidos não têm mais linhas na tabela quente).
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        meses_quentes: Meses mantidos na tabela quente (padrão: config_arquivamento).
+        simular: Se True, só conta as linhas de cada mês, sem mover.
+
+    Returns:
+        dict: Limite usado, meses processados (linhas copiadas e removidas), total de linhas e duração.
+
+    Dependências:
+        - Funções: limite_arquivamento, faixa_registro, _arquivar_mes, _liberar_particao, eh_sqlite.
+    """
+    limite = limite_arquivamento(meses_quentes)
+    inicio_execucao = time.perf_counter()
+    meses = []
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT dt_registro FROM T_MNDSH_METRICA_DIA WHERE dt_registro < :limite ORDER BY dt_registro",
+                       {"limite": limite})
+        primeiro = cursor.fetchone()
+    finally:
+        cursor.close()
+    mes = datetime(primeiro[0].year, primeiro[0].month, 1) if primeiro else limite
+    while mes < limite:
+        inicio, fim = faixa_registro(mes=mes.month, ano=mes.year)
+        if simular:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT COUNT(*) FROM T_MNDSH_METRICA_DIA WHERE dt_registro >= :inicio AND dt_registro < :fim",
+                               {"inicio": inicio, "fim": fim})
+                linhas = cursor.fetchone()[0]
+            finally:
+                cursor.close()
+            if linhas:
+                meses.append({"mes": inicio.strftime("%m/%Y"), "linhas": linhas})
+        else:
+            with medir_duracao("mindshift_arquivamento_segundos", "Duração do arquivamento de um mês de métricas."):
+                resultado = _arquivar_mes(conn, inicio, fim)
+            if resultado["removidas"]:
+                if not eh_sqlite(conn):
+                    resultado["particao_liberada"] = _liberar_particao(conn, inicio)
+                contador_inc("mindshift_arquivamento_linhas_total", "Registros diários de métricas movidos para o arquivo.",
+                             resultado["copiadas"])
+                meses.append(resultado)
+        mes = fim
+    chave = "linhas" if simular else "copiadas"
+    return {
+        "limite": limite.strftime("%d/%m/%Y"),
+        "simulacao": simular,
+        "meses": meses,
+        "linhas": sum(m[chave] for m in meses),
+        "segundos": round(time.perf_counter() - inicio_execucao, 3)
+    }
+
+# ====== CONSULTAS DOS RELATÓRIOS ======
+
+def faixa_registro(data: str | None = None, mes: int | None = None, ano: int | None = None) -> tuple[datetime, datetime] | None:
+    """
+    Converte os filtros de data dos relatórios em um intervalo semiaberto [inicio, fim) de dt_registro.
+
+    Args:
+        data: Um dia no formato DD/MM/AAAA.
+        mes: Mês de referência (usado junto com ano).
+        ano: Ano de referência.
+
+    Returns:
+        tuple[datetime, datetime]: Início (inclusivo) e fim (exclusivo); com dia e mês, a interseção dos dois.
+        None: Se nenhum filtro de data foi informado.
+
+    Raises:
+        ValueError: Se a data for inválida.
+    """
+    faixas = []
+    if data is not None:
+        inicio = data_datetime(data)
+        faixas.append((inicio, inicio + timedelta(days=1)))
+    if mes is not None and ano is not None:
+        faixas.append((datetime(ano, mes, 1), datetime(ano + mes // 12, mes % 12 + 1, 1)))
+    if not faixas:
+        return None
+    return max(f[0] for f in faixas), min(f[1] for f in faixas)
+
+def buscar_metricas(conn: oracledb.Connection, cpf: str | None = None, data: str | None = None, mes: int | None = None, ano: int | None = None) -> pd.DataFrame:
+    """
+    Busca os registros diários (uma linha por colaborador e dia) com os filtros informados, sem interação
+    com o usuário, na tabela quente T_MNDSH_METRICA_DIA e, para períodos arquivados, em T_MNDSH_METRICA_ARQUIVO.
+    O CPF vem de T_MNDSH_COLABORADOR, pela junção em id_colaborador; colaboradores excluídos (dt_exclusao)
+    ficam de fora enquanto aguardam o expurgo.
 
-    # Produtividade x estresse
-    adiciona_insight(ruim(produtividade, "produtividade") and ruim(estresse, "estresse"),
-                "Produtividade média baixa associada a alto estresse na equipe.", insights)
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf: CPF do colaborador. Se None, busca de todos os colaboradores.
+        data: Data do registro no formato DD/MM/AAAA (relatório diário).
+        mes: Mês de referência (relatório mensal/geral, usado junto com ano).
+        ano: Ano de referência.
 
-    # Energia x atividade física
-    adiciona_insight(ruim(energia, "energia") and ruim(atividade_fisica, "atividade_fisica"),
-                "Baixa energia e pouca atividade física média da equipe; pode afetar desempenho e saúde.", insights)
-    adiciona_insight(bom(energia, "energia") and ruim(atividade_fisica, "atividade_fisica"),
-                "Energia média boa apesar de pouca atividade física; monitorar bem-estar físico da equipe.", insights)
+    Returns:
+        pd.DataFrame: As linhas encontradas com os nomes das colunas em minúsculas (vazio se não houver dados).
 
-    # Satisfação x reconhecimento
-    adiciona_insight(ruim(satisfacao, "satisfacao") and ruim(reconhecimento, "reconhecimento"),
-                "Satisfação e reconhecimento médios da equipe baixos; atenção à motivação coletiva.", insights)
-    adiciona_insight(bom(satisfacao, "satisfacao") and ruim(reconhecimento, "reconhecimento"),
-                "Satisfação média boa apesar de pouco reconhecimento; monitorar engajamento da equipe.", insights)
+    Dependências:
+        - Funções: faixa_registro, tabelas_metricas.
+    """
+    filtros = ["c.dt_exclusao IS NULL"]
+    params = {}
+    if cpf is not None:
+        filtros.append("c.nr_cpf = :cpf")
+        params["cpf"] = cpf
+    faixa = faixa_registro(data, mes, ano)
+    if faixa is not None:
+        # Faixa direto sobre dt_registro (sem TRUNC/EXTRACT na coluna): usa idx_metrica_dia_dt e, no Oracle,
+        # limita a leitura às partições mensais do período
+        filtros.append("m.dt_registro >= :inicio AND m.dt_registro < :fim")
+        params.update({"inicio": faixa[0], "fim": faixa[1]})
+    where = " AND ".join(filtros)
+    colunas_select = ", ".join(["m.id_metrica_dia", "m.id_colaborador", "c.nr_cpf", "m.dt_registro", "m.dt_dia"]
+                               + ["m." + campo for campo in colunas_metricas_diarias])
+    cursor = conn.cursor()
+    try:
+        with etapa_memoria("busca"):
+            cursor.execute(" UNION ALL ".join(f"""
+                SELECT {colunas_select}
+                FROM {tabela} m
+                JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+                WHERE {where}
+            """ for tabela in tabelas_metricas(conn, faixa)), params)
+            linhas = cursor.fetchall()
+            colunas = [d[0].lower() for d in cursor.description] if cursor.description else []
+    finally:
+        cursor.close()
+    with etapa_memoria("montagem_df"):
+        return pd.DataFrame(linhas, columns=colunas)
 
-    # Água x energia
-    adiciona_insight(ruim(agua, "agua") and ruim(energia, "energia"),
-                "Baixa ingestão de água correlacionada com baixa energia média da equipe.", insights)
+def dados_relatorio_diario(conn: oracledb.Connection, cpf: str, data_dt: datetime) -> pd.DataFrame:
+    """
+    Calcula o desempenho diário de um colaborador sem interação com o usuário.
 
-    # Humor x controle do dia
-    adiciona_insight(ruim(humor, "humor") and ruim(controle_dia, "controle_dia"),
-                "Humor médio baixo possivelmente associado à sensação de pouco controle sobre o dia.", insights)
-    adiciona_insight(bom(humor, "humor") and ruim(controle_dia, "controle_dia"),
-                "Humor médio bom, mas sensação de pouco controle sobre o dia pode gerar estresse futuro.", insights)
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf: CPF do colaborador.
+        data_dt: Data de referência.
 
-    # Sono x energia
-    adiciona_insight(ruim(sono_horas, "sono_horas") and bom(energia, "energia"),
-                "Boa energia média da equipe apesar de pouco sono; atenção à fadiga futura.", insights)
-    adiciona_insight(ruim(sono_horas, "sono_horas") and ruim(energia, "energia"),
-                "Pouco sono e baixa energia média; risco de queda de desempenho coletivo.", insights)
+    Returns:
+        pd.DataFrame: Resultado de calcular_desempenho() (vazio se não houver métricas).
+    """
+    with medir_duracao("mindshift_relatorio_segundos", "Duração da consulta e do cálculo dos relatórios.", tipo="diario"):
+        df_metrica = buscar_metricas(conn, cpf=cpf, data=data_dt.strftime("%d/%m/%Y"))
+        with etapa_memoria("agregacao"):
+            return calcular_desempenho(df_metrica, pd.Timestamp(data_dt))
 
-    # Estresse x humor x energia
-    adiciona_insight(ruim(estresse, "estresse") and ruim(humor, "humor") and ruim(energia, "energia"),
-                "Alto estresse, humor baixo e energia baixa médios; atenção ao bem-estar emocional da equipe.", insights)
+def dados_relatorio_mensal(conn: oracledb.Connection, cpf: str, mes: int, ano: int) -> pd.DataFrame:
+    """
+    Calcula o desempenho mensal de um colaborador sem interação com o usuário.
 
-    # Atividade física x energia
-    adiciona_insight(ruim(atividade_fisica, "atividade_fisica") and ruim(energia, "energia"),
-                "Baixa atividade física e energia reduzida na média; cuidado com saúde geral da equipe.", insights)
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf: CPF do colaborador.
+        mes: Mês de referência.
+        ano: Ano de referência.
 
-    # Hidratação x energia
-    adiciona_insight(ruim(agua, "agua") and ruim(energia, "energia"),
-                "Baixa ingestão de água e energia baixa média; atenção à hidratação da equipe.", insights)
+    Returns:
+        pd.DataFrame: Resultado de calcular_desempenho() com valores arredondados (vazio se não houver métricas).
+    """
+    with medir_duracao("mindshift_relatorio_segundos", "Duração da consulta e do cálculo dos relatórios.", tipo="mensal"):
+        df_metrica = buscar_metricas(conn, cpf=cpf, mes=mes, ano=ano)
+        with etapa_memoria("agregacao"):
+            df_desempenho = calcular_desempenho(df_metrica)
+            if not df_desempenho.empty:
+                colunas_numericas = df_desempenho.select_dtypes(include="number").columns
+                df_desempenho[colunas_numericas] = df_desempenho[colunas_numericas].round(2)
+        return df_desempenho
+
+def dados_relatorio_geral(conn: oracledb.Connection, mes: int, ano: int) -> tuple[pd.DataFrame, dict]:
+    """
+    Calcula o desempenho mensal de todos os colaboradores e as médias da equipe sem interação com o usuário.
 
-    # Sono x estresse
-    adiciona_insight(ruim(sono_horas, "sono_horas") and ruim(estresse, "estresse"),
-                "Sono insuficiente e alto estresse médio; risco elevado de burnout coletivo.", insights)
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        mes: Mês de referência.
+        ano: Ano de referência.
 
-    # Carga de trabalho x estresse
-    adiciona_insight(ruim(carga_trabalho, "carga_trabalho") and ruim(estresse, "estresse"),
-                "Alta carga de trabalho correlacionada com estresse elevado médio da equipe.", insights)
+    Returns:
+        tuple[pd.DataFrame, dict]: O desempenho por colaborador e o dicionário de médias da equipe
+        (ambos vazios se não houver métricas).
+    """
+    with medir_duracao("mindshift_relatorio_segundos", "Duração da consulta e do cálculo dos relatórios.", tipo="geral"):
+        df_metrica = buscar_metricas(conn, mes=mes, ano=ano)
+        with etapa_memoria("agregacao"):
+            df_desempenho = calcular_desempenho(df_metrica)
+            if df_desempenho.empty:
+                return df_desempenho, {}
+            return df_desempenho, calcular_medias_equipe(df_desempenho)
+
+def calcular_medias_equipe(df_desempenho: pd.DataFrame) -> dict:
+    """
+    Calcula a média de cada métrica da equipe e a proporção média de tarefas concluídas.
 
-    # Produtividade x satisfação
-    adiciona_insight(bom(produtividade, "produtividade") and ruim(satisfacao, "satisfacao"),
-                "Produtividade média boa, mas satisfação baixa; monitorar motivação da equipe.", insights)
+    Args:
+        df_desempenho: DataFrame consolidado retornado por calcular_desempenho().
 
-    # Combinadas adicionais
-    adiciona_insight(prop_conclusao < 0.5 and ruim(energia, "energia"),
-                "Baixa conclusão de tarefas e pouca energia média; atenção à gestão de tempo e bem-estar coletivo.", insights)
-    adiciona_insight(ruim(estresse, "estresse") and ruim(sono_horas, "sono_horas"),
-                "Estresse elevado e pouco sono médio; risco de fadiga e burnout.", insights)
-    adiciona_insight(ruim(carga_trabalho, "carga_trabalho") and ruim(energia, "energia"),
-                "Carga de trabalho alta com baixa energia média; atenção à sobrecarga da equipe.", insights)
-    adiciona_insight(ruim(atividade_fisica, "atividade_fisica") and ruim(sono_horas, "sono_horas"),
-                "Pouca atividade física e sono insuficiente médio; risco de redução de desempenho físico e mental coletivo.", insights)
-    adiciona_insight(ruim(agua, "agua") and ruim(carga_trabalho, "carga_trabalho"),
-                "Baixa ingestão de água com alta carga de trabalho média; cuidado com hidratação e estresse.", insights)
-    adiciona_insight(ruim(sono_horas, "sono_horas") and ruim(carga_trabalho, "carga_trabalho"),
-                "Pouco sono e alta carga de trabalho médio; risco de burnout coletivo.", insights)
-    adiciona_insight(bom(humor, "humor") and ruim(reconhecimento, "reconhecimento"),
-                "Humor médio bom mesmo com baixo reconhecimento; monitorar motivação futura da equipe.", insights)
-    adiciona_insight(ruim(humor, "humor") and bom(reconhecimento, "reconhecimento"),
-                "Humor médio baixo mesmo com reconhecimento alto; atenção a fatores externos.", insights)
-    adiciona_insight(bom(energia, "energia") and ruim(sono_horas, "sono_horas") and ruim(atividade_fisica, "atividade_fisica"),
-                "Alta energia média com pouco sono e pouca atividade física; risco de fadiga futura.", insights)
-    adiciona_insight(ruim(satisfacao, "satisfacao") and ruim(estresse, "estresse") and ruim(carga_trabalho, "carga_trabalho"),
-                "Baixa satisfação, alto estresse e alta carga de trabalho média; alerta vermelho de desmotivação.", insights)
-    adiciona_insight(bom(produtividade, "produtividade") and ruim(energia, "energia"),
-                "Produtividade alta, mas energia média baixa; risco de queda de desempenho coletivo.", insights)
+    Returns:
+        dict: Médias das métricas, incluindo a chave "prop_conclusao".
+    """
+    try:
+        total_concluidas = df_desempenho["tarefas_concluidas"].sum()
+        total_geral = (
+            df_desempenho["tarefas_concluidas"].sum() +
+            df_desempenho["tarefas_andamento"].sum() +
+            df_desempenho["tarefas_pendentes"].sum())
 
-    return "\n".join(feedback), insights
+        prop_conclusao_media = total_concluidas / total_geral if total_geral > 0 else 0
+    except:
+        prop_conclusao_media = 0
 
-def calcular_desempenho(df_metrica: pd.DataFrame, data_filtro: pd.Timestamp = None) -> pd.DataFrame:
+    metricas_media = df_desempenho.drop(columns=["nr_cpf"], errors="ignore").mean().to_dict()
+    metricas_media["prop_conclusao"] = prop_conclusao_media
+    return metricas_media
+
+def _linhas_texto(texto: str) -> list[str]:
+    """
+    Remove margens e linhas vazias das mensagens de feedback/insights para saída legível por máquina.
     """
-    Processa um DataFrame de métricas brutas (T_MNDSH_METRICA) e consolida os dados, 
-    calculando a média de cada variável numérica por colaborador (CPF) para um dia específico.
+    return [linha.strip() for linha in texto.splitlines() if linha.strip()]
 
-    Como cada métrica é inserida em linhas separadas no banco, esta função agrupa essas entradas
-    pelo tipo de métrica e calcula a média para produzir um registro unificado por CPF para o dia.
+def gerar_relatorio(conn: oracledb.Connection, tipo: str, cpf: str | None = None, data: str | None = None, mes: int | None = None, ano: int | None = None) -> tuple[pd.DataFrame, dict]:
+    """
+    Gera um relatório (diário, mensal ou geral) sem interação com o usuário, no formato usado pela CLI e pela API.
 
     Args:
-        df_metrica: DataFrame contendo as linhas de métricas brutas.
-        data_filtro: Objeto Timestamp para filtrar os dados por data.
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        tipo: "diario" (cpf e data), "mensal" (cpf, mes e ano) ou "geral" (mes e ano).
+        cpf: CPF do colaborador.
+        data: Data no formato DD/MM/AAAA.
+        mes: Mês de referência.
+        ano: Ano de referência.
 
     Returns:
-        pd.DataFrame: Um DataFrame consolidado onde cada linha representa o resumo
-        de desempenho de um colaborador, com colunas nomeadas para as métricas.
+        tuple[pd.DataFrame, dict]: O desempenho calculado e o documento do relatório com as chaves
+        relatorio, referencia, desempenho, feedback, insights e (no geral) medias. O documento fica
+        vazio se não houver métricas.
+
+    Raises:
+        ValueError: Se o tipo ou a data forem inválidos.
+
+    Dependências:
+        - Funções: dados_relatorio_diario, dados_relatorio_mensal, dados_relatorio_geral,
+                   gerar_feedback_e_insights, gerar_feedback_e_insights_geral.
     """
-    if df_metrica.empty:
-        return pd.DataFrame()
+    medias = None
+    if tipo == "diario":
+        if not validar_data(data or ""):
+            raise ValueError("Data inválida! Use DD/MM/AAAA.")
+        referencia = data
+        df_desempenho = dados_relatorio_diario(conn, cpf, data_datetime(data))
+    elif tipo == "mensal":
+        referencia = f"{mes}/{ano}"
+        df_desempenho = dados_relatorio_mensal(conn, cpf, mes, ano)
+    elif tipo == "geral":
+        referencia = f"{mes}/{ano}"
+        df_desempenho, medias = dados_relatorio_geral(conn, mes, ano)
+    else:
+        raise ValueError(f"Tipo de relatório inválido: {tipo}")
+    if df_desempenho.empty:
+        return df_desempenho, {}
 
-    df = df_metrica.copy()
+    with etapa_memoria("formatacao"):
+        if tipo == "geral":
+            feedback, insights = gerar_feedback_e_insights_geral(medias)
+        else:
+            feedback, insights = gerar_feedback_e_insights(df_desempenho.iloc[0].to_dict())
+        dados = {
+            "relatorio": tipo,
+            "referencia": referencia,
+            "desempenho": json.loads(df_desempenho.to_json(orient="records", force_ascii=False)),
+            "feedback": _linhas_texto(feedback),
+            "insights": [linha for insight in insights for linha in _linhas_texto(insight)]
+        }
+        if medias is not None:
+            dados["medias"] = {k: float(v) for k, v in medias.items()}
+    return df_desempenho, dados
+
+def formatar_desempenho_exibir(df_desempenho: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepara o desempenho para exibição e exportação nos relatórios diário e geral: colunas com os nomes
+    de colunas_renomear e valores numéricos com duas casas decimais.
 
-    if data_filtro is not None:
-        df["dt_registro"] = pd.to_datetime(df["dt_registro"], errors="coerce")
-        df = df[df["dt_registro"].dt.date == data_filtro.date()]
+    Args:
+        df_desempenho: DataFrame retornado por calcular_desempenho() ou dados_relatorio_geral().
 
-    if df.empty:
-        return pd.DataFrame()
+    Returns:
+        pd.DataFrame: Uma cópia formatada (o DataFrame original não é alterado).
+    """
+    df_exibir = df_desempenho.rename(columns=colunas_renomear)
+    for col in df_exibir.select_dtypes(include="number").columns:
+        df_exibir[col] = df_exibir[col].apply(lambda x: f"{x:.2f}")
+    return df_exibir
 
-    resultados = []
-
-    for cpf, df_cpf in df.groupby("nr_cpf"):
-        metricas = {"nr_cpf": cpf}
-        for tipo, df_tipo in df_cpf.groupby("tipo_metrica"):
-            valores = df_tipo.select_dtypes(include=["int", "float"]).mean().to_dict()
-            if tipo == "Produtividade":
-                metricas.update({
-                    "produtividade": valores.get("horas_produtivas", 0),
-                    "foco": valores.get("nivel_foco", 0),
-                    "tarefas_concluidas": valores.get("tarefas_concluidas", 0),
-                    "tarefas_andamento": valores.get("tarefas_andamento", 0),
-                    "tarefas_pendentes": valores.get("tarefas_pendentes", 0),
-                    "concluidas_no_prazo": valores.get("concluidas_no_prazo", 0),
-                    "concluidas_atraso": valores.get("concluidas_atraso", 0)
-                })
-            elif tipo == "Bem-estar emocional":
-                metricas.update({
-                    "estresse": valores.get("estresse", 0),
-                    "humor": valores.get("humor", 0),
-                    "energia": valores.get("energia", 0),
-                    "controle_dia": valores.get("controle_dia", 0)
-                })
-            elif tipo == "Satisfação no trabalho":
-                metricas.update({
-                    "satisfacao": valores.get("satisfacao_geral", 0),
-                    "relacao_colegas": valores.get("relacao_colegas", 0),
-                    "reconhecimento": valores.get("reconhecimento", 0),
-                    "carga_trabalho": valores.get("carga_trabalho", 0)
-                })
-            elif tipo == "Qualidade do sono":
-                metricas.update({
-                    "sono_horas": valores.get("horas_dormidas", 0),
-                    "sono_descanso": valores.get("descanso", 0),
-                    "despertares": valores.get("despertares", 0)
-                })
-            elif tipo == "Bem-estar físico":
-                metricas.update({
-                    "atividade_fisica": valores.get("atividade_fisica", 0),
-                    "agua": valores.get("ingestao_agua", 0)
-                })
-
-        resultados.append(metricas)
-    return pd.DataFrame(resultados)
-
-def relatorio_diario(conn: oracledb.Connection, cpf: str = None) -> None:
+def relatorio_diario(conn: oracledb.Connection, cpf: str = None, painel: "PainelColaborador | None" = None) -> None:
     """
     Gera o relatório diário de métricas para um colaborador específico, com base na data fornecida pelo usuário.
 
@@ -2439,20 +6358,24 @@ def relatorio_diario(conn: oracledb.Connection, cpf: str = None) -> None:
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
         cpf: O CPF do colaborador logado.
+        painel: Cache da sessão (o nome do colaborador vem dele, sem consulta).
 
     Returns:
         None: Gerencia a interação com o usuário e a exibição do relatório.
 
     Dependências:
         - Funções: limpa_tela, validar_data, data_datetime, imprimir_tabela, gerar_dataframe, 
-                   calcular_desempenho, gerar_feedback_e_insights, perguntar_continuar.
-        - Variáveis: colunas_renomear, grupos_relatorio_diario, margem.
+                   calcular_desempenho, formatar_desempenho_exibir, gerar_feedback_e_insights, perguntar_continuar.
+        - Variáveis: grupos_relatorio_diario, margem.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT nm_colaborador FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf", {"cpf": cpf})
-    resultado = cursor.fetchone()
-    nome = resultado[0] if resultado else None
-    cursor.close()
+    if painel is not None:
+        nome = painel.nome
+    else:
+        cursor = conn.cursor()
+        cursor.execute("SELECT nm_colaborador FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf", {"cpf": cpf})
+        resultado = cursor.fetchone()
+        nome = resultado[0] if resultado else None
+        cursor.close()
     while True:
         limpa_tela()
         print(f"\n===== RELATÓRIO DIÁRIO - {nome} (CPF: {cpf})")
@@ -2464,37 +6387,27 @@ def relatorio_diario(conn: oracledb.Connection, cpf: str = None) -> None:
             continue
         data_dt = data_datetime(data_str)
         break
+    iniciar_memoria_relatorio(f"Relatório diário {data_str}")
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT *
-            FROM T_MNDSH_METRICA
-            WHERE nr_cpf = :cpf
-              AND TRUNC(dt_registro) = TO_DATE(:data, 'DD/MM/YYYY')
-        """, {"cpf": cpf, "data": data_str})
-        linhas = cursor.fetchall()
-        colunas = [d[0].lower() for d in cursor.description] if cursor.description else []
-        cursor.close()
-        if not linhas:
+        df_metrica = buscar_metricas(conn, cpf=cpf, data=data_str)
+        if df_metrica.empty:
             print(f"\n{margem}Nenhuma métrica encontrada para essa data.")
             input("\nPressione ENTER para continuar...")
             return
-        df_metrica = pd.DataFrame(linhas, columns=colunas)
     except Exception as e:
         print(f"\n{margem}Erro ao buscar métricas: {e}")
         input("\nPressione ENTER para continuar...")
         return
     
-    df_desempenho = calcular_desempenho(df_metrica, data_dt)
+    with etapa_memoria("agregacao"):
+        df_desempenho = calcular_desempenho(df_metrica, data_dt)
     if df_desempenho.empty:
         print(f"\n{margem}Nenhum dado de desempenho calculado para esta data.")
         input("\nPressione ENTER para continuar...")
         return
 
-    df_exibir = df_desempenho.rename(columns=colunas_renomear)
-    colunas_numericas = df_exibir.select_dtypes(include="number").columns
-    for col in colunas_numericas:
-        df_exibir[col] = df_exibir[col].apply(lambda x: f"{x:.2f}")
+    with etapa_memoria("formatacao"):
+        df_exibir = formatar_desempenho_exibir(df_desempenho)
 
     grupos_relatorio_diario = [
     ("PRODUTIVIDADE", ['Produtividade', 'Foco','Tarefas concluídas', 'Tarefas em andamento', 'Tarefas pendentes', 'Tarefas concluídas no prazo', 'Tarefas concluídas com atraso']),
@@ -2508,16 +6421,20 @@ def relatorio_diario(conn: oracledb.Connection, cpf: str = None) -> None:
         df_exibir = df_exibir.drop(columns=['CPF'])
     limpa_tela()
     data_formatada = data_dt.strftime("%d/%m/%Y")
-    imprimir_tabela(df_exibir, 
-                    titulo=f"Relatório Diário - {nome} CPF: {cpf} - Referência: {data_formatada}", 
-                    colunas_exibir=grupos_relatorio_diario)
-    feedback, insights = gerar_feedback_e_insights(df_desempenho.iloc[0].to_dict())
-    print(feedback)
-    for insight in insights:
-        print(insight)
-    gerar_dataframe(df_exibir)
-
-def relatorio_mensal(conn: oracledb.Connection, cpf: str, nome: str, mes: int = None, ano: int = None) -> None:
+    with etapa_memoria("exibicao"):
+        imprimir_tabela(df_exibir, 
+                        titulo=f"Relatório Diário - {nome} CPF: {cpf} - Referência: {data_formatada}", 
+                        colunas_exibir=grupos_relatorio_diario)
+        feedback, insights = gerar_feedback_e_insights(df_desempenho.iloc[0].to_dict())
+        print(feedback)
+        for insight in insights:
+            print(insight)
+    with etapa_memoria("exportacao"):
+        gerar_dataframe(df_exibir)
+    _encerrar_memoria_relatorio()
+
+def relatorio_mensal(conn: oracledb.Connection, cpf: str, nome: str, mes: int = None, ano: int = None,
+                     painel: "PainelColaborador | None" = None) -> None:
     """
     Gera o relatório mensal de métricas para um colaborador específico.
 
@@ -2530,6 +6447,7 @@ def relatorio_mensal(conn: oracledb.Connection, cpf: str, nome: str, mes: int =
         nome: O nome do colaborador.
         mes: O mês de referência.
         ano: O ano de referência.
+        painel: Cache da sessão; o mês atual vem do desempenho pré-carregado, sem consulta.
 
     Returns:
         None: Gerencia a interação com o usuário e a exibição do relatório.
@@ -2559,36 +6477,24 @@ def relatorio_mensal(conn: oracledb.Connection, cpf: str, nome: str, mes: int =
             print(f"\n{margem}Mês ou ano inválido!")
             if not perguntar_continuar("inserir mês e ano novamente"):
                 return
+    pre_carregado = painel.obter("desempenho_mes") if painel is not None else None
+    iniciar_memoria_relatorio(f"Relatório mensal {mes_int}/{ano_int}")
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT *
-            FROM T_MNDSH_METRICA
-            WHERE nr_cpf = :cpf
-              AND EXTRACT(MONTH FROM dt_registro) = :mes
-              AND EXTRACT(YEAR FROM dt_registro) = :ano
-        """, {"cpf": cpf, "mes": mes_int, "ano": ano_int})
-        linhas = cursor.fetchall()
-        colunas = [d[0].lower() for d in cursor.description] if cursor.description else []
-        cursor.close()
-        if not linhas:
-            print(f"\n{margem}Nenhuma métrica encontrada para esse mês.")
-            input("\nPressione ENTER para continuar...")
-            return
-        df_metrica = pd.DataFrame(linhas, columns=colunas)
+        if pre_carregado is not None and pre_carregado[:2] == (mes_int, ano_int):
+            df_desempenho = pre_carregado[2].copy()
+        else:
+            df_desempenho = dados_relatorio_mensal(conn, cpf, mes_int, ano_int)
     except Exception as e:
         print(f"\n{margem}Erro ao buscar métricas: {e}")
         input("\nPressione ENTER para continuar...")
         return
 
-    df_desempenho = calcular_desempenho(df_metrica)
     if df_desempenho.empty:
-        print(f"\n{margem}Nenhum dado de desempenho calculado para este mês.")
+        print(f"\n{margem}Nenhuma métrica encontrada para esse mês.")
         input("\nPressione ENTER para continuar...")
         return
-    colunas_numericas = df_desempenho.select_dtypes(include="number").columns
-    df_desempenho[colunas_numericas] = df_desempenho[colunas_numericas].round(2)
-    df_exibir = df_desempenho.rename(columns=colunas_renomear)
+    with etapa_memoria("formatacao"):
+        df_exibir = df_desempenho.rename(columns=colunas_renomear)
 
     grupos_relatorio_diario = [
     ("PRODUTIVIDADE", ['Produtividade', 'Foco','Tarefas concluídas', 'Tarefas em andamento', 'Tarefas pendentes', 'Tarefas concluídas no prazo', 'Tarefas concluídas com atraso']),
@@ -2600,14 +6506,17 @@ def relatorio_mensal(conn: oracledb.Connection, cpf: str, nome: str, mes: int =
         df_exibir = df_exibir.drop(columns=['CPF'])
 
     limpa_tela()
-    imprimir_tabela(df_exibir, 
-                    titulo=f"Relatório Mensal - {nome} CPF: {cpf} - Referência: {mes_int}/{ano_int}", 
-                    colunas_exibir=grupos_relatorio_diario)
-    feedback, insights = gerar_feedback_e_insights(df_desempenho.iloc[0].to_dict())
-    print(feedback)
-    for insight in insights:
-        print(insight)
-    gerar_dataframe(df_exibir)
+    with etapa_memoria("exibicao"):
+        imprimir_tabela(df_exibir, 
+                        titulo=f"Relatório Mensal - {nome} CPF: {cpf} - Referência: {mes_int}/{ano_int}", 
+                        colunas_exibir=grupos_relatorio_diario)
+        feedback, insights = gerar_feedback_e_insights(df_desempenho.iloc[0].to_dict())
+        print(feedback)
+        for insight in insights:
+            print(insight)
+    with etapa_memoria("exportacao"):
+        gerar_dataframe(df_exibir)
+    _encerrar_memoria_relatorio()
 
 def relatorio_geral(conn: oracledb.Connection, mes: int = None, ano: int = None) -> None:
     """
@@ -2651,43 +6560,21 @@ def relatorio_geral(conn: oracledb.Connection, mes: int = None, ano: int = None)
             print(f"\n{margem}Mês ou ano inválido!")
             if not perguntar_continuar("inserir mês e ano novamente"):
                 return
+    iniciar_memoria_relatorio(f"Relatório geral {mes_int}/{ano_int}")
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT *
-            FROM T_MNDSH_METRICA
-            WHERE EXTRACT(MONTH FROM dt_registro) = :mes
-              AND EXTRACT(YEAR FROM dt_registro) = :ano
-        """, {"mes": mes_int, "ano": ano_int})
-
-        linhas = cursor.fetchall()
-        colunas = [d[0].lower() for d in cursor.description] if cursor.description else []
-        cursor.close()
-
-        if not linhas:
-            print(f"\n{margem}Nenhuma métrica encontrada para esse mês.")
-            input("\nPressione ENTER para continuar...")
-            return
-
-        df_metrica = pd.DataFrame(linhas, columns=colunas)
-
+        df_desempenho, metricas_media = dados_relatorio_geral(conn, mes_int, ano_int)
     except Exception as e:
         print(f"\n{margem}Erro ao buscar métricas: {e}")
         input("\nPressione ENTER para continuar...")
         return
 
-    df_desempenho = calcular_desempenho(df_metrica)
-
     if df_desempenho.empty:
-        print(f"\n{margem}Nenhum dado de desempenho calculado para esse mês.")
+        print(f"\n{margem}Nenhuma métrica encontrada para esse mês.")
         input("\nPressione ENTER para continuar...")
         return
 
-    df_exibir = df_desempenho.rename(columns=colunas_renomear)
-
-    colunas_numericas = df_exibir.select_dtypes(include="number").columns
-    for col in colunas_numericas:
-        df_exibir[col] = df_exibir[col].apply(lambda x: f"{x:.2f}")
+    with etapa_memoria("formatacao"):
+        df_exibir = formatar_desempenho_exibir(df_desempenho)
 
     colunas_id = ['CPF']
     grupos_metricas = [
@@ -2703,28 +6590,209 @@ def relatorio_geral(conn: oracledb.Connection, mes: int = None, ano: int = None)
         grupos_relatorio_geral.append((titulo, colunas_do_grupo_completo))
 
     limpa_tela()
-    imprimir_tabela(df_exibir, 
-                    titulo=f"Relatório Geral - Referência: {mes_int}/{ano_int}", 
-                    colunas_exibir=grupos_relatorio_geral)
+    with etapa_memoria("exibicao"):
+        imprimir_tabela(df_exibir, 
+                        titulo=f"Relatório Geral - Referência: {mes_int}/{ano_int}", 
+                        colunas_exibir=grupos_relatorio_geral)
+        feedback, insights = gerar_feedback_e_insights_geral(metricas_media)
+        print(feedback)
+        for insight in insights:
+            print(insight)
+    with etapa_memoria("exportacao"):
+        gerar_dataframe(df_exibir)
+    _encerrar_memoria_relatorio()
+
+# ====== PAINEL DO COLABORADOR (pré-carregamento) ======
+
+# Logo após o login, o que as telas seguintes do colaborador consultam (tarefas abertas, registro de hoje e
+# o desempenho do mês atual) é carregado em segundo plano enquanto ele lê o menu
+config_painel = {
+    "ativo": os.environ.get("MINDSHIFT_PAINEL_PREFETCH", "1") == "1"
+}
+# Colunas das tarefas abertas, na ordem do SELECT de carregar_tarefas_abertas()
+colunas_tarefas_abertas = ["ID", "Título", "Descrição", "Status", "Prioridade", "Prazo", "Data Criação", "Data Última Modificação"]
+
+def carregar_tarefas_abertas(conn: oracledb.Connection, cpf_colaborador: str) -> list[tuple]:
+    """
+    Busca as tarefas NÃO CONCLUÍDAS do colaborador, ordenadas pelo prazo (colunas de colunas_tarefas_abertas).
+
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador.
+
+    Returns:
+        list[tuple]: As linhas das tarefas.
+    """
+    cursor = conn.cursor()
     try:
-        total_concluidas = df_desempenho["tarefas_concluidas"].sum()
-        total_geral = (
-            df_desempenho["tarefas_concluidas"].sum() +
-            df_desempenho["tarefas_andamento"].sum() +
-            df_desempenho["tarefas_pendentes"].sum())
+        cursor.execute("""
+            SELECT id_tarefa, ds_titulo, ds_descricao, ds_status, ds_prioridade, dt_prazo, dt_criacao, dt_modificacao
+            FROM T_MNDSH_TAREFA
+            WHERE id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf) AND ds_status != 'concluída'
+            ORDER BY dt_prazo
+        """, {"cpf": cpf_colaborador})
+        return cursor.fetchall()
+    finally:
+        cursor.close()
 
-        prop_conclusao_media = total_concluidas / total_geral if total_geral > 0 else 0
-    except:
-        prop_conclusao_media = 0
+class PainelColaborador:
+    """
+    Cache da sessão de um colaborador, preenchido em segundo plano logo após o login.
+
+    - Chaves: "tarefas_abertas" (linhas de carregar_tarefas_abertas), "registrado_hoje" (bool) e
+      "desempenho_mes" ((mes, ano, DataFrame de dados_relatorio_mensal)).
+    - Com uma ConexaoEmprestada (servidor de quiosque), as três cargas rodam ao mesmo tempo em um executor
+      pequeno, cada uma com a sua conexão emprestada do mesmo pool.
+    - Com uma conexão única (menu local), a thread roda as cargas uma após a outra na conexão do menu; as
+      telas chamam obter(), que espera o fim do carregamento, para que a conexão nunca seja usada pelas
+      duas threads ao mesmo tempo.
+    - Chaves ausentes (falha no carregamento ou invalidadas após uma alteração) retornam None e a tela
+      consulta o banco como antes.
 
-    metricas_media = df_desempenho.drop(columns=["nr_cpf"], errors="ignore").mean().to_dict()
-    metricas_media["prop_conclusao"] = prop_conclusao_media
+    Args:
+        conn: O objeto de conexão ativo com o banco de dados Oracle.
+        cpf_colaborador: O CPF do colaborador logado.
+        nome_colaborador: O nome do colaborador logado.
+    """
+    def __init__(self, conn: oracledb.Connection, cpf_colaborador: str, nome_colaborador: str):
+        self.conn = conn
+        self.cpf = cpf_colaborador
+        self.nome = nome_colaborador
+        self.dados = {}
+        self.erro = None
+        self._thread = threading.Thread(target=self._carregar, name=f"painel-{cpf_colaborador}", daemon=True)
+
+    def iniciar(self) -> "PainelColaborador":
+        self._thread.start()
+        return self
+
+    def _carregar(self) -> None:
+        hoje = datetime.now()
+        cargas = {
+            "tarefas_abertas": lambda conn: carregar_tarefas_abertas(conn, self.cpf),
+            "registrado_hoje": lambda conn: metricas_registradas_hoje(conn, self.cpf),
+            "desempenho_mes": lambda conn: (hoje.month, hoje.year, dados_relatorio_mensal(conn, self.cpf, hoje.month, hoje.year))
+        }
+        with medir_duracao("mindshift_painel_carga_segundos", "Duração do pré-carregamento do painel do colaborador."):
+            if isinstance(self.conn, ConexaoEmprestada):
+                with futuros_concorrentes.ThreadPoolExecutor(max_workers=len(cargas), thread_name_prefix=f"painel-{self.cpf}") as executor:
+                    futuros = {chave: executor.submit(self._carregar_emprestada, carga) for chave, carga in cargas.items()}
+                resultados = {chave: futuro.exception() or futuro.result() for chave, futuro in futuros.items()}
+            else:
+                resultados = {}
+                for chave, carga in cargas.items():
+                    try:
+                        resultados[chave] = carga(self.conn)
+                    except Exception as e:
+                        resultados[chave] = e
+        # Uma carga que falha não descarta as outras: a chave fica ausente e a tela consulta o banco
+        for chave, resultado in resultados.items():
+            if isinstance(resultado, Exception):
+                self.erro = resultado
+                contador_inc("mindshift_painel_falhas_total", "Falhas no pré-carregamento do painel do colaborador.")
+            else:
+                self.dados[chave] = resultado
+
+    def _carregar_emprestada(self, carga):
+        conn = ConexaoEmprestada(self.conn.pool)
+        try:
+            return carga(conn)
+        finally:
+            conn.close()
+
+    def aguardar(self) -> None:
+        """
+        Espera o carregamento terminar (antes de a conexão voltar a ser usada ou fechada pelo menu).
+        """
+        if self._thread.ident is not None:
+            self._thread.join()
+
+    def obter(self, chave: str):
+        """
+        Retorna o valor pré-carregado (esperando o carregamento terminar) ou None se não estiver disponível.
+        """
+        self.aguardar()
+        valor = self.dados.get(chave)
+        contador_inc("mindshift_painel_cache_total", "Consultas ao cache do painel do colaborador.", chave=chave,
+                     resultado="acerto" if valor is not None else "falta")
+        return valor
+
+    def definir(self, chave: str, valor) -> None:
+        self.dados[chave] = valor
+
+    def invalidar(self, *chaves: str) -> None:
+        for chave in chaves:
+            self.dados.pop(chave, None)
+
+# ====== PERFILAMENTO DAS AÇÕES DOS MENUS ======
+
+# Perfilamento opcional (variáveis de ambiente ou main.py --perfil / --perfil-memoria)
+config_perfil = {
+    "ativo": os.environ.get("MINDSHIFT_PERFIL", "") not in ("", "0"),
+    "memoria": os.environ.get("MINDSHIFT_PERFIL_MEMORIA", "") not in ("", "0"),
+    "pasta": os.environ.get("MINDSHIFT_PERFIL_PASTA", "perfis"),
+    "top": int(os.environ.get("MINDSHIFT_PERFIL_TOP", "25"))
+}
+
+def executar_acao(nome: str, funcao, *args, **kwargs):
+    """
+    Executa uma ação disparada pelos menus. Com config_perfil["ativo"], a ação roda sob o cProfile
+    e são gravados na pasta de perfis o arquivo <data>_<nome>.prof (para pstats/snakeviz) e um resumo
+    <data>_<nome>.txt com as N funções de maior tempo acumulado e próprio. Com config_perfil["memoria"],
+    o resumo inclui o pico de memória e as maiores alocações (tracemalloc).
+
+    O tempo em que a ação fica parada esperando o usuário aparece no resumo como builtins.input.
+
+    Args:
+        nome: Nome da ação (usado nos nomes dos arquivos).
+        funcao: A função da ação.
+        *args, **kwargs: Argumentos repassados à função.
 
-    feedback, insights = gerar_feedback_e_insights_geral(metricas_media)
-    print(feedback)
-    for insight in insights:
-        print(insight)
-    gerar_dataframe(df_exibir)
+    Returns:
+        O retorno da própria função.
+    """
+    if not config_perfil["ativo"] and not config_perfil["memoria"]:
+        return funcao(*args, **kwargs)
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    perfil = cProfile.Profile() if config_perfil["ativo"] else None
+    medir_memoria = config_perfil["memoria"] and not tracemalloc.is_tracing()
+    if medir_memoria:
+        tracemalloc.start(25)
+    inicio = time.perf_counter()
+    if perfil:
+        perfil.enable()
+    try:
+        return funcao(*args, **kwargs)
+    finally:
+        if perfil:
+            perfil.disable()
+        duracao = time.perf_counter() - inicio
+        base = os.path.join(config_perfil["pasta"], f"{datetime.now():%Y%m%d_%H%M%S}_{nome}")
+        resumo = io.StringIO()
+        resumo.write(f"Ação: {nome}\nDuração: {duracao:.3f} s\n")
+        try:
+            os.makedirs(config_perfil["pasta"], exist_ok=True)
+            if perfil:
+                perfil.dump_stats(f"{base}.prof")
+                for ordem in ("cumulative", "tottime"):
+                    resumo.write(f"\n===== TOP {config_perfil['top']} POR {ordem.upper()} =====\n")
+                    pstats.Stats(perfil, stream=resumo).strip_dirs().sort_stats(ordem).print_stats(config_perfil["top"])
+            if medir_memoria:
+                atual, pico = tracemalloc.get_traced_memory()
+                resumo.write(f"\n===== MEMÓRIA =====\nAtual: {atual / 1024:.1f} KiB | Pico: {pico / 1024:.1f} KiB\n\n")
+                for estatistica in tracemalloc.take_snapshot().statistics("lineno")[:config_perfil["top"]]:
+                    resumo.write(f"{estatistica}\n")
+            with open(f"{base}.txt", "w", encoding="utf-8") as arquivo:
+                arquivo.write(resumo.getvalue())
+        except OSError as e:
+            print(f"\n {margem} Não foi possível gravar o perfil da ação {nome}: {e}\n")
+        finally:
+            if medir_memoria:
+                tracemalloc.stop()
 
 # ===== MENU ADMINISTRADOR =====
 
@@ -2740,8 +6808,8 @@ def menu_administrador(conn: oracledb.Connection) -> None:
     while True:
         escolha = menu_opcoes(
             "===== MENU ADMINISTRADOR =====\n",
-            ["Colaboradores", "Tarefas", "Relatórios", "Voltar"],
-            ["colaboradores", "tarefas", "relatorios", "voltar"])
+            ["Colaboradores", "Tarefas", "Relatórios", "Manutenção", "Voltar"],
+            ["colaboradores", "tarefas", "relatorios", "manutencao", "voltar"])
 
         if escolha == "colaboradores":
             while True:
@@ -2751,16 +6819,16 @@ def menu_administrador(conn: oracledb.Connection) -> None:
                     ["cadastrar", "atualizar", "deletar", "listar", "voltar"])
                 if op == "cadastrar":
                     limpa_tela()
-                    cadastrar_colaborador(conn)
+                    executar_acao("cadastrar_colaborador", cadastrar_colaborador, conn)
                 elif op == "atualizar":
                     limpa_tela()
-                    atualizar_colaborador(conn)
+                    executar_acao("atualizar_colaborador", atualizar_colaborador, conn)
                 elif op == "deletar":
                     limpa_tela()
-                    excluir_colaborador(conn)
+                    executar_acao("excluir_colaborador", excluir_colaborador, conn)
                 elif op == "listar":
                     limpa_tela()
-                    listar_colaboradores(conn)
+                    executar_acao("listar_colaboradores", listar_colaboradores, conn)
                 elif op == "voltar":
                     print(f"\n {margem} Voltando...!")
                     input("\nPressione ENTER para continuar...")
@@ -2771,20 +6839,22 @@ def menu_administrador(conn: oracledb.Connection) -> None:
             limpa_tela()
             while True:
                 op = menu_opcoes("===== MENU TAREFAS=====\n",
-                    ["Cadastrar", "Atualizar", "Deletar", "Listar", "Voltar"],
-                    ["cadastrar", "atualizar", "deletar", "listar", "voltar"])
+                    ["Cadastrar", "Atualizar", "Deletar", "Listar", "Prazos", "Voltar"],
+                    ["cadastrar", "atualizar", "deletar", "listar", "prazos", "voltar"])
                 if op == "cadastrar":
                     limpa_tela()
-                    adicionar_tarefa_admin(conn)
+                    executar_acao("adicionar_tarefa_admin", adicionar_tarefa_admin, conn)
                 elif op == "atualizar":
                     limpa_tela()
-                    atualizar_tarefa_admin(conn)
+                    executar_acao("atualizar_tarefa_admin", atualizar_tarefa_admin, conn)
                 elif op == "deletar":
                     limpa_tela()
-                    excluir_tarefa_admin(conn)
+                    executar_acao("excluir_tarefa_admin", excluir_tarefa_admin, conn)
                 elif op == "listar":
                     limpa_tela()
-                    listar_tarefas_admin(conn)
+                    executar_acao("listar_tarefas_admin", listar_tarefas_admin, conn)
+                elif op == "prazos":
+                    executar_acao("relatorio_prazos", relatorio_prazos, conn)
                 elif op == "voltar":
                     print(f"\n {margem} Voltando...!")
                     input("\nPressione ENTER para continuar...")
@@ -2817,13 +6887,42 @@ def menu_administrador(conn: oracledb.Connection) -> None:
                     nome_colab = colaborador["nm_colaborador"]
 
                     if op == "diario":
-                        relatorio_diario(conn, cpf=cpf_colab)
+                        executar_acao("relatorio_diario", relatorio_diario, conn, cpf=cpf_colab)
 
                     elif op == "mensal":
-                        relatorio_mensal(conn, cpf=cpf_colab, nome=nome_colab)
+                        executar_acao("relatorio_mensal", relatorio_mensal, conn, cpf=cpf_colab, nome=nome_colab)
 
                 elif op == "geral":
-                    relatorio_geral(conn)
+                    executar_acao("relatorio_geral", relatorio_geral, conn)
+
+        elif escolha == "manutencao":
+            while True:
+                limpa_tela()
+                op = menu_opcoes("===== MENU MANUTENÇÃO =====\n",
+                    ["Pré-carregar cache de CEP", "Enriquecer endereços em lote", "Estatísticas do cliente de CEP", "Estatísticas de SQL",
+                     "Memória do último relatório", "Voltar"],
+                    ["cache_cep", "enriquecer_ceps", "estatisticas_cep", "estatisticas_sql", "memoria_relatorio", "voltar"])
+                if op == "cache_cep":
+                    limpa_tela()
+                    executar_acao("preaquecer_cache_cep", menu_preaquecer_cache_cep, conn)
+                elif op == "enriquecer_ceps":
+                    limpa_tela()
+                    executar_acao("enriquecer_ceps", menu_enriquecer_ceps, conn)
+                elif op == "estatisticas_cep":
+                    limpa_tela()
+                    exibir_estatisticas_cep()
+                elif op == "estatisticas_sql":
+                    limpa_tela()
+                    exibir_estatisticas_sql()
+                elif op == "memoria_relatorio":
+                    limpa_tela()
+                    exibir_memoria_relatorio()
+                    input("Pressione ENTER para continuar...")
+                elif op == "voltar":
+                    print(f"\n {margem} Voltando...!")
+                    input("\nPressione ENTER para continuar...")
+                    limpa_tela()
+                    break
                     
         elif escolha == "voltar":
             print(f"\n {margem} Voltando...!")
@@ -2839,7 +6938,8 @@ def menu_colaborador(conn: oracledb.Connection) -> None:
 
     O fluxo começa com a seleção do colaborador (simulando o login usando o buscar_colaborador()). Uma vez selecionado,
     o usuário tem acesso às funcionalidades essenciais: gestão de tarefas pessoais,
-    registro de métricas e visualização de seus relatórios.
+    registro de métricas e visualização de seus relatórios. Com config_painel["ativo"], um PainelColaborador
+    pré-carrega em segundo plano os dados dessas telas enquanto o menu é exibido.
 
     Args:
         conn: O objeto de conexão ativo com o banco de dados Oracle.
@@ -2852,6 +6952,7 @@ def menu_colaborador(conn: oracledb.Connection) -> None:
 
         cpf_colaborador = colaborador["nr_cpf"]
         nome_colaborador = colaborador["nm_colaborador"]
+        painel = PainelColaborador(conn, cpf_colaborador, nome_colaborador).iniciar() if config_painel["ativo"] else None
 
         while True: 
             limpa_tela()
@@ -2860,23 +6961,27 @@ def menu_colaborador(conn: oracledb.Connection) -> None:
                 ["Listar Tarefas", "Atualizar Tarefa", "Registrar Métricas Diárias", "Relatório Diário", "Relatório Mensal", "Buscar outro Colaborador", "Voltar Menu Principal"],
                 ["listar", "atualizar", "registrar", "rel_diario", "rel_mensal", "buscar_outro_colaborador", "voltar_menu_principal"])
 
+            if painel is not None:
+                painel.aguardar()
+
             if op == "listar":
                 limpa_tela()
-                listar_tarefas_colaborador(conn, cpf_colaborador)
+                executar_acao("listar_tarefas_colaborador", listar_tarefas_colaborador, conn, cpf_colaborador, painel=painel)
 
             elif op == "atualizar":
                 limpa_tela()
-                atualizar_tarefa_colaborador(conn,  cpf_colaborador, nome_colaborador)
+                executar_acao("atualizar_tarefa_colaborador", atualizar_tarefa_colaborador, conn, cpf_colaborador, nome_colaborador,
+                              painel=painel)
 
             elif op == "registrar":
                 limpa_tela()
-                registrar_metrica(conn, cpf_colaborador)
+                executar_acao("registrar_metrica", registrar_metrica, conn, cpf_colaborador, painel=painel)
 
             elif op == "rel_diario":
-                relatorio_diario(conn, cpf_colaborador)
+                executar_acao("relatorio_diario", relatorio_diario, conn, cpf_colaborador, painel=painel)
 
             elif op == "rel_mensal":
-                relatorio_mensal(conn, cpf=cpf_colaborador, nome=nome_colaborador)
+                executar_acao("relatorio_mensal", relatorio_mensal, conn, cpf=cpf_colaborador, nome=nome_colaborador, painel=painel)
 
             elif op == "buscar_outro_colaborador": 
                 limpa_tela() 
@@ -2887,3 +6992,55 @@ def menu_colaborador(conn: oracledb.Connection) -> None:
                 input("\nPressione ENTER para continuar...")
                 limpa_tela()
                 return 
+
+def menu_principal(conectar=None) -> None:
+    """
+    Implementa o menu principal (Administrador, Colaborador, Sair). A conexão só é aberta quando
+    um dos menus precisa do banco e é fechada ao sair. Se o banco estiver indisponível, o colaborador usa o
+    menu offline (diário local) e a conexão é tentada de novo na próxima escolha; ao conectar,
+    o diário pendente é reproduzido.
+
+    Args:
+        conectar: Função sem argumentos que retorna a conexão (padrão: conectarBD). O servidor de quiosque
+            usa uma que retorna uma ConexaoEmprestada do pool compartilhado.
+    """
+    conectar = conectar or conectarBD
+    conn = None
+    try:
+        while True:
+            escolha = menu_opcoes(
+                "===== MENU PRINCIPAL =====\n",
+                ["Administrador", "Colaborador", "Sair"],
+                ["administrador", "colaborador", "sair"]
+            )
+            if escolha in ("administrador", "colaborador") and conn is None:
+                conn = conectar()
+                if conn is not None and diario_pendentes():
+                    try:
+                        resumo = reproduzir_diario(conn)
+                        print(f"\n {margem} Diário offline enviado ao banco: {resumo['checkins']} registro(s) de métricas e "
+                              f"{resumo['status_tarefa']} mudança(s) de status aplicados.\n")
+                        if resumo["quarentena"]:
+                            motivos = ", ".join(f"{motivo}: {n}" for motivo, n in resumo["quarentena_por_motivo"].items())
+                            print(f" {margem} {resumo['quarentena']} entrada(s) não aplicada(s) ({motivos}); guardada(s) em "
+                                  f"{config_diario_offline['quarentena']}.\n")
+                    except Exception as e:
+                        print(f"\n {margem} Erro ao enviar o diário offline (será tentado de novo): {e}\n")
+            if escolha == "administrador" and conn is None:
+                print(f"\n {margem} O menu do administrador precisa do banco de dados, que está indisponível.\n")
+                input("Pressione ENTER para continuar...")
+                limpa_tela()
+            elif escolha == "administrador":
+                limpa_tela()
+                menu_administrador(conn)
+            elif escolha == "colaborador" and conn is None:
+                menu_offline()
+            elif escolha == "colaborador":
+                limpa_tela()
+                menu_colaborador(conn)
+            elif escolha == "sair":
+                print(f"\n {margem} Encerrando sistema...\n")
+                break
+    finally:
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,218 @@
+import argparse
+import contextlib
+import json
+import platform
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+import biblioteca as _b
+import dados_sinteticos
+
+# Trechos das mensagens de erro que indicam disputa de bloqueio (SQLite e Oracle)
+erros_bloqueio = ("database is locked", "database table is locked", "ORA-00060", "ORA-00054", "ORA-04021")
+etapas_checkin = ["espera_conexao", "login", "contar_tarefas", "gravar_metricas", "total"]
+
+
+def _percentis(valores: list[float]) -> dict:
+    if not valores:
+        return {}
+    valores = sorted(valores)
+    def p(fracao):
+        return round(valores[min(len(valores) - 1, int(len(valores) * fracao))], 3)
+    return {"p50_ms": p(0.5), "p90_ms": p(0.9), "p95_ms": p(0.95), "p99_ms": p(0.99), "max_ms": round(valores[-1], 3)}
+
+
+def checkin(pool, cpf: str, rng: random.Random, fila=None) -> dict:
+    """
+    Executa o fluxo de registrar_metricas_dia() de um colaborador sem interação: busca do colaborador (login),
+    contagem das tarefas e gravação das cinco categorias, em que o upsert recusa o registro repetido no dia
+    (ou a entrega à FilaMetricas, quando informada, que antes verifica o registro no dia).
+
+    Returns:
+        dict: Tempo (ms) de cada etapa e o resultado ("ok" ou "duplicado").
+    """
+    tempos = {}
+    inicio = marca = time.perf_counter()
+
+    def etapa(nome):
+        nonlocal marca
+        agora = time.perf_counter()
+        tempos[nome] = (agora - marca) * 1000
+        marca = agora
+
+    conn = pool.acquire()
+    etapa("espera_conexao")
+    try:
+        if _b.obter_colaborador(conn, cpf) is None:
+            raise RuntimeError(f"Colaborador {cpf} não encontrado.")
+        etapa("login")
+        if fila is not None and (fila.pendente(cpf) or _b.metricas_registradas_hoje(conn, cpf)):
+            return {"resultado": "duplicado", "tempos": tempos}
+        valores = _b.contar_tarefas_colaborador(conn, cpf)
+        etapa("contar_tarefas")
+        valores.update({campo: rng.randint(0, 10) for campo in _b.notas_metricas_diarias})
+        if fila is None:
+            if not _b.gravar_metricas_dia(conn, cpf, valores):
+                return {"resultado": "duplicado", "tempos": tempos}
+        elif not fila.enfileirar(cpf, valores):
+            return {"resultado": "duplicado", "tempos": tempos}
+        etapa("gravar_metricas")
+    finally:
+        pool.release(conn)
+    tempos["total"] = (time.perf_counter() - inicio) * 1000
+    return {"resultado": "ok", "tempos": tempos}
+
+
+def executar_carga(pool, cpfs: list[str], rampa: float = 0.0, semente: int = 42, fila=None) -> dict:
+    """
+    Dispara um check-in por CPF, cada um em sua própria thread, todos liberados ao mesmo tempo
+    (ou espalhados ao longo de 'rampa' segundos), e consolida throughput, latências e erros.
+    """
+    largada = threading.Barrier(len(cpfs) + 1)
+    resultados = [None] * len(cpfs)
+
+    def usuario(indice: int, cpf: str):
+        rng = random.Random(semente + indice)
+        largada.wait()
+        if rampa:
+            time.sleep(rampa * indice / len(cpfs))
+        try:
+            resultados[indice] = checkin(pool, cpf, rng, fila)
+        except Exception as e:
+            mensagem = str(e)
+            tipo = "bloqueio" if any(trecho in mensagem for trecho in erros_bloqueio) else "erro"
+            resultados[indice] = {"resultado": tipo, "mensagem": f"{type(e).__name__}: {mensagem}"}
+
+    threads = [threading.Thread(target=usuario, args=(i, cpf), daemon=True) for i, cpf in enumerate(cpfs)]
+    for thread in threads:
+        thread.start()
+    largada.wait()
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    duracao = time.perf_counter() - inicio
+
+    contagem = {tipo: 0 for tipo in ("ok", "duplicado", "bloqueio", "erro")}
+    for r in resultados:
+        contagem[r["resultado"]] += 1
+    sucesso = [r for r in resultados if r["resultado"] == "ok"]
+    mensagens = {}
+    for r in resultados:
+        if "mensagem" in r:
+            mensagens[r["mensagem"]] = mensagens.get(r["mensagem"], 0) + 1
+    return {
+        "usuarios": len(cpfs),
+        "segundos": round(duracao, 3),
+        "checkins_por_segundo": round(contagem["ok"] / duracao, 2) if duracao else None,
+        "resultados": contagem,
+        "taxa_erro": round((contagem["erro"] + contagem["bloqueio"]) / len(cpfs), 4),
+        "taxa_bloqueio": round(contagem["bloqueio"] / len(cpfs), 4),
+        "latencias": {etapa: _percentis([r["tempos"][etapa] for r in sucesso]) for etapa in etapas_checkin},
+        "erros_frequentes": dict(sorted(mensagens.items(), key=lambda item: -item[1])[:10])
+    }
+
+
+def _cpfs_disponiveis(conn, quantidade: int) -> list[str]:
+    """
+    Retorna CPFs de colaboradores ativos que ainda não registraram métricas hoje.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT c.nr_cpf
+            FROM T_MNDSH_COLABORADOR c
+            WHERE c.ds_status = 'Ativo' AND c.dt_exclusao IS NULL
+              AND NOT EXISTS (SELECT 1 FROM T_MNDSH_METRICA_DIA m
+                              WHERE m.id_colaborador = c.id AND m.dt_dia = TRUNC(SYSDATE))
+            ORDER BY c.nr_cpf
+        """)
+        return [linha[0] for linha in cursor.fetchmany(quantidade)]
+    finally:
+        cursor.close()
+
+
+def _limpar_checkins(conn, cpfs: list[str]) -> None:
+    """
+    Apaga as métricas gravadas hoje pelos CPFs da carga, para que o teste possa ser repetido.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.executemany("""
+            DELETE FROM T_MNDSH_METRICA_DIA
+            WHERE id_colaborador = (SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf) AND dt_dia = TRUNC(SYSDATE)
+        """, [{"cpf": cpf} for cpf in cpfs])
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Simula o pico de fim de expediente: muitos colaboradores registrando as métricas ao mesmo tempo.")
+    parser.add_argument("-u", "--usuarios", type=int, default=200, help="colaboradores simultâneos")
+    parser.add_argument("--conexoes", type=int, default=32, help="tamanho máximo do pool de conexões")
+    parser.add_argument("--rampa", type=float, default=0.0, help="segundos para espalhar as largadas (0 = todos juntos)")
+    parser.add_argument("--preparar", action="store_true", help="gera colaboradores sintéticos se não houver CPFs suficientes")
+    parser.add_argument("--fila", action="store_true", help="usa a fila de gravação em segundo plano (FilaMetricas)")
+    parser.add_argument("--limpar", action="store_true", help="apaga os registros de hoje gerados pela carga ao final")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.sqlite:
+        _b.config_banco["sqlite"] = args.sqlite
+    with contextlib.redirect_stdout(sys.stderr):
+        pool = _b.criar_pool(minimo=1, maximo=args.conexoes)
+    if pool is None:
+        sys.exit(1)
+    conn = pool.acquire()
+    try:
+        cpfs = _cpfs_disponiveis(conn, args.usuarios)
+        if len(cpfs) < args.usuarios and args.preparar:
+            faltam = args.usuarios - len(cpfs)
+            # CPFs já gravados (com ou sem registro hoje) são pulados: repetir --preparar no mesmo banco não colide
+            dados_sinteticos.popular_banco(conn, faltam, faltam * 10, 0, datetime.now(), semente=args.semente, acrescentar=True)
+            cpfs = _cpfs_disponiveis(conn, args.usuarios)
+    finally:
+        pool.release(conn)
+    if len(cpfs) < args.usuarios:
+        sys.exit(f"Só há {len(cpfs)} colaboradores sem registro hoje; use --preparar ou reduza --usuarios.")
+
+    fila = None
+    if args.fila:
+        _b.config_fila_metricas["ativa"] = True
+        fila = _b.iniciar_fila_metricas(lambda: _b.ConexaoEmprestada(pool))
+    print(f"Iniciando {len(cpfs)} check-ins simultâneos com {args.conexoes} conexões...", file=sys.stderr)
+    resultado = {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "banco": "sqlite" if _b.config_banco["sqlite"] else "oracle",
+        "conexoes": args.conexoes,
+        "rampa_segundos": args.rampa,
+        "fila": args.fila,
+        **executar_carga(pool, cpfs, args.rampa, args.semente, fila)
+    }
+    if fila is not None:
+        inicio = time.perf_counter()
+        _b.encerrar_fila_metricas()
+        resultado["segundos_esvaziar_fila"] = round(time.perf_counter() - inicio, 3)
+    if args.limpar:
+        conn = pool.acquire()
+        try:
+            _limpar_checkins(conn, cpfs)
+        finally:
+            pool.release(conn)
+    pool.close()
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import argparse
+import contextlib
+import json
+import sys
+
+import biblioteca as _b
+
+FORMATOS = ["json", "csv", "excel"]
+
+
+def _saida_tabela(df, args) -> None:
+    """
+    Grava um DataFrame no arquivo informado em --saida ou no stdout.
+    """
+    if args.saida:
+        _b.exportar_dataframe(df, args.saida, args.formato)
+        print(f"{len(df)} linha(s) gravadas em {args.saida}", file=sys.stderr)
+    elif args.formato == "excel":
+        sys.exit("O formato excel exige --saida.")
+    else:
+        _b.exportar_dataframe(df, sys.stdout, args.formato)
+        sys.stdout.write("\n")
+
+
+def _saida_json(dados: dict, args) -> None:
+    """
+    Grava um dicionário como JSON no arquivo informado em --saida ou no stdout.
+    """
+    texto = json.dumps(dados, ensure_ascii=False, indent=4, default=str)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+        print(f"Resultado gravado em {args.saida}", file=sys.stderr)
+    else:
+        print(texto)
+
+
+def _saida_relatorio(conn, args, tipo: str, **filtros) -> None:
+    """
+    Emite um relatório: tabela de desempenho (csv/excel) ou documento JSON completo com feedback e insights.
+    """
+    if args.memoria:
+        _b.config_memoria_relatorios["ativo"] = True
+        _b.iniciar_memoria_relatorio(f"Relatório {tipo}")
+    try:
+        df_desempenho, dados = _b.gerar_relatorio(conn, tipo, **filtros)
+    except ValueError as e:
+        sys.exit(str(e))
+    if df_desempenho.empty:
+        sys.exit("Nenhuma métrica encontrada para o período informado.")
+    with _b.etapa_memoria("exportacao"):
+        if args.formato != "json":
+            _saida_tabela(df_desempenho.rename(columns=_b.colunas_renomear), args)
+        else:
+            _saida_json(dados, args)
+    if args.memoria:
+        _b.finalizar_memoria_relatorio()
+        _b.exibir_memoria_relatorio(sys.stderr)
+
+
+def cmd_colaboradores_listar(conn, args) -> None:
+    _saida_tabela(_b.consultar_colaboradores(conn), args)
+
+
+def cmd_colaboradores_importar(conn, args) -> None:
+    resultado = _b.importar_colaboradores(conn, _b.ler_arquivo_importacao(args.arquivo))
+    _saida_json(resultado, args)
+
+
+def cmd_colaboradores_expurgar(conn, args) -> None:
+    if args.simular:
+        _saida_json({"pendentes": _b.pendencias_expurgo(conn)}, args)
+        return
+
+    def progresso(situacao):
+        print(f"colaborador {situacao['id_colaborador']} ({situacao['posicao']}/{situacao['colaboradores']}) "
+              f"{situacao['tabela']}: {situacao['total_tabela']} linha(s) apagada(s)", file=sys.stderr)
+
+    _saida_json(_b.expurgar_colaboradores(conn, args.lote, progresso), args)
+
+
+def cmd_tarefas_listar(conn, args) -> None:
+    _saida_tabela(_b.consultar_tarefas(conn, cpf=args.cpf, status=args.status), args)
+
+
+def cmd_tarefas_prazos(conn, args) -> None:
+    referencia = None
+    if args.data:
+        if not _b.validar_data(args.data):
+            sys.exit("Data inválida! Use DD/MM/AAAA.")
+        referencia = _b.data_datetime(args.data)
+    varredura = _b.varrer_prazos(conn, referencia, args.dias)
+    if args.formato != "json":
+        _saida_tabela(_b.tabela_prazos(varredura), args)
+    elif args.resumo:
+        _saida_json({chave: varredura[chave] for chave in ("referencia", "ate", "resumo")}, args)
+    else:
+        _saida_json(varredura, args)
+
+
+def cmd_tarefas_importar(conn, args) -> None:
+    resultado = _b.importar_tarefas(conn, _b.ler_arquivo_importacao(args.arquivo))
+    _saida_json(resultado, args)
+
+
+def cmd_relatorio_diario(conn, args) -> None:
+    _saida_relatorio(conn, args, "diario", cpf=args.cpf, data=args.data)
+
+
+def cmd_relatorio_mensal(conn, args) -> None:
+    _saida_relatorio(conn, args, "mensal", cpf=args.cpf, mes=args.mes, ano=args.ano)
+
+
+def cmd_relatorio_geral(conn, args) -> None:
+    _saida_relatorio(conn, args, "geral", mes=args.mes, ano=args.ano)
+
+
+def cmd_metricas_arquivar(conn, args) -> None:
+    _saida_json(_b.arquivar_metricas(conn, args.meses, args.simular), args)
+
+
+def cmd_ceps_preaquecer(conn, args) -> None:
+    _saida_json({"ceps": _b.preaquecer_cache_cep(conn)}, args)
+
+
+def cmd_ceps_enriquecer(conn, args) -> None:
+    resumo = _b.enriquecer_ceps_em_lote(conn, args.arquivo, max_threads=args.threads, limite_por_segundo=args.taxa,
+                                        usar_cache=args.usar_cache)
+    _saida_json(resumo, args)
+
+
+def _mes(valor: str) -> int:
+    mes = int(valor)
+    if not 1 <= mes <= 12:
+        raise argparse.ArgumentTypeError("mês deve estar entre 1 e 12")
+    return mes
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Operações administrativas e relatórios sem interação (para cron e benchmarks).")
+    saida = argparse.ArgumentParser(add_help=False)
+    saida.add_argument("-f", "--formato", choices=FORMATOS, default="json", help="formato da saída (padrão: json)")
+    saida.add_argument("-o", "--saida", help="arquivo de saída (padrão: stdout)")
+    grupos = parser.add_subparsers(dest="grupo", required=True)
+
+    colaboradores = grupos.add_parser("colaboradores", help="listar, exportar, importar e expurgar colaboradores").add_subparsers(dest="acao", required=True)
+    for nome in ("listar", "exportar"):
+        colaboradores.add_parser(nome, parents=[saida]).set_defaults(func=cmd_colaboradores_listar)
+    p = colaboradores.add_parser("importar", parents=[saida])
+    p.add_argument("arquivo", help="arquivo CSV, Excel ou JSON")
+    p.set_defaults(func=cmd_colaboradores_importar)
+    p = colaboradores.add_parser("expurgar", parents=[saida], help="apaga em lotes as tarefas e métricas dos colaboradores excluídos (retomável)")
+    p.add_argument("--lote", type=int, help=f"linhas apagadas por commit (padrão: {_b.config_expurgo['tamanho_lote']})")
+    p.add_argument("--simular", action="store_true", help="só lista os colaboradores pendentes e as linhas que restam")
+    p.set_defaults(func=cmd_colaboradores_expurgar)
+
+    tarefas = grupos.add_parser("tarefas", help="listar, exportar, importar e verificar prazos das tarefas").add_subparsers(dest="acao", required=True)
+    for nome in ("listar", "exportar"):
+        p = tarefas.add_parser(nome, parents=[saida])
+        p.add_argument("--cpf", help="somente as tarefas deste colaborador")
+        p.add_argument("--status", choices=["pendente", "em andamento", "concluída"])
+        p.set_defaults(func=cmd_tarefas_listar)
+    p = tarefas.add_parser("importar", parents=[saida])
+    p.add_argument("arquivo", help="arquivo CSV, Excel ou JSON")
+    p.set_defaults(func=cmd_tarefas_importar)
+    p = tarefas.add_parser("prazos", parents=[saida], help="tarefas atrasadas, que vencem hoje e na semana, por colaborador")
+    p.add_argument("--data", help="dia de referência DD/MM/AAAA (padrão: hoje)")
+    p.add_argument("--dias", type=int, default=7, help="dias após hoje considerados \"na semana\" (padrão: 7)")
+    p.add_argument("--resumo", action="store_true", help="no formato json, só o resumo (sem as listas por colaborador)")
+    p.set_defaults(func=cmd_tarefas_prazos)
+
+    relatorio = grupos.add_parser("relatorio", help="relatórios diário, mensal e geral").add_subparsers(dest="acao", required=True)
+    saida_relatorio = argparse.ArgumentParser(add_help=False, parents=[saida])
+    saida_relatorio.add_argument("--memoria", action="store_true", help="mede a memória de cada etapa (tracemalloc) e imprime no stderr")
+    p = relatorio.add_parser("diario", parents=[saida_relatorio])
+    p.add_argument("--cpf", required=True)
+    p.add_argument("--data", required=True, help="DD/MM/AAAA")
+    p.set_defaults(func=cmd_relatorio_diario)
+    p = relatorio.add_parser("mensal", parents=[saida_relatorio])
+    p.add_argument("--cpf", required=True)
+    p.add_argument("--mes", type=_mes, required=True)
+    p.add_argument("--ano", type=int, required=True)
+    p.set_defaults(func=cmd_relatorio_mensal)
+    p = relatorio.add_parser("geral", parents=[saida_relatorio])
+    p.add_argument("--mes", type=_mes, required=True)
+    p.add_argument("--ano", type=int, required=True)
+    p.set_defaults(func=cmd_relatorio_geral)
+
+    metricas = grupos.add_parser("metricas", help="manutenção das métricas diárias").add_subparsers(dest="acao", required=True)
+    p = metricas.add_parser("arquivar", parents=[saida], help="move os meses antigos para a tabela de arquivo (retomável)")
+    p.add_argument("--meses", type=int, help=f"meses mantidos na tabela quente, contando o corrente (padrão: {_b.config_arquivamento['meses_quentes']})")
+    p.add_argument("--simular", action="store_true", help="só conta as linhas de cada mês, sem mover")
+    p.set_defaults(func=cmd_metricas_arquivar)
+
+    ceps = grupos.add_parser("ceps", help="manutenção de endereços").add_subparsers(dest="acao", required=True)
+    ceps.add_parser("preaquecer", parents=[saida]).set_defaults(func=cmd_ceps_preaquecer)
+    p = ceps.add_parser("enriquecer", parents=[saida])
+    p.add_argument("--arquivo", help="arquivo de CEPs (CSV com coluna cep ou um por linha)")
+    p.add_argument("--threads", type=int, default=8)
+    p.add_argument("--taxa", type=float, default=10.0, help="requisições por segundo à API ViaCEP")
+    p.add_argument("--usar-cache", action="store_true", help="aproveita o cache local de CEPs (padrão: consulta a API de novo)")
+    p.set_defaults(func=cmd_ceps_enriquecer)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = criar_parser().parse_args(argv)
+    with contextlib.redirect_stdout(sys.stderr):
+        conn = _b.conectarBD()
+    if conn is None:
+        sys.exit(1)
+    try:
+        args.func(conn, args)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
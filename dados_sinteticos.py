@@ -0,0 +1,227 @@
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import biblioteca as _b
+
+# ====== PARÂMETROS DA GERAÇÃO ======
+
+nomes = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor", "Isabela", "João", "Larissa", "Marcos",
+         "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Thiago", "Vanessa", "William"]
+sobrenomes = ["Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Costa", "Ferreira", "Almeida", "Ribeiro",
+              "Carvalho", "Gomes", "Martins", "Rocha", "Barbosa"]
+cidades = [("São Paulo", "SP", "01"), ("Campinas", "SP", "13"), ("Rio de Janeiro", "RJ", "20"), ("Belo Horizonte", "MG", "30"),
+           ("Curitiba", "PR", "80"), ("Porto Alegre", "RS", "90"), ("Recife", "PE", "50"), ("Salvador", "BA", "40")]
+cargos = [("Analista", 6500), ("Desenvolvedor", 8500), ("Designer", 6000), ("Coordenador", 12000), ("Assistente", 3500),
+          ("Gerente", 16000)]
+# Pesos das prioridades e dos status (tarefas já vencidas tendem a estar concluídas)
+pesos_prioridade = {"baixa": 50, "média": 35, "alta": 15}
+pesos_status_vencida = {"concluída": 70, "em andamento": 15, "pendente": 15}
+pesos_status_futura = {"concluída": 20, "em andamento": 40, "pendente": 40}
+# Notas em que valores altos são ruins (a média individual é sorteada mais baixa)
+notas_negativas = {"estresse", "carga_trabalho", "despertares"}
+# Probabilidade de o colaborador registrar as métricas em um dia útil
+chance_registro = 0.9
+
+
+def _cpf(rng: random.Random) -> str:
+    """
+    Gera um CPF com dígitos verificadores válidos.
+    """
+    base = [rng.randint(0, 9) for _ in range(9)]
+    for tamanho in (9, 10):
+        soma = sum(d * (tamanho + 1 - i) for i, d in enumerate(base[:tamanho]))
+        base.append((soma * 10 % 11) % 10)
+    return "".join(map(str, base))
+
+
+def _escolher(rng: random.Random, pesos: dict) -> str:
+    return rng.choices(list(pesos), weights=list(pesos.values()))[0]
+
+
+def _nota(rng: random.Random, media: float, desvio: float = 1.5) -> int:
+    return max(0, min(10, round(rng.gauss(media, desvio))))
+
+
+# ====== GERADORES ======
+
+def gerar_colaboradores(rng: random.Random, quantidade: int, existentes: set[str] = frozenset()) -> list[dict]:
+    """
+    Gera os colaboradores (CPFs únicos e fora de existentes, endereço, cargo e salário com variação em torno do cargo).
+    """
+    colaboradores, cpfs = [], set(existentes)
+    while len(colaboradores) < quantidade:
+        cpf = _cpf(rng)
+        if cpf in cpfs:
+            continue
+        cpfs.add(cpf)
+        cidade, estado, prefixo_cep = rng.choice(cidades)
+        cargo, salario = rng.choice(cargos)
+        admissao = datetime(2015, 1, 1) + timedelta(days=rng.randint(0, 3650))
+        colaboradores.append({
+            "cpf": cpf,
+            "nome": f"{rng.choice(nomes)} {rng.choice(sobrenomes)} {rng.choice(sobrenomes)}",
+            "nascimento": datetime(1965, 1, 1) + timedelta(days=rng.randint(0, 13000)),
+            "sexo": rng.choice("MF"),
+            "cep": f"{prefixo_cep}{rng.randint(0, 999):03d}-{rng.randint(0, 999):03d}",
+            "logradouro": f"Rua {rng.choice(sobrenomes)}",
+            "numero": str(rng.randint(1, 3000)),
+            "bairro": f"Bairro {rng.choice(sobrenomes)}",
+            "cidade": cidade,
+            "estado": estado,
+            "salario": round(salario * rng.lognormvariate(0, 0.2), 2),
+            "cargo": cargo,
+            "admissao": admissao
+        })
+    return colaboradores
+
+
+def gerar_tarefas(rng: random.Random, cpfs: list[str], quantidade: int, inicio: datetime, dias: int) -> list[dict]:
+    """
+    Gera as tarefas distribuídas entre os colaboradores, com prazos no período e status coerentes com o prazo.
+    """
+    tarefas = []
+    fim = inicio + timedelta(days=dias)
+    for _ in range(quantidade):
+        prazo = inicio + timedelta(days=rng.randint(0, dias + 14))
+        status = _escolher(rng, pesos_status_vencida if prazo < fim else pesos_status_futura)
+        tarefas.append({
+            "cpf": rng.choice(cpfs),
+            "titulo": f"Tarefa {rng.randint(1, 99999)}",
+            "descricao": "Tarefa gerada para testes de carga.",
+            "prioridade": _escolher(rng, pesos_prioridade),
+            "status": status,
+            "prazo": prazo
+        })
+    return tarefas
+
+
+def gerar_metricas(rng: random.Random, cpfs: list[str], inicio: datetime, dias: int) -> list[dict]:
+    """
+    Gera os registros diários (uma linha por dia útil registrado) de cada colaborador. Cada colaborador
+    tem uma média própria por nota e as notas diárias variam em torno dela.
+    """
+    linhas = []
+    for cpf in cpfs:
+        medias = {campo: rng.gauss(4 if campo in notas_negativas else 6.5, 1.2) for campo in _b.notas_metricas_diarias}
+        ritmo = rng.uniform(1, 4)
+        for d in range(dias):
+            dia = inicio + timedelta(days=d)
+            if dia.weekday() >= 5 or rng.random() > chance_registro:
+                continue
+            valores = {campo: _nota(rng, media) for campo, media in medias.items()}
+            concluidas = max(0, round(rng.gauss(ritmo, 1)))
+            atrasadas = rng.randint(0, concluidas) if concluidas and rng.random() < 0.2 else 0
+            valores.update({
+                "tarefas_concluidas": concluidas,
+                "tarefas_andamento": rng.randint(0, 4),
+                "tarefas_pendentes": rng.randint(0, 6),
+                "concluidas_no_prazo": concluidas - atrasadas,
+                "concluidas_atraso": atrasadas
+            })
+            registro = dia + timedelta(hours=17, minutes=rng.randint(0, 179))
+            linhas.append({**valores, "cpf": cpf, "dt_registro": registro})
+    return linhas
+
+
+# ====== GRAVAÇÃO ======
+
+def _inserir_lotes(conn, sql: str, linhas: list[dict], tamanho_lote: int) -> None:
+    cursor = conn.cursor()
+    try:
+        for i in range(0, len(linhas), tamanho_lote):
+            cursor.executemany(sql, linhas[i:i + tamanho_lote])
+            conn.commit()
+    finally:
+        cursor.close()
+
+
+def popular_banco(conn, colaboradores: int, tarefas: int, dias: int, inicio: datetime = datetime(2025, 1, 1),
+                  semente: int = 42, tamanho_lote: int = 5000, acrescentar: bool = False) -> dict:
+    """
+    Gera e grava um conjunto de dados sintético determinístico (mesma semente, mesmos dados).
+
+    Args:
+        conn: Conexão retornada por biblioteca.conectarBD().
+        colaboradores: Quantidade de colaboradores.
+        tarefas: Quantidade total de tarefas.
+        dias: Quantidade de dias de métricas a partir de inicio.
+        inicio: Primeiro dia do período.
+        semente: Semente do gerador pseudoaleatório.
+        tamanho_lote: Linhas por executemany/commit.
+        acrescentar: Se True, os CPFs já gravados no banco são pulados (para acrescentar colaboradores a um banco populado).
+
+    Returns:
+        dict: Quantidade de linhas gravadas por tabela e o tempo total.
+    """
+    comeco = time.perf_counter()
+    rng = random.Random(semente)
+    existentes = set()
+    if acrescentar:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT nr_cpf FROM T_MNDSH_COLABORADOR")
+            existentes = {linha[0] for linha in cursor.fetchall()}
+        finally:
+            cursor.close()
+    lista_colaboradores = gerar_colaboradores(rng, colaboradores, existentes)
+    cpfs = [c["cpf"] for c in lista_colaboradores]
+    lista_tarefas = gerar_tarefas(rng, cpfs, tarefas, inicio, dias)
+    lista_metricas = gerar_metricas(rng, cpfs, inicio, dias)
+
+    _inserir_lotes(conn, """
+        INSERT INTO T_MNDSH_COLABORADOR (nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco,
+                                         ds_bairro, ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao, ds_status)
+        VALUES (:cpf, :nome, :nascimento, :sexo, :cep, :logradouro, :numero, :bairro, :cidade, :estado, :salario, :cargo,
+                :admissao, 'Ativo')
+    """, lista_colaboradores, tamanho_lote)
+    # Tarefas e métricas referenciam o colaborador pelo id gerado na inserção
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT nr_cpf, id FROM T_MNDSH_COLABORADOR")
+        id_por_cpf = dict(cursor.fetchall())
+    finally:
+        cursor.close()
+    for linha in lista_tarefas + lista_metricas:
+        linha["id_colaborador"] = id_por_cpf[linha.pop("cpf")]
+    _inserir_lotes(conn, """
+        INSERT INTO T_MNDSH_TAREFA (id_colaborador, ds_titulo, ds_descricao, ds_prioridade, ds_status, dt_prazo)
+        VALUES (:id_colaborador, :titulo, :descricao, :prioridade, :status, :prazo)
+    """, lista_tarefas, tamanho_lote)
+    colunas = _b.colunas_metricas_diarias
+    _inserir_lotes(conn, f"""
+        INSERT INTO T_MNDSH_METRICA_DIA (id_colaborador, dt_registro, {", ".join(colunas)})
+        VALUES (:id_colaborador, :dt_registro, {", ".join(":" + campo for campo in colunas)})
+    """, lista_metricas, tamanho_lote)
+    return {"colaboradores": len(lista_colaboradores), "tarefas": len(lista_tarefas), "metricas": len(lista_metricas),
+            "segundos": round(time.perf_counter() - comeco, 3)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos determinísticos de colaboradores, tarefas e métricas.")
+    parser.add_argument("-c", "--colaboradores", type=int, default=100)
+    parser.add_argument("-t", "--tarefas", type=int, default=2000)
+    parser.add_argument("-d", "--dias", type=int, default=30)
+    parser.add_argument("--inicio", default="01/01/2025", help="primeiro dia (DD/MM/AAAA)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    args = parser.parse_args(argv)
+
+    if not _b.validar_data(args.inicio):
+        sys.exit("Data inválida! Use DD/MM/AAAA.")
+    if args.sqlite:
+        _b.config_banco["sqlite"] = args.sqlite
+    conn = _b.conectarBD()
+    if conn is None:
+        sys.exit(1)
+    try:
+        resumo = popular_banco(conn, args.colaboradores, args.tarefas, args.dias, _b.data_datetime(args.inicio), args.semente)
+    finally:
+        conn.close()
+    print(resumo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import biblioteca as _b
+
+
+def inspecionar(arquivo: str) -> dict:
+    """
+    Resume o diário offline: entradas pendentes e aplicadas, por tipo e por dia, e o período coberto.
+    """
+    entradas, aplicados = _b.ler_diario(arquivo)
+    pendentes = [e for e in entradas if e["id"] not in aplicados]
+    por_tipo, por_dia, colaboradores = {}, {}, set()
+    for entrada in pendentes:
+        por_tipo[entrada["tipo"]] = por_tipo.get(entrada["tipo"], 0) + 1
+        por_dia[entrada["data"][:10]] = por_dia.get(entrada["data"][:10], 0) + 1
+        colaboradores.add(entrada["cpf"])
+    return {
+        "arquivo": arquivo,
+        "bytes": os.path.getsize(arquivo) if os.path.exists(arquivo) else 0,
+        "entradas": len(entradas),
+        "aplicadas": len(entradas) - len(pendentes),
+        "pendentes": len(pendentes),
+        "pendentes_por_tipo": dict(sorted(por_tipo.items())),
+        "pendentes_por_dia": dict(sorted(por_dia.items())),
+        "colaboradores": len(colaboradores),
+        "mais_antiga": min((e["data"] for e in pendentes), default=None),
+        "mais_recente": max((e["data"] for e in pendentes), default=None)
+    }
+
+
+def gerar(conn, arquivo: str, quantidade: int, dias: int, semente: int = 42) -> dict:
+    """
+    Grava no diário entradas sintéticas (80% check-ins, 20% mudanças de status) de colaboradores e tarefas
+    existentes no banco, espalhadas pelos últimos 'dias' dias, para medir a reprodução.
+    """
+    rng = random.Random(semente)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT nr_cpf FROM T_MNDSH_COLABORADOR ORDER BY nr_cpf")
+        cpfs = [linha[0] for linha in cursor.fetchall()]
+        cursor.execute("""
+            SELECT t.id_tarefa, c.nr_cpf
+            FROM T_MNDSH_TAREFA t
+            JOIN T_MNDSH_COLABORADOR c ON c.id = t.id_colaborador
+            ORDER BY t.id_tarefa
+        """)
+        tarefas = cursor.fetchall()
+    finally:
+        cursor.close()
+    if not cpfs:
+        raise RuntimeError("Não há colaboradores no banco para gerar o diário.")
+    hoje = datetime.now().replace(microsecond=0)
+    usados, contagem = set(), {"checkin": 0, "status_tarefa": 0}
+    inicio = time.perf_counter()
+    for _ in range(quantidade):
+        data = hoje - timedelta(days=rng.randrange(dias), seconds=rng.randrange(36000))
+        if tarefas and rng.random() < 0.2:
+            id_tarefa, cpf = rng.choice(tarefas)
+            entrada = {"tipo": "status_tarefa", "id_tarefa": id_tarefa, "cpf": cpf,
+                       "status": rng.choice(["em andamento", "concluída"])}
+        else:
+            cpf = rng.choice(cpfs)
+            if (cpf, data.date()) in usados:
+                continue
+            usados.add((cpf, data.date()))
+            entrada = {"tipo": "checkin", "cpf": cpf, "notas": {campo: rng.randint(0, 10) for campo in _b.notas_metricas_diarias}}
+        entrada = {"id": f"{rng.getrandbits(128):032x}", "data": data.isoformat(), **entrada}
+        contagem[entrada["tipo"]] += 1
+        with open(arquivo, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+    return {**contagem, "segundos": round(time.perf_counter() - inicio, 3)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspeciona, gera e reproduz o diário offline de check-ins e mudanças de status.")
+    parser.add_argument("acao", choices=["inspecionar", "reproduzir", "gerar"])
+    parser.add_argument("-a", "--arquivo", default=_b.config_diario_offline["arquivo"], help="caminho do diário")
+    parser.add_argument("-l", "--lote", type=int, default=_b.config_diario_offline["tamanho_lote"], help="entradas por transação na reprodução")
+    parser.add_argument("-n", "--quantidade", type=int, default=10000, help="entradas sintéticas (gerar)")
+    parser.add_argument("-d", "--dias", type=int, default=7, help="dias cobertos pelas entradas sintéticas (gerar)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.acao == "inspecionar":
+        resultado = inspecionar(args.arquivo)
+    else:
+        if args.sqlite:
+            _b.config_banco["sqlite"] = args.sqlite
+        with contextlib.redirect_stdout(sys.stderr):
+            conn = _b.conectarBD()
+        if conn is None:
+            sys.exit(1)
+        try:
+            if args.acao == "gerar":
+                resultado = gerar(conn, args.arquivo, args.quantidade, args.dias, args.semente)
+            else:
+                antes = inspecionar(args.arquivo)
+                resultado = {
+                    "data": datetime.now().isoformat(timespec="seconds"),
+                    "banco": "sqlite" if _b.eh_sqlite(conn) else "oracle",
+                    "tamanho_lote": args.lote,
+                    "pendentes_por_tipo": antes["pendentes_por_tipo"],
+                    **_b.reproduzir_diario(conn, args.arquivo, args.lote)
+                }
+        finally:
+            conn.close()
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import argparse
+import time
+
+import biblioteca as _b
+
+parser = argparse.ArgumentParser(description="Gera o índice offline de CEPs a partir de um CSV.")
+parser.add_argument("csv", help="arquivo CSV com as colunas cep, logradouro, bairro, cidade/localidade e estado/uf")
+parser.add_argument("-o", "--saida", default=_b.config_indice_cep["arquivo"], help="arquivo do índice gerado")
+args = parser.parse_args()
+
+inicio = time.perf_counter()
+qtd = _b.construir_indice_cep(args.csv, args.saida)
+print(f"{qtd} CEP(s) gravados em {args.saida} ({time.perf_counter() - inicio:.2f}s)")
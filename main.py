@@ -1,25 +1,22 @@
+import sys
+
 import biblioteca as _b
 
 margem = ' ' * 4
 
-conn = _b.conectarBD()
-
-while True:
-    escolha = _b.menu_opcoes(
-        "===== MENU PRINCIPAL =====\n",
-        ["Administrador", "Colaborador", "Sair"],
-        ["administrador", "colaborador", "sair"]
-    )
-    if escolha == "administrador":
-        _b.limpa_tela()
-        _b.menu_administrador(conn)
-    elif escolha == "colaborador":
-        _b.limpa_tela()
-        _b.menu_colaborador(conn)
-    elif escolha == "sair":
-        print(f"\n {margem} Encerrando sistema...\n")
-        break
-
-conn.close()
-
+# Perfilamento opcional das ações dos menus (equivalente a MINDSHIFT_PERFIL=1 / MINDSHIFT_PERFIL_MEMORIA=1)
+if "--perfil" in sys.argv:
+    _b.config_perfil["ativo"] = True
+if "--perfil-memoria" in sys.argv:
+    _b.config_perfil["memoria"] = True
 
+# A conexão (e o carregamento do pandas/oracledb) só acontece quando um menu precisa do banco;
+# enquanto isso as dependências são importadas em segundo plano.
+_b.precarregar_dependencias()
+_b.iniciar_exportador_metricas()
+_b.iniciar_fila_metricas()
+try:
+    _b.menu_principal()
+finally:
+    _b.encerrar_expurgo()
+    _b.encerrar_fila_metricas()
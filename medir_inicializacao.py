@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# Dependências carregadas sob demanda (medidas separadamente para acompanhar o custo adiado)
+dependencias_tardias = ["pandas", "oracledb", "requests"]
+
+pasta = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importtime(codigo: str) -> dict:
+    """
+    Executa um interpretador novo com -X importtime e retorna o tempo cumulativo (µs) de cada módulo
+    importado diretamente pelo código (primeiro nível) e o total.
+    """
+    processo = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=pasta,
+                              capture_output=True, text=True, check=True)
+    modulos = {}
+    total = 0
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, cumulativo, nome = linha.split("|")
+        if not cumulativo.strip().isdigit():
+            continue
+        nivel = (len(nome) - len(nome.lstrip())) // 2
+        if nivel == 0:
+            modulos[nome.strip()] = int(cumulativo)
+            total += int(cumulativo)
+    return {"total_us": total, "modulos_us": modulos}
+
+
+def medir_menu() -> float:
+    """
+    Inicia o main.py e mede o tempo (ms) até o menu principal aparecer; em seguida escolhe "Sair".
+    """
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([sys.executable, "main.py"], cwd=pasta, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, env={**os.environ, "PYTHONUNBUFFERED": "1"})
+    try:
+        for linha in processo.stdout:
+            if "MENU PRINCIPAL" in linha:
+                decorrido = (time.perf_counter() - inicio) * 1000
+                break
+        else:
+            raise RuntimeError("main.py encerrou sem exibir o menu principal.")
+        processo.communicate("3\n", timeout=30)
+    finally:
+        if processo.poll() is None:
+            processo.kill()
+    return decorrido
+
+
+def resumo(valores: list[float]) -> dict:
+    return {"mediana": statistics.median(valores), "minimo": min(valores), "maximo": max(valores)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização (import da biblioteca e exibição do menu).")
+    parser.add_argument("-n", "--repeticoes", type=int, default=5)
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    importacoes = [medir_importtime("import biblioteca") for _ in range(args.repeticoes)]
+    resultado = {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeticoes": args.repeticoes,
+        "import_biblioteca_ms": resumo([i["modulos_us"].get("biblioteca", 0) / 1000 for i in importacoes]),
+        "ate_menu_ms": resumo([medir_menu() for _ in range(args.repeticoes)]),
+        "dependencias_tardias_ms": {}
+    }
+    for nome in dependencias_tardias:
+        tempos = [medir_importtime(f"import {nome}")["modulos_us"].get(nome, 0) / 1000 for _ in range(args.repeticoes)]
+        resultado["dependencias_tardias_ms"][nome] = resumo(tempos)
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
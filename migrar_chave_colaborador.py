@@ -0,0 +1,95 @@
+import argparse
+import contextlib
+import json
+import sys
+import time
+from datetime import datetime
+
+import biblioteca as _b
+
+
+def estado(conn) -> dict:
+    """
+    Situação de cada tabela filha do colaborador: se ainda tem nr_cpf, se já tem id_colaborador, as linhas
+    com id_colaborador vazio ou diferente do id do CPF (enquanto nr_cpf existir) e as restrições e índices
+    de _b.chaves_colaborador já criados.
+    """
+    resultado = {}
+    cursor = conn.cursor()
+    try:
+        for tabela, definicao in _b.chaves_colaborador.items():
+            colunas = _b.colunas_tabela(conn, tabela)
+            if not colunas:
+                resultado[tabela] = None
+                continue
+            situacao = {"nr_cpf": "nr_cpf" in colunas, "id_colaborador": "id_colaborador" in colunas}
+            cursor.execute(f"SELECT COUNT(*) FROM {tabela}")
+            situacao["linhas"] = cursor.fetchone()[0]
+            if situacao["nr_cpf"] and situacao["id_colaborador"]:
+                cursor.execute(f"""
+                    SELECT COUNT(*)
+                    FROM {tabela} t
+                    LEFT JOIN T_MNDSH_COLABORADOR c ON c.nr_cpf = t.nr_cpf
+                    WHERE t.id_colaborador IS NULL OR t.id_colaborador <> c.id
+                """)
+                situacao["sem_id_correto"] = cursor.fetchone()[0]
+            nomes = list(definicao["restricoes"]) + list(definicao["indices"])
+            if _b.eh_sqlite(conn):
+                cursor.execute("SELECT LOWER(name) FROM sqlite_master WHERE type = 'index' AND tbl_name = :tabela",
+                               {"tabela": tabela})
+            else:
+                cursor.execute("""
+                    SELECT LOWER(constraint_name) FROM user_constraints WHERE table_name = :tabela
+                    UNION
+                    SELECT LOWER(index_name) FROM user_indexes WHERE table_name = :tabela
+                """, {"tabela": tabela})
+            existentes = {linha[0] for linha in cursor.fetchall()}
+            # No banco local a chave estrangeira não tem nome; a chave única é o índice uk_*
+            situacao["restricoes_indices"] = {nome: nome in existentes for nome in nomes
+                                              if not (_b.eh_sqlite(conn) and nome.startswith("fk_"))}
+            resultado[tabela] = situacao
+    finally:
+        cursor.close()
+    return resultado
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Troca a referência ao colaborador de nr_cpf para id_colaborador em tarefas "
+                                                 "e métricas (preenchimento em lotes, chaves e índices sobre o id).")
+    parser.add_argument("--simular", action="store_true", help="só mostra a situação atual, sem alterar o banco")
+    parser.add_argument("-l", "--lote", type=int, default=50000, help="valores da chave primária por lote do preenchimento")
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.sqlite:
+        _b.config_banco["sqlite"] = args.sqlite
+    with contextlib.redirect_stdout(sys.stderr):
+        # O banco local já é convertido ao abrir (ConexaoSQLite); aqui ele só é conferido
+        conn = _b.conectarBD()
+    if conn is None:
+        sys.exit(1)
+    inicio = time.perf_counter()
+    try:
+        resultado = {
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "banco": "sqlite" if _b.eh_sqlite(conn) else "oracle",
+            "antes": estado(conn)
+        }
+        if not args.simular:
+            resultado["convertidas"] = _b.converter_chave_colaborador(conn, args.lote)
+            resultado["depois"] = estado(conn)
+            resultado["visao_metrica"] = _b.tipo_objeto_banco(conn, "T_MNDSH_METRICA")
+        resultado["segundos"] = round(time.perf_counter() - inicio, 3)
+    finally:
+        conn.close()
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4, default=str)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import argparse
+import contextlib
+import json
+import sys
+import time
+from datetime import datetime
+
+import biblioteca as _b
+
+# Contadores de tarefas (inteiros); as notas são NUMBER(3,1)
+colunas_contadores = ["tarefas_concluidas", "tarefas_andamento", "tarefas_pendentes", "concluidas_no_prazo", "concluidas_atraso"]
+
+
+def comandos_tabela_dia() -> list[str]:
+    """
+    DDL de T_MNDSH_METRICA_DIA no Oracle, igual a scripts.sql: uma linha por colaborador e dia, chave única
+    (id_colaborador, dt_dia), partições mensais de dt_registro e índice local em dt_registro.
+    """
+    colunas = ",\n".join(f"    {campo:<24} {'NUMBER' if campo in colunas_contadores else 'NUMBER(3,1)'}"
+                         for campo in _b.colunas_metricas_diarias)
+    return [f"""CREATE TABLE T_MNDSH_METRICA_DIA (
+    id_metrica_dia           NUMBER GENERATED BY DEFAULT ON NULL AS IDENTITY PRIMARY KEY,
+    id_colaborador           NUMBER NOT NULL,
+    dt_registro              DATE DEFAULT SYSDATE NOT NULL,
+    dt_dia                   DATE GENERATED ALWAYS AS (TRUNC(dt_registro)) VIRTUAL,
+{colunas},
+    CONSTRAINT fk_metrica_dia_colaborador_id FOREIGN KEY (id_colaborador) REFERENCES T_MNDSH_COLABORADOR(id) ON DELETE CASCADE,
+    CONSTRAINT uk_metrica_dia_colaborador UNIQUE (id_colaborador, dt_dia)
+)
+PARTITION BY RANGE (dt_registro) INTERVAL (NUMTOYMINTERVAL(1, 'MONTH')) (
+    PARTITION p_metrica_anterior VALUES LESS THAN (DATE '2025-01-01')
+)""", "CREATE INDEX idx_metrica_dia_dt ON T_MNDSH_METRICA_DIA(dt_registro) LOCAL"]
+
+
+def estado(conn) -> dict:
+    """
+    Situação das métricas: o que é T_MNDSH_METRICA (tabela antiga ou visão), se a tabela antiga renomeada
+    ainda existe, e as linhas e dias de cada formato.
+    """
+    resultado = {
+        "T_MNDSH_METRICA": _b.tipo_objeto_banco(conn, "T_MNDSH_METRICA"),
+        "T_MNDSH_METRICA_LEGADO": _b.tipo_objeto_banco(conn, "T_MNDSH_METRICA_LEGADO"),
+        "T_MNDSH_METRICA_DIA": _b.tipo_objeto_banco(conn, "T_MNDSH_METRICA_DIA")
+    }
+    antiga = None
+    if resultado["T_MNDSH_METRICA"] == "table":
+        antiga = "T_MNDSH_METRICA"
+    elif resultado["T_MNDSH_METRICA_LEGADO"]:
+        antiga = "T_MNDSH_METRICA_LEGADO"
+    cursor = conn.cursor()
+    try:
+        if antiga:
+            cursor.execute(f"""
+                SELECT COUNT(*), COUNT(DISTINCT nr_cpf || TO_CHAR(dt_registro, 'YYYYMMDD'))
+                FROM {antiga}
+            """)
+            resultado["linhas_formato_antigo"], resultado["dias_formato_antigo"] = cursor.fetchone()
+        if resultado["T_MNDSH_METRICA_DIA"]:
+            cursor.execute("SELECT COUNT(*) FROM T_MNDSH_METRICA_DIA")
+            resultado["dias_tabela_dia"] = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    return resultado
+
+
+def conferir(conn) -> dict:
+    """
+    Compara, coluna a coluna, a soma dos valores da tabela antiga (primeiro registro de cada categoria no dia,
+    a mesma regra da conversão) com a soma em T_MNDSH_METRICA_DIA nos dias que vieram da tabela antiga.
+
+    Returns:
+        dict: Dias da tabela antiga sem linha em T_MNDSH_METRICA_DIA e as colunas com somas diferentes.
+    """
+    tipo_categoria = {campo: tipo for tipo, campos in _b.campos_metricas_diarias.items() for campo in campos}
+    colunas = _b.colunas_metricas_diarias
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT {", ".join(f"SUM(CASE WHEN tipo_metrica = '{tipo_categoria[campo]}' THEN {campo} END)" for campo in colunas)}
+            FROM (SELECT l.*, ROW_NUMBER() OVER (PARTITION BY nr_cpf, TRUNC(dt_registro), tipo_metrica
+                                                 ORDER BY dt_registro, id_metrica) AS ordem
+                  FROM T_MNDSH_METRICA_LEGADO l) p
+            WHERE ordem = 1
+        """)
+        antigas = cursor.fetchone()
+        cursor.execute(f"""
+            SELECT {", ".join(f"SUM({campo})" for campo in colunas)}
+            FROM T_MNDSH_METRICA_DIA d
+            JOIN T_MNDSH_COLABORADOR c ON c.id = d.id_colaborador
+            WHERE EXISTS (SELECT 1 FROM T_MNDSH_METRICA_LEGADO l
+                          WHERE l.nr_cpf = c.nr_cpf AND TRUNC(l.dt_registro) = d.dt_dia)
+        """)
+        novas = cursor.fetchone()
+        cursor.execute("""
+            SELECT COUNT(*)
+            FROM (SELECT DISTINCT nr_cpf, TRUNC(dt_registro) AS dia FROM T_MNDSH_METRICA_LEGADO) l
+            WHERE NOT EXISTS (SELECT 1 FROM T_MNDSH_METRICA_DIA d
+                              JOIN T_MNDSH_COLABORADOR c ON c.id = d.id_colaborador
+                              WHERE c.nr_cpf = l.nr_cpf AND d.dt_dia = l.dia)
+        """)
+        faltando = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    divergentes = {campo: {"antiga": antiga, "nova": nova} for campo, antiga, nova in zip(colunas, antigas, novas)
+                   if round(float(antiga or 0), 1) != round(float(nova or 0), 1)}
+    return {"dias_sem_conversao": faltando, "colunas_divergentes": divergentes}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Converte T_MNDSH_METRICA (uma linha por categoria) em T_MNDSH_METRICA_DIA "
+                                                 "(uma linha por colaborador e dia) com a visão de compatibilidade.")
+    parser.add_argument("--simular", action="store_true", help="só mostra a situação atual, sem alterar o banco")
+    parser.add_argument("--remover-legado", action="store_true",
+                        help="apaga T_MNDSH_METRICA_LEGADO se a conferência não encontrar diferenças")
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.sqlite:
+        _b.config_banco["sqlite"] = args.sqlite
+    with contextlib.redirect_stdout(sys.stderr):
+        # O banco local já é convertido ao abrir (ConexaoSQLite); aqui ele só é conferido
+        conn = _b.conectarBD()
+    if conn is None:
+        sys.exit(1)
+    inicio = time.perf_counter()
+    try:
+        resultado = {
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "banco": "sqlite" if _b.eh_sqlite(conn) else "oracle",
+            "antes": estado(conn),
+            "passos": []
+        }
+        if not args.simular:
+            if resultado["antes"]["T_MNDSH_METRICA_DIA"] is None:
+                cursor = conn.cursor()
+                try:
+                    for comando in comandos_tabela_dia():
+                        cursor.execute(comando)
+                finally:
+                    cursor.close()
+                resultado["passos"].append("CREATE TABLE T_MNDSH_METRICA_DIA")
+            if resultado["antes"]["T_MNDSH_METRICA"] != "view":
+                resultado["dias_gravados"] = _b.converter_metricas_largas(conn)
+                resultado["passos"].append("converter_metricas_largas")
+            if _b.tipo_objeto_banco(conn, "T_MNDSH_METRICA_LEGADO"):
+                resultado["conferencia"] = conferir(conn)
+                sem_diferencas = not resultado["conferencia"]["dias_sem_conversao"] and not resultado["conferencia"]["colunas_divergentes"]
+                if args.remover_legado and sem_diferencas:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute("DROP TABLE T_MNDSH_METRICA_LEGADO")
+                        conn.commit()
+                    finally:
+                        cursor.close()
+                    resultado["passos"].append("DROP TABLE T_MNDSH_METRICA_LEGADO")
+            resultado["depois"] = estado(conn)
+        resultado["segundos"] = round(time.perf_counter() - inicio, 3)
+    finally:
+        conn.close()
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4, default=str)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
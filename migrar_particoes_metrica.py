@@ -0,0 +1,142 @@
+import argparse
+import contextlib
+import json
+import sys
+import time
+from datetime import datetime
+
+import biblioteca as _b
+
+# Índices de T_MNDSH_METRICA_DIA que passam a ser locais (a chave primária e uk_metrica_dia_colaborador continuam globais)
+indices_locais = ["idx_metrica_dia_dt"]
+
+
+def estado_particoes(conn) -> dict:
+    """
+    Descreve o particionamento atual de T_MNDSH_METRICA_DIA: tipo, intervalo, partições (com as linhas
+    estimadas pelas estatísticas) e a localidade dos índices.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT partitioning_type, interval
+            FROM user_part_tables
+            WHERE table_name = 'T_MNDSH_METRICA_DIA'
+        """)
+        linha = cursor.fetchone()
+        if linha is None:
+            return {"particionada": False}
+        cursor.execute("""
+            SELECT partition_name, high_value, num_rows
+            FROM user_tab_partitions
+            WHERE table_name = 'T_MNDSH_METRICA_DIA'
+            ORDER BY partition_position
+        """)
+        particoes = [{"nome": nome, "limite": str(limite), "linhas": linhas} for nome, limite, linhas in cursor.fetchall()]
+        cursor.execute("""
+            SELECT i.index_name, NVL(p.locality, 'GLOBAL (não particionado)')
+            FROM user_indexes i
+            LEFT JOIN user_part_indexes p ON p.index_name = i.index_name
+            WHERE i.table_name = 'T_MNDSH_METRICA_DIA'
+            ORDER BY i.index_name
+        """)
+        indices = {nome.lower(): localidade for nome, localidade in cursor.fetchall()}
+    finally:
+        cursor.close()
+    return {"particionada": True, "tipo": linha[0], "intervalo": linha[1], "particoes": particoes, "indices": indices}
+
+
+def comando_particionamento(conn) -> str:
+    """
+    Monta o ALTER TABLE que converte a tabela existente em particionada por intervalo mensal (Oracle 12.2 ou
+    superior, ONLINE: leituras e gravações continuam durante a conversão). A primeira partição termina no
+    mês do registro mais antigo; as seguintes são criadas pelo intervalo.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT MIN(dt_registro) FROM T_MNDSH_METRICA_DIA")
+        mais_antigo = cursor.fetchone()[0] or datetime.now()
+    finally:
+        cursor.close()
+    limite = f"{mais_antigo.year:04d}-{mais_antigo.month:02d}-01"
+    return (f"ALTER TABLE T_MNDSH_METRICA_DIA MODIFY "
+            f"PARTITION BY RANGE (dt_registro) INTERVAL (NUMTOYMINTERVAL(1, 'MONTH')) "
+            f"(PARTITION p_metrica_anterior VALUES LESS THAN (DATE '{limite}')) "
+            f"ONLINE UPDATE INDEXES ({', '.join(f'{indice} LOCAL' for indice in indices_locais)})")
+
+
+def verificar_poda(conn, mes: int, ano: int) -> list[dict]:
+    """
+    EXPLAIN PLAN da consulta mensal de buscar_metricas() com as datas do mês como literais, para conferir
+    que o acesso é PARTITION RANGE SINGLE (uma só partição lida).
+    """
+    inicio, fim = _b.faixa_registro(mes=mes, ano=ano)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            EXPLAIN PLAN SET STATEMENT_ID = 'mindshift_poda' FOR
+            SELECT * FROM T_MNDSH_METRICA_DIA
+            WHERE dt_registro >= DATE '{inicio:%Y-%m-%d}' AND dt_registro < DATE '{fim:%Y-%m-%d}'
+        """)
+        cursor.execute("""
+            SELECT operation, options, object_name, partition_start, partition_stop
+            FROM plan_table
+            WHERE statement_id = 'mindshift_poda'
+            ORDER BY id
+        """)
+        plano = [{"operacao": f"{operacao} {opcoes or ''}".strip(), "objeto": objeto, "particao_inicial": inicial,
+                  "particao_final": final} for operacao, opcoes, objeto, inicial, final in cursor.fetchall()]
+        cursor.execute("DELETE FROM plan_table WHERE statement_id = 'mindshift_poda'")
+        conn.commit()
+    finally:
+        cursor.close()
+    return plano
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Converte T_MNDSH_METRICA_DIA em tabela particionada por mês (dt_registro) com índices locais.")
+    parser.add_argument("--simular", action="store_true", help="só mostra o estado atual e o comando, sem alterar o banco")
+    parser.add_argument("--mes", type=int, help="mês usado na verificação da poda de partições (padrão: mês atual)")
+    parser.add_argument("--ano", type=int, help="ano usado na verificação da poda de partições (padrão: ano atual)")
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    parser.add_argument("-o", "--saida", help="arquivo JSON de resultado (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.sqlite:
+        _b.config_banco["sqlite"] = args.sqlite
+    with contextlib.redirect_stdout(sys.stderr):
+        conn = _b.conectarBD()
+    if conn is None:
+        sys.exit(1)
+    hoje = datetime.now()
+    inicio = time.perf_counter()
+    try:
+        resultado = {"data": hoje.isoformat(timespec="seconds"), "banco": "sqlite" if _b.eh_sqlite(conn) else "oracle"}
+        if _b.eh_sqlite(conn):
+            # O banco local não tem partições; as consultas por faixa de dt_registro usam idx_metrica_dia_dt
+            resultado["particionamento"] = "não se aplica ao banco local SQLite"
+        else:
+            resultado["antes"] = estado_particoes(conn)
+            if not resultado["antes"]["particionada"]:
+                resultado["comando"] = comando_particionamento(conn)
+                if not args.simular:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute(resultado["comando"])
+                    finally:
+                        cursor.close()
+                    resultado["depois"] = estado_particoes(conn)
+            resultado["poda"] = verificar_poda(conn, args.mes or hoje.month, args.ano or hoje.year)
+        resultado["segundos"] = round(time.perf_counter() - inicio, 3)
+    finally:
+        conn.close()
+
+    texto = json.dumps(resultado, ensure_ascii=False, indent=4, default=str)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    print(texto)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+import argparse
+import ast
+import contextlib
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+import biblioteca as _b
+
+# ====== CATÁLOGO DOS COMANDOS ======
+
+pasta = os.path.dirname(os.path.abspath(__file__))
+# Tabelas grandes em que varreduras completas e filtros sem índice são sinalizados
+tabelas_monitoradas = ["T_MNDSH_METRICA_DIA", "T_MNDSH_TAREFA"]
+# Valores fixos dos binds (os mesmos em toda execução, para o relatório poder ser comparado entre versões), com os
+# tipos da execução real: datas como datetime e, nos binds convertidos por TO_DATE(:bind, 'DD/MM/YYYY'), como texto
+cpf_exemplo = "12345678909"
+data_exemplo = datetime(2025, 1, 1)
+binds_exemplo = {
+    "cpf": cpf_exemplo, "cpf_colaborador": cpf_exemplo, "id": 1, "id_tarefa": 1, "id_colaborador": 1, "mes": 1,
+    "ano": 2025, "status": "pendente", "novo_status": "pendente", "base": "%Silva%", "valor": "x", "linhas": 1,
+    "deslocamento": 0, "data": data_exemplo, "dia": data_exemplo, "hoje": data_exemplo, "inicio": data_exemplo,
+    "fim": datetime(2025, 2, 1), "limite": data_exemplo, "prazo": data_exemplo, "nasc": datetime(1990, 1, 1),
+    "admissao": datetime(2020, 1, 1), "demissao": None, "criacao": data_exemplo, "modificacao": data_exemplo,
+    "nome": "Ana Silva", "sexo": "F", "cep": "01001000", "logradouro": "Praça da Sé", "numero": 1, "bairro": "Sé",
+    "cidade": "São Paulo", "estado": "SP", "salario": 5000.0, "cargo": "Analista", "titulo": "Relatório mensal",
+    "descricao": "", "prioridade": "média"
+}
+# Comandos montados em tempo de execução (f-strings): capturados chamando as funções com binds de exemplo
+
+
+def _com_respostas(respostas: dict, chamada):
+    """
+    Chamada representativa em que as consultas da gravadora que contêm um trecho de 'respostas' ({trecho do SQL em
+    maiúsculas: linhas}) devolvem essas linhas, para a função passar pelas conferências de estado (colaborador
+    existente, tipo do objeto, colunas, faixa da chave) e chegar aos comandos seguintes.
+    """
+    def chamar(conn):
+        conn.respostas = respostas
+        return chamada(conn)
+    return chamar
+
+
+# Respostas às conferências feitas antes dos comandos: colaborador ativo e objeto existente como tabela
+colaborador_existente = {"SELECT NR_CPF, ID FROM T_MNDSH_COLABORADOR": [(cpf_exemplo, 1)]}
+objeto_tabela = {"FROM USER_OBJECTS": [("table",)], "FROM SQLITE_MASTER": [("table",)]}
+chamadas_representativas = {
+    "obter_colaborador[cpf]": lambda conn: _b.obter_colaborador(conn, cpf_exemplo),
+    "obter_colaborador[id]": lambda conn: _b.obter_colaborador(conn, "1"),
+    "atualizar_campo_colaborador[texto]": lambda conn: _b.atualizar_campo_colaborador(conn, 1, "ds_cargo", "Analista"),
+    "atualizar_campo_colaborador[data]": lambda conn: _b.atualizar_campo_colaborador(conn, 1, "dt_admissao", "01/01/2020"),
+    "atualizar_status_tarefa[id]": lambda conn: _b.atualizar_status_tarefa(conn, 1, "pendente"),
+    "atualizar_status_tarefa[id,cpf]": lambda conn: _b.atualizar_status_tarefa(conn, 1, "pendente", cpf_exemplo),
+    "atualizar_campo_tarefa[texto]": lambda conn: _b.atualizar_campo_tarefa(conn, 1, "ds_titulo", "Relatório mensal"),
+    "atualizar_campo_tarefa[prazo]": lambda conn: _b.atualizar_campo_tarefa(conn, 1, "dt_prazo", "01/01/2025"),
+    "consultar_tarefas[todas]": lambda conn: _b.consultar_tarefas(conn),
+    "consultar_tarefas[cpf,status,pagina]": lambda conn: _b.consultar_tarefas(conn, cpf_exemplo, "pendente", 20, 0),
+    "consultar_tarefas_admin[todas]": lambda conn: _b.consultar_tarefas_admin(conn),
+    "consultar_tarefas_admin[status]": lambda conn: _b.consultar_tarefas_admin(conn, status="pendente"),
+    "consultar_tarefas_admin[id]": lambda conn: _b.consultar_tarefas_admin(conn, 1),
+    "consultar_tarefas_admin[id,status]": lambda conn: _b.consultar_tarefas_admin(conn, 1, "pendente"),
+    "contar_tarefas_colaboradores": lambda conn: _b.contar_tarefas_colaboradores(conn, [cpf_exemplo]),
+    "ids_colaboradores": lambda conn: _b.ids_colaboradores(conn, [cpf_exemplo]),
+    "gravar_metricas_dia": _com_respostas(colaborador_existente, lambda conn: _b.gravar_metricas_dia(conn, cpf_exemplo, {})),
+    "gravar_metricas_lote": _com_respostas(colaborador_existente, lambda conn: _b.gravar_metricas_lote(
+        conn, [{"cpf": cpf_exemplo, "valores": {}, "dt_registro": data_exemplo}])),
+    "buscar_metricas[cpf,data]": lambda conn: _b.buscar_metricas(conn, cpf=cpf_exemplo, data="01/01/2025"),
+    "buscar_metricas[cpf,mes,ano]": lambda conn: _b.buscar_metricas(conn, cpf=cpf_exemplo, mes=1, ano=2025),
+    "buscar_metricas[mes,ano]": lambda conn: _b.buscar_metricas(conn, mes=1, ano=2025),
+    "buscar_metricas[todas]": lambda conn: _b.buscar_metricas(conn),
+    "_conferir_diario": lambda conn: _b._conferir_diario(conn, [{"id": "1", "tipo": "status_tarefa", "cpf": cpf_exemplo,
+                                                                "id_tarefa": 1, "data": data_exemplo.isoformat()}]),
+    "pendencias_expurgo": _com_respostas({"FROM T_MNDSH_COLABORADOR": [(1, cpf_exemplo, data_exemplo)], "COUNT(*)": [(1,)]},
+                                         _b.pendencias_expurgo),
+    "_apagar_lote_colaborador[tarefa]": lambda conn: _b._apagar_lote_colaborador(conn, conn.cursor(), "T_MNDSH_TAREFA", 1, 1000),
+    "_apagar_lote_colaborador[metrica_dia]": lambda conn: _b._apagar_lote_colaborador(conn, conn.cursor(), "T_MNDSH_METRICA_DIA", 1, 1000),
+    "_arquivar_mes": lambda conn: _b._arquivar_mes(conn, data_exemplo, datetime(2025, 2, 1)),
+    # Só no Oracle: partições (arquivar_metricas) e preenchimento no lugar (converter_chave_colaborador)
+    "_liberar_particao": lambda conn: _b.eh_sqlite(conn) or _b._liberar_particao(conn, data_exemplo),
+    "colunas_tabela": lambda conn: _b.colunas_tabela(conn, "T_MNDSH_TAREFA"),
+    "converter_metricas_largas": _com_respostas(objeto_tabela, _b.converter_metricas_largas),
+    "converter_chave_colaborador": _com_respostas({**objeto_tabela, "PRAGMA TABLE_XINFO": [(0, "id_colaborador"), (1, "dt_registro")]},
+                                                  _b.converter_chave_colaborador),
+    "_preencher_id_colaborador": _com_respostas({"MIN(": [(1, 1)]}, lambda conn: _b.eh_sqlite(conn) or _b._preencher_id_colaborador(
+        conn, "T_MNDSH_METRICA_DIA", "id_metrica_dia", 1000))
+}
+# Conversões de esquema: leem tabelas e colunas do formato anterior (T_MNDSH_METRICA_LEGADO, nr_cpf nas tabelas
+# filhas, tabelas <tabela>_CPF), que não existem depois da conversão; sem plano nesse caso, ficam sem alerta de erro
+migracoes = ["converter_metricas_largas", "converter_chave_colaborador", "_preencher_id_colaborador"]
+# Só os comandos de consulta e alteração de dados entram no catálogo (DDL e PRAGMA não têm plano comparável)
+comandos_dml = ["SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "WITH"]
+# Funções aplicadas a colunas que impedem o uso de índices comuns sobre a coluna
+funcoes_em_coluna = ["TRUNC", "EXTRACT", "UPPER", "LOWER", "TO_CHAR", "TO_DATE", "NVL", "SUBSTR"]
+_palavras_reservadas = {"WHERE", "JOIN", "ON", "SET", "ORDER", "GROUP", "INNER", "LEFT", "RIGHT", "VALUES", "WHEN", "AND", "OR"}
+
+
+def _normalizar(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def _nomes_binds(sql: str) -> list[str]:
+    """
+    Nomes dos binds (:nome) do comando, ignorando o conteúdo de literais como 'HH24:MI:SS'.
+    """
+    sem_literais = re.sub(r"'[^']*'", "''", sql)
+    return list(dict.fromkeys(re.findall(r"(?<![:\w]):(\w+)", sem_literais)))
+
+
+def _binds_exemplo(sql: str) -> dict:
+    """
+    Valores de exemplo dos binds do comando: os de binds_exemplo, com as datas passadas como texto DD/MM/AAAA
+    quando o bind é convertido por TO_DATE no próprio comando.
+    """
+    binds = {}
+    for nome in _nomes_binds(sql):
+        valor = binds_exemplo.get(nome)
+        if isinstance(valor, datetime) and re.search(rf"\bTO_DATE\s*\(\s*:{nome}\b", sql, re.IGNORECASE):
+            valor = valor.strftime("%d/%m/%Y")
+        binds[nome] = valor
+    return binds
+
+
+def _dml(sql: str) -> bool:
+    """
+    True para consultas e alterações de dados sobre as tabelas do sistema.
+    """
+    texto = sql.upper()
+    return "T_MNDSH_" in texto and texto.split(None, 1)[0] in comandos_dml
+
+
+def descobrir_literais(arquivo: str) -> tuple[list[dict], list[str]]:
+    """
+    Lê o código-fonte e extrai os comandos SQL escritos como literais nas chamadas execute/executemany.
+
+    Args:
+        arquivo: Caminho do módulo Python.
+
+    Returns:
+        tuple: (comandos, nao_cobertos). Cada comando é um dict com nome ("funcao#n"), sql e binds de exemplo;
+        nao_cobertos lista as funções com SQL montado em tempo de execução (f-string ou variável).
+    """
+    with open(arquivo, encoding="utf-8") as f:
+        arvore = ast.parse(f.read())
+    comandos, nao_cobertos = [], []
+    for funcao in ast.walk(arvore):
+        if not isinstance(funcao, ast.FunctionDef):
+            continue
+        ordem = 0
+        for no in ast.walk(funcao):
+            if not (isinstance(no, ast.Call) and isinstance(no.func, ast.Attribute)
+                    and no.func.attr in ("execute", "executemany") and no.args):
+                continue
+            argumento = no.args[0]
+            if isinstance(argumento, ast.Constant) and isinstance(argumento.value, str):
+                if not _dml(argumento.value):
+                    continue
+                ordem += 1
+                sql = _normalizar(argumento.value)
+                comandos.append({"nome": f"{funcao.name}#{ordem}", "origem": "literal", "sql": sql,
+                                 "binds": _binds_exemplo(sql)})
+            elif funcao.name not in ("execute", "executemany", "_executar"):
+                nao_cobertos.append(funcao.name)
+    return comandos, sorted(set(nao_cobertos))
+
+
+class _CursorGravador:
+    """
+    Cursor que só anota os comandos recebidos e devolve as respostas da conexão para o comando (vazias por padrão;
+    nada é executado).
+    """
+    description = None
+    rowcount = 0
+
+    def __init__(self, conexao: "_ConexaoGravadora"):
+        self._conexao = conexao
+        self._linhas = []
+
+    def execute(self, sql: str, params=None):
+        self._conexao.anotados.append((sql, params))
+        texto = _normalizar(sql).upper()
+        self._linhas = next((list(linhas) for trecho, linhas in self._conexao.respostas.items() if trecho in texto), [])
+        return self
+
+    def executemany(self, sql: str, params) -> None:
+        params = list(params)
+        self._conexao.anotados.append((sql, params[0] if params else None))
+
+    def fetchone(self):
+        return self._linhas.pop(0) if self._linhas else None
+
+    def fetchmany(self, quantidade=None):
+        linhas, self._linhas = self._linhas, []
+        return linhas
+
+    def fetchall(self):
+        linhas, self._linhas = self._linhas, []
+        return linhas
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self) -> None:
+        pass
+
+
+class _ConexaoGravadora:
+    def __init__(self):
+        self.anotados = []
+        self.respostas = {}
+
+    def cursor(self):
+        return _CursorGravador(self)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+class _ConexaoGravadoraSQLite(_ConexaoGravadora, _b.ConexaoSQLite):
+    """
+    Gravadora reconhecida por eh_sqlite(), para capturar a variante do banco local dos comandos que mudam de dialeto.
+    """
+
+
+def capturar_dinamicos(sqlite: bool = False) -> list[dict]:
+    """
+    Chama as funções de chamadas_representativas com uma conexão gravadora e retorna os comandos de dados (DML sobre
+    as tabelas do sistema) montados por elas, no dialeto do banco local quando sqlite=True.
+    """
+    comandos = []
+    for nome, chamada in chamadas_representativas.items():
+        conn = _ConexaoGravadoraSQLite() if sqlite else _ConexaoGravadora()
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                chamada(conn)
+        except Exception:
+            pass  # o resultado fixo pode quebrar a função depois do execute; o comando já foi anotado
+        anotados = [(sql, params) for sql, params in conn.anotados if _dml(sql)]
+        for i, (sql, params) in enumerate(anotados, start=1):
+            binds = dict(params) if isinstance(params, dict) else {}
+            comando = {"nome": nome if len(anotados) == 1 else f"{nome}#{i}", "origem": "capturado",
+                       "sql": _normalizar(sql), "binds": binds}
+            if nome.split("[")[0] in migracoes:
+                comando["migracao"] = True
+            comandos.append(comando)
+    return comandos
+
+
+def catalogo(arquivos: list[str], sqlite: bool = False) -> tuple[list[dict], list[str]]:
+    """
+    Reúne em um só lugar os comandos literais dos arquivos e os capturados das funções dinâmicas,
+    sem repetições e ordenados pelo nome.
+    """
+    comandos, nao_cobertos = capturar_dinamicos(sqlite), []
+    for arquivo in arquivos:
+        literais, dinamicos = descobrir_literais(arquivo)
+        comandos += literais
+        nao_cobertos += dinamicos
+    vistos, unicos = set(), []
+    for comando in comandos:
+        if comando["sql"] not in vistos:
+            vistos.add(comando["sql"])
+            unicos.append(comando)
+    capturadas = {nome.split("[")[0] for nome in chamadas_representativas}
+    return sorted(unicos, key=lambda c: c["nome"]), sorted(set(nao_cobertos) - capturadas)
+
+
+# ====== PLANOS DE EXECUÇÃO ======
+
+def esquema(conn) -> dict:
+    """
+    Lê as colunas e os índices das tabelas do sistema.
+
+    Returns:
+        dict: {tabela: {"colunas": set, "indices": {nome: [colunas em ordem]}}}, nomes de colunas em minúsculas.
+    """
+    cursor = conn.cursor()
+    tabelas = {}
+    try:
+        if _b.eh_sqlite(conn):
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'T_MNDSH_%'")
+            for (tabela,) in cursor.fetchall():
+                cursor.execute(f"PRAGMA table_xinfo({tabela})")
+                info = cursor.fetchall()
+                indices = {f"pk_{tabela.lower()}": [c[1].lower() for c in info if c[5]]}
+                cursor.execute(f"PRAGMA index_list({tabela})")
+                for indice in [linha[1] for linha in cursor.fetchall()]:
+                    cursor.execute(f"PRAGMA index_info({indice})")
+                    indices[indice] = [c[2].lower() for c in sorted(cursor.fetchall())]
+                tabelas[tabela.upper()] = {"colunas": {c[1].lower() for c in info}, "indices": indices}
+        else:
+            cursor.execute("SELECT table_name, column_name FROM user_tab_columns WHERE table_name LIKE 'T\\_MNDSH\\_%' ESCAPE '\\'")
+            for tabela, coluna in cursor.fetchall():
+                tabelas.setdefault(tabela, {"colunas": set(), "indices": {}})["colunas"].add(coluna.lower())
+            cursor.execute("""
+                SELECT table_name, index_name, column_name
+                FROM user_ind_columns
+                WHERE table_name LIKE 'T\\_MNDSH\\_%' ESCAPE '\\'
+                ORDER BY table_name, index_name, column_position
+            """)
+            for tabela, indice, coluna in cursor.fetchall():
+                if tabela in tabelas:
+                    tabelas[tabela]["indices"].setdefault(indice.lower(), []).append(coluna.lower())
+    finally:
+        cursor.close()
+    return tabelas
+
+
+def plano_sqlite(conn, comando: dict) -> list[str]:
+    exemplo = _binds_exemplo(comando["sql"])
+    binds = {nome: comando["binds"].get(nome, exemplo[nome]) for nome in exemplo}
+    cursor = conn.cursor()
+    try:
+        cursor.execute("EXPLAIN QUERY PLAN " + comando["sql"], binds)
+        return [linha[3] for linha in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def plano_oracle(conn, comando: dict) -> list[str]:
+    """
+    EXPLAIN PLAN sem valores de binds, lido da PLAN_TABLE sem custo/cardinalidade (que variam com as estatísticas
+    e atrapalhariam a comparação entre versões). Equivale ao formato BASIC do DBMS_XPLAN com os predicados.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("EXPLAIN PLAN SET STATEMENT_ID = 'mindshift_planos' FOR " + comando["sql"])
+        cursor.execute("""
+            SELECT depth, operation, options, object_name, access_predicates, filter_predicates
+            FROM plan_table
+            WHERE statement_id = 'mindshift_planos'
+            ORDER BY id
+        """)
+        linhas = []
+        for profundidade, operacao, opcoes, objeto, acesso, filtro in cursor.fetchall():
+            texto = "  " * profundidade + " ".join(p for p in (operacao, opcoes, objeto) if p)
+            if acesso:
+                texto += f" [acesso: {acesso}]"
+            if filtro:
+                texto += f" [filtro: {filtro}]"
+            linhas.append(texto)
+        cursor.execute("DELETE FROM plan_table WHERE statement_id = 'mindshift_planos'")
+        return linhas
+    finally:
+        cursor.close()
+        conn.rollback()
+
+
+def _apelidos(sql: str) -> dict:
+    """
+    Mapeia tabelas e apelidos (em maiúsculas) para o nome da tabela.
+    """
+    apelidos = {}
+    for tabela, apelido in re.findall(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(T_MNDSH_\w+)(?:\s+(\w+))?", sql, re.IGNORECASE):
+        apelidos[tabela.upper()] = tabela.upper()
+        if apelido and apelido.upper() not in _palavras_reservadas:
+            apelidos[apelido.upper()] = tabela.upper()
+    return apelidos
+
+
+def _trechos_predicados(sql: str) -> list[str]:
+    """
+    Trechos de WHERE e ON (até GROUP BY/ORDER BY/OFFSET ou a próxima cláusula), sem os literais de texto.
+    """
+    sem_literais = re.sub(r"'[^']*'", "''", sql)
+    return re.findall(r"\b(?:WHERE|ON)\b(.*?)(?=\bGROUP BY\b|\bORDER BY\b|\bOFFSET\b|\bFETCH\b|\bJOIN\b|\bWHERE\b|$)",
+                      sem_literais, re.IGNORECASE)
+
+
+def _tabela_da_coluna(apelido: str, coluna: str, apelidos: dict, tabelas: dict) -> str | None:
+    if apelido:
+        return apelidos.get(apelido.upper())
+    candidatas = sorted(t for t in set(apelidos.values()) if coluna in tabelas.get(t, {}).get("colunas", ()))
+    return candidatas[0] if candidatas else None
+
+
+def analisar(comando: dict, plano: list[str], tabelas: dict) -> list[dict]:
+    """
+    Aplica as regras de alerta a um comando e ao seu plano.
+
+    Regras:
+        - VARREDURA_COMPLETA: leitura da tabela inteira (SCAN sem índice / TABLE ACCESS FULL) em tabela monitorada.
+        - FUNCAO_EM_COLUNA_INDEXADA: coluna indexada envolvida por função (ex.: TRUNC(dt_registro)) no filtro.
+        - SEM_INDICE: coluna de tabela monitorada filtrada que não está em nenhum prefixo de índice cujas colunas
+          sejam todas filtradas no comando (ex.: dt_dia com id_colaborador usa (id_colaborador, dt_dia)).
+
+    Returns:
+        list[dict]: Alertas ordenados (tipo, tabela, coluna e detalhe).
+    """
+    apelidos = _apelidos(comando["sql"])
+    alertas = []
+    for linha in plano:
+        sqlite = re.match(r"\s*SCAN (\w+)(?: AS (\w+))?(.*)$", linha)
+        if sqlite and "INDEX" not in sqlite.group(3) and "PRIMARY KEY" not in sqlite.group(3):
+            tabela = apelidos.get(sqlite.group(1).upper(), sqlite.group(1).upper())
+        else:
+            oracle = re.match(r"\s*TABLE ACCESS (?:STORAGE )?FULL (\w+)", linha)
+            tabela = oracle.group(1).upper() if oracle else None
+        if tabela in tabelas_monitoradas:
+            alertas.append({"tipo": "VARREDURA_COMPLETA", "tabela": tabela, "coluna": "", "detalhe": linha.strip()})
+
+    filtradas = {}
+    for trecho in _trechos_predicados(comando["sql"]):
+        padrao_funcao = rf"\b({'|'.join(funcoes_em_coluna)})\s*\(\s*(?:\w+\s+FROM\s+)?(?:(\w+)\.)?(\w+)\s*[,)]"
+        for funcao, apelido, coluna in re.findall(padrao_funcao, trecho, re.IGNORECASE):
+            coluna = coluna.lower()
+            tabela = _tabela_da_coluna(apelido, coluna, apelidos, tabelas)
+            indices = sorted(nome for nome, cols in tabelas.get(tabela, {}).get("indices", {}).items() if coluna in cols)
+            if indices:
+                alertas.append({"tipo": "FUNCAO_EM_COLUNA_INDEXADA", "tabela": tabela, "coluna": coluna,
+                                "detalhe": f"{funcao.upper()}({coluna}) impede o uso de {', '.join(indices)}"})
+        for apelido, coluna in re.findall(r"(?<![:\w.])(?:(\w+)\.)?([A-Za-z_]\w*)\s*(?:=|<>|!=|<=|>=|<|>|\bLIKE\b|\bIN\b|\bBETWEEN\b)",
+                                          trecho, re.IGNORECASE):
+            coluna = coluna.lower()
+            tabela = _tabela_da_coluna(apelido, coluna, apelidos, tabelas)
+            if tabela in tabelas_monitoradas:
+                filtradas.setdefault(tabela, set()).add(coluna)
+    for tabela, colunas in filtradas.items():
+        # Coluna coberta: está no maior prefixo de algum índice em que todas as colunas são filtradas no comando
+        cobertas = set()
+        for cols in tabelas[tabela]["indices"].values():
+            for coluna in cols:
+                if coluna not in colunas:
+                    break
+                cobertas.add(coluna)
+        for coluna in sorted(colunas - cobertas):
+            alertas.append({"tipo": "SEM_INDICE", "tabela": tabela, "coluna": coluna,
+                            "detalhe": f"nenhum índice de {tabela} tem {coluna} em um prefixo filtrado pelo comando"})
+    unicos = {json.dumps(a, sort_keys=True): a for a in alertas}
+    return [unicos[chave] for chave in sorted(unicos)]
+
+
+def capturar_planos(conn, arquivos: list[str]) -> dict:
+    """
+    Gera o relatório de planos de todos os comandos do catálogo.
+
+    Args:
+        conn: Conexão retornada por biblioteca.conectarBD() (Oracle ou banco local SQLite).
+        arquivos: Módulos Python de onde os comandos literais são extraídos.
+
+    Returns:
+        dict: Banco, comandos (com plano e alertas), resumo por tipo de alerta e funções não cobertas.
+    """
+    comandos, nao_cobertos = catalogo(arquivos, _b.eh_sqlite(conn))
+    tabelas = esquema(conn)
+    explicar = plano_sqlite if _b.eh_sqlite(conn) else plano_oracle
+    resumo = {}
+    for comando in comandos:
+        try:
+            comando["plano"] = explicar(conn, comando)
+            comando["alertas"] = analisar(comando, comando["plano"], tabelas)
+        except Exception as e:
+            if comando.get("migracao"):
+                comando["plano"] = [f"(sem plano: migração sobre o esquema anterior; {type(e).__name__}: {e})"]
+                comando["alertas"] = []
+            else:
+                comando["plano"] = []
+                comando["alertas"] = [{"tipo": "ERRO_PLANO", "tabela": "", "coluna": "", "detalhe": f"{type(e).__name__}: {e}"}]
+        for alerta in comando["alertas"]:
+            resumo[alerta["tipo"]] = resumo.get(alerta["tipo"], 0) + 1
+    return {
+        "banco": "sqlite" if _b.eh_sqlite(conn) else "oracle",
+        "comandos": comandos,
+        "resumo": dict(sorted(resumo.items())),
+        "nao_cobertos": nao_cobertos
+    }
+
+
+def formatar_texto(relatorio: dict) -> str:
+    """
+    Formata o relatório em texto estável (sem datas nem tempos), próprio para diff entre versões.
+    """
+    linhas = [f"# Planos de execução ({relatorio['banco']}) - {len(relatorio['comandos'])} comandos",
+              f"# Tabelas monitoradas: {', '.join(tabelas_monitoradas)}", ""]
+    for comando in relatorio["comandos"]:
+        linhas.append(f"== {comando['nome']} ({comando['origem']}) ==")
+        linhas.append(f"SQL: {comando['sql']}")
+        if comando["binds"]:
+            linhas.append("Binds: " + ", ".join(f"{k}={v!r}" for k, v in sorted(comando["binds"].items())))
+        linhas.append("Plano:")
+        linhas += [f"  {passo}" for passo in comando["plano"]] or ["  (vazio)"]
+        if comando["alertas"]:
+            linhas.append("Alertas:")
+            linhas += [f"  {a['tipo']}: {a['detalhe']}" for a in comando["alertas"]]
+        linhas.append("")
+    linhas.append("== RESUMO ==")
+    linhas += [f"{tipo}: {quantidade}" for tipo, quantidade in relatorio["resumo"].items()] or ["Nenhum alerta."]
+    if relatorio["nao_cobertos"]:
+        linhas.append("SQL montado em tempo de execução (fora do catálogo): " + ", ".join(relatorio["nao_cobertos"]))
+    return "\n".join(linhas) + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Captura os planos de execução dos comandos SQL do sistema e sinaliza varreduras completas, funções sobre colunas indexadas e filtros sem índice.")
+    parser.add_argument("arquivos", nargs="*", default=[os.path.join(pasta, "biblioteca.py")], help="módulos com os comandos SQL (padrão: biblioteca.py)")
+    parser.add_argument("--sqlite", help="arquivo do banco local SQLite (padrão: o banco configurado em biblioteca)")
+    parser.add_argument("-f", "--formato", choices=["texto", "json"], default="texto")
+    parser.add_argument("-o", "--saida", help="arquivo do relatório (padrão: stdout)")
+    parser.add_argument("--falhar-em-alerta", action="store_true", help="termina com código 1 se houver algum alerta")
+    args = parser.parse_args(argv)
+
+    if args.sqlite:
+        _b.config_banco["sqlite"] = args.sqlite
+    with contextlib.redirect_stdout(sys.stderr):
+        conn = _b.conectarBD()
+    if conn is None:
+        sys.exit(1)
+    try:
+        relatorio = capturar_planos(conn, args.arquivos)
+    finally:
+        conn.close()
+
+    if args.formato == "json":
+        texto = json.dumps(relatorio, ensure_ascii=False, indent=4, sort_keys=True, default=str) + "\n"
+    else:
+        texto = formatar_texto(relatorio)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    else:
+        sys.stdout.write(texto)
+    if args.falhar_em_alerta and relatorio["resumo"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,14 +18,20 @@ CREATE TABLE T_MNDSH_COLABORADOR (
     dt_demissao        DATE,
     ds_status          VARCHAR2(20 CHAR) DEFAULT 'Ativo' CHECK (ds_status IN ('Ativo','Inativo')),
     dt_criacao         DATE DEFAULT SYSDATE NOT NULL,
-    dt_ultima_modificacao DATE DEFAULT SYSDATE NOT NULL
+    dt_ultima_modificacao DATE DEFAULT SYSDATE NOT NULL,
+    dt_exclusao        DATE
 );
 
+-- Exclusão lógica: dt_exclusao preenchida tira o colaborador das buscas e relatórios até o expurgo
+-- em lotes das tarefas e métricas (expurgar_colaboradores). Só as linhas excluídas entram no índice
+-- (chave nula não é indexada). Em bancos já criados:
+--   ALTER TABLE T_MNDSH_COLABORADOR ADD dt_exclusao DATE;
+CREATE INDEX idx_colaborador_exclusao ON T_MNDSH_COLABORADOR(dt_exclusao);
+
 -- Criação da tabela TAREFA
 CREATE TABLE T_MNDSH_TAREFA (
     id_tarefa            NUMBER GENERATED BY DEFAULT ON NULL AS IDENTITY PRIMARY KEY,
-    nr_cpf               VARCHAR2(11 CHAR) NOT NULL,
-    id_colaborador       NUMBER,  
+    id_colaborador       NUMBER NOT NULL,
     ds_titulo            VARCHAR2(100 CHAR) NOT NULL,
     ds_descricao         VARCHAR2(4000 CHAR),
     ds_prioridade        VARCHAR2(10 CHAR) DEFAULT 'baixa' 
@@ -38,26 +44,24 @@ CREATE TABLE T_MNDSH_TAREFA (
     dt_modificacao DATE DEFAULT SYSDATE,
     grau_dificuldade     NUMBER(3,1) CHECK (grau_dificuldade BETWEEN 0 AND 10),
     
-    CONSTRAINT fk_tarefa_colaborador_cpf FOREIGN KEY (nr_cpf)
-        REFERENCES T_MNDSH_COLABORADOR(nr_cpf)
-        ON DELETE CASCADE,
-    
     CONSTRAINT fk_tarefa_colaborador_id FOREIGN KEY (id_colaborador)
         REFERENCES T_MNDSH_COLABORADOR(id)
         ON DELETE CASCADE
 );
 
--- Índices
-CREATE INDEX idx_tarefa_cpf ON T_MNDSH_TAREFA(nr_cpf);
+-- Índices (idx_tarefa_colaborador cobre a contagem de tarefas por status e prazo de um colaborador
+-- sem ler a tabela)
+CREATE INDEX idx_tarefa_colaborador ON T_MNDSH_TAREFA(id_colaborador, ds_status, dt_prazo);
 CREATE INDEX idx_tarefa_status ON T_MNDSH_TAREFA(ds_status);
 CREATE INDEX idx_tarefa_prazo ON T_MNDSH_TAREFA(dt_prazo);
 
--- Criação da tabela METRICA
-CREATE TABLE T_MNDSH_METRICA (
-    id_metrica               NUMBER GENERATED BY DEFAULT ON NULL AS IDENTITY PRIMARY KEY,
-    nr_cpf                   VARCHAR2(11 CHAR) NOT NULL,
-    tipo_metrica             VARCHAR2(50 CHAR) NOT NULL,
+-- Criação da tabela METRICA_DIA (um check-in por colaborador e dia, com as cinco categorias na mesma linha)
+CREATE TABLE T_MNDSH_METRICA_DIA (
+    id_metrica_dia           NUMBER GENERATED BY DEFAULT ON NULL AS IDENTITY PRIMARY KEY,
+    id_colaborador           NUMBER NOT NULL,
     dt_registro              DATE DEFAULT SYSDATE NOT NULL,
+    -- Dia do registro (sem horário): chave diária de um check-in por colaborador
+    dt_dia                   DATE GENERATED ALWAYS AS (TRUNC(dt_registro)) VIRTUAL,
 
     -- PRODUTIVIDADE
     horas_produtivas         NUMBER(3,1),
@@ -90,15 +94,135 @@ CREATE TABLE T_MNDSH_METRICA (
     ingestao_agua            NUMBER(3,1),
     intensidade_atividade    NUMBER(3,1),
 
-    CONSTRAINT fk_metrica_colaborador FOREIGN KEY (nr_cpf)
-        REFERENCES T_MNDSH_COLABORADOR(nr_cpf)
-        ON DELETE CASCADE
+    CONSTRAINT fk_metrica_dia_colaborador_id FOREIGN KEY (id_colaborador)
+        REFERENCES T_MNDSH_COLABORADOR(id)
+        ON DELETE CASCADE,
+
+    CONSTRAINT uk_metrica_dia_colaborador UNIQUE (id_colaborador, dt_dia)
+)
+-- Uma partição por mês de dt_registro, criada automaticamente no primeiro registro do mês;
+-- consultas com faixa em dt_registro leem só as partições do período
+PARTITION BY RANGE (dt_registro) INTERVAL (NUMTOYMINTERVAL(1, 'MONTH')) (
+    PARTITION p_metrica_anterior VALUES LESS THAN (DATE '2025-01-01')
+);
+
+-- Índices (local: particionado junto com a tabela; a chave primária e uk_metrica_dia_colaborador
+-- não contêm dt_registro e ficam globais; uk_metrica_dia_colaborador também atende as buscas por colaborador)
+CREATE INDEX idx_metrica_dia_dt ON T_MNDSH_METRICA_DIA(dt_registro) LOCAL;
+
+-- Visão de compatibilidade T_MNDSH_METRICA: o formato anterior, uma linha por categoria com as colunas
+-- das outras categorias nulas, para as consultas que ainda leem as métricas por tipo_metrica; o nr_cpf
+-- vem de T_MNDSH_COLABORADOR
+CREATE OR REPLACE VIEW T_MNDSH_METRICA AS
+SELECT id_metrica_dia * 5 + 1 AS id_metrica, m.id_colaborador, c.nr_cpf, 'Produtividade' AS tipo_metrica, dt_registro, dt_dia,
+       horas_produtivas, nivel_foco, tarefas_concluidas, tarefas_andamento,
+       tarefas_pendentes, concluidas_no_prazo, concluidas_atraso, NULL AS estresse,
+       NULL AS humor, NULL AS energia, NULL AS controle_dia, NULL AS satisfacao_geral,
+       NULL AS relacao_colegas, NULL AS reconhecimento, NULL AS carga_trabalho, NULL AS horas_dormidas,
+       NULL AS descanso, NULL AS despertares, NULL AS atividade_fisica, NULL AS ingestao_agua,
+       NULL AS intensidade_atividade
+FROM T_MNDSH_METRICA_DIA m
+JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+UNION ALL
+SELECT id_metrica_dia * 5 + 2 AS id_metrica, m.id_colaborador, c.nr_cpf, 'Bem-estar emocional' AS tipo_metrica, dt_registro, dt_dia,
+       NULL AS horas_produtivas, NULL AS nivel_foco, NULL AS tarefas_concluidas, NULL AS tarefas_andamento,
+       NULL AS tarefas_pendentes, NULL AS concluidas_no_prazo, NULL AS concluidas_atraso, estresse,
+       humor, energia, controle_dia, NULL AS satisfacao_geral,
+       NULL AS relacao_colegas, NULL AS reconhecimento, NULL AS carga_trabalho, NULL AS horas_dormidas,
+       NULL AS descanso, NULL AS despertares, NULL AS atividade_fisica, NULL AS ingestao_agua,
+       NULL AS intensidade_atividade
+FROM T_MNDSH_METRICA_DIA m
+JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+UNION ALL
+SELECT id_metrica_dia * 5 + 3 AS id_metrica, m.id_colaborador, c.nr_cpf, 'Satisfação no trabalho' AS tipo_metrica, dt_registro, dt_dia,
+       NULL AS horas_produtivas, NULL AS nivel_foco, NULL AS tarefas_concluidas, NULL AS tarefas_andamento,
+       NULL AS tarefas_pendentes, NULL AS concluidas_no_prazo, NULL AS concluidas_atraso, NULL AS estresse,
+       NULL AS humor, NULL AS energia, NULL AS controle_dia, satisfacao_geral,
+       relacao_colegas, reconhecimento, carga_trabalho, NULL AS horas_dormidas,
+       NULL AS descanso, NULL AS despertares, NULL AS atividade_fisica, NULL AS ingestao_agua,
+       NULL AS intensidade_atividade
+FROM T_MNDSH_METRICA_DIA m
+JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+UNION ALL
+SELECT id_metrica_dia * 5 + 4 AS id_metrica, m.id_colaborador, c.nr_cpf, 'Qualidade do sono' AS tipo_metrica, dt_registro, dt_dia,
+       NULL AS horas_produtivas, NULL AS nivel_foco, NULL AS tarefas_concluidas, NULL AS tarefas_andamento,
+       NULL AS tarefas_pendentes, NULL AS concluidas_no_prazo, NULL AS concluidas_atraso, NULL AS estresse,
+       NULL AS humor, NULL AS energia, NULL AS controle_dia, NULL AS satisfacao_geral,
+       NULL AS relacao_colegas, NULL AS reconhecimento, NULL AS carga_trabalho, horas_dormidas,
+       descanso, despertares, NULL AS atividade_fisica, NULL AS ingestao_agua,
+       NULL AS intensidade_atividade
+FROM T_MNDSH_METRICA_DIA m
+JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+UNION ALL
+SELECT id_metrica_dia * 5 + 5 AS id_metrica, m.id_colaborador, c.nr_cpf, 'Bem-estar físico' AS tipo_metrica, dt_registro, dt_dia,
+       NULL AS horas_produtivas, NULL AS nivel_foco, NULL AS tarefas_concluidas, NULL AS tarefas_andamento,
+       NULL AS tarefas_pendentes, NULL AS concluidas_no_prazo, NULL AS concluidas_atraso, NULL AS estresse,
+       NULL AS humor, NULL AS energia, NULL AS controle_dia, NULL AS satisfacao_geral,
+       NULL AS relacao_colegas, NULL AS reconhecimento, NULL AS carga_trabalho, NULL AS horas_dormidas,
+       NULL AS descanso, NULL AS despertares, atividade_fisica, ingestao_agua,
+       intensidade_atividade
+FROM T_MNDSH_METRICA_DIA m
+JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador;
+
+-- Criação da tabela METRICA_ARQUIVO (camada fria: registros diários anteriores ao horizonte de
+-- config_arquivamento, movidos em lote por arquivar_metricas(); compressão básica, que vale para as
+-- inserções direct-path do arquivamento, e uma partição por ano)
+CREATE TABLE T_MNDSH_METRICA_ARQUIVO (
+    id_metrica_dia           NUMBER PRIMARY KEY,
+    id_colaborador           NUMBER NOT NULL,
+    dt_registro              DATE NOT NULL,
+    dt_dia                   DATE GENERATED ALWAYS AS (TRUNC(dt_registro)) VIRTUAL,
+
+    -- PRODUTIVIDADE
+    horas_produtivas         NUMBER(3,1),
+    nivel_foco               NUMBER(3,1),
+    tarefas_concluidas       NUMBER,
+    tarefas_andamento        NUMBER,
+    tarefas_pendentes        NUMBER,
+    concluidas_no_prazo      NUMBER,
+    concluidas_atraso        NUMBER,
+
+    -- BEM-ESTAR EMOCIONAL
+    estresse                 NUMBER(3,1),
+    humor                    NUMBER(3,1),
+    energia                  NUMBER(3,1),
+    controle_dia             NUMBER(3,1),
+
+    -- SATISFAÇÃO NO TRABALHO
+    satisfacao_geral         NUMBER(3,1),
+    relacao_colegas          NUMBER(3,1),
+    reconhecimento           NUMBER(3,1),
+    carga_trabalho           NUMBER(3,1),
+
+    -- QUALIDADE DO SONO
+    horas_dormidas           NUMBER(3,1),
+    descanso                 NUMBER(3,1),
+    despertares              NUMBER(3,1),
+
+    -- BEM-ESTAR FÍSICO
+    atividade_fisica         NUMBER(3,1),
+    ingestao_agua            NUMBER(3,1),
+    intensidade_atividade    NUMBER(3,1),
+
+    CONSTRAINT fk_metrica_arquivo_colaborador_id FOREIGN KEY (id_colaborador)
+        REFERENCES T_MNDSH_COLABORADOR(id)
+        ON DELETE CASCADE,
+
+    CONSTRAINT uk_metrica_arquivo_colaborador UNIQUE (id_colaborador, dt_dia)
+)
+ROW STORE COMPRESS BASIC
+PARTITION BY RANGE (dt_registro) INTERVAL (NUMTOYMINTERVAL(12, 'MONTH')) (
+    PARTITION p_arquivo_anterior VALUES LESS THAN (DATE '2020-01-01')
 );
 
--- Índices
-CREATE INDEX idx_metrica_cpf ON T_MNDSH_METRICA(nr_cpf);
-CREATE INDEX idx_metrica_tipo ON T_MNDSH_METRICA(tipo_metrica);
-CREATE INDEX idx_metrica_dt ON T_MNDSH_METRICA(dt_registro);
+CREATE INDEX idx_metrica_arquivo_dt ON T_MNDSH_METRICA_ARQUIVO(dt_registro) LOCAL;
+
+-- Controle do arquivamento: um registro por mês movido para T_MNDSH_METRICA_ARQUIVO
+CREATE TABLE T_MNDSH_ARQUIVAMENTO (
+    dt_mes                   DATE PRIMARY KEY,
+    qt_linhas                NUMBER NOT NULL,
+    dt_arquivamento          DATE DEFAULT SYSDATE NOT NULL
+);
 
 
 
@@ -204,7 +328,6 @@ BEGIN
                     v_criacao := v_data - TRUNC(DBMS_RANDOM.VALUE(1,3)); -- 1 a 2 dias antes do prazo
 
                     INSERT INTO T_MNDSH_TAREFA (
-                        nr_cpf,
                         id_colaborador,
                         ds_titulo,
                         ds_descricao,
@@ -217,7 +340,6 @@ BEGIN
                         grau_dificuldade
                     )
                     VALUES (
-                        col.nr_cpf,
                         col.id,
                         v_titulo,
                         v_desc,
@@ -242,7 +364,7 @@ END;
 -- Criação de dados METRICAS
 DECLARE
     CURSOR c_colab IS 
-        SELECT nr_cpf 
+        SELECT id 
         FROM T_MNDSH_COLABORADOR
         WHERE ds_status = 'Ativo';
     
@@ -253,64 +375,40 @@ BEGIN
         IF TO_CHAR(v_data, 'DY', 'NLS_DATE_LANGUAGE=ENGLISH') NOT IN ('SAT','SUN') THEN
             FOR col IN c_colab LOOP
 
-                -- PRODUTIVIDADE
-                INSERT INTO t_mndsh_metrica (
-                    nr_cpf, tipo_metrica, dt_registro,
+                INSERT INTO T_MNDSH_METRICA_DIA (
+                    id_colaborador, dt_registro,
+                    -- PRODUTIVIDADE
                     horas_produtivas, nivel_foco,
                     tarefas_concluidas, tarefas_andamento, tarefas_pendentes,
-                    concluidas_no_prazo, concluidas_atraso
+                    concluidas_no_prazo, concluidas_atraso,
+                    -- BEM-ESTAR EMOCIONAL
+                    estresse, humor, energia, controle_dia,
+                    -- SATISFAÇÃO NO TRABALHO
+                    satisfacao_geral, relacao_colegas, reconhecimento, carga_trabalho,
+                    -- QUALIDADE DO SONO
+                    horas_dormidas, descanso, despertares,
+                    -- BEM-ESTAR FÍSICO
+                    atividade_fisica, ingestao_agua, intensidade_atividade
                 ) VALUES (
-                    col.nr_cpf, 'Produtividade', v_data,
+                    col.id, v_data,
+                    TRUNC(DBMS_RANDOM.VALUE(0,11)),
+                    TRUNC(DBMS_RANDOM.VALUE(0,11)),
+                    TRUNC(DBMS_RANDOM.VALUE(0,11)),
+                    TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
-                    TRUNC(DBMS_RANDOM.VALUE(0,11))
-                );
-
-                -- BEM-ESTAR EMOCIONAL
-                INSERT INTO t_mndsh_metrica (
-                    nr_cpf, tipo_metrica, dt_registro,
-                    estresse, humor, energia, controle_dia
-                ) VALUES (
-                    col.nr_cpf, 'Bem-estar emocional', v_data,
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
-                    TRUNC(DBMS_RANDOM.VALUE(0,11))
-                );
-
-                -- SATISFAÇÃO NO TRABALHO
-                INSERT INTO t_mndsh_metrica (
-                    nr_cpf, tipo_metrica, dt_registro,
-                    satisfacao_geral, relacao_colegas, reconhecimento, carga_trabalho
-                ) VALUES (
-                    col.nr_cpf, 'Satisfação no trabalho', v_data,
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
-                    TRUNC(DBMS_RANDOM.VALUE(0,11))
-                );
-
-                -- QUALIDADE DO SONO
-                INSERT INTO t_mndsh_metrica (
-                    nr_cpf, tipo_metrica, dt_registro,
-                    horas_dormidas, descanso, despertares
-                ) VALUES (
-                    col.nr_cpf, 'Qualidade do sono', v_data,
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
-                    TRUNC(DBMS_RANDOM.VALUE(0,11))
-                );
-
-                -- BEM-ESTAR FÍSICO
-                INSERT INTO t_mndsh_metrica (
-                    nr_cpf, tipo_metrica, dt_registro,
-                    atividade_fisica, ingestao_agua, intensidade_atividade
-                ) VALUES (
-                    col.nr_cpf, 'Bem-estar físico', v_data,
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11)),
                     TRUNC(DBMS_RANDOM.VALUE(0,11))
@@ -0,0 +1,361 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import traceback
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import biblioteca as _b
+
+# ====== CONFIGURAÇÃO ======
+
+# Configuração do servidor (pode ser sobrescrita por variáveis de ambiente ou pela linha de comando)
+config_api = {
+    "host": os.environ.get("MINDSHIFT_API_HOST", "127.0.0.1"),
+    "porta": int(os.environ.get("MINDSHIFT_API_PORTA", "8080")),
+    "conexoes": int(os.environ.get("MINDSHIFT_API_CONEXOES", "16")),
+    "ttl_relatorios": float(os.environ.get("MINDSHIFT_API_TTL_RELATORIOS", "60")),
+    "tamanho_pagina": 50,
+    "tamanho_pagina_max": 500,
+    "tamanho_corpo_max": 1024 * 1024,
+    "timeout_ocioso": 30
+}
+
+status_http = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               408: "Request Timeout", 409: "Conflict", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+               500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class ErroAPI(Exception):
+    """
+    Erro tratado de uma requisição, convertido em resposta JSON {"erro": mensagem} com o status informado.
+    """
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+# ====== CACHE DE RELATÓRIOS ======
+
+# Relatórios prontos (já serializados) por chave de consulta: {chave: (expira_em, corpo)}
+_cache_relatorios = {}
+_cache_trava = threading.Lock()
+
+
+def _cache_obter(chave: tuple) -> bytes | None:
+    with _cache_trava:
+        item = _cache_relatorios.get(chave)
+        if item and item[0] > time.monotonic():
+            return item[1]
+        _cache_relatorios.pop(chave, None)
+        return None
+
+
+def _cache_gravar(chave: tuple, corpo: bytes) -> None:
+    with _cache_trava:
+        _cache_relatorios[chave] = (time.monotonic() + config_api["ttl_relatorios"], corpo)
+
+
+def invalidar_relatorios(cpf: str) -> None:
+    """
+    Descarta os relatórios em cache afetados por um novo registro de métricas (os do colaborador e o geral).
+    """
+    with _cache_trava:
+        for chave in [c for c in _cache_relatorios if c[0] == "geral" or c[1] == cpf]:
+            del _cache_relatorios[chave]
+
+
+# ====== SERIALIZAÇÃO ======
+
+def _json_padrao(valor):
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    if hasattr(valor, "item"):
+        return valor.item()
+    return str(valor)
+
+
+def _json(dados) -> bytes:
+    return json.dumps(dados, ensure_ascii=False, default=_json_padrao).encode("utf-8")
+
+
+def _inteiro(params: dict, nome: str, padrao: int | None = None, minimo: int = 0, maximo: int | None = None) -> int | None:
+    """
+    Lê um parâmetro inteiro da query string validando os limites.
+    """
+    valor = params.get(nome, [None])[0]
+    if valor is None:
+        return padrao
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ErroAPI(400, f"Parâmetro '{nome}' deve ser inteiro.")
+    if numero < minimo or (maximo is not None and numero > maximo):
+        raise ErroAPI(400, f"Parâmetro '{nome}' fora do intervalo permitido.")
+    return numero
+
+
+# ====== ROTAS ======
+# Cada rota recebe (conn, parametros_url, query, corpo) e retorna (status, corpo_bytes).
+# Rodam em threads do executor, cada uma com uma conexão emprestada do pool.
+
+def rota_saude(conn, url, query, corpo):
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1 FROM DUAL" if not _b.eh_sqlite(conn) else "SELECT 1")
+        cursor.fetchone()
+    finally:
+        cursor.close()
+    return 200, _json({"status": "ok"})
+
+
+def rota_colaborador(conn, url, query, corpo):
+    colaborador = _b.obter_colaborador(conn, url["id"])
+    if colaborador is None:
+        raise ErroAPI(404, "Colaborador não encontrado.")
+    return 200, _json(colaborador)
+
+
+def rota_tarefas(conn, url, query, corpo):
+    status = query.get("status", [None])[0]
+    if status is not None and status not in ("pendente", "em andamento", "concluída"):
+        raise ErroAPI(400, "Status inválido. Use 'pendente', 'em andamento' ou 'concluída'.")
+    pagina = _inteiro(query, "pagina", 1, minimo=1)
+    tamanho = _inteiro(query, "tamanho", config_api["tamanho_pagina"], minimo=1, maximo=config_api["tamanho_pagina_max"])
+    df = _b.consultar_tarefas(conn, cpf=query.get("cpf", [None])[0], status=status,
+                              limite=tamanho, deslocamento=(pagina - 1) * tamanho)
+    df = df.rename(columns=_b.colunas_tarefas)
+    df = df.astype(object).where(df.notna(), None)
+    return 200, _json({"pagina": pagina, "tamanho": tamanho, "itens": df.to_dict(orient="records")})
+
+
+def rota_atualizar_tarefa(conn, url, query, corpo):
+    novo_status = corpo.get("status")
+    try:
+        atualizada = _b.atualizar_status_tarefa(conn, int(url["id"]), novo_status, corpo.get("cpf"))
+    except ValueError as e:
+        raise ErroAPI(400, str(e))
+    if not atualizada:
+        raise ErroAPI(404, "Tarefa não encontrada.")
+    return 200, _json({"id_tarefa": int(url["id"]), "status": novo_status})
+
+
+def rota_registrar_metricas(conn, url, query, corpo):
+    cpf = url["cpf"]
+    if _b.obter_colaborador(conn, cpf) is None:
+        raise ErroAPI(404, "Colaborador não encontrado.")
+    try:
+        gravado = _b.registrar_metricas_dia(conn, cpf, corpo)
+    except ValueError as e:
+        raise ErroAPI(400, str(e))
+    if not gravado:
+        raise ErroAPI(409, "Já existe um registro de métricas para o colaborador na data de hoje.")
+    invalidar_relatorios(cpf)
+    return 201, _json({"cpf": cpf, "registrado": True})
+
+
+def _rota_relatorio(tipo: str):
+    def rota(conn, url, query, corpo):
+        filtros = {"cpf": query.get("cpf", [None])[0]} if tipo != "geral" else {}
+        if tipo == "diario":
+            filtros["data"] = query.get("data", [None])[0]
+        else:
+            filtros["mes"] = _inteiro(query, "mes", minimo=1, maximo=12)
+            filtros["ano"] = _inteiro(query, "ano", minimo=1900)
+            if filtros["mes"] is None or filtros["ano"] is None:
+                raise ErroAPI(400, "Informe os parâmetros 'mes' e 'ano'.")
+        if tipo != "geral" and not filtros["cpf"]:
+            raise ErroAPI(400, "Informe o parâmetro 'cpf'.")
+
+        chave = (tipo, filtros.get("cpf"), filtros.get("data"), filtros.get("mes"), filtros.get("ano"))
+        corpo_cache = _cache_obter(chave)
+        if corpo_cache is not None:
+            return 200, corpo_cache
+        try:
+            _, dados = _b.gerar_relatorio(conn, tipo, **filtros)
+        except ValueError as e:
+            raise ErroAPI(400, str(e))
+        if not dados:
+            raise ErroAPI(404, "Nenhuma métrica encontrada para o período informado.")
+        resposta = _json(dados)
+        _cache_gravar(chave, resposta)
+        return 200, resposta
+    return rota
+
+
+rotas = [
+    ("GET", re.compile(r"^/saude$"), rota_saude),
+    ("GET", re.compile(r"^/colaboradores/(?P<id>\d+)$"), rota_colaborador),
+    ("GET", re.compile(r"^/tarefas$"), rota_tarefas),
+    ("PATCH", re.compile(r"^/tarefas/(?P<id>\d+)$"), rota_atualizar_tarefa),
+    ("POST", re.compile(r"^/colaboradores/(?P<cpf>\d{11})/metricas$"), rota_registrar_metricas),
+    ("GET", re.compile(r"^/relatorios/diario$"), _rota_relatorio("diario")),
+    ("GET", re.compile(r"^/relatorios/mensal$"), _rota_relatorio("mensal")),
+    ("GET", re.compile(r"^/relatorios/geral$"), _rota_relatorio("geral")),
+]
+
+
+def _localizar_rota(metodo: str, caminho: str):
+    metodo_invalido = False
+    for metodo_rota, padrao, rota in rotas:
+        encontrado = padrao.match(caminho)
+        if encontrado:
+            if metodo_rota == metodo:
+                return rota, encontrado.groupdict()
+            metodo_invalido = True
+    raise ErroAPI(405 if metodo_invalido else 404, "Método não permitido." if metodo_invalido else "Rota não encontrada.")
+
+
+# ====== SERVIDOR ======
+
+class ServidorAPI:
+    """
+    Servidor HTTP/1.1 (JSON) sobre asyncio. O laço de eventos só faz E/S de rede; as operações da
+    biblioteca rodam em um ThreadPoolExecutor, cada uma com uma conexão emprestada do pool.
+
+    Args:
+        pool: Pool retornado por biblioteca.criar_pool() (acquire/release).
+        threads: Quantidade de operações simultâneas no banco (normalmente o máximo do pool).
+    """
+    def __init__(self, pool, threads: int):
+        self.pool = pool
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="api")
+
+    def _executar(self, rota, url: dict, query: dict, corpo: dict):
+        conn = self.pool.acquire()
+        try:
+            return rota(conn, url, query, corpo)
+        finally:
+            self.pool.release(conn)
+
+    async def _processar(self, metodo: str, alvo: str, corpo_bruto: bytes) -> tuple[int, bytes]:
+        try:
+            partes = urlsplit(alvo)
+            rota, url = _localizar_rota(metodo, unquote(partes.path))
+            corpo = {}
+            if corpo_bruto:
+                try:
+                    corpo = json.loads(corpo_bruto)
+                except ValueError:
+                    raise ErroAPI(400, "Corpo da requisição não é um JSON válido.")
+                if not isinstance(corpo, dict):
+                    raise ErroAPI(400, "Corpo da requisição deve ser um objeto JSON.")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._executar, rota, url, parse_qs(partes.query), corpo)
+        except ErroAPI as e:
+            return e.status, _json({"erro": e.mensagem})
+        except Exception:
+            # O detalhe (SQL, caminhos, dados) fica só no log do servidor
+            _b.contador_inc("mindshift_api_erros_internos_total", "Requisições da API encerradas com erro interno (500).")
+            print(f"Erro interno em {metodo} {alvo}:", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            return 500, _json({"erro": "Erro interno."})
+
+    @staticmethod
+    async def _responder(escritor: asyncio.StreamWriter, status: int, resposta: bytes, manter: bool) -> None:
+        escritor.write(
+            f"HTTP/1.1 {status} {status_http.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(resposta)}\r\n"
+            f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode("latin-1") + resposta)
+        await escritor.drain()
+
+    async def atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """
+        Atende uma conexão TCP, processando requisições em sequência enquanto o cliente mantiver keep-alive.
+        Cabeçalho e corpo têm o prazo de config_api["timeout_ocioso"]; cabeçalhos acima do limite do leitor
+        recebem 431 e a conexão é fechada.
+        """
+        try:
+            while True:
+                try:
+                    cabecalho = await asyncio.wait_for(leitor.readuntil(b"\r\n\r\n"), config_api["timeout_ocioso"])
+                except asyncio.LimitOverrunError:
+                    await self._responder(escritor, 431, _json({"erro": "Cabeçalhos da requisição muito grandes."}), False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                linhas = cabecalho.decode("latin-1").split("\r\n")
+                try:
+                    metodo, alvo, versao = linhas[0].split(" ", 2)
+                except ValueError:
+                    break
+                cabecalhos = {}
+                for linha in linhas[1:]:
+                    if ":" in linha:
+                        nome, valor = linha.split(":", 1)
+                        cabecalhos[nome.strip().lower()] = valor.strip()
+
+                # Sem um Content-Length válido não dá para saber onde o corpo termina: responde e fecha a conexão
+                tamanho_texto = cabecalhos.get("content-length", "")
+                tamanho = int(tamanho_texto) if re.fullmatch(r"[0-9]+", tamanho_texto) else None
+                if tamanho_texto and tamanho is None:
+                    status, resposta = 400, _json({"erro": "Cabeçalho Content-Length inválido."})
+                    manter = False
+                elif tamanho and tamanho > config_api["tamanho_corpo_max"]:
+                    status, resposta = 413, _json({"erro": "Corpo da requisição muito grande."})
+                    manter = False
+                else:
+                    try:
+                        corpo = await asyncio.wait_for(leitor.readexactly(tamanho), config_api["timeout_ocioso"]) if tamanho else b""
+                    except asyncio.IncompleteReadError:
+                        break  # cliente desconectou no meio do corpo
+                    except asyncio.TimeoutError:
+                        await self._responder(escritor, 408, _json({"erro": "Tempo esgotado aguardando o corpo da requisição."}), False)
+                        break
+                    status, resposta = await self._processar(metodo.upper(), alvo, corpo)
+                    conexao = cabecalhos.get("connection", "").lower()
+                    manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+
+                await self._responder(escritor, status, resposta, manter)
+                if not manter:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    def fechar(self) -> None:
+        self.executor.shutdown(wait=True)
+        self.pool.close()
+
+
+async def servir(host: str, porta: int, conexoes: int) -> None:
+    """
+    Cria o pool de conexões e atende requisições até o processo ser interrompido.
+    """
+    pool = _b.criar_pool(minimo=1, maximo=conexoes)
+    if pool is None:
+        raise SystemExit(1)
+    _b.iniciar_exportador_metricas()
+    servidor_api = ServidorAPI(pool, conexoes)
+    servidor = await asyncio.start_server(servidor_api.atender, host, porta, backlog=1024)
+    print(f"API MindShift em http://{host}:{porta} ({conexoes} conexões no pool)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servidor_api.fechar()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="API HTTP (JSON) com as operações de colaboradores, tarefas, métricas e relatórios.")
+    parser.add_argument("--host", default=config_api["host"])
+    parser.add_argument("--porta", type=int, default=config_api["porta"])
+    parser.add_argument("--conexoes", type=int, default=config_api["conexoes"], help="tamanho máximo do pool de conexões")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.porta, args.conexoes))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import io
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import biblioteca as _b
+
+# ====== CONFIGURAÇÃO ======
+
+# Configuração do servidor (pode ser sobrescrita por variáveis de ambiente ou pela linha de comando)
+config_quiosque = {
+    "host": os.environ.get("MINDSHIFT_QUIOSQUE_HOST", "127.0.0.1"),
+    "porta": int(os.environ.get("MINDSHIFT_QUIOSQUE_PORTA", "2323")),
+    "sessoes": int(os.environ.get("MINDSHIFT_QUIOSQUE_SESSOES", "300")),
+    "conexoes": int(os.environ.get("MINDSHIFT_QUIOSQUE_CONEXOES", "8")),
+    "timeout_ocioso": float(os.environ.get("MINDSHIFT_QUIOSQUE_TIMEOUT", "1800"))
+}
+
+margem = _b.margem
+
+
+# ====== SESSÕES ======
+
+class SessaoEncerrada(BaseException):
+    """
+    Interrompe o menu de uma sessão cujo terminal desconectou. Herda de BaseException para não ser
+    engolida pelos 'except Exception' dos menus (que voltariam a pedir a opção para sempre).
+    """
+
+
+class Sessao:
+    """
+    Um terminal conectado: a thread do menu lê as linhas digitadas da fila 'entrada' e o texto
+    impresso por ela é enviado ao socket pelo loop do asyncio.
+    """
+    def __init__(self, loop: asyncio.AbstractEventLoop, writer: asyncio.StreamWriter):
+        self.loop = loop
+        self.writer = writer
+        self.entrada = queue.Queue()
+        self.encerrada = False
+
+    def _enviar(self, dados: bytes) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(dados)
+
+    def escrever(self, texto: str) -> None:
+        self.loop.call_soon_threadsafe(self._enviar, texto.replace("\n", "\r\n").encode("utf-8"))
+
+    def ler_linha(self) -> str:
+        linha = None if self.encerrada else self.entrada.get()
+        if linha is None:
+            self.encerrada = True
+            raise SessaoEncerrada()
+        return linha
+
+
+# Sessão atendida pela thread atual (None nas threads do próprio servidor)
+_sessao_atual = threading.local()
+
+
+def sessao_atual() -> Sessao | None:
+    return getattr(_sessao_atual, "sessao", None)
+
+
+class _SaidaSessoes:
+    """
+    Substitui sys.stdout: nas threads de sessão escreve no terminal do cliente; nas demais, no stdout original.
+    """
+    def __init__(self, original):
+        self._original = original
+
+    @property
+    def terminal_remoto(self) -> bool:
+        return sessao_atual() is not None
+
+    def write(self, texto: str) -> int:
+        sessao = sessao_atual()
+        if sessao is None:
+            return self._original.write(texto)
+        sessao.escrever(texto)
+        return len(texto)
+
+    def flush(self) -> None:
+        if sessao_atual() is None:
+            self._original.flush()
+
+    def fileno(self) -> int:
+        # Sem fileno, o input() das sessões não tenta usar o terminal real do servidor
+        if sessao_atual() is not None:
+            raise io.UnsupportedOperation("fileno")
+        return self._original.fileno()
+
+    def __getattr__(self, nome):
+        return getattr(self._original, nome)
+
+
+class _EntradaSessoes:
+    """
+    Substitui sys.stdin: nas threads de sessão lê as linhas digitadas no terminal do cliente.
+    """
+    def __init__(self, original):
+        self._original = original
+
+    def readline(self, *args) -> str:
+        sessao = sessao_atual()
+        if sessao is None:
+            return self._original.readline(*args)
+        return sessao.ler_linha()
+
+    def fileno(self) -> int:
+        if sessao_atual() is not None:
+            raise io.UnsupportedOperation("fileno")
+        return self._original.fileno()
+
+    def __getattr__(self, nome):
+        return getattr(self._original, nome)
+
+
+def executar_sessao(sessao: Sessao, pool) -> None:
+    """
+    Roda o menu principal de uma sessão (na thread do executor) com uma ConexaoEmprestada do pool compartilhado.
+    """
+    _sessao_atual.sessao = sessao
+    try:
+        _b.menu_principal(lambda: _b.ConexaoEmprestada(pool))
+    except SessaoEncerrada:
+        pass
+    except Exception as e:
+        print(f"\n {margem} Erro inesperado na sessão: {e}\n")
+    finally:
+        _sessao_atual.sessao = None
+
+
+# ====== SERVIDOR ======
+
+class ServidorQuiosque:
+    """
+    Atende os terminais (uma sessão de menu por conexão TCP) compartilhando um único pool de conexões.
+    Cada sessão roda o código síncrono dos menus em uma thread; o banco só é ocupado durante os comandos.
+
+    Args:
+        pool: Pool retornado por biblioteca.criar_pool().
+        sessoes: Máximo de sessões simultâneas (as excedentes são recusadas).
+    """
+    def __init__(self, pool, sessoes: int):
+        self.pool = pool
+        self.sessoes = sessoes
+        self.ativas = 0
+        self.executor = ThreadPoolExecutor(max_workers=sessoes, thread_name_prefix="sessao")
+
+    async def atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self.ativas >= self.sessoes:
+            _b.contador_inc("mindshift_quiosque_recusadas_total", "Sessões recusadas por falta de vaga.")
+            writer.write(f"Servidor cheio ({self.sessoes} sessões). Tente novamente em instantes.\r\n".encode("utf-8"))
+            await writer.drain()
+            writer.close()
+            return
+        self.ativas += 1
+        _b.contador_inc("mindshift_quiosque_sessoes_total", "Sessões de quiosque iniciadas.")
+        _b.medidor_somar("mindshift_quiosque_sessoes", "Sessões de quiosque abertas.", 1)
+        loop = asyncio.get_running_loop()
+        sessao = Sessao(loop, writer)
+        menu = loop.run_in_executor(self.executor, executar_sessao, sessao, self.pool)
+        try:
+            while not menu.done():
+                leitura = asyncio.ensure_future(asyncio.wait_for(reader.readline(), config_quiosque["timeout_ocioso"]))
+                await asyncio.wait({leitura, menu}, return_when=asyncio.FIRST_COMPLETED)
+                if not leitura.done():
+                    leitura.cancel()
+                    break
+                try:
+                    linha = leitura.result()
+                except (asyncio.TimeoutError, ConnectionError):
+                    linha = b""
+                if not linha:
+                    break
+                sessao.entrada.put(linha.decode("utf-8", errors="replace").rstrip("\r\n") + "\n")
+        finally:
+            sessao.entrada.put(None)
+            await menu
+            if not writer.is_closing():
+                await writer.drain()
+                writer.close()
+            self.ativas -= 1
+            _b.medidor_somar("mindshift_quiosque_sessoes", "Sessões de quiosque abertas.", -1)
+
+    def fechar(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+
+
+async def servir(host: str, porta: int, sessoes: int, conexoes: int) -> None:
+    """
+    Cria o pool de conexões e atende terminais até o processo ser interrompido.
+    """
+    pool = _b.criar_pool(minimo=1, maximo=conexoes)
+    if pool is None:
+        raise SystemExit(1)
+    _b.precarregar_dependencias()
+    _b.iniciar_exportador_metricas()
+    _b.iniciar_fila_metricas(lambda: _b.ConexaoEmprestada(pool))
+    sys.stdout = _SaidaSessoes(sys.stdout)
+    sys.stdin = _EntradaSessoes(sys.stdin)
+    servidor_quiosque = ServidorQuiosque(pool, sessoes)
+    servidor = await asyncio.start_server(servidor_quiosque.atender, host, porta, backlog=1024)
+    print(f"Quiosque MindShift em {host}:{porta} (até {sessoes} sessões, {conexoes} conexões no pool)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        _b.encerrar_fila_metricas()
+        servidor_quiosque.fechar()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Servidor de quiosque: muitas sessões do menu por TCP (ex.: nc host porta) compartilhando um pool de conexões.")
+    parser.add_argument("--host", default=config_quiosque["host"])
+    parser.add_argument("--porta", type=int, default=config_quiosque["porta"])
+    parser.add_argument("--sessoes", type=int, default=config_quiosque["sessoes"], help="máximo de sessões simultâneas")
+    parser.add_argument("--conexoes", type=int, default=config_quiosque["conexoes"], help="tamanho máximo do pool de conexões")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.porta, args.sessoes, args.conexoes))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import biblioteca as _b
+
+
+class ViaCEPFalso:
+    """
+    Servidor HTTP local que imita a API ViaCEP (GET /<cep>/json/).
+
+    - enderecos: CEPs conhecidos, respondidos com 200 e o JSON no formato da ViaCEP.
+    - CEPs desconhecidos recebem 200 com {"erro": true}, como a API real.
+    - status: respostas forçadas por CEP (lista de códigos HTTP consumida a cada requisição).
+    - atraso: segundos de espera antes de cada resposta.
+    - acessos, conexoes, instantes e simultaneas_max registram o que o servidor recebeu.
+    """
+    def __init__(self):
+        self.enderecos = {}
+        self.status = {}
+        self.atraso = 0.0
+        self.acessos = {}
+        self.conexoes = 0
+        self.instantes = []
+        self.simultaneas = 0
+        self.simultaneas_max = 0
+        self._lock = threading.Lock()
+        falso = self
+
+        class _Tratador(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with falso._lock:
+                    falso.conexoes += 1
+
+            def do_GET(self):
+                cep = self.path.strip("/").split("/")[0]
+                with falso._lock:
+                    falso.acessos[cep] = falso.acessos.get(cep, 0) + 1
+                    falso.instantes.append(time.monotonic())
+                    falso.simultaneas += 1
+                    falso.simultaneas_max = max(falso.simultaneas_max, falso.simultaneas)
+                    forcados = falso.status.get(cep)
+                    status = forcados.pop(0) if forcados else 200
+                try:
+                    if falso.atraso:
+                        time.sleep(falso.atraso)
+                    if status != 200:
+                        corpo = {"erro": status}
+                    elif cep in falso.enderecos:
+                        e = falso.enderecos[cep]
+                        corpo = {"cep": cep, "logradouro": e["logradouro"], "bairro": e["bairro"],
+                                 "localidade": e["cidade"], "uf": e["estado"]}
+                    else:
+                        corpo = {"erro": True}
+                    dados = json.dumps(corpo).encode("utf-8")
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(dados)))
+                    self.end_headers()
+                    self.wfile.write(dados)
+                finally:
+                    with falso._lock:
+                        falso.simultaneas -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Tratador)
+        self.servidor.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.servidor.server_address[1]}"
+        self._thread = threading.Thread(target=self.servidor.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def total_acessos(self) -> int:
+        return sum(self.acessos.values())
+
+    def encerrar(self) -> None:
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+
+@pytest.fixture(autouse=True)
+def sql_lento(tmp_path, monkeypatch):
+    """
+    Log de SQL lento em arquivo temporário, para os testes não deixarem sql_lento.jsonl na raiz do projeto.
+    """
+    caminho = str(tmp_path / "sql_lento.jsonl")
+    monkeypatch.setitem(_b.config_sql_lento, "arquivo", caminho)
+    return caminho
+
+
+@pytest.fixture
+def viacep(tmp_path, monkeypatch):
+    """
+    ViaCEP falso em localhost, com cache de CEP em arquivo temporário e sem índice offline.
+    """
+    falso = ViaCEPFalso()
+    monkeypatch.setitem(_b.config_cep, "url_base", falso.url)
+    monkeypatch.setitem(_b.config_cep, "backoff_base", 0.01)
+    monkeypatch.setitem(_b.config_cep, "backoff_max", 0.02)
+    monkeypatch.setitem(_b.config_cache_cep, "arquivo", str(tmp_path / "cache_cep.db"))
+    monkeypatch.setitem(_b.config_indice_cep, "arquivo", str(tmp_path / "indice_cep.bin"))
+    _b.fechar_cliente_cep()
+    _b.fechar_indice_cep()
+    yield falso
+    _b.fechar_cliente_cep()
+    _b.fechar_indice_cep()
+    falso.encerrar()
+
+
+@pytest.fixture
+def metrica():
+    """
+    Função que lê o valor atual de um contador (ou a quantidade de observações de um histograma).
+    """
+    def ler(nome: str, **rotulos) -> float:
+        chave = tuple(sorted((k, str(v)) for k, v in rotulos.items()))
+        with _b._trava_metricas:
+            valor = _b._metricas.get(nome, {}).get("series", {}).get(chave, 0)
+        return valor[2] if isinstance(valor, list) else valor
+    return ler
+
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    """
+    Banco local SQLite vazio (config_banco["sqlite"] aponta para ele, para as funções que conectam sozinhas).
+    """
+    caminho = str(tmp_path / "mindshift.db")
+    monkeypatch.setitem(_b.config_banco, "sqlite", caminho)
+    conn = _b.ConexaoSQLite(caminho)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def inserir_colaborador(banco):
+    """
+    Função que grava um colaborador com dados mínimos e retorna o id.
+    """
+    def inserir(cpf: str, cep: str = "01001000", **campos) -> int:
+        dados = {"cpf": cpf, "nome": f"Colaborador {cpf}", "cep": cep, "logradouro": "Rua Antiga", "bairro": "Centro",
+                 "cidade": "Cidade Antiga", "estado": "XX", **campos}
+        cursor = banco.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO T_MNDSH_COLABORADOR (nr_cpf, nm_colaborador, dt_nascimento, ds_sexo, cep, ds_logradouro, nr_endereco,
+                                                 ds_bairro, ds_cidade, ds_estado, vl_salario, ds_cargo, dt_admissao)
+                VALUES (:cpf, :nome, :nascimento, 'F', :cep, :logradouro, '10', :bairro, :cidade, :estado, 5000,
+                        'Analista', :admissao)
+            """, {**dados, "nascimento": datetime(1990, 1, 1), "admissao": datetime(2020, 1, 1)})
+            cursor.execute("SELECT id FROM T_MNDSH_COLABORADOR WHERE nr_cpf = :cpf", {"cpf": cpf})
+            id_colaborador = cursor.fetchone()[0]
+            banco.commit()
+        finally:
+            cursor.close()
+        return id_colaborador
+    return inserir
@@ -0,0 +1,55 @@
+import biblioteca as _b
+
+SE = {"logradouro": "Praça da Sé", "bairro": "Sé", "cidade": "São Paulo", "estado": "SP"}
+
+
+def test_primeira_consulta_vai_a_api_e_a_segunda_vem_do_cache(viacep, metrica):
+    viacep.enderecos["01001000"] = SE
+    cache_antes = metrica("mindshift_cep_consultas_total", origem="cache")
+
+    assert _b.endereco_cep("01001-000") == SE
+    assert _b.endereco_cep("01001000") == SE
+
+    assert viacep.acessos == {"01001000": 1}
+    assert metrica("mindshift_cep_consultas_total", origem="cache") == cache_antes + 1
+    assert _b.cache_cep_obter("01001000") == (True, SE)
+
+
+def test_entrada_vencida_consulta_a_api_de_novo(viacep, monkeypatch):
+    viacep.enderecos["01001000"] = SE
+    assert _b.endereco_cep("01001000") == SE
+
+    monkeypatch.setitem(_b.config_cache_cep, "ttl_segundos", -1)
+    assert _b.cache_cep_obter("01001000") == (False, None)
+    assert _b.endereco_cep("01001000") == SE
+
+    assert viacep.acessos == {"01001000": 2}
+
+
+def test_cep_nao_encontrado_fica_no_cache_negativo(viacep, monkeypatch):
+    assert _b.endereco_cep("99999999") is None
+    assert _b.endereco_cep("99999-999") is None
+    assert viacep.acessos == {"99999999": 1}
+    assert _b.cache_cep_obter("99999999") == (True, None)
+
+    # O cache negativo vence antes (ttl_negativo_segundos) sem afetar os endereços encontrados
+    viacep.enderecos["01001000"] = SE
+    assert _b.endereco_cep("01001000") == SE
+    monkeypatch.setitem(_b.config_cache_cep, "ttl_negativo_segundos", -1)
+    assert _b.endereco_cep("99999999") is None
+    assert _b.endereco_cep("01001000") == SE
+    assert viacep.acessos == {"99999999": 2, "01001000": 1}
+
+
+def test_cep_recusado_pela_api_fica_no_cache_negativo(viacep):
+    viacep.status["00000000"] = [400]
+    assert _b.endereco_cep("00000000") is None
+    assert _b.endereco_cep("00000000") is None
+    assert viacep.acessos == {"00000000": 1}
+
+
+def test_cep_com_formato_invalido_nao_chega_a_api(viacep):
+    for cep in ("123", "0100100A", "010010001"):
+        assert _b.endereco_cep(cep) is None
+    assert viacep.total_acessos() == 0
+    assert _b.cache_cep_obter("123") == (False, None)
@@ -0,0 +1,76 @@
+import pytest
+import requests
+
+import biblioteca as _b
+
+SE = {"logradouro": "Praça da Sé", "bairro": "Sé", "cidade": "São Paulo", "estado": "SP"}
+
+
+@pytest.fixture
+def esperas(monkeypatch):
+    """
+    Registra o limite de cada espera do backoff (random.uniform(0, espera)) sem dormir.
+    """
+    limites = []
+
+    def uniform(inicio, fim):
+        limites.append(fim)
+        return 0
+    monkeypatch.setattr(_b.random, "uniform", uniform)
+    return limites
+
+
+def test_429_e_5xx_sao_repetidos_com_backoff_exponencial(viacep, metrica, esperas, monkeypatch):
+    monkeypatch.setitem(_b.config_cep, "backoff_base", 0.1)
+    monkeypatch.setitem(_b.config_cep, "backoff_max", 1.0)
+    viacep.enderecos["01001000"] = SE
+    viacep.status["01001000"] = [429, 503]
+    retentativas = _b.estatisticas_cep["retentativas"]
+    falhas = _b.estatisticas_cep["falhas"]
+    contador = metrica("mindshift_viacep_retentativas_total")
+    erros = metrica("mindshift_viacep_segundos", resultado="erro")
+
+    assert _b._consultar_viacep("01001000") == SE
+
+    assert viacep.acessos == {"01001000": 3}
+    assert esperas == [0.1, 0.2]
+    assert _b.estatisticas_cep["retentativas"] == retentativas + 2
+    assert _b.estatisticas_cep["falhas"] == falhas + 2
+    assert metrica("mindshift_viacep_retentativas_total") == contador + 2
+    assert metrica("mindshift_viacep_segundos", resultado="erro") == erros + 2
+
+
+def test_espera_do_backoff_respeita_o_maximo(viacep, esperas, monkeypatch):
+    monkeypatch.setitem(_b.config_cep, "tentativas", 5)
+    monkeypatch.setitem(_b.config_cep, "backoff_base", 0.1)
+    monkeypatch.setitem(_b.config_cep, "backoff_max", 0.25)
+    viacep.enderecos["01001000"] = SE
+    viacep.status["01001000"] = [500, 502, 503, 504]
+
+    assert _b._consultar_viacep("01001000") == SE
+    assert esperas == [0.1, 0.2, 0.25, 0.25]
+
+
+def test_falha_persistente_desiste_apos_as_tentativas(viacep, metrica, esperas):
+    viacep.status["01001000"] = [503] * 10
+    falhas = _b.estatisticas_cep["falhas"]
+    contador = metrica("mindshift_viacep_retentativas_total")
+
+    with pytest.raises(requests.HTTPError):
+        _b._consultar_viacep("01001000")
+
+    assert viacep.acessos == {"01001000": _b.config_cep["tentativas"]}
+    assert _b.estatisticas_cep["falhas"] == falhas + _b.config_cep["tentativas"]
+    assert metrica("mindshift_viacep_retentativas_total") == contador + _b.config_cep["tentativas"] - 1
+    # O erro não vai para o cache: a próxima consulta tenta a API de novo
+    assert _b.endereco_cep("01001000") is None
+    assert _b.cache_cep_obter("01001000") == (False, None)
+
+
+def test_consultas_reaproveitam_a_conexao(viacep, esperas):
+    viacep.enderecos.update({"01001000": SE, "20040002": SE})
+    viacep.status["20040002"] = [429]
+    for cep in ("01001000", "20040002", "99999999", "01001000"):
+        _b._consultar_viacep(cep)
+    assert viacep.total_acessos() == 5
+    assert viacep.conexoes == 1
@@ -0,0 +1,93 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import biblioteca as _b
+
+NOTAS = {campo: 5 for campo in _b.notas_metricas_diarias}
+
+
+@pytest.fixture
+def diario(tmp_path, monkeypatch):
+    """
+    Diário offline e quarentena em arquivos temporários. Retorna o caminho do diário.
+    """
+    monkeypatch.setitem(_b.config_diario_offline, "quarentena", str(tmp_path / "quarentena.jsonl"))
+    return str(tmp_path / "diario.jsonl")
+
+
+def _tarefa(banco, id_colaborador: int) -> int:
+    cursor = banco.cursor()
+    try:
+        cursor.execute("""
+            INSERT INTO T_MNDSH_TAREFA (id_colaborador, ds_titulo, ds_status, dt_prazo)
+            VALUES (:id, 'Relatório', 'pendente', :prazo)
+        """, {"id": id_colaborador, "prazo": datetime.now() + timedelta(days=3)})
+        cursor.execute("SELECT MAX(id_tarefa) FROM T_MNDSH_TAREFA")
+        id_tarefa = cursor.fetchone()[0]
+        banco.commit()
+    finally:
+        cursor.close()
+    return id_tarefa
+
+
+def _consultar(banco, sql: str) -> list[tuple]:
+    cursor = banco.cursor()
+    try:
+        cursor.execute(sql)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def test_entradas_invalidas_vao_para_a_quarentena_e_as_validas_sao_aplicadas(banco, inserir_colaborador, diario, metrica):
+    id_ana = inserir_colaborador("00000000001")
+    inserir_colaborador("00000000002")
+    id_tarefa = _tarefa(banco, id_ana)
+    _b.registrar_offline("checkin", diario, cpf="00000000001", notas=NOTAS)
+    _b.registrar_offline("checkin", diario, cpf="12345678901", notas=NOTAS)
+    _b.registrar_offline("checkin", diario, cpf="00000000002", notas=NOTAS)
+    _b.registrar_offline("status_tarefa", diario, id_tarefa=id_tarefa, status="concluída", cpf="00000000001")
+    _b.registrar_offline("status_tarefa", diario, id_tarefa=999, status="concluída", cpf="00000000001")
+    _b.registrar_offline("status_tarefa", diario, id_tarefa=id_tarefa, status="em andamento", cpf="00000000002")
+    quarentena = metrica("mindshift_diario_offline_quarentena_total", motivo="colaborador inexistente")
+
+    resumo = _b.reproduzir_diario(banco, diario)
+
+    assert resumo["checkins"] == 2 and resumo["status_tarefa"] == 1
+    assert resumo["checkins_duplicados"] == 0 and resumo["status_ignorados"] == 0
+    assert resumo["quarentena"] == 3
+    assert resumo["quarentena_por_motivo"] == {"colaborador inexistente": 1, "tarefa inexistente": 1,
+                                               "tarefa de outro colaborador": 1}
+    assert metrica("mindshift_diario_offline_quarentena_total", motivo="colaborador inexistente") == quarentena + 1
+    assert len(_consultar(banco, "SELECT 1 FROM T_MNDSH_METRICA_DIA")) == 2
+    assert _consultar(banco, "SELECT ds_status FROM T_MNDSH_TAREFA") == [("concluída",)]
+
+    # Tudo foi tratado: nada fica pendente para a próxima reconexão
+    assert _b.diario_pendentes(diario) == []
+    assert _b.reproduzir_diario(banco, diario)["entradas"] == 0
+    with open(_b.config_diario_offline["quarentena"], encoding="utf-8") as arquivo:
+        separadas = [json.loads(linha) for linha in arquivo]
+    assert sorted((e["tipo"], e["cpf"], e["motivo"]) for e in separadas) == [
+        ("checkin", "12345678901", "colaborador inexistente"),
+        ("status_tarefa", "00000000001", "tarefa inexistente"),
+        ("status_tarefa", "00000000002", "tarefa de outro colaborador")]
+
+
+def test_entrada_malformada_e_notas_invalidas(banco, inserir_colaborador, diario):
+    inserir_colaborador("00000000001")
+    _b.registrar_offline("checkin", diario, cpf="00000000001", notas={**NOTAS, "estresse": 11})
+    _b.registrar_offline("checkin", diario, cpf="00000000001")
+
+    resumo = _b.reproduzir_diario(banco, diario)
+
+    assert resumo["checkins"] == 0
+    assert resumo["quarentena_por_motivo"] == {"notas inválidas": 1, "entrada malformada": 1}
+    assert _b.diario_pendentes(diario) == []
+
+
+@pytest.mark.parametrize("cpf, valido", [("123.456.789-09", True), ("52998224725", True), ("12345678901", False),
+                                         ("11111111111", False), ("1234567890", False)])
+def test_digitos_verificadores_do_cpf(cpf, valido):
+    assert _b.cpf_digitos_validos(cpf) is valido
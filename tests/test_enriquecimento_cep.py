@@ -0,0 +1,119 @@
+from datetime import datetime
+
+import biblioteca as _b
+
+SE = {"logradouro": "Praça da Sé", "bairro": "Sé", "cidade": "São Paulo", "estado": "SP"}
+CENTRO_RJ = {"logradouro": "Avenida Rio Branco", "bairro": "Centro", "cidade": "Rio de Janeiro", "estado": "RJ"}
+
+
+def _enderecos(banco) -> dict:
+    cursor = banco.cursor()
+    try:
+        cursor.execute("SELECT nr_cpf, ds_logradouro, ds_bairro, ds_cidade, ds_estado FROM T_MNDSH_COLABORADOR")
+        return {cpf: {"logradouro": l, "bairro": b, "cidade": c, "estado": e} for cpf, l, b, c, e in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def test_ceps_sao_consultados_em_paralelo_uma_vez_cada(viacep, banco, inserir_colaborador):
+    ceps = [f"0100{i:04d}" for i in range(8)]
+    for i, cep in enumerate(ceps):
+        viacep.enderecos[cep] = SE
+        inserir_colaborador(f"{i:011d}", cep)
+        inserir_colaborador(f"{i + 100:011d}", cep)
+    viacep.atraso = 0.1
+
+    resumo = _b.enriquecer_ceps_em_lote(banco, max_threads=4, limite_por_segundo=0)
+
+    assert resumo["ceps"] == 8 and resumo["resolvidos"] == 8
+    assert viacep.acessos == {cep: 1 for cep in ceps}
+    assert viacep.simultaneas_max > 1
+    assert resumo["segundos"] < 8 * viacep.atraso
+
+
+def test_limite_de_requisicoes_por_segundo(viacep, banco, inserir_colaborador):
+    for i in range(6):
+        inserir_colaborador(f"{i:011d}", f"0100{i:04d}")
+
+    _b.enriquecer_ceps_em_lote(banco, max_threads=6, limite_por_segundo=20)
+
+    instantes = sorted(viacep.instantes)
+    assert len(instantes) == 6
+    assert instantes[-1] - instantes[0] >= 5 / 20 * 0.9
+
+
+def test_update_em_lote_conta_as_linhas_de_cada_cep(viacep, banco, inserir_colaborador):
+    viacep.enderecos.update({"01001000": SE, "20040002": CENTRO_RJ})
+    inserir_colaborador("00000000001", "01001000")
+    inserir_colaborador("00000000002", "01001000")
+    inserir_colaborador("00000000003", "01001-000")
+    inserir_colaborador("00000000004", "20040002")
+    inserir_colaborador("00000000005", "99999999")
+
+    resumo = _b.enriquecer_ceps_em_lote(banco, limite_por_segundo=0, tamanho_lote=2)
+
+    assert resumo["ceps"] == 3
+    assert resumo["resolvidos"] == 2 and resumo["nao_encontrados"] == 1 and resumo["erros"] == 0
+    assert resumo["linhas_atualizadas"] == 4
+    enderecos = _enderecos(banco)
+    assert enderecos["00000000001"] == enderecos["00000000002"] == enderecos["00000000003"] == SE
+    assert enderecos["00000000004"] == CENTRO_RJ
+    assert enderecos["00000000005"]["logradouro"] == "Rua Antiga"
+
+
+def test_arquivo_com_campos_entre_aspas_e_ceps_fora_do_banco(viacep, banco, inserir_colaborador, tmp_path):
+    viacep.enderecos.update({"01001000": SE, "20040002": CENTRO_RJ})
+    inserir_colaborador("00000000001", "01001000")
+    inserir_colaborador("00000000002", "20040002")
+    arquivo = tmp_path / "ceps.csv"
+    arquivo.write_text('nome,cep\n"Silva, Ana","01001-000"\n"Souza, João",88888888\n', encoding="utf-8")
+
+    resumo = _b.enriquecer_ceps_em_lote(banco, str(arquivo), limite_por_segundo=0)
+
+    assert resumo["ceps"] == 1 and resumo["linhas_atualizadas"] == 1
+    assert resumo["ceps_fora_do_banco"] == ["88888888"]
+    assert viacep.acessos == {"01001000": 1}
+    assert _enderecos(banco)["00000000002"]["logradouro"] == "Rua Antiga"
+
+
+def test_leitura_do_arquivo_de_ceps(tmp_path):
+    ponto_virgula = tmp_path / "ponto_virgula.csv"
+    ponto_virgula.write_text('cep;nome\n01001-000;"Ana; Silva"\n20040002;João\n', encoding="utf-8")
+    um_por_linha = tmp_path / "ceps.txt"
+    um_por_linha.write_text("01001-000\n\n20040002\n123\n", encoding="utf-8")
+
+    assert _b._ler_ceps_arquivo(str(ponto_virgula)) == {"01001000", "20040002"}
+    assert _b._ler_ceps_arquivo(str(um_por_linha)) == {"01001000", "20040002"}
+
+
+def test_correcao_nao_le_o_cache_preaquecido_com_os_dados_do_banco(viacep, banco, inserir_colaborador):
+    viacep.enderecos["01001000"] = SE
+    inserir_colaborador("00000000001", "01001000")
+    assert _b.preaquecer_cache_cep(banco) == 1
+
+    assert _b.enriquecer_ceps_em_lote(banco, limite_por_segundo=0, usar_cache=True)["linhas_atualizadas"] == 1
+    assert viacep.total_acessos() == 0
+    assert _enderecos(banco)["00000000001"]["logradouro"] == "Rua Antiga"
+
+    resumo = _b.enriquecer_ceps_em_lote(banco, limite_por_segundo=0)
+
+    assert viacep.acessos == {"01001000": 1}
+    assert resumo["linhas_atualizadas"] == 1
+    assert _enderecos(banco)["00000000001"] == SE
+    assert _b.cache_cep_obter("01001000") == (True, SE)
+
+
+def test_preaquecimento_usa_um_endereco_inteiro_por_cep(viacep, banco, inserir_colaborador):
+    antigo = inserir_colaborador("00000000001", "01001000", logradouro="Rua Zeta", bairro="Alfa", cidade="Cidade", estado="SP")
+    recente = inserir_colaborador("00000000002", "01001000", logradouro="Rua Alfa", bairro="Zeta", cidade="Cidade", estado="SP")
+    cursor = banco.cursor()
+    for id_colaborador, data in ((antigo, datetime(2024, 1, 1)), (recente, datetime(2025, 1, 1))):
+        cursor.execute("UPDATE T_MNDSH_COLABORADOR SET dt_ultima_modificacao = :data WHERE id = :id",
+                       {"data": data, "id": id_colaborador})
+    cursor.close()
+    banco.commit()
+
+    assert _b.preaquecer_cache_cep(banco) == 1
+
+    # MAX() por coluna misturaria "Rua Zeta" (do antigo) com o bairro "Zeta" (do recente)
+    assert _b.cache_cep_obter("01001000") == (True, {"logradouro": "Rua Alfa", "bairro": "Zeta", "cidade": "Cidade", "estado": "SP"})
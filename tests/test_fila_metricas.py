@@ -0,0 +1,108 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import biblioteca as _b
+
+VALORES = {campo: 5 for campo in _b.colunas_metricas_diarias}
+ONTEM = datetime.now().replace(microsecond=0) - timedelta(days=1)
+
+
+@pytest.fixture
+def nova_fila(banco, tmp_path, monkeypatch):
+    """
+    Função que cria uma FilaMetricas (sem iniciar) sobre o banco local, com spool e rejeitados em arquivos temporários.
+    """
+    monkeypatch.setitem(_b.config_fila_metricas, "intervalo_segundos", 0.05)
+
+    def criar() -> _b.FilaMetricas:
+        return _b.FilaMetricas(lambda: _b.ConexaoSQLite(_b.config_banco["sqlite"]), str(tmp_path / "fila.jsonl"),
+                               str(tmp_path / "rejeitados.jsonl"))
+    return criar
+
+
+def _gravados(banco) -> dict:
+    cursor = banco.cursor()
+    try:
+        cursor.execute("""
+            SELECT c.nr_cpf, m.estresse FROM T_MNDSH_METRICA_DIA m JOIN T_MNDSH_COLABORADOR c ON c.id = m.id_colaborador
+        """)
+        return dict(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def _rejeitados(fila) -> list[dict]:
+    with open(fila.rejeitados, encoding="utf-8") as arquivo:
+        return [json.loads(linha) for linha in arquivo]
+
+
+def _processar(nova_fila, registros: list[tuple[str, dict]]):
+    """
+    Deixa os registros no spool (como após uma queda) e os grava com uma nova fila, em um único lote.
+    """
+    anterior = nova_fila()
+    for cpf, valores in registros:
+        anterior.enfileirar(cpf, valores, ONTEM)
+    fila = nova_fila()
+    assert fila.iniciar() == len(registros)
+    assert fila.encerrar(10)
+    return fila
+
+
+def test_cpf_sem_colaborador_vai_para_os_rejeitados_sem_segurar_o_lote(banco, inserir_colaborador, nova_fila, metrica):
+    inserir_colaborador("00000000001")
+    inserir_colaborador("00000000002")
+    rejeitados = metrica("mindshift_fila_metricas_rejeitados_total", motivo="sem_colaborador")
+
+    fila = _processar(nova_fila, [("00000000001", VALORES), ("12345678901", VALORES), ("00000000002", VALORES)])
+
+    assert set(_gravados(banco)) == {"00000000001", "00000000002"}
+    assert [(r["cpf"], r["motivo"]) for r in _rejeitados(fila)] == [("12345678901", "sem_colaborador")]
+    assert metrica("mindshift_fila_metricas_rejeitados_total", motivo="sem_colaborador") == rejeitados + 1
+    # Nada sobra no spool para ser regravado na próxima execução
+    assert nova_fila().iniciar() == 0
+
+
+def test_erro_do_registro_grava_os_demais_e_desiste_apos_as_tentativas(banco, inserir_colaborador, nova_fila, metrica,
+                                                                       monkeypatch):
+    monkeypatch.setitem(_b.config_fila_metricas, "tentativas_max", 2)
+    inserir_colaborador("00000000001")
+    inserir_colaborador("00000000002")
+    cursor = banco.cursor()
+    cursor.execute("""
+        CREATE TRIGGER tg_estresse BEFORE INSERT ON T_MNDSH_METRICA_DIA WHEN NEW.estresse > 10
+        BEGIN SELECT RAISE(ABORT, 'estresse fora da faixa'); END
+    """)
+    cursor.close()
+    banco.commit()
+    falhas = metrica("mindshift_fila_metricas_falhas_total")
+
+    fila = _processar(nova_fila, [("00000000001", {**VALORES, "estresse": 11}), ("00000000002", VALORES)])
+
+    assert _gravados(banco) == {"00000000002": 5}
+    rejeitados = _rejeitados(fila)
+    assert [(r["cpf"], r["motivo"]) for r in rejeitados] == [("00000000001", "erro")]
+    assert "estresse fora da faixa" in rejeitados[0]["erro"]
+    assert metrica("mindshift_fila_metricas_falhas_total") == falhas + 1
+    assert nova_fila().iniciar() == 0
+
+
+def test_gravacao_em_lote_confere_os_colaboradores_antes(banco, inserir_colaborador):
+    inserir_colaborador("00000000001")
+    inserir_colaborador("00000000002")
+    cursor = banco.cursor()
+    cursor.execute("UPDATE T_MNDSH_COLABORADOR SET dt_exclusao = :agora WHERE nr_cpf = '00000000002'", {"agora": datetime.now()})
+    cursor.close()
+    banco.commit()
+    registros = [{"cpf": cpf, "valores": VALORES, "dt_registro": ONTEM} for cpf in ("00000000001", "00000000002", "12345678901")]
+
+    with pytest.raises(ValueError, match="00000000002, 12345678901"):
+        _b.gravar_metricas_lote(banco, registros)
+    assert _gravados(banco) == {}
+
+    sem_colaborador = []
+    assert _b.gravar_metricas_lote(banco, registros, sem_colaborador=sem_colaborador) == 1
+    assert [r["cpf"] for r in sem_colaborador] == ["00000000002", "12345678901"]
+    assert set(_gravados(banco)) == {"00000000001"}
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import biblioteca as _b
+
+
+@pytest.fixture
+def indice(tmp_path, monkeypatch):
+    """
+    Índice offline em arquivo temporário (ainda não gerado), conferido a cada consulta.
+    """
+    caminho = str(tmp_path / "indice_cep.bin")
+    monkeypatch.setitem(_b.config_indice_cep, "arquivo", caminho)
+    monkeypatch.setitem(_b.config_indice_cep, "verificar_segundos", 0)
+    _b.fechar_indice_cep()
+    yield caminho
+    _b.fechar_indice_cep()
+
+
+def _gerar(tmp_path, destino: str, linhas: list[str]) -> int:
+    csv_ceps = tmp_path / "ceps.csv"
+    csv_ceps.write_text("cep,logradouro,bairro,cidade,uf\n" + "\n".join(linhas) + "\n", encoding="utf-8")
+    return _b.construir_indice_cep(str(csv_ceps), destino)
+
+
+def test_indice_gerado_depois_da_primeira_consulta_passa_a_ser_usado(indice, tmp_path):
+    assert _b.indice_cep_obter("01001000") is None
+
+    _gerar(tmp_path, indice, ["01001-000,Praça da Sé,Sé,São Paulo,SP"])
+
+    assert _b.indice_cep_obter("01001000") == {"logradouro": "Praça da Sé", "bairro": "Sé", "cidade": "São Paulo", "estado": "SP"}
+
+
+def test_indice_regerado_por_outro_processo_e_reaberto(indice, tmp_path):
+    _gerar(tmp_path, indice, ["01001-000,Praça da Sé,Sé,São Paulo,SP"])
+    assert _b.indice_cep_obter("01001000")["logradouro"] == "Praça da Sé"
+
+    # gerar_indice_cep.py em outro processo troca o arquivo sem passar pelo estado deste processo
+    csv_ceps = tmp_path / "novos.csv"
+    csv_ceps.write_text("cep,logradouro,bairro,cidade,uf\n01001-000,Praça da Sé (nova),Sé,São Paulo,SP\n"
+                        "20040-002,Av. Rio Branco,Centro,Rio de Janeiro,RJ\n", encoding="utf-8")
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, os.path.join(raiz, "gerar_indice_cep.py"), str(csv_ceps), "-o", indice],
+                   cwd=raiz, check=True, capture_output=True)
+
+    assert _b.indice_cep_obter("01001000")["logradouro"] == "Praça da Sé (nova)"
+    assert _b.indice_cep_obter("20040002")["estado"] == "RJ"
+
+
+def test_indice_apagado_deixa_de_ser_usado(indice, tmp_path):
+    _gerar(tmp_path, indice, ["01001-000,Praça da Sé,Sé,São Paulo,SP"])
+    assert _b.indice_cep_obter("01001000") is not None
+    os.remove(indice)
+    assert _b.indice_cep_obter("01001000") is None
+
+
+def test_consultas_simultaneas_nao_esperam_o_lock(indice, tmp_path, monkeypatch):
+    _gerar(tmp_path, indice, [f"{cep:08d},Rua {cep},Bairro,Cidade,SP" for cep in range(1000000, 1001000)])
+    monkeypatch.setitem(_b.config_indice_cep, "verificar_segundos", 60)
+    assert _b.indice_cep_obter("01000000") is not None
+    erros = []
+
+    def consultar():
+        for cep in range(1000000, 1001000, 7):
+            if _b.indice_cep_obter(f"{cep:08d}") != {"logradouro": f"Rua {cep}", "bairro": "Bairro", "cidade": "Cidade", "estado": "SP"}:
+                erros.append(cep)
+
+    # Com o mapeamento já aberto e conferido, as consultas terminam mesmo com o lock ocupado
+    with _b._indice_cep["lock"]:
+        threads = [threading.Thread(target=consultar) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        assert not any(thread.is_alive() for thread in threads)
+    assert erros == []
+
+
+@pytest.mark.parametrize("conteudo", ["", "cep\n01001-000\n"])
+def test_csv_sem_separador_detectavel_gera_indice(indice, tmp_path, conteudo):
+    csv_ceps = tmp_path / "ceps.csv"
+    csv_ceps.write_text(conteudo, encoding="utf-8")
+
+    assert _b.construir_indice_cep(str(csv_ceps), indice) == (1 if conteudo else 0)
+    assert _b.indice_cep_obter("01001000") == ({"logradouro": "", "bairro": "", "cidade": "", "estado": ""} if conteudo else None)
+
+
+def test_regerar_o_indice_nao_fecha_o_mapeamento_em_uso(indice, tmp_path):
+    _gerar(tmp_path, indice, ["01001-000,Praça da Sé,Sé,São Paulo,SP"])
+    assert _b.indice_cep_obter("01001000") is not None
+    mapa_anterior = _b._indice_cep["estado"]["mmap"]
+
+    _gerar(tmp_path, indice, ["01001-000,Praça da Sé (nova),Sé,São Paulo,SP"])
+
+    # Uma consulta que já tinha o mapeamento anterior continua lendo dele
+    assert not mapa_anterior.closed and mapa_anterior[:8] == b"MSCEPIX1"
+    assert _b.indice_cep_obter("01001000")["logradouro"] == "Praça da Sé (nova)"
+    assert _b._indice_cep["estado"]["mmap"] is not mapa_anterior
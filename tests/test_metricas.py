@@ -0,0 +1,15 @@
+import biblioteca as _b
+
+
+def test_exposicao_mantem_a_precisao_dos_valores(monkeypatch):
+    monkeypatch.setattr(_b, "_metricas", {})
+    _b.contador_inc("mindshift_teste_total", "Contador de teste.", 1234567)
+    _b.medidor_definir("mindshift_teste_inicio_segundos", "Instante de teste.", 1792370123.456789)
+    _b.histograma_observar("mindshift_teste_segundos", "Histograma de teste.", 1234567.125)
+
+    linhas = _b.texto_prometheus().splitlines()
+
+    assert "mindshift_teste_total 1234567" in linhas
+    assert "mindshift_teste_inicio_segundos 1792370123.456789" in linhas
+    assert "mindshift_teste_segundos_sum 1234567.125" in linhas
+    assert 'mindshift_teste_segundos_bucket{le="0.005"} 0' in linhas
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+import biblioteca as _b
+
+CPF = "12345678909"
+
+
+@pytest.fixture
+def cargas_lentas(monkeypatch):
+    """
+    Envolve as três cargas do painel com uma espera e registra quantas rodaram ao mesmo tempo.
+    """
+    estado = {"atraso": 0.2, "simultaneas": 0, "simultaneas_max": 0, "conexoes": set()}
+    trava = threading.Lock()
+
+    def lenta(original):
+        def carga(conn, *args):
+            with trava:
+                estado["simultaneas"] += 1
+                estado["simultaneas_max"] = max(estado["simultaneas_max"], estado["simultaneas"])
+                estado["conexoes"].add(id(conn))
+            try:
+                time.sleep(estado["atraso"])
+                return original(conn, *args)
+            finally:
+                with trava:
+                    estado["simultaneas"] -= 1
+        return carga
+    for nome in ("carregar_tarefas_abertas", "metricas_registradas_hoje", "dados_relatorio_mensal"):
+        monkeypatch.setattr(_b, nome, lenta(getattr(_b, nome)))
+    return estado
+
+
+def test_com_pool_as_cargas_rodam_ao_mesmo_tempo(banco, inserir_colaborador, cargas_lentas):
+    inserir_colaborador(CPF)
+    pool = _b.criar_pool(minimo=1, maximo=4)
+    sessao = _b.ConexaoEmprestada(pool)
+    try:
+        painel = _b.PainelColaborador(sessao, CPF, "Ana").iniciar()
+        painel.aguardar()
+    finally:
+        pool.close()
+
+    assert painel.erro is None
+    assert painel.obter("tarefas_abertas") == [] and painel.obter("registrado_hoje") is False
+    assert painel.obter("desempenho_mes") is not None
+    assert cargas_lentas["simultaneas_max"] == 3
+    assert id(sessao) not in cargas_lentas["conexoes"] and len(cargas_lentas["conexoes"]) == 3
+
+
+def test_com_conexao_unica_as_cargas_rodam_uma_apos_a_outra(banco, inserir_colaborador, cargas_lentas):
+    inserir_colaborador(CPF)
+
+    painel = _b.PainelColaborador(banco, CPF, "Ana").iniciar()
+    painel.aguardar()
+
+    assert painel.erro is None and painel.obter("tarefas_abertas") == []
+    assert cargas_lentas["simultaneas_max"] == 1
+    assert cargas_lentas["conexoes"] == {id(banco)}
+
+
+def test_carga_com_falha_nao_descarta_as_outras(banco, inserir_colaborador, monkeypatch, metrica):
+    inserir_colaborador(CPF)
+
+    def falhar(conn, cpf):
+        raise RuntimeError("falha na consulta")
+    monkeypatch.setattr(_b, "metricas_registradas_hoje", falhar)
+    falhas = metrica("mindshift_painel_falhas_total")
+
+    painel = _b.PainelColaborador(banco, CPF, "Ana").iniciar()
+
+    assert painel.obter("registrado_hoje") is None
+    assert painel.obter("tarefas_abertas") == []
+    assert str(painel.erro) == "falha na consulta"
+    assert metrica("mindshift_painel_falhas_total") == falhas + 1
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+import biblioteca as _b
+import planos_sql
+
+
+def test_catalogo_cobre_todos_os_comandos_dinamicos(banco):
+    relatorio = planos_sql.capturar_planos(banco, [_b.__file__])
+
+    assert relatorio["nao_cobertos"] == []
+    assert "ERRO_PLANO" not in relatorio["resumo"]
+    nomes = {comando["nome"].split("[")[0].split("#")[0] for comando in relatorio["comandos"]}
+    assert {"consultar_tarefas_admin", "atualizar_campo_tarefa", "atualizar_campo_colaborador", "_arquivar_mes",
+            "pendencias_expurgo", "converter_metricas_largas"} <= nomes
+
+
+def test_filtro_por_prefixo_de_indice_composto_nao_e_alertado(banco):
+    comandos, _ = planos_sql.catalogo([_b.__file__], sqlite=True)
+    comando = next(c for c in comandos if c["nome"] == "metricas_registradas_hoje#1")
+    tabelas = planos_sql.esquema(banco)
+
+    assert planos_sql.analisar(comando, planos_sql.plano_sqlite(banco, comando), tabelas) == []
+    # Sem a coluna inicial do índice, dt_dia continua sem índice que a atenda
+    so_dia = {"sql": "SELECT 1 FROM T_MNDSH_METRICA_DIA WHERE dt_dia = :dia", "binds": {}}
+    assert [(a["tipo"], a["coluna"]) for a in planos_sql.analisar(so_dia, [], tabelas)] == [("SEM_INDICE", "dt_dia")]
+
+
+def test_binds_de_exemplo_usam_o_tipo_da_execucao():
+    assert planos_sql._binds_exemplo("SELECT 1 FROM T_MNDSH_TAREFA WHERE dt_prazo < :limite") == {"limite": datetime(2025, 1, 1)}
+    assert planos_sql._binds_exemplo("UPDATE T_MNDSH_TAREFA SET dt_prazo = TO_DATE(:prazo, 'DD/MM/YYYY')") == {"prazo": "01/01/2025"}
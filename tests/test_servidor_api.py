@@ -0,0 +1,204 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import biblioteca as _b
+import servidor_api
+
+CPF = "12345678909"
+NOTAS = {campo: 5 for campo in _b.notas_metricas_diarias}
+
+
+@pytest.fixture
+def api(banco, inserir_colaborador):
+    """
+    ServidorAPI sobre o banco local SQLite, atendendo em uma porta livre de localhost.
+    Retorna (porta, id do colaborador, id da tarefa pendente).
+    """
+    id_colaborador = inserir_colaborador(CPF)
+    cursor = banco.cursor()
+    try:
+        for titulo, status in (("Relatório", "pendente"), ("Revisão", "concluída")):
+            cursor.execute("""
+                INSERT INTO T_MNDSH_TAREFA (id_colaborador, ds_titulo, ds_status, dt_prazo)
+                VALUES (:id, :titulo, :status, :prazo)
+            """, {"id": id_colaborador, "titulo": titulo, "status": status, "prazo": datetime.now() + timedelta(days=3)})
+        cursor.execute("SELECT id_tarefa FROM T_MNDSH_TAREFA WHERE ds_status = 'pendente'")
+        id_tarefa = cursor.fetchone()[0]
+        banco.commit()
+    finally:
+        cursor.close()
+
+    servidor_api._cache_relatorios.clear()
+    api = servidor_api.ServidorAPI(_b.criar_pool(minimo=1, maximo=4), 4)
+    loop = asyncio.new_event_loop()
+    # Exceções que escapam de atender() (tarefa da conexão morrendo sem tratamento) falham o teste; o
+    # cancelamento das conexões abertas no encerramento não conta
+    nao_tratadas = []
+    loop.set_exception_handler(lambda loop, contexto: None if isinstance(contexto.get("exception"), asyncio.CancelledError)
+                               else nao_tratadas.append(contexto))
+    servidor = loop.run_until_complete(asyncio.start_server(api.atender, "127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield servidor.sockets[0].getsockname()[1], id_colaborador, id_tarefa
+
+    async def parar():
+        servidor.close()
+        conexoes = [tarefa for tarefa in asyncio.all_tasks() if tarefa is not asyncio.current_task()]
+        for tarefa in conexoes:
+            tarefa.cancel()
+        await asyncio.gather(*conexoes, return_exceptions=True)
+        await servidor.wait_closed()
+    asyncio.run_coroutine_threadsafe(parar(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+    api.fechar()
+    assert nao_tratadas == []
+
+
+def _requisitar(porta: int, metodo: str, caminho: str, corpo=None) -> tuple[int, dict]:
+    conexao = http.client.HTTPConnection("127.0.0.1", porta, timeout=10)
+    try:
+        dados = json.dumps(corpo).encode("utf-8") if corpo is not None else None
+        conexao.request(metodo, caminho, body=dados, headers={"Content-Type": "application/json"} if dados else {})
+        resposta = conexao.getresponse()
+        return resposta.status, json.loads(resposta.read())
+    finally:
+        conexao.close()
+
+
+def _bruto(porta: int, requisicao: bytes) -> tuple[int, dict, bytes]:
+    """
+    Envia a requisição como bytes (cabeçalhos malformados) e lê a resposta até o servidor fechar a conexão.
+    """
+    with socket.create_connection(("127.0.0.1", porta), timeout=10) as s:
+        s.sendall(requisicao)
+        resposta = b""
+        while True:
+            parte = s.recv(65536)
+            if not parte:
+                break
+            resposta += parte
+    cabecalho, corpo = resposta.split(b"\r\n\r\n", 1)
+    return int(cabecalho.split(b" ", 2)[1]), json.loads(corpo), cabecalho
+
+
+def test_saude_e_colaborador(api):
+    porta, id_colaborador, _ = api
+    assert _requisitar(porta, "GET", "/saude") == (200, {"status": "ok"})
+    status, colaborador = _requisitar(porta, "GET", f"/colaboradores/{id_colaborador}")
+    assert status == 200 and colaborador["nr_cpf"] == CPF
+    assert _requisitar(porta, "GET", f"/colaboradores/{CPF}")[1]["id"] == id_colaborador
+    assert _requisitar(porta, "GET", "/colaboradores/999")[0] == 404
+
+
+def test_rota_e_metodo_inexistentes(api):
+    porta, _, _ = api
+    assert _requisitar(porta, "GET", "/nada")[0] == 404
+    assert _requisitar(porta, "DELETE", "/tarefas")[0] == 405
+
+
+def test_listagem_de_tarefas_com_filtro_e_paginacao(api):
+    porta, _, _ = api
+    status, resposta = _requisitar(porta, "GET", f"/tarefas?cpf={CPF}")
+    assert status == 200 and len(resposta["itens"]) == 2
+    status, resposta = _requisitar(porta, "GET", "/tarefas?status=pendente&tamanho=1&pagina=1")
+    assert status == 200 and [t["ds_titulo"] for t in resposta["itens"]] == ["Relatório"]
+    assert _requisitar(porta, "GET", "/tarefas?pagina=2&tamanho=2")[1]["itens"] == []
+    assert _requisitar(porta, "GET", "/tarefas?status=arquivada")[0] == 400
+    assert _requisitar(porta, "GET", "/tarefas?tamanho=0")[0] == 400
+    assert _requisitar(porta, "GET", "/tarefas?pagina=x")[0] == 400
+
+
+def test_atualizacao_de_status_da_tarefa(api):
+    porta, _, id_tarefa = api
+    assert _requisitar(porta, "PATCH", f"/tarefas/{id_tarefa}", {"status": "concluída", "cpf": CPF}) == \
+        (200, {"id_tarefa": id_tarefa, "status": "concluída"})
+    assert _requisitar(porta, "GET", "/tarefas?status=pendente")[1]["itens"] == []
+    assert _requisitar(porta, "PATCH", f"/tarefas/{id_tarefa}", {"status": "arquivada"})[0] == 400
+    assert _requisitar(porta, "PATCH", "/tarefas/999", {"status": "pendente"})[0] == 404
+    assert _requisitar(porta, "PATCH", f"/tarefas/{id_tarefa}", {"status": "pendente", "cpf": "00000000000"})[0] == 404
+
+
+def test_registro_de_metricas_e_relatorio_diario(api):
+    porta, _, _ = api
+    hoje = datetime.now().strftime("%d/%m/%Y")
+    assert _requisitar(porta, "GET", f"/relatorios/diario?cpf={CPF}&data={hoje}")[0] == 404
+
+    assert _requisitar(porta, "POST", f"/colaboradores/{CPF}/metricas", NOTAS) == (201, {"cpf": CPF, "registrado": True})
+    assert _requisitar(porta, "POST", f"/colaboradores/{CPF}/metricas", NOTAS)[0] == 409
+    assert _requisitar(porta, "POST", f"/colaboradores/{CPF}/metricas", {**NOTAS, "estresse": 11})[0] == 400
+    assert _requisitar(porta, "POST", "/colaboradores/00000000000/metricas", NOTAS)[0] == 404
+
+    # A resposta 404 anterior não fica no cache: depois do registro o relatório aparece
+    status, relatorio = _requisitar(porta, "GET", f"/relatorios/diario?cpf={CPF}&data={hoje}")
+    assert status == 200 and relatorio
+    assert _requisitar(porta, "GET", "/relatorios/diario")[0] == 400
+    assert _requisitar(porta, "GET", "/relatorios/geral?mes=13&ano=2025")[0] == 400
+
+
+def test_corpo_que_nao_e_objeto_json(api):
+    porta, _, id_tarefa = api
+    assert _requisitar(porta, "PATCH", f"/tarefas/{id_tarefa}", ["concluída"])[0] == 400
+    status, resposta, _ = _bruto(porta, f"PATCH /tarefas/{id_tarefa} HTTP/1.1\r\nHost: x\r\nContent-Length: 5\r\n"
+                                        f"Connection: close\r\n\r\n{{abc}}".encode("latin-1"))
+    assert status == 400 and "JSON" in resposta["erro"]
+
+
+@pytest.mark.parametrize("valor", ["abc", "-1", "1.5", "10 20", "+5"])
+def test_content_length_invalido_responde_400_e_fecha(api, valor):
+    porta, _, id_tarefa = api
+    status, resposta, cabecalho = _bruto(porta, f"PATCH /tarefas/{id_tarefa} HTTP/1.1\r\nHost: x\r\n"
+                                                f"Content-Length: {valor}\r\n\r\n{{}}".encode("latin-1"))
+    assert status == 400 and "Content-Length" in resposta["erro"]
+    assert b"Connection: close" in cabecalho
+
+
+def test_corpo_acima_do_limite_responde_413(api, monkeypatch):
+    porta, _, id_tarefa = api
+    monkeypatch.setitem(servidor_api.config_api, "tamanho_corpo_max", 10)
+    status, _, _ = _bruto(porta, f"PATCH /tarefas/{id_tarefa} HTTP/1.1\r\nHost: x\r\nContent-Length: 11\r\n\r\n".encode("latin-1"))
+    assert status == 413
+
+
+def test_erro_interno_nao_expoe_o_detalhe(api, monkeypatch, metrica, capsys):
+    porta, id_colaborador, _ = api
+
+    def falhar(conn, identificador):
+        raise RuntimeError("ORA-00942: tabela T_MNDSH_SEGREDO não existe")
+    monkeypatch.setattr(_b, "obter_colaborador", falhar)
+    erros = metrica("mindshift_api_erros_internos_total")
+
+    assert _requisitar(porta, "GET", f"/colaboradores/{id_colaborador}") == (500, {"erro": "Erro interno."})
+    assert metrica("mindshift_api_erros_internos_total") == erros + 1
+    assert "T_MNDSH_SEGREDO" in capsys.readouterr().err
+
+
+def test_corpo_incompleto_responde_408_apos_o_prazo(api, monkeypatch):
+    porta, _, id_tarefa = api
+    monkeypatch.setitem(servidor_api.config_api, "timeout_ocioso", 0.3)
+    status, resposta, cabecalho = _bruto(porta, f"PATCH /tarefas/{id_tarefa} HTTP/1.1\r\nHost: x\r\n"
+                                                f"Content-Length: 10\r\n\r\n{{}}".encode("latin-1"))
+    assert status == 408 and b"Connection: close" in cabecalho
+
+
+def test_cliente_que_desconecta_no_meio_do_corpo(api):
+    porta, _, id_tarefa = api
+    with socket.create_connection(("127.0.0.1", porta), timeout=10) as s:
+        s.sendall(f"PATCH /tarefas/{id_tarefa} HTTP/1.1\r\nHost: x\r\nContent-Length: 10\r\n\r\n{{}}".encode("latin-1"))
+        s.shutdown(socket.SHUT_WR)
+        assert s.recv(65536) == b""
+    # A conexão seguinte é atendida normalmente (e o fixture confere que nada escapou sem tratamento)
+    assert _requisitar(porta, "GET", "/saude") == (200, {"status": "ok"})
+
+
+def test_cabecalhos_grandes_demais_respondem_431(api):
+    porta, _, _ = api
+    status, resposta, cabecalho = _bruto(porta, b"GET /saude HTTP/1.1\r\nHost: x\r\nX-Grande: " + b"a" * 70000 + b"\r\n\r\n")
+    assert status == 431 and b"Connection: close" in cabecalho